@@ -0,0 +1,115 @@
+import argparse
+import operator
+import time
+from typing import Any, Callable, Dict, List
+
+
+from src.alerts.alert_engine import AlertEngine
+from src.alerts.alert_rules import parseRule
+from src.sampling.snapshot_collector import SnapshotCollector, PROCESSES_MODULE
+from src.sources.synthetic_source import SyntheticSource
+
+
+# Operadores das condições usados pela avaliação processo a processo
+PYTHON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+  ">": operator.gt,
+  ">=": operator.ge,
+  "<": operator.lt,
+  "<=": operator.le,
+  "==": operator.eq,
+  "!=": operator.ne
+}
+
+
+def ruleDescriptions(count: int) -> List[Dict[str, Any]]:
+
+  """Regras de processos com limites variados, metade com uma condição sobre o nome
+  """
+
+  rules = list()
+
+  for position in range(0, count):
+
+    conditions = [{"attribute": "cpu_used_percentage", "operator": ">", "value": 50 + position % 50},
+                  {"attribute": "memory_used_percent", "operator": "<", "value": 90 - position % 40}]
+
+    if position % 2:
+
+      conditions.append({"attribute": "name", "operator": "!=", "value": f"proc-{position}"})
+
+    rules.append({"name": f"regra {position}", "module": PROCESSES_MODULE, "for_seconds": 60, "hysteresis": 5,
+                  "when": conditions})
+
+  return rules
+
+
+def evaluatePerProcess(snapshot, descriptions: List[Dict[str, Any]]) -> int:
+
+  """Avaliação das mesmas condições com um laço em Python por processo e por regra, para comparação
+  """
+
+  processes = list(snapshot.info_manager.all_processes_info)
+  matches = 0
+
+  for description in descriptions:
+
+    for process_info in processes:
+
+      if all(PYTHON_OPERATORS[condition["operator"]](getattr(process_info, condition["attribute"]), condition["value"])
+             for condition in description["when"]):
+
+        matches += 1
+
+  return matches
+
+
+def median(timings: List[float]) -> float:
+
+  return sorted(timings)[len(timings) // 2]
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede a avaliação das regras de alerta sobre a coleta de processos")
+  parser.add_argument("--processes", type=int, nargs="+", default=[1000, 10000])
+  parser.add_argument("--rules", type=int, nargs="+", default=[12, 48])
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  print(f"{'processos':>10} {'regras':>7} {'colunas (ms)':>13} {'laço (ms)':>10} {'ganho':>7}")
+
+  for processes_count in args.processes:
+
+    collector = SnapshotCollector(source=SyntheticSource(processes_count, 8, 4))
+    snapshots = list()
+
+    for _ in range(0, args.repeat):
+
+      collector.advance()
+      snapshots.append(collector.collect(PROCESSES_MODULE))
+
+    for rules_count in args.rules:
+
+      descriptions = ruleDescriptions(rules_count)
+      engine = AlertEngine([parseRule(description) for description in descriptions], [])
+
+      vectorized_timings = list()
+
+      for snapshot in snapshots:
+
+        start = time.perf_counter()
+        engine.evaluate(snapshot)
+        vectorized_timings.append(time.perf_counter() - start)
+
+      loop_timings = list()
+
+      for snapshot in snapshots:
+
+        start = time.perf_counter()
+        evaluatePerProcess(snapshot, descriptions)
+        loop_timings.append(time.perf_counter() - start)
+
+      vectorized, loop = median(vectorized_timings), median(loop_timings)
+
+      print(f"{processes_count:>10} {rules_count:>7} {vectorized * 1000:>13.2f} {loop * 1000:>10.2f} "
+            f"{loop / vectorized:>6.1f}x")
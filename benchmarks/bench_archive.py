@@ -0,0 +1,87 @@
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import List
+
+
+from src.archive.archive_reader import ArchiveReader
+from src.archive.archive_writer import ArchiveWriter
+from src.sampling.snapshot_collector import SnapshotCollector, CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE
+from src.sources.synthetic_source import SyntheticSource
+
+
+MODULES: List[str] = [CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE]
+
+
+def directorySize(directory: str) -> int:
+
+  return sum(os.path.getsize(os.path.join(directory, entry)) for entry in os.listdir(directory))
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede o custo da gravação contínua das métricas e das consultas por intervalo")
+  parser.add_argument("--seconds", type=int, default=3600, help="Segundos gravados, a uma coleta por segundo")
+  parser.add_argument("--processes", type=int, default=1000)
+  parser.add_argument("--cpus", type=int, default=64)
+  parser.add_argument("--mountpoints", type=int, default=16)
+  parser.add_argument("--top", type=int, default=10)
+  parser.add_argument("--chunk-seconds", type=float, default=60.0)
+  args = parser.parse_args()
+
+  source = SyntheticSource(args.processes, args.cpus, args.mountpoints)
+  collector = SnapshotCollector(processes_top_count=args.top, source=source)
+
+  directory = tempfile.mkdtemp(prefix="bench_archive_")
+
+  try:
+
+    writer = ArchiveWriter(directory, args.chunk_seconds, top_processes_count=args.top)
+    write_time = 0.0
+
+    for _ in range(0, args.seconds):
+
+      collector.advance()
+
+      for module in MODULES:
+
+        snapshot = collector.collect(module)
+
+        # Apenas a gravação é medida, não a coleta
+        start = time.process_time()
+        writer.record(snapshot)
+        write_time += time.process_time() - start
+
+    start = time.process_time()
+    writer.close()
+    write_time += time.process_time() - start
+
+    size = directorySize(directory)
+    reader = ArchiveReader(directory)
+    first_time, last_time = reader.timeRange()
+
+    print(f"{args.seconds} s gravados ({args.cpus} CPUs, {args.mountpoints} partições, top {args.top} processos)")
+    print(f"CPU da gravação: {write_time / args.seconds * 1000:.3f} ms por segundo gravado "
+          f"({write_time / args.seconds * 100:.3f}% de um núcleo)")
+    print(f"tamanho: {size / 1024:.1f} KiB ({size / args.seconds:.1f} bytes por segundo gravado)")
+
+    for stream in ["cpu", "disks", "processes"]:
+
+      for span in [60, 600]:
+
+        start = time.perf_counter()
+        columns = reader.query(stream, last_time - span, last_time)
+        duration = time.perf_counter() - start
+
+        print(f"consulta dos últimos {span:>4} s de {stream:>9}: {duration * 1000:7.2f} ms "
+              f"({len(columns.get('time', []))} linhas)")
+
+    start = time.perf_counter()
+    columns = reader.query("cpu")
+    print(f"consulta de todo o fluxo cpu: {(time.perf_counter() - start) * 1000:.2f} ms ({len(columns['time'])} linhas)")
+
+  finally:
+
+    shutil.rmtree(directory)
@@ -0,0 +1,89 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+
+# Módulos que o modo sem interface gráfica nunca pode carregar
+FORBIDDEN_MODULES: List[str] = ["PySide6", "shiboken6", "pandas", "numpy"]
+
+MAIN_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def importedModules(modules: List[str]) -> List[str]:
+
+  """Executa uma coleta do modo "collect" com -X importtime e retorna os módulos importados
+  """
+
+  result = subprocess.run([sys.executable, "-X", "importtime", MAIN_PATH, "collect", "--count", "1", "--modules", *modules],
+                          capture_output=True, text=True, check=True)
+
+  imported = list()
+
+  for line in result.stderr.splitlines():
+
+    if line.startswith("import time:") and "|" in line:
+
+      imported.append(line.rsplit("|", 1)[1].strip())
+
+  return imported
+
+
+def coldStart(modules: List[str], repeat: int) -> float:
+
+  """Mediana, em segundos, do tempo total de um processo que faz uma única coleta
+  """
+
+  timings = list()
+
+  for _ in range(0, repeat):
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, MAIN_PATH, "collect", "--count", "1", "--modules", *modules],
+                   stdout=subprocess.DEVNULL, check=True)
+    timings.append(time.perf_counter() - start)
+
+  return statistics.median(timings)
+
+
+def interpreterStart(repeat: int) -> float:
+
+  """Mediana, em segundos, do tempo de um interpretador vazio (referência)
+  """
+
+  timings = list()
+
+  for _ in range(0, repeat):
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    timings.append(time.perf_counter() - start)
+
+  return statistics.median(timings)
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede a inicialização do modo collect e verifica que ele não importa a interface gráfica")
+  parser.add_argument("--modules", nargs="+", default=["cpu"])
+  parser.add_argument("--repeat", type=int, default=10)
+  args = parser.parse_args()
+
+  forbidden = sorted({module for module in importedModules(args.modules)
+                      if module.split(".")[0] in FORBIDDEN_MODULES})
+
+  baseline = interpreterStart(args.repeat)
+  cold_start = coldStart(args.modules, args.repeat)
+
+  print(f"interpretador vazio: {baseline * 1000:.1f} ms")
+  print(f"collect --count 1 --modules {' '.join(args.modules)}: {cold_start * 1000:.1f} ms")
+
+  if forbidden:
+
+    print(f"ERRO: o modo collect importou {', '.join(forbidden)}")
+    sys.exit(1)
+
+  print(f"nenhum destes módulos foi importado: {', '.join(FORBIDDEN_MODULES)}")
@@ -0,0 +1,82 @@
+import argparse
+import os
+import time
+from typing import List
+
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtGui import QImage, QPainter
+
+
+from screens.history_charts import HistoryChart, CPUHeatmapChart, DiskThroughputChart
+from src.history.metrics_history import MetricsHistory
+from src.sampling.snapshot_collector import SnapshotCollector, CPU_MODULE, DISKS_MODULE
+from src.sources.synthetic_source import SyntheticSource
+
+
+def measureChart(chart: HistoryChart, repeat: int) -> List[float]:
+
+  """Mediana do tempo de refazer o cache e do tempo de um desenho a partir do cache, em segundos
+  """
+
+  rect = chart.plotRect()
+  image = QImage(chart.size(), QImage.Format_ARGB32_Premultiplied)
+
+  rebuild_timings: List[float] = list()
+  paint_timings: List[float] = list()
+
+  for _ in range(0, repeat):
+
+    start = time.perf_counter()
+    chart.rebuildCache(rect)
+    rebuild_timings.append(time.perf_counter() - start)
+
+    painter = QPainter(image)
+
+    start = time.perf_counter()
+    chart.paintCache(painter, rect)
+    paint_timings.append(time.perf_counter() - start)
+
+    painter.end()
+
+  return [sorted(rebuild_timings)[repeat // 2], sorted(paint_timings)[repeat // 2]]
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede o desenho dos gráficos do histórico a partir de coletas sintéticas")
+  parser.add_argument("--seconds", type=int, default=3600, help="Segundos de histórico, a uma coleta por segundo")
+  parser.add_argument("--cpus", type=int, default=256)
+  parser.add_argument("--mountpoints", type=int, default=8)
+  parser.add_argument("--width", type=int, default=1000, help="Largura dos gráficos em pixels")
+  parser.add_argument("--repeat", type=int, default=10)
+  args = parser.parse_args()
+
+  app = QApplication([])
+
+  history = MetricsHistory()
+  collector = SnapshotCollector(history, source=SyntheticSource(10, args.cpus, args.mountpoints))
+
+  for _ in range(0, args.seconds):
+
+    collector.advance()
+    collector.collect(CPU_MODULE)
+    collector.collect(DISKS_MODULE)
+
+  print(f"{args.seconds} s de histórico, {args.cpus} CPUs, {args.mountpoints} partições, {args.width} pixels de largura")
+  print(f"{'gráfico':>20} {'janela (s)':>11} {'refazer (ms)':>13} {'desenhar (ms)':>14} {'quadros/s':>10}")
+
+  for chart_type in [CPUHeatmapChart, DiskThroughputChart]:
+
+    for span in [60, 300, 3600]:
+
+      chart = chart_type(history, span)
+      chart.resize(args.width, 300)
+
+      rebuild, paint = measureChart(chart, args.repeat)
+
+      print(f"{chart_type.__name__:>20} {span:>11} {rebuild * 1000:>13.2f} {paint * 1000:>14.2f} "
+            f"{1 / max(paint, 1e-9):>10.0f}")
@@ -0,0 +1,138 @@
+import psutil
+
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+
+from src.processes.processes_snapshot import ProcessesSnapshot
+
+
+# Tipo das métricas de E/S de um processo na plataforma atual
+IO_COUNTERS_TYPE = type(psutil.Process().io_counters())
+
+
+class LegacyProcessInfo:
+
+  """Representação usada antes das colunas: um objeto por processo, com um atributo privado por campo
+  """
+
+  def __init__(self, attributes: Dict[str, Any]) -> None:
+
+    self.__name = attributes["name"]
+    self.__pid = attributes["pid"]
+    self.__ppid = attributes["ppid"]
+    self.__priority_number = attributes["nice"]
+    self.__owner_username = attributes["username"]
+    self.__status = attributes["status"]
+    self.__executable_path = attributes["exe"]
+    self.__created_time = attributes["create_time"]
+    self.__threads_used_count = attributes["num_threads"]
+    self.__cpu_used_percentage = attributes["cpu_percent"]
+
+    io_metrics = attributes["io_counters"]
+
+    self.__write_operations_count = io_metrics.write_count
+    self.__read_operations_count = io_metrics.read_count
+    self.__write_bytes_number = io_metrics.write_bytes
+    self.__read_bytes_number = io_metrics.read_bytes
+
+    self.__memory_used_percent = attributes["memory_percent"]
+
+
+def syntheticAttributes(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+
+  """Atributos de 'count' processos no formato de PROCESS_ATTRIBUTES, com textos repetidos como em um sistema real
+  """
+
+  generator = random.Random(seed)
+
+  names = ["bash", "python3", "sleep", "nginx", "postgres", "java", "node", "chrome", "sshd", "systemd"]
+  users = ["root", "www-data", "postgres", "ubuntu"]
+  statuses = ["sleeping", "running", "idle", "disk-sleep"]
+
+  processes_attributes = list()
+
+  for pid in range(1, count + 1):
+
+    name = generator.choice(names)
+
+    # Cada leitura do psutil cria novos objetos de texto, mesmo com valores repetidos
+    processes_attributes.append({
+      "name": "".join(name),
+      "pid": pid,
+      "ppid": generator.randint(1, pid),
+      "nice": generator.choice([0, 0, 0, 10, -20]),
+      "username": "".join(generator.choice(users)),
+      "status": "".join(generator.choice(statuses)),
+      "exe": f"/usr/bin/{name}",
+      "create_time": 1.7e9 + generator.random() * 1e6,
+      "num_threads": generator.randint(1, 64),
+      "cpu_percent": generator.random() * 100,
+      "io_counters": IO_COUNTERS_TYPE(*[generator.randint(0, 1 << 40) for _ in IO_COUNTERS_TYPE._fields]),
+      "memory_percent": generator.random()
+    })
+
+  return processes_attributes
+
+
+def retainedMemory(build: Callable[[List[Dict[str, Any]]], Any], count: int) -> Dict[str, float]:
+
+  """Memória e objetos rastreados pelo coletor de lixo que sobram após montar a representação e descartar os atributos lidos
+  """
+
+  gc.collect()
+
+  tracked_before = len(gc.get_objects())
+
+  tracemalloc.start()
+
+  processes_attributes = syntheticAttributes(count)
+
+  start = time.perf_counter()
+  representation = build(processes_attributes)
+  build_time = time.perf_counter() - start
+
+  del processes_attributes
+  gc.collect()
+
+  retained_bytes, _ = tracemalloc.get_traced_memory()
+
+  tracemalloc.stop()
+
+  tracked_objects = len(gc.get_objects()) - tracked_before
+
+  start = time.perf_counter()
+  gc.collect()
+  gc_time = time.perf_counter() - start
+
+  del representation
+
+  return {"bytes": retained_bytes, "objects": tracked_objects, "build": build_time, "gc": gc_time}
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Compara a memória dos processos em objetos e em colunas")
+  parser.add_argument("--counts", type=int, nargs="+", default=[10000, 50000])
+  args = parser.parse_args()
+
+  representations = {
+    "objetos": lambda processes_attributes: [LegacyProcessInfo(attributes) for attributes in processes_attributes],
+    "colunas": lambda processes_attributes: ProcessesSnapshot(processes_attributes)
+  }
+
+  print(f"{'processos':>10} {'formato':>8} {'KiB/10k':>9} {'objetos gc':>11} {'montagem (ms)':>14} {'gc.collect (ms)':>16}")
+
+  for count in args.counts:
+
+    for label, build in representations.items():
+
+      result = retainedMemory(build, count)
+
+      print(f"{count:>10} {label:>8} {result['bytes'] / count * 10000 / 1024:>9.0f} {result['objects']:>11} "
+            f"{result['build'] * 1000:>14.1f} {result['gc'] * 1000:>16.1f}")
@@ -0,0 +1,88 @@
+import argparse
+import math
+import time
+from typing import Dict, List, Tuple
+
+
+from src.processes.process_info import SUMMARY_PROCESS_ATTRIBUTES
+from src.processes.process_rates_sampler import ProcessRatesSampler, COUNTERS
+from src.processes.processes_snapshot import ProcessesSnapshot
+from src.sampling.snapshot_collector import SnapshotCollector, PROCESSES_MODULE
+from src.sources.synthetic_source import SyntheticSource
+
+
+def ratesPerProcess(previous: ProcessesSnapshot, snapshot: ProcessesSnapshot, interval: float) -> List[Tuple[float, ...]]:
+
+  """Cálculo das mesmas taxas com um dicionário da coleta anterior e um laço em Python por processo, para comparação
+  """
+
+  previous_columns = [previous.column(column) for column in ["pid", "create_time", *COUNTERS]]
+  columns = [snapshot.column(column) for column in ["pid", "create_time", *COUNTERS]]
+
+  counters_by_key: Dict[Tuple[int, float], Tuple[float, ...]] = {
+    (values[0], values[1]): values[2:] for values in zip(*previous_columns)
+  }
+
+  rates = list()
+
+  for values in zip(*columns):
+
+    previous_counters = counters_by_key.get((values[0], values[1]))
+
+    if previous_counters is None:
+
+      rates.append((math.nan,) * 5)
+      continue
+
+    deltas = [(current - before) / interval for current, before in zip(values[2:], previous_counters)]
+
+    rates.append((deltas[0] * 100, deltas[1], deltas[2], deltas[3] + deltas[4], deltas[5]))
+
+  return rates
+
+
+def median(timings: List[float]) -> float:
+
+  return sorted(timings)[len(timings) // 2]
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede o cálculo das taxas de cada processo entre duas coletas")
+  parser.add_argument("--processes", type=int, nargs="+", default=[1000, 10000, 50000])
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  print(f"{'processos':>10} {'colunas (ms)':>13} {'laço (ms)':>10} {'ganho':>7}")
+
+  for processes_count in args.processes:
+
+    source = SyntheticSource(processes_count, 8, 4)
+    collector = SnapshotCollector(process_attributes=SUMMARY_PROCESS_ATTRIBUTES, source=source)
+
+    previous = collector.collect(PROCESSES_MODULE).info_manager.snapshot
+
+    collector.advance()
+    snapshot = collector.collect(PROCESSES_MODULE).info_manager.snapshot
+
+    vectorized_timings = list()
+    loop_timings = list()
+
+    for _ in range(0, args.repeat):
+
+      # A primeira amostra apenas guarda a coleta anterior; a medida é a da segunda, que calcula as taxas um segundo depois
+      sampler = ProcessRatesSampler(source)
+      sampler.sample(previous)
+      source.advance()
+
+      start = time.perf_counter()
+      sampler.sample(snapshot)
+      vectorized_timings.append(time.perf_counter() - start)
+
+      start = time.perf_counter()
+      ratesPerProcess(previous, snapshot, 1.0)
+      loop_timings.append(time.perf_counter() - start)
+
+    vectorized, loop = median(vectorized_timings), median(loop_timings)
+
+    print(f"{processes_count:>10} {vectorized * 1000:>13.2f} {loop * 1000:>10.2f} {loop / vectorized:>6.1f}x")
@@ -0,0 +1,138 @@
+import psutil
+
+
+import argparse
+import statistics
+import subprocess
+import time
+from typing import Callable, List
+
+
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.processes.process_registry import ProcessRegistry
+
+
+def legacyScan() -> int:
+
+  """Varredura usada antes do process_iter: um psutil.Process por pid e uma chamada separada por atributo
+  """
+
+  count = 0
+
+  for pid in psutil.pids():
+
+    try:
+
+      process = psutil.Process(pid)
+
+      process.name()
+      process.ppid()
+      process.nice()
+      process.username()
+      process.status()
+      process.exe()
+      process.create_time()
+      process.num_threads()
+      process.cpu_percent()
+      process.io_counters()
+      process.memory_percent()
+
+      count += 1
+
+    except (psutil.AccessDenied, psutil.NoSuchProcess):
+
+      pass
+
+  return count
+
+
+def bulkScan() -> int:
+
+  """Varredura atual, feita pelo ProcessesInfoManager
+  """
+
+  return ProcessesInfoManager().processes_count
+
+
+def incrementalScan(registry: ProcessRegistry) -> Callable[[], int]:
+
+  """Varredura com o registro persistente, como feita a cada atualização da janela
+  """
+
+  return lambda: ProcessesInfoManager(registry).processes_count
+
+
+def topScan(registry: ProcessRegistry, count: int) -> Callable[[], int]:
+
+  """Varredura do modo Top-N: ordenação de todos os processos pela CPU e leitura completa apenas dos 'count' maiores
+  """
+
+  return lambda: ProcessesInfoManager(registry, top_count=count, top_by="cpu").processes_count
+
+
+def spawnSleepers(count: int) -> List[subprocess.Popen]:
+
+  """Cria processos ociosos até que o sistema tenha pelo menos 'count' processos
+  """
+
+  missing = max(0, count - len(psutil.pids()))
+
+  return [subprocess.Popen(["sleep", "3600"]) for _ in range(0, missing)]
+
+
+def measure(scan: Callable[[], int], repeat: int) -> float:
+
+  """Mediana, em segundos, do tempo de 'repeat' execuções de uma varredura
+  """
+
+  timings = list()
+
+  for _ in range(0, repeat):
+
+    start = time.perf_counter()
+    scan()
+    timings.append(time.perf_counter() - start)
+
+  return statistics.median(timings)
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Compara o tempo das varreduras de processos")
+  parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 20000])
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--top", type=int, default=20)
+  args = parser.parse_args()
+
+  sleepers: List[subprocess.Popen] = list()
+
+  try:
+
+    print(f"{'processos':>10} {'antes (s)':>10} {'depois (s)':>11} {'ganho':>7} {'registro (s)':>13} {'ganho':>7} "
+          f"{f'top {args.top} (s)':>11} {'ganho':>7}")
+
+    for count in sorted(args.counts):
+
+      sleepers += spawnSleepers(count)
+
+      # O registro é preenchido antes da medição, como acontece nas atualizações seguintes da janela
+      registry = ProcessRegistry()
+      registry.refresh()
+
+      top_registry = ProcessRegistry()
+      top_registry.refreshTop(args.top, "cpu")
+
+      before = measure(legacyScan, args.repeat)
+      after = measure(bulkScan, args.repeat)
+      incremental = measure(incrementalScan(registry), args.repeat)
+      top = measure(topScan(top_registry, args.top), args.repeat)
+
+      print(f"{len(psutil.pids()):>10} {before:>10.3f} {after:>11.3f} {before / after:>6.1f}x "
+            f"{incremental:>13.3f} {before / incremental:>6.1f}x {top:>11.3f} {before / top:>6.1f}x")
+
+  finally:
+
+    for sleeper in sleepers:
+
+      sleeper.kill()
+      sleeper.wait()
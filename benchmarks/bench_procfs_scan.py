@@ -0,0 +1,77 @@
+import psutil
+
+
+import argparse
+import subprocess
+from typing import Callable, List
+
+
+from benchmarks.bench_process_scan import measure, spawnSleepers
+from src.processes.process_info import PROCESS_ATTRIBUTES, SUMMARY_PROCESS_ATTRIBUTES
+from src.processes.process_registry import ProcessRegistry
+from src.processes.procfs_registry import PROCFS_AVAILABLE, ProcfsRegistry
+
+
+def refreshScan(registry: ProcessRegistry | ProcfsRegistry, attributes: List[str]) -> Callable[[], int]:
+
+  """Atualização completa do registro, como feita a cada coleta de processos
+  """
+
+  return lambda: len(registry.refresh(attributes))
+
+
+def topScan(registry: ProcessRegistry | ProcfsRegistry, count: int) -> Callable[[], int]:
+
+  """Atualização do modo Top-N, ordenando todos os processos pela CPU
+  """
+
+  return lambda: len(registry.refreshTop(count, "cpu", SUMMARY_PROCESS_ATTRIBUTES))
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Compara a leitura dos processos pelo psutil e pelo /proc")
+  parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 20000])
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--top", type=int, default=20)
+  args = parser.parse_args()
+
+  if not PROCFS_AVAILABLE:
+
+    parser.exit(1, "A leitura pelo /proc só está disponível no Linux\n")
+
+  scenarios = {
+    "resumo": lambda registry: refreshScan(registry, SUMMARY_PROCESS_ATTRIBUTES),
+    "completo": lambda registry: refreshScan(registry, PROCESS_ATTRIBUTES),
+    f"top {args.top}": lambda registry: topScan(registry, args.top)
+  }
+
+  sleepers: List[subprocess.Popen] = list()
+
+  try:
+
+    print(f"{'processos':>10} {'leitura':>10} {'psutil (s)':>11} {'/proc (s)':>10} {'ganho':>7}")
+
+    for count in sorted(args.counts):
+
+      sleepers += spawnSleepers(count)
+
+      for name, scan in scenarios.items():
+
+        timings = list()
+
+        for registry in [ProcessRegistry(), ProcfsRegistry()]:
+
+          # O registro é preenchido antes da medição, como acontece nas coletas seguintes
+          scan(registry)()
+          timings.append(measure(scan(registry), args.repeat))
+
+        print(f"{len(psutil.pids()):>10} {name:>10} {timings[0]:>11.3f} {timings[1]:>10.3f} "
+              f"{timings[0] / timings[1]:>6.1f}x")
+
+  finally:
+
+    for sleeper in sleepers:
+
+      sleeper.kill()
+      sleeper.wait()
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from typing import List
+
+
+from src.remote.frame_codec import FrameEncoder
+from src.remote.remote_source import RemoteSource
+from src.sources.source_reader import SourceReader
+from src.sources.synthetic_source import SyntheticSource
+
+
+MAIN_PATH: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def startAgents(directory: str, agents: int, processes: int, interval: float) -> List[subprocess.Popen]:
+
+  """Inicia os agentes locais, cada um com um sistema sintético diferente e o seu socket Unix
+  """
+
+  return [subprocess.Popen([sys.executable, MAIN_PATH, "agent", "--listen", f"unix:{directory}/agent-{agent}.sock",
+                            "--interval", str(interval), "--synthetic", str(processes), "--seed", str(agent)],
+                           stderr=subprocess.DEVNULL)
+          for agent in range(0, agents)]
+
+
+def connect(address: str, path: str, timeout: float = 60.0) -> RemoteSource:
+
+  # O socket só existe depois que o agente cria o sistema sintético
+  deadline = time.monotonic() + timeout
+
+  while not os.path.exists(path):
+
+    if time.monotonic() > deadline:
+
+      raise TimeoutError(f"O agente '{address}' não foi iniciado!")
+
+    time.sleep(0.1)
+
+  return RemoteSource(address, timeout)
+
+
+def frameSizes(processes: int) -> List[int]:
+
+  """Tamanho de uma leitura completa no formato binário, e no formato da gravação (JSON com todos os processos) sem e com compressão
+  """
+
+  reader = SourceReader(SyntheticSource(processes))
+  frame = reader.read()
+
+  encoder = FrameEncoder(reader.fields["process_io"])
+  encoder.encode(frame)
+
+  json_frame = json.dumps(frame, separators=(",", ":")).encode("utf-8")
+
+  return [len(encoder.encodeFull()), len(json_frame), len(zlib.compress(json_frame, 6))]
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Mede a banda e o custo do visualizador conectado a vários agentes locais "
+                                               "(python main.py agent) com sistemas sintéticos")
+  parser.add_argument("--agents", type=int, default=4)
+  parser.add_argument("--processes", type=int, default=5000, help="Processos de cada agente")
+  parser.add_argument("--seconds", type=float, default=20.0, help="Duração da medição")
+  parser.add_argument("--interval", type=float, default=1.0, help="Intervalo entre as leituras dos agentes")
+  parser.add_argument("--target-agents", type=int, default=50,
+                      help="Quantidade de agentes para a estimativa a partir da medição")
+  args = parser.parse_args()
+
+  directory = tempfile.mkdtemp(prefix="bench_remote_")
+  agents = startAgents(directory, args.agents, args.processes, args.interval)
+
+  try:
+
+    sources = [connect(f"unix:{directory}/agent-{agent}.sock", f"{directory}/agent-{agent}.sock")
+               for agent in range(0, args.agents)]
+
+    # Apenas as leituras parciais entram na medição
+    start_bytes = sum(source.bytes_received for source in sources)
+    start_frames = sum(source.frames_received for source in sources)
+    start_cpu = time.process_time()
+
+    time.sleep(args.seconds)
+
+    cpu = time.process_time() - start_cpu
+    frames = sum(source.frames_received for source in sources) - start_frames
+    delta_bytes = sum(source.bytes_received for source in sources) - start_bytes
+
+    for source in sources:
+
+      source.close()
+
+  finally:
+
+    for agent in agents:
+
+      agent.terminate()
+      agent.wait()
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+  full_size, json_size, json_compressed_size = frameSizes(args.processes)
+
+  per_frame = delta_bytes / max(frames, 1)
+  per_agent_second = delta_bytes / args.agents / args.seconds
+  cpu_per_agent = cpu / args.agents / args.seconds
+
+  print(f"{args.agents} agentes, {args.processes} processos cada, leituras a cada {args.interval} s, {args.seconds} s medidos")
+  print(f"{'leitura completa (binária)':>36}: {full_size / 1024:10.1f} KiB")
+  print(f"{'leitura em JSON (gravação)':>36}: {json_size / 1024:10.1f} KiB ({json_compressed_size / 1024:.1f} KiB com zlib)")
+  print(f"{'leitura parcial (média)':>36}: {per_frame / 1024:10.1f} KiB em {frames} leituras")
+  print(f"{'banda por agente':>36}: {per_agent_second / 1024:10.1f} KiB/s")
+  print(f"{'CPU do visualizador por agente':>36}: {cpu_per_agent * 100:10.2f} %")
+  print(f"{f'estimativa com {args.target_agents} agentes':>36}: {per_agent_second * args.target_agents / 1024:10.1f} KiB/s, "
+        f"{cpu_per_agent * args.target_agents * 100:.1f} % de uma CPU")
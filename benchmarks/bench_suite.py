@@ -0,0 +1,369 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+# A renderização é feita sem tela, então a suíte roda em servidores e na integração contínua
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+from src.cpus.cpu_sampler import CPUSampler
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.disks.disk_io_sampler import DiskIOSampler
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.disks.mount_usage_prober import MountUsageProber
+from src.processes.process_info import SUMMARY_PROCESS_ATTRIBUTES
+from src.processes.process_registry import ProcessRegistry
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.sources.synthetic_source import SyntheticSource
+
+
+# Aumento da mediana, em relação ao resultado de referência, a partir do qual uma etapa é marcada como regressão
+REGRESSION_THRESHOLD: float = 0.10
+
+RESULTS_FORMAT_VERSION: int = 1
+
+
+class Scenario:
+
+  """
+
+  Representa um cenário da suíte: um sistema sintético e os objetos de coleta reaproveitados entre as repetições, como na janela
+
+  """
+
+  def __init__(self, processes_count: int, cpu_count: int, mountpoints_count: int, seed: int = 0) -> None:
+
+    self.__source = SyntheticSource(processes_count=processes_count, cpu_count=cpu_count,
+                                    mountpoints_count=mountpoints_count, seed=seed)
+
+    self.__registry = ProcessRegistry(self.__source)
+    self.__cpu_sampler = CPUSampler(self.__source)
+    self.__io_sampler = DiskIOSampler(self.__source)
+    self.__usage_prober = MountUsageProber(source=self.__source)
+
+    self.__processes_info_manager: ProcessesInfoManager | None = None
+    self.__window = None
+
+  @property
+  def parameters(self) -> Dict[str, int]:
+
+    return {
+      "processes": self.__source.processes_count,
+      "cpus": self.__source.cpuCount(),
+      "mountpoints": self.__source.mountpoints_count
+    }
+
+  def warmUp(self, with_gui: bool) -> None:
+
+    """Faz a primeira coleta de cada módulo (registro dos processos e leituras anteriores dos amostradores), que não entra na medição
+    """
+
+    self.collectProcesses()
+    self.collectCPUs()
+    self.collectDisks()
+
+    if with_gui:
+
+      # Importado apenas aqui, para que --no-gui funcione sem o PySide6 instalado
+      from PySide6.QtCore import qInstallMessageHandler
+      from PySide6.QtWidgets import QApplication
+      from screens.main_window import MainWindow
+
+      # O plugin offscreen avisa a cada janela exibida que não repassa o tamanho sugerido, o que não afeta a medição
+      qInstallMessageHandler(lambda mode, context, message: None if "propagateSizeHints" in message
+                                                              else print(message, file=sys.stderr))
+
+      self.__application = QApplication.instance() or QApplication(sys.argv)
+
+      self.__window = MainWindow(self.__source)
+
+      # As atualizações são feitas pela suíte, e não pelo agendador ou pela thread de coleta
+      self.__window.scheduler.stop()
+      self.__window.show()
+
+  def stages(self, with_gui: bool) -> Dict[str, Callable[[], Any]]:
+
+    stages: Dict[str, Callable[[], Any]] = {
+      "collect_processes": self.collectProcesses,
+      "collect_cpus": self.collectCPUs,
+      "collect_disks": self.collectDisks,
+      "filter_processes": self.filterProcesses
+    }
+
+    if with_gui:
+
+      stages.update({
+        "tabulate_processes": lambda: self.__window.showProcessInfo(self.__processes_info_manager),
+        "render_processes": self.render,
+        "tabulate_cpus": lambda: self.__window.showCPUInfo(self.collectCPUs()),
+        "render_cpus": self.render,
+        "tabulate_disks": lambda: self.__window.showDiskInfo(self.collectDisks()),
+        "render_disks": self.render
+      })
+
+    return stages
+
+  def collectProcesses(self) -> ProcessesInfoManager:
+
+    # Cada ciclo da suíte começa pelos processos, então é aqui que o sistema sintético avança um passo
+    self.__source.advance()
+
+    # Mesma coleta da janela: registro persistente e apenas os atributos da tabela
+    self.__processes_info_manager = ProcessesInfoManager(self.__registry, attributes=SUMMARY_PROCESS_ATTRIBUTES,
+                                                         source=self.__source)
+
+    return self.__processes_info_manager
+
+  def collectCPUs(self) -> CPUsInfoManager:
+
+    return CPUsInfoManager(self.__cpu_sampler, self.__source)
+
+  def collectDisks(self) -> DiskPartitionsInfoManager:
+
+    return DiskPartitionsInfoManager(self.__io_sampler, self.__usage_prober, self.__source)
+
+  def filterProcesses(self) -> None:
+
+    """Simula a digitação no filtro por nome (consultas que se estreitam), seguida de uma busca por PID
+    """
+
+    pim = self.__processes_info_manager
+
+    for text in ["p", "py", "pyt", "pyth"]:
+
+      pim.filterBy("Nome", text)
+
+    pim.filterBy("PID", str(pim.all_processes_info[len(pim.all_processes_info) // 2].pid))
+    pim.filterBy("Nome", "")
+
+  def render(self) -> None:
+
+    # O grab pinta a janela inteira em um pixmap, pelo mesmo caminho de uma atualização da tela
+    self.__application.processEvents()
+    self.__window.grab()
+
+  def close(self) -> None:
+
+    if self.__window is not None:
+
+      self.__window.sampler.stop()
+      self.__window.close()
+
+    self.__usage_prober.close()
+
+
+def measure(stages: Dict[str, Callable[[], Any]], repeat: int) -> Dict[str, List[float]]:
+
+  """Executa as etapas em sequência 'repeat' vezes e retorna os tempos, em segundos, de cada uma
+
+  As etapas rodam intercaladas (e não cada uma 'repeat' vezes seguidas) porque dependem umas das outras, como em uma atualização da janela.
+  """
+
+  timings: Dict[str, List[float]] = {name: list() for name in stages}
+
+  for _ in range(0, repeat):
+
+    for name, stage in stages.items():
+
+      start = time.perf_counter()
+      stage()
+      timings[name].append(time.perf_counter() - start)
+
+  return timings
+
+
+def measurePeakMemory(stages: Dict[str, Callable[[], Any]]) -> Dict[str, int]:
+
+  """Executa as etapas uma vez com o tracemalloc e retorna o pico de memória alocada, em bytes, durante cada uma
+
+  É uma passada separada da medição de tempo, já que o tracemalloc deixa as alocações bem mais lentas.
+  """
+
+  peaks: Dict[str, int] = dict()
+
+  tracemalloc.start()
+
+  try:
+
+    for name, stage in stages.items():
+
+      baseline = tracemalloc.get_traced_memory()[0]
+      tracemalloc.reset_peak()
+
+      stage()
+
+      peaks[name] = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+
+  finally:
+
+    tracemalloc.stop()
+
+  return peaks
+
+
+def maxResidentBytes() -> int | None:
+
+  """Pico de memória residente do processo da suíte, ou None em sistemas sem o módulo resource (Windows)
+  """
+
+  try:
+
+    import resource
+
+  except ImportError:
+
+    return None
+
+  # No Linux o ru_maxrss vem em KiB, e no macOS em bytes
+  max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+  return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def runScenario(processes_count: int, cpu_count: int, mountpoints_count: int, repeat: int, with_gui: bool) -> Dict[str, Any]:
+
+  scenario = Scenario(processes_count, cpu_count, mountpoints_count)
+
+  try:
+
+    scenario.warmUp(with_gui)
+
+    stages = scenario.stages(with_gui)
+
+    timings = measure(stages, repeat)
+    peaks = measurePeakMemory(stages)
+
+  finally:
+
+    scenario.close()
+
+  return {
+    "scenario": scenario.parameters,
+    "stages": {
+      name: {
+        "median_seconds": statistics.median(stage_timings),
+        "min_seconds": min(stage_timings),
+        "timings_seconds": stage_timings,
+        "peak_allocated_bytes": peaks[name]
+      }
+      for name, stage_timings in timings.items()
+    },
+    "max_resident_bytes": maxResidentBytes()
+  }
+
+
+def gitCommit() -> str | None:
+
+  try:
+
+    result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+
+  except (OSError, subprocess.CalledProcessError):
+
+    return None
+
+  return result.stdout.strip()
+
+
+def compareResults(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+
+  """Compara as medianas de cada etapa com as de um resultado de referência (mesmo cenário) e retorna as regressões encontradas
+  """
+
+  baseline_scenarios = {json.dumps(scenario_result["scenario"], sort_keys=True): scenario_result
+                        for scenario_result in baseline["results"]}
+
+  regressions: List[str] = list()
+
+  for scenario_result in results["results"]:
+
+    baseline_result = baseline_scenarios.get(json.dumps(scenario_result["scenario"], sort_keys=True))
+
+    if baseline_result is None:
+
+      continue
+
+    for name, stage in scenario_result["stages"].items():
+
+      baseline_stage = baseline_result["stages"].get(name)
+
+      if baseline_stage is None or baseline_stage["median_seconds"] <= 0:
+
+        continue
+
+      ratio = stage["median_seconds"] / baseline_stage["median_seconds"]
+
+      if ratio > 1 + threshold:
+
+        regressions.append(f"{scenario_result['scenario']['processes']} processos, {name}: "
+                           f"{baseline_stage['median_seconds']:.4f} s -> {stage['median_seconds']:.4f} s ({ratio:.2f}x)")
+
+  return regressions
+
+
+def printResults(results: Dict[str, Any]) -> None:
+
+  print(f"{'processos':>10} {'etapa':<20} {'mediana (s)':>12} {'mínimo (s)':>11} {'pico (KiB)':>11}")
+
+  for scenario_result in results["results"]:
+
+    for name, stage in scenario_result["stages"].items():
+
+      print(f"{scenario_result['scenario']['processes']:>10} {name:<20} {stage['median_seconds']:>12.4f} "
+            f"{stage['min_seconds']:>11.4f} {stage['peak_allocated_bytes'] / 1024:>11.0f}")
+
+
+if __name__ == "__main__":
+
+  parser = argparse.ArgumentParser(description="Suíte de desempenho da coleta, filtro, tabela e renderização, "
+                                               "sobre um sistema sintético (não lê o sistema real)")
+  parser.add_argument("--processes", type=int, nargs="+", default=[1000, 10000, 50000])
+  parser.add_argument("--cpus", type=int, default=256)
+  parser.add_argument("--mountpoints", type=int, default=100)
+  parser.add_argument("--repeat", type=int, default=5)
+  parser.add_argument("--no-gui", action="store_true", help="Não mede as etapas da tabela e da renderização (Qt)")
+  parser.add_argument("--output", default="bench_results.json", help="Arquivo JSON com os resultados")
+  parser.add_argument("--compare", help="Arquivo JSON de uma execução anterior, usado como referência")
+  parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+  args = parser.parse_args()
+
+  results: Dict[str, Any] = {
+    "format_version": RESULTS_FORMAT_VERSION,
+    "metadata": {
+      "timestamp": time.time(),
+      "python": platform.python_version(),
+      "platform": platform.platform(),
+      "git_commit": gitCommit(),
+      "repeat": args.repeat,
+      "gui": not args.no_gui
+    },
+    "results": [runScenario(processes_count, args.cpus, args.mountpoints, args.repeat, not args.no_gui)
+                for processes_count in sorted(args.processes)]
+  }
+
+  with open(args.output, "w", encoding="utf-8") as results_file:
+
+    json.dump(results, results_file, indent=2)
+
+  printResults(results)
+
+  if args.compare:
+
+    with open(args.compare, "r", encoding="utf-8") as baseline_file:
+
+      regressions = compareResults(results, json.load(baseline_file), args.threshold)
+
+    for regression in regressions:
+
+      print(f"Regressão: {regression}")
+
+    # Código de saída diferente de zero para que a integração contínua falhe
+    sys.exit(1 if regressions else 0)
@@ -1,13 +1,32 @@
-from PySide6.QtWidgets import QApplication
-
-
+import argparse
 import sys
 import os
+from typing import List
 
 
-from screens.main_window import MainWindow
+def runGUI(argv: List[str]) -> int:
 
-if __name__ == "__main__":
+  """Abre a janela principal do aplicativo
+  """
+
+  from src.sources.source_arguments import addSourceArguments, sourcesFromArguments
+  from src.processes.procfs_registry import PROCESS_BACKENDS
+
+  parser = argparse.ArgumentParser(prog="main.py", description="Abre a janela de monitoramento do sistema")
+  parser.add_argument("--process-backend", choices=PROCESS_BACKENDS, default="psutil",
+                      help="Leitura dos processos: psutil ou procfs (leitura direta do /proc, apenas no Linux) (padrão: psutil)")
+  parser.add_argument("--alerts", metavar="ARQUIVO",
+                      help="Arquivo JSON com as regras de alerta, avaliadas a cada coleta exibida (ver 'python main.py alerts')")
+
+  addSourceArguments(parser)
+
+  # Os argumentos não reconhecidos ficam para o Qt (ex.: -platform)
+  args, qt_argv = parser.parse_known_args(argv)
+
+  # A interface gráfica é importada apenas aqui, para que o modo "collect" não dependa do PySide6
+  from PySide6.QtWidgets import QApplication
+
+  from screens.main_window import MainWindow
 
   STYLES_PATH: str = os.path.join(os.path.dirname(__file__), "styles", "styles.txt")
   style_content: str = ""
@@ -16,12 +35,83 @@ if __name__ == "__main__":
 
     style_content = style_sheet_stream.read()
   
-  app = QApplication(sys.argv)
+  app = QApplication([sys.argv[0], *qt_argv])
   app.setStyleSheet(style_content)
 
-  window = MainWindow()
-  window.show()
+  if args.alerts is not None:
+
+    from src.alerts.alert_engine import createAlertEngine
+
+  try:
+
+    sources = sourcesFromArguments(args)
+
+  except (ConnectionError, ValueError) as error:
+
+    print(error, file=sys.stderr)
+    return 1
+
+  windows: List[MainWindow] = list()
+
+  # Uma janela por agente de --connect (ou uma única janela para as demais fontes), cada uma com as suas regras de alerta
+  for source in sources:
+
+    window = MainWindow(source, args.process_backend,
+                        createAlertEngine(args.alerts) if args.alerts is not None else None)
+
+    if args.connect is not None:
+
+      window.setWindowTitle(f"{window.windowTitle()} - {source.hostname} ({source.address})")
+
+    window.show()
+    windows.append(window)
+
+  return app.exec()
 
-  sys.exit(app.exec())
-    
 
+if __name__ == "__main__":
+
+  # Modo sem interface gráfica: python main.py collect [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "collect":
+
+    from src.sampling.collector_cli import runCollector
+
+    sys.exit(runCollector(sys.argv[2:]))
+
+  # Gravação das leituras do sistema, para reprodução com --replay: python main.py record --output ARQUIVO [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "record":
+
+    from src.sources.recorder_cli import runRecorder
+
+    sys.exit(runRecorder(sys.argv[2:]))
+
+  # Exportação das métricas no formato OpenMetrics: python main.py export [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "export":
+
+    from src.exporter.exporter_cli import runExporter
+
+    sys.exit(runExporter(sys.argv[2:]))
+
+  # Gravação contínua das métricas em disco, e consulta do que foi gravado: python main.py archive write|read [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "archive":
+
+    from src.archive.archive_cli import runArchive
+
+    sys.exit(runArchive(sys.argv[2:]))
+
+  # Agente remoto, que transmite as leituras do sistema à janela de outro computador: python main.py agent [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "agent":
+
+    from src.remote.agent_cli import runAgent
+
+    sys.exit(runAgent(sys.argv[2:]))
+
+  # Avaliação das regras de alerta sem interface gráfica: python main.py alerts --config ARQUIVO [opções]
+  if len(sys.argv) > 1 and sys.argv[1] == "alerts":
+
+    from src.alerts.alerts_cli import runAlerts
+
+    sys.exit(runAlerts(sys.argv[2:]))
+
+  sys.exit(runGUI(sys.argv[1:]))
+    
@@ -0,0 +1,188 @@
+from PySide6.QtCore import QObject, QThread, Signal, Slot
+
+
+from typing import List, Set
+
+
+from src.sampling.snapshot_collector import SnapshotCollector, ModuleSnapshot
+from src.abstracts.metrics_source import MetricsSource
+from src.processes.process_info import SUMMARY_PROCESS_ATTRIBUTES
+from src.processes.process_rates_sampler import ProcessRatesSampler
+from src.history.metrics_history import MetricsHistory
+
+
+class CollectorWorker(QObject):
+
+  """Executa as coletas do SnapshotCollector na thread de coleta
+  """
+
+  snapshotReady = Signal(object)
+  collectionFailed = Signal(str, str)
+
+  def __init__(self, history: MetricsHistory | None = None, source: MetricsSource | None = None,
+               process_backend: str = "psutil") -> None:
+
+    super().__init__()
+
+    # Criado aqui e usado apenas pela thread de coleta. A tabela de processos só precisa dos atributos de resumo
+    # (com os contadores das taxas); os detalhes de um processo são lidos quando a janela de detalhes é aberta
+    self.__collector = SnapshotCollector(history, process_attributes=SUMMARY_PROCESS_ATTRIBUTES, source=source,
+                                         process_backend=process_backend,
+                                         process_rates_sampler=ProcessRatesSampler(source))
+
+    # Módulos coletados desde o último avanço da fonte
+    self.__collected_modules: Set[str] = set()
+
+  @Slot(object, str)
+  def setProcessesTop(self, count: int | None, by: str) -> None:
+
+    self.__collector.setProcessesTop(count, by)
+
+  @Slot(object)
+  def setProcessAttributes(self, attributes: List[str]) -> None:
+
+    self.__collector.setProcessAttributes(attributes)
+
+  @Slot(str)
+  def collect(self, module: str) -> None:
+
+    # Cada módulo tem o seu intervalo, então o ciclo termina quando um módulo já coletado é coletado de novo: a fonte
+    # avança no ritmo do módulo mais frequente, e os módulos coletados no mesmo ciclo leem a mesma leitura da fonte
+    if not self.__collected_modules or module in self.__collected_modules:
+
+      self.__collector.advance()
+      self.__collected_modules.clear()
+
+    self.__collected_modules.add(module)
+
+    try:
+
+      snapshot = self.__collector.collect(module)
+
+    except Exception as error:
+
+      self.collectionFailed.emit(module, str(error))
+      return
+
+    self.snapshotReady.emit(snapshot)
+
+
+class BackgroundSampler(QObject):
+
+  """Coleta as informações dos módulos em uma thread separada da interface, entregando cada resultado pelo sinal snapshotReady.
+
+  Apenas uma coleta é executada por vez. Pedidos feitos durante uma coleta do mesmo módulo são descartados (a coleta em andamento já entregará dados novos), e pedidos de outros módulos ficam pendentes, um por módulo, e são coletados na ordem em que foram feitos.
+  """
+
+  snapshotReady = Signal(object)
+  collectionFailed = Signal(str, str)
+
+  # Sinais internos usados para pedir uma coleta à thread de coleta e para alterar as opções das próximas coletas. As
+  # opções são aplicadas na própria thread de coleta, entre duas coletas, e nunca no meio de uma
+  collectRequested = Signal(str)
+  processesTopRequested = Signal(object, str)
+  processAttributesRequested = Signal(object)
+
+  def __init__(self, history: MetricsHistory | None = None, parent: QObject | None = None,
+               source: MetricsSource | None = None, process_backend: str = "psutil") -> None:
+
+    """
+    Parameters
+    ----------
+    history : MetricsHistory | None
+      Histórico alimentado a cada coleta
+    parent : QObject | None
+      Objeto pai do Qt
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, lê o sistema ao vivo
+    process_backend : str
+      Leitura dos processos: "psutil" ou "procfs" (ver SnapshotCollector)
+    """
+
+    super().__init__(parent)
+
+    self.__running_module: str | None = None
+    self.__pending_modules: List[str] = list()
+
+    self.__thread = QThread()
+    self.__worker = CollectorWorker(history, source, process_backend)
+    self.__worker.moveToThread(self.__thread)
+
+    self.collectRequested.connect(self.__worker.collect)
+    self.processesTopRequested.connect(self.__worker.setProcessesTop)
+    self.processAttributesRequested.connect(self.__worker.setProcessAttributes)
+    self.__worker.snapshotReady.connect(self.__onSnapshotReady)
+    self.__worker.collectionFailed.connect(self.__onCollectionFailed)
+
+    self.__thread.start()
+
+  @property
+  def is_collecting(self) -> bool:
+
+    return self.__running_module is not None
+
+  def setProcessesTop(self, count: int | None, by: str = "cpu") -> None:
+
+    """Altera o modo Top-N das próximas coletas de processos (ver SnapshotCollector.setProcessesTop)
+    """
+
+    self.processesTopRequested.emit(count, by)
+
+  def setProcessAttributes(self, attributes: List[str]) -> None:
+
+    """Altera os atributos lidos de cada processo nas próximas coletas (ver SnapshotCollector.setProcessAttributes)
+    """
+
+    self.processAttributesRequested.emit(attributes)
+
+  def request(self, module: str) -> None:
+
+    """Pede uma coleta de um módulo
+
+    Parameters
+    ----------
+    module : str
+      Identificador do módulo (ver src.sampling.snapshot_collector)
+    """
+
+    if self.__running_module is not None:
+
+      # Um pedido do módulo em andamento é agrupado à coleta atual; os de outros módulos ficam pendentes, um por módulo
+      if module != self.__running_module and module not in self.__pending_modules:
+
+        self.__pending_modules.append(module)
+
+      return
+
+    self.__running_module = module
+    self.collectRequested.emit(module)
+
+  def stop(self, timeout_ms: int = 2000) -> None:
+
+    """Encerra a thread de coleta, esperando no máximo timeout_ms pela coleta em andamento
+    """
+
+    self.__pending_modules.clear()
+
+    self.__thread.quit()
+    self.__thread.wait(timeout_ms)
+
+  def __finish(self) -> None:
+
+    self.__running_module = None
+
+    if self.__pending_modules:
+
+      self.request(self.__pending_modules.pop(0))
+
+  @Slot(object)
+  def __onSnapshotReady(self, snapshot: ModuleSnapshot) -> None:
+
+    self.snapshotReady.emit(snapshot)
+    self.__finish()
+
+  @Slot(str, str)
+  def __onCollectionFailed(self, module: str, message: str) -> None:
+
+    self.collectionFailed.emit(module, message)
+    self.__finish()
@@ -22,6 +22,9 @@ class DetailsWindow(QWidget):
        specific_info_attributes = {
           "ID da CPU": "cpu_id",
           "Porcentagem de Uso": "used_percentage",
+          "Porcentagem de Uso (Usuário)": "user_percentage",
+          "Porcentagem de Uso (Sistema)": "system_percentage",
+          "Porcentagem em Espera de E/S": "iowait_percentage",
           "Frequência Atual": "current_frequency",
           "Frequência Mínima": "minimum_frequency",
           "Frequência Máxima": "maximum_frequency"
@@ -59,10 +62,16 @@ class DetailsWindow(QWidget):
           "Armazenamento Usado (Bytes)": "used_bytes",
           "Armazenamento Livre (Bytes)": "free_bytes",
           "Porcentagem de Uso": "used_percentage",
+          "Sem Resposta": "is_stale",
           "Operações de Escrita Realizadas": "write_operations_count",
           "Operações de Leitura Realizadas": "read_operations_count",
           "Quantidade de Bytes de Escrita": "write_bytes",
           "Quantidade de Bytes de Leitura": "read_bytes",
+          "Bytes Lidos por Segundo": "read_bytes_per_second",
+          "Bytes Escritos por Segundo": "write_bytes_per_second",
+          "Operações de Leitura por Segundo": "read_operations_per_second",
+          "Operações de Escrita por Segundo": "write_operations_per_second",
+          "Porcentagem de Ocupação do Dispositivo": "busy_percentage",
        }
     
     else:
@@ -95,6 +104,10 @@ class DetailsWindow(QWidget):
             # Converte a data de criação de um processo para o formato dd-mm-yyyy
             data_label = QLabel(convertToDatetimeFormat(data))
         
+        case "is_stale":
+            
+            data_label = QLabel("Sim" if data else "Não")
+        
         case _:
             
             data_label = QLabel(str(data).replace(".", ",") if isinstance(data, float) else str(data))
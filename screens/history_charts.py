@@ -0,0 +1,394 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRect, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QPolygonF, QImage, QColor, QPen, qRgb, QPaintEvent, QResizeEvent
+
+
+import numpy as np
+
+
+from typing import Any, Dict, List
+
+
+from src.history.metrics_history import MetricsHistory, PARTITION_FIELDS
+from src.history.downsampling import minMaxDownsample, holdLastBucket
+
+
+# Janelas de tempo dos gráficos: rótulo -> segundos
+HISTORY_SPANS: Dict[str, int] = {
+  "Último Minuto": 60,
+  "Últimos 5 Minutos": 300,
+  "Última Hora": 3600
+}
+
+# Um intervalo entre amostras maior que GAP_FACTOR vezes o intervalo típico (ex.: o módulo ficou oculto) interrompe o gráfico
+GAP_FACTOR: int = 3
+
+CHART_HEIGHT: int = 160
+TITLE_HEIGHT: int = 20
+MARGIN: int = 6
+
+BACKGROUND_COLOR = QColor("#121212")
+TEXT_COLOR = QColor("#ffffff")
+AXIS_COLOR = QColor("#5a5a5a")
+
+# Paleta do mapa de calor: 255 níveis de uso (0% a 100%), e um último nível para as faixas sem amostras
+NO_DATA_LEVEL: int = 255
+HEATMAP_COLORS: List[int] = [
+  qRgb(*(round(np.interp(level, [0, 127, 254], channel)) for channel in ([18, 230, 220], [40, 180, 40], [90, 30, 30])))
+  for level in range(0, NO_DATA_LEVEL)
+] + [BACKGROUND_COLOR.rgb()]
+
+# Cores das partições, repetidas quando há mais partições do que cores
+DISK_COLORS: List[QColor] = [QColor(color) for color in ["#4fc3f7", "#ffb74d", "#81c784", "#e57373",
+                                                         "#ba68c8", "#fff176", "#4db6ac", "#f06292"]]
+
+
+def formatBytesRate(value: float) -> str:
+
+  """Formata uma taxa em bytes por segundo com a unidade adequada (ex.: "1,5 MB/s")
+  """
+
+  for unit in ["B/s", "KB/s", "MB/s", "GB/s"]:
+
+    if value < 1024 or unit == "GB/s":
+
+      return f"{value:.1f} {unit}".replace(".", ",")
+
+    value /= 1024
+
+
+def typicalInterval(timestamps: np.ndarray) -> float:
+
+  """Intervalo típico (mediana) entre amostras consecutivas, em segundos
+  """
+
+  return float(np.median(np.diff(timestamps))) if len(timestamps) > 1 else 0.0
+
+
+def envelopePath(left: int, minimums: np.ndarray, maximums: np.ndarray, filled: np.ndarray, toY,
+                 bucket_seconds: float, max_gap: float) -> QPainterPath:
+
+  """Cria o caminho de uma série reduzida por minMaxDownsample, com um segmento do mínimo ao máximo em cada coluna
+
+  As colunas com amostras são ligadas entre si; um intervalo maior que 'max_gap' segundos interrompe o caminho.
+
+  Parameters
+  ----------
+  left : int
+    Posição x da primeira coluna
+  minimums, maximums, filled : np.ndarray
+    Resultado de minMaxDownsample para uma coluna da série
+  toY : Callable[[np.ndarray], np.ndarray]
+    Converte os valores em posições y
+  bucket_seconds : float
+    Duração de cada coluna, em segundos
+  max_gap : float
+    Maior intervalo entre amostras ligado por uma linha, em segundos
+  """
+
+  path = QPainterPath()
+  columns = np.flatnonzero(filled)
+
+  if not len(columns):
+
+    return path
+
+  # Cada coluna vira dois pontos: o mínimo e o máximo da sua faixa de tempo
+  xs = np.repeat(left + columns + 0.5, 2).tolist()
+  ys = toY(np.column_stack((minimums[columns], maximums[columns])).ravel()).tolist()
+
+  breaks = (np.flatnonzero(np.diff(columns) * bucket_seconds > max(max_gap, bucket_seconds)) + 1) * 2
+
+  for first, last in zip([0] + breaks.tolist(), breaks.tolist() + [len(xs)]):
+
+    path.addPolygon(QPolygonF([QPointF(x, y) for x, y in zip(xs[first:last], ys[first:last])]))
+
+  return path
+
+
+class HistoryChart(QWidget):
+
+  """Gráfico de uma série do histórico de métricas, desenhado a partir de um cache
+
+  O cache (uma imagem ou QPainterPaths) é refeito apenas quando há amostras novas, a janela de tempo muda ou o gráfico é redimensionado, e as amostras são reduzidas à largura do gráfico em pixels antes do desenho. Os demais desenhos (ex.: a janela exposta de novo) apenas copiam o cache, então custam pouco mesmo a 30 quadros por segundo.
+
+  As subclasses definem dataVersion, rebuildCache e paintCache.
+  """
+
+  def __init__(self, history: MetricsHistory, title: str, span_seconds: int = 300, parent: QWidget | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    history : MetricsHistory
+      Histórico lido pelo gráfico
+    title : str
+      Título exibido no canto superior esquerdo
+    span_seconds : int
+      Janela de tempo exibida, até a amostra mais recente
+    """
+
+    super().__init__(parent)
+
+    self.__history = history
+    self.__title = title
+    self.__span_seconds = span_seconds
+
+    self.__data_version: Any = None
+    self.__cache_valid = False
+
+    self.setMinimumHeight(CHART_HEIGHT)
+
+  @property
+  def history(self) -> MetricsHistory:
+
+    return self.__history
+
+  @property
+  def span_seconds(self) -> int:
+
+    return self.__span_seconds
+
+  def setSpan(self, span_seconds: int) -> None:
+
+    self.__span_seconds = span_seconds
+    self.invalidate()
+
+  def refresh(self) -> None:
+
+    """Redesenha o gráfico se o histórico tiver amostras novas
+    """
+
+    data_version = self.dataVersion()
+
+    if data_version != self.__data_version:
+
+      self.__data_version = data_version
+      self.invalidate()
+
+  def invalidate(self) -> None:
+
+    self.__cache_valid = False
+    self.update()
+
+  def plotRect(self) -> QRect:
+
+    """Área do gráfico, abaixo do título
+    """
+
+    return self.rect().adjusted(MARGIN, TITLE_HEIGHT, -MARGIN, -MARGIN)
+
+  def resizeEvent(self, event: QResizeEvent) -> None:
+
+    self.__cache_valid = False
+
+    super().resizeEvent(event)
+
+  def paintEvent(self, event: QPaintEvent) -> None:
+
+    rect = self.plotRect()
+
+    if not self.__cache_valid:
+
+      self.rebuildCache(rect)
+      self.__cache_valid = True
+
+    painter = QPainter(self)
+    painter.fillRect(self.rect(), BACKGROUND_COLOR)
+
+    painter.setPen(AXIS_COLOR)
+    painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+    painter.setPen(TEXT_COLOR)
+    painter.drawText(QRect(MARGIN, 0, self.width() - 2 * MARGIN, TITLE_HEIGHT),
+                     Qt.AlignLeft | Qt.AlignVCenter, self.__title)
+
+    self.paintCache(painter, rect)
+
+    painter.end()
+
+  def dataVersion(self) -> Any:
+
+    """Valor que muda sempre que o histórico exibido recebe amostras novas
+    """
+
+    raise NotImplementedError
+
+  def rebuildCache(self, rect: QRect) -> None:
+
+    """Refaz o cache do desenho para a área 'rect'
+    """
+
+    raise NotImplementedError
+
+  def paintCache(self, painter: QPainter, rect: QRect) -> None:
+
+    """Desenha o cache na área 'rect'
+    """
+
+    raise NotImplementedError
+
+
+class CPUHeatmapChart(HistoryChart):
+
+  """Mapa de calor do uso de cada CPU: uma linha por CPU e uma coluna por pixel da janela de tempo
+
+  Cada pixel mostra o maior uso da faixa de tempo da coluna, então os picos nunca são escondidos pela redução. Com mais CPUs do que pixels na altura, cada linha mostra o maior uso de um grupo de CPUs.
+  """
+
+  def __init__(self, history: MetricsHistory, span_seconds: int = 300, parent: QWidget | None = None) -> None:
+
+    super().__init__(history, "Uso de cada CPU (uma linha por CPU, de 0% a 100%)", span_seconds, parent)
+
+    self.__image: QImage | None = None
+
+  def dataVersion(self) -> Any:
+
+    series = self.history.cpu_usage
+
+    return None if series is None else (id(series), series.count, series.last_timestamp)
+
+  def rebuildCache(self, rect: QRect) -> None:
+
+    self.__image = None
+
+    series = self.history.cpu_usage
+
+    if series is None or not series.count or rect.width() <= 0 or rect.height() <= 0:
+
+      return
+
+    end = series.last_timestamp
+    start = end - self.span_seconds
+
+    timestamps, values = series.since(start)
+    _, maximums, filled = minMaxDownsample(timestamps, values, start, end, rect.width(), with_minimums=False)
+
+    # Com menos amostras do que pixels, cada amostra ocupa as colunas até a seguinte
+    source_columns, covered = holdLastBucket(filled, self.span_seconds / rect.width(),
+                                             GAP_FACTOR * typicalInterval(timestamps))
+    maximums = maximums[source_columns]
+
+    rows = min(series.width, rect.height())
+
+    if rows < series.width:
+
+      maximums = np.fmax.reduceat(maximums, (np.arange(0, rows) * series.width) // rows, axis=1)
+
+    levels = (np.clip(np.nan_to_num(maximums), 0, 100) * ((NO_DATA_LEVEL - 1) / 100)).astype(np.uint8)
+    levels[~covered] = NO_DATA_LEVEL
+
+    # Uma linha da imagem por CPU (ou grupo de CPUs)
+    levels = np.ascontiguousarray(levels.T)
+
+    image = QImage(levels.data, levels.shape[1], levels.shape[0], levels.shape[1], QImage.Format_Indexed8)
+    image.setColorTable(HEATMAP_COLORS)
+
+    # A cópia deixa de depender do array do NumPy
+    self.__image = image.copy()
+
+  def paintCache(self, painter: QPainter, rect: QRect) -> None:
+
+    if self.__image is not None:
+
+      painter.drawImage(rect, self.__image)
+
+
+class DiskThroughputChart(HistoryChart):
+
+  """Taxas de leitura (para cima) e de escrita (para baixo) de cada partição, com uma cor por partição
+
+  Cada pixel da janela de tempo vira um segmento vertical do menor ao maior valor da sua faixa de tempo, então os picos continuam visíveis depois da redução. Os caminhos são desenhados uma única vez em uma imagem, refeita junto com o cache.
+  """
+
+  READ_COLUMN = PARTITION_FIELDS.index("read_bytes_per_second")
+  WRITE_COLUMN = PARTITION_FIELDS.index("write_bytes_per_second")
+
+  def __init__(self, history: MetricsHistory, span_seconds: int = 300, parent: QWidget | None = None) -> None:
+
+    super().__init__(history, "Leitura (para cima) e Escrita (para baixo) de cada partição", span_seconds, parent)
+
+    self.__image: QImage | None = None
+
+  def dataVersion(self) -> Any:
+
+    return tuple((mountpoint, series.last_timestamp) for mountpoint in self.history.partition_mountpoints
+                 if (series := self.history.partitionSeries(mountpoint)) is not None)
+
+  def rebuildCache(self, rect: QRect) -> None:
+
+    self.__image = None
+
+    all_series = [(mountpoint, series) for mountpoint in self.history.partition_mountpoints
+                  if (series := self.history.partitionSeries(mountpoint)) is not None and series.count]
+
+    if not all_series or rect.width() <= 0 or rect.height() <= 0:
+
+      return
+
+    end = max(series.last_timestamp for _, series in all_series)
+    start = end - self.span_seconds
+    bucket_seconds = self.span_seconds / rect.width()
+
+    envelopes = list()
+    peak = 0.0
+
+    for mountpoint, series in all_series:
+
+      timestamps, values = series.since(start)
+      rates = values[:, [self.READ_COLUMN, self.WRITE_COLUMN]]
+
+      minimums, maximums, filled = minMaxDownsample(timestamps, rates, start, end, rect.width())
+      envelopes.append((mountpoint, minimums, maximums, filled, GAP_FACTOR * typicalInterval(timestamps)))
+
+      if filled.any():
+
+        peak = max(peak, float(np.nanmax(maximums)))
+
+    # A escala é a mesma para todas as partições, com o maior valor da janela na borda do gráfico
+    scale = (rect.height() / 2) / max(peak, 1.0)
+    middle = rect.height() / 2
+
+    pixel_ratio = self.devicePixelRatioF()
+
+    image = QImage(rect.size() * pixel_ratio, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(pixel_ratio)
+    image.fill(Qt.transparent)
+
+    painter = QPainter(image)
+
+    painter.setPen(AXIS_COLOR)
+    painter.drawLine(0, round(middle), rect.width(), round(middle))
+
+    line_height = painter.fontMetrics().height()
+
+    for position, (mountpoint, minimums, maximums, filled, max_gap) in enumerate(envelopes):
+
+      color = DISK_COLORS[position % len(DISK_COLORS)]
+
+      # Caneta cosmética (largura 0): sempre um pixel, e a mais rápida de desenhar
+      painter.setPen(QPen(color, 0))
+
+      for column, direction in [(0, -1), (1, 1)]:
+
+        painter.drawPath(envelopePath(0, minimums[:, column], maximums[:, column], filled,
+                                      lambda value: middle + direction * value * scale, bucket_seconds, max_gap))
+
+    # Legenda das partições no canto superior esquerdo do gráfico, por cima das linhas
+    for position, (mountpoint, *_) in enumerate(envelopes):
+
+      painter.setPen(DISK_COLORS[position % len(DISK_COLORS)])
+      painter.drawText(4, (position + 1) * line_height, mountpoint)
+
+    painter.setPen(TEXT_COLOR)
+    painter.drawText(QRect(4, 2, rect.width() - 8, line_height), Qt.AlignRight | Qt.AlignTop, formatBytesRate(peak))
+
+    painter.end()
+
+    self.__image = image
+
+  def paintCache(self, painter: QPainter, rect: QRect) -> None:
+
+    if self.__image is not None:
+
+      painter.drawImage(rect.topLeft(), self.__image)
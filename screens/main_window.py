@@ -1,48 +1,154 @@
 from PySide6.QtWidgets import (
-    QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QLayout, 
-    QLabel, QTableWidget, QTableWidgetItem, QMessageBox,
-    QLineEdit, QComboBox
+    QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
+    QLabel, QTableView, QAbstractItemView, QMessageBox,
+    QLineEdit, QComboBox, QTreeView, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QIcon, QCloseEvent
 
-import pandas as pd
 
+import sys
 
-import os
-from typing import Any, Dict
+
+from typing import Any, Dict, List, Tuple
 
 
 from screens.details_window import DetailsWindow
+from screens.units_table_model import UnitsTableModel
+from screens.process_tree_model import ProcessTreeModel
+from screens.background_sampler import BackgroundSampler
+from screens.refresh_scheduler import RefreshScheduler
+from screens.history_charts import HistoryChart, CPUHeatmapChart, DiskThroughputChart, HISTORY_SPANS
 
 from src.cpus.cpus_info_manager import CPUsInfoManager
 from src.processes.processes_info_manager import ProcessesInfoManager
+from src.processes.process_info import PROCESS_ATTRIBUTES, SUMMARY_PROCESS_ATTRIBUTES
 from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
 from src.battery.battery_info_manager import BatteryInfoManager
 from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
+from src.history.metrics_history import MetricsHistory
+from src.alerts.alert_engine import AlertEngine
+from src.sampling.snapshot_collector import (
+    ModuleSnapshot, CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE, BATTERY_MODULE
+)
 
 from utils.format_time import convertToTimeFormat
-from utils.format_datetime import convertToDatetimeFormat
 from utils.icons import getSystemIconPath
+from utils.style_sheets import readStyleSheet
+
+
+# Modos de coleta dos processos: rótulo -> (quantidade de processos lidos por completo, ordenação). None lê todos
+PROCESSES_TOP_MODES: Dict[str, Tuple[int | None, str]] = {
+  "Todos os Processos": (None, "cpu"),
+  "Top 50 por CPU": (50, "cpu"),
+  "Top 50 por Memória": (50, "memory"),
+  "Top 50 por E/S": (50, "io")
+}
+
+# Informações gerais de cada módulo: rótulo -> atributo do gerenciador
+GENERAL_INFOS: Dict[type, Dict[str, str]] = {
+  CPUsInfoManager: {
+    "Número de CPUs": "cpu_count",
+    "Número de Núcleos": "physical_cores_count",
+    "Mudanças de Contexto": "context_switches_count",
+    "Interrupções de Hardware": "hardware_interrupts_count",
+    "Mudanças de Contexto por Segundo": "context_switches_per_second",
+    "Interrupções de Hardware por Segundo": "hardware_interrupts_per_second"
+  },
+  ProcessesInfoManager: {
+    "Número de Processos": "processes_count",
+    "Processos no Sistema": "system_processes_count",
+    "Leituras do Sistema Evitadas": "saved_system_reads_count",
+    "Processos em Execução": "running_processes_count",
+    "Processos em Espera": "waiting_processes_count"
+  },
+  DiskPartitionsInfoManager: {
+    "Número de Partições": "disk_partitions_count",
+    "Partições sem Resposta": "stale_partitions_count"
+  },
+  BatteryInfoManager: {
+    "Porcentagem de Bateria Restante": "percentage_remaining",
+    "Tempo de Bateria Restante": "time_left",
+    "Carregador Conectado": "is_charging"
+  }
+}
+
+
+def formatGeneralInfo(attribute: str, data: Any) -> str:
+
+  """Formata uma informação geral de um módulo para exibição
+  """
+
+  match attribute:
+
+    case "percentage_remaining" | "context_switches_per_second" | "hardware_interrupts_per_second":
+
+      return f"{data:.2f}".replace(".", ",")
+
+    case "time_left":
+
+      return convertToTimeFormat(data)
+
+    case "is_charging":
+
+      return "Sim" if data else "Não"
+
+    case _:
+
+      return str(data)
+
 
 class MainWindow(QWidget):
 
   """Janela principal do aplicativo, com as informações gerais do sistema"""
   
-  def __init__(self) -> None:
+  def __init__(self, source: MetricsSource | None = None, process_backend: str = "psutil",
+               alert_engine: AlertEngine | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das métricas exibidas (o sistema ao vivo, uma gravação ou um sistema sintético). Sem ela, exibe o sistema ao vivo
+    process_backend : str
+      Leitura dos processos: "psutil" ou "procfs" (ver SnapshotCollector)
+    alert_engine : AlertEngine | None
+      Regras de alerta avaliadas a cada coleta recebida (apenas dos módulos exibidos). Sem ele, nenhum alerta é avaliado
+    """
 
     super().__init__()
 
     self.setWindowTitle("Monitoramento do Sistema")
     self.setWindowIcon(QIcon(getSystemIconPath()))
-    self.resize(700, 500)
+    self.resize(700, 650)
 
     self.selected_filter = "" # Atributo para filtro do módulo de processos
     self.current_filter_text = "" # Texto do filtro do módulo de processos
-    self.current_row_index = 0 # Atributo para pegar o indice da linha selecionada na tabela
+    self.process_tree_mode = False # Exibe os processos em árvore em vez da tabela
+    self.processes_top_mode = "Todos os Processos" # Modo de coleta dos processos (ver PROCESSES_TOP_MODES)
+
+    self.current_module = "" # Módulo exibido na janela
+
+    # Módulos cuja última coleta falhou, com a mensagem do erro. Cada falha é informada uma única vez, até o módulo voltar a
+    # ser coletado (uma coleta que falha sempre, como a da bateria em um computador sem bateria, se repete a cada ciclo)
+    self.failed_modules: Dict[str, str] = dict()
 
-    self.table_horiz_scroll_pos = 0
-    self.table_vert_scroll_pos = 0
+    self.alert_engine = alert_engine
+
+    # Histórico das métricas, alimentado pela thread de coleta
+    self.metrics_history = MetricsHistory()
+
+    # Coleta as informações em uma thread separada, para que uma coleta lenta não trave a janela
+    self.sampler = BackgroundSampler(self.metrics_history, self, source, process_backend)
+    self.sampler.snapshotReady.connect(self.showSnapshot)
+    self.sampler.collectionFailed.connect(self.showCollectionError)
+    self.sampler.setProcessAttributes(self.processAttributes())
+
+    # Agenda as atualizações de cada módulo, com intervalos que aumentam com a janela oculta ou sem foco
+    self.scheduler = RefreshScheduler(self)
+    self.scheduler.refreshRequested.connect(self.sampler.request)
+    self.scheduler.burstFinished.connect(self.uncheckBurstMode)
 
     # Layout da tela
     self.main_layout = QVBoxLayout()
@@ -50,14 +156,6 @@ class MainWindow(QWidget):
     self.setOptionsLayout()
     self.setInfoLayout()
 
-    # Adicionando um timer de atualização dos conteúdos
-    self.timer = QTimer(self)
-
-    # Iterável com objetos Connection correspondentes as conexões com o timer
-    self.timer_connections = list()
-
-    self.timer.start(10000) # Período de atualização de 5000ms (5s)
-
     self.setLayout(self.main_layout)
 
   def setOptionsLayout(self) -> None:
@@ -74,23 +172,30 @@ class MainWindow(QWidget):
     btn_disk = QPushButton("Partições de Disco")
     btn_battery = QPushButton("Bateria")
 
+    # Atualiza o módulo exibido várias vezes por segundo, por um tempo limitado
+    self.burst_mode_checkbox = QCheckBox("Atualização Rápida")
+
     # Adicionando os itens ao layout do frame de opções
     self.options_layout.addWidget(btn_cpu)
     self.options_layout.addWidget(btn_process)
     self.options_layout.addWidget(btn_disk)
     self.options_layout.addWidget(btn_battery)
+    self.options_layout.addWidget(self.burst_mode_checkbox)
 
     # Adicionando os escutadores de evento de cada botão
     btn_cpu.clicked.connect(self.loadCPUInfo)
     btn_process.clicked.connect(self.loadProcessInfo)
     btn_disk.clicked.connect(self.loadDiskInfo)
     btn_battery.clicked.connect(self.loadBatteryInfo)
+    self.burst_mode_checkbox.toggled.connect(self.setBurstMode)
 
     self.main_layout.addLayout(self.options_layout)
   
   def setGeneralInfoLayout(self, info_obj: InfoManager) -> None:
 
-    """Adiciona as informações gerais de um módulo (CPU, Processos, Partições ou Bateria), a partir do gerenciador desse módulo
+    """Exibe as informações gerais de um módulo (CPU, Processos, Partições ou Bateria), a partir do gerenciador desse módulo
+
+    Os rótulos de cada módulo são criados na primeira exibição; as atualizações seguintes apenas trocam os textos.
 
     Parameters
     ----------
@@ -98,73 +203,63 @@ class MainWindow(QWidget):
       A instância do gerenciador que deseja adicionar as informações gerais
     """
 
-    if isinstance(info_obj, CPUsInfoManager):
+    general_infos = GENERAL_INFOS.get(type(info_obj))
 
-        general_infos = {
-          "Número de CPUs": "cpu_count", 
-          "Número de Núcleos": "physical_cores_count", 
-          "Mudanças de Contexto": "context_switches_count", 
-          "Interrupções de Hardware": "hardware_interrupts_count"
-        }
-      
-    elif isinstance(info_obj, ProcessesInfoManager):
+    if general_infos is None:
 
-        general_infos = {
-          "Número de Processos": "processes_count", 
-          "Processos em Execução": "running_processes_count", 
-          "Processos em Espera": "waiting_processes_count"
-        }
-    
-    elif isinstance(info_obj, DiskPartitionsInfoManager):
+      return
 
-        general_infos = {"Número de Partições": "disk_partitions_count"}
-    
-    elif isinstance(info_obj, BatteryInfoManager):
+    page = self.general_info_pages.get(type(info_obj))
 
-        general_infos = {
-           
-          "Porcentagem de Bateria Restante": "percentage_remaining", 
-          "Tempo de Bateria Restante": "time_left", 
-          "Carregador Conectado": "is_charging"
+    if page is None:
 
-        }
-    
-    else:
-       
-       return
+      page = self.createGeneralInfoPage(type(info_obj), general_infos)
+
+    # Apenas a troca de módulo muda os rótulos visíveis
+    if page is not self.shown_general_info_page:
+
+      if self.shown_general_info_page is not None:
+
+        self.shown_general_info_page.setVisible(False)
+
+      page.setVisible(True)
+      self.shown_general_info_page = page
 
-    # Informações gerais
+    for attribute, data_label in self.general_info_labels[type(info_obj)].items():
+
+      data_label.setText(formatGeneralInfo(attribute, getattr(info_obj, attribute)))
+
+  def createGeneralInfoPage(self, manager_type: type, general_infos: Dict[str, str]) -> QWidget:
+
+    """Cria os rótulos das informações gerais de um módulo, em um container oculto dentro do layout de informações gerais
+    """
+
+    page = QWidget()
+    page_layout = QVBoxLayout(page)
+    page_layout.setContentsMargins(0, 0, 0, 0)
+
+    data_labels: Dict[str, QLabel] = dict()
 
     for label, attribute in general_infos.items():
-      
-      data = getattr(info_obj, attribute)
-      
+
       # Layout de cada rótulo e informação geral
       unique_info_layout = QHBoxLayout()
 
+      data_labels[attribute] = QLabel()
+
       unique_info_layout.addWidget(QLabel(f"{label}: "))
+      unique_info_layout.addWidget(data_labels[attribute])
 
-      match attribute:
+      page_layout.addLayout(unique_info_layout)
 
-         case "percentage_remaining":
+    page.setVisible(False)
 
-            data_label = QLabel(f"{data:.2f}".replace(".", ","))
-         
-         case "time_left":
-            
-            data_label = QLabel(convertToTimeFormat(data))
-         
-         case "is_charging":
-            
-            data_label = QLabel("Sim" if data else "Não")
+    self.general_info_layout.addWidget(page)
 
-         case _:
-            
-            data_label = QLabel(str(data))
-            
-      unique_info_layout.addWidget(data_label)
+    self.general_info_pages[manager_type] = page
+    self.general_info_labels[manager_type] = data_labels
 
-      self.general_info_layout.addLayout(unique_info_layout)
+    return page
 
   def setSpecificInfoLayout(self, info_obj: InfoManager) -> None:
 
@@ -193,7 +288,12 @@ class MainWindow(QWidget):
           "PID": "pid", 
           "Estado": "status",
           "Caminho de Execução": "executable_path",
-          "Data e Hora de Criação": "created_time"
+          "Data e Hora de Criação": "created_time",
+          "CPU (%)": "cpu_time_percentage",
+          "Leitura (Bytes/s)": "read_bytes_per_second",
+          "Escrita (Bytes/s)": "write_bytes_per_second",
+          "Operações de E/S por Segundo": "io_operations_per_second",
+          "Crescimento da Memória (Bytes/s)": "memory_growth_per_second"
           }
         units_attribute = "processes_info"
     
@@ -203,7 +303,11 @@ class MainWindow(QWidget):
            "Caminho de Montagem": "mountpoint_path",
            "Caminho do Dispositivo": "device_path",
            "Sistema de Arquivos": "file_system",
-           "Porcentagem de Uso": "used_percentage"
+           "Porcentagem de Uso": "used_percentage",
+           "Leitura (Bytes/s)": "read_bytes_per_second",
+           "Escrita (Bytes/s)": "write_bytes_per_second",
+           "Operações de E/S por Segundo": "iops",
+           "Porcentagem de Ocupação do Dispositivo": "busy_percentage"
            }
         units_attribute = "disk_partitions_info"
     
@@ -212,29 +316,16 @@ class MainWindow(QWidget):
        specific_infos = {}
        units_attribute = ""
 
-    self.specific_info_table = QTableWidget()
-    
-    self.styleSpecificInfoTable()
+    # Gerenciador usado pelo botão de detalhes
+    self.specific_info_obj = info_obj
 
     self.insertUnitsInfoOnTable(info_obj, units_attribute, specific_infos)
-    
-    btn_details = QPushButton("Detalhes")
-    
-    if self.specific_info_layout.isEmpty():
 
-      self.specific_info_layout.addWidget(self.specific_info_table)
-      self.specific_info_layout.addWidget(btn_details)
+    show_tree = self.process_tree_mode and isinstance(info_obj, ProcessesInfoManager)
 
-    btn_details.clicked.connect(lambda: self.openDetailsWindow(self.specific_info_table.currentRow(), 
-                                                               info_obj))
-
-    # Obtém o valor máximo de cada scroll bar                                                           
-    max_vert_scroll : int = self.specific_info_table.verticalScrollBar().maximum() or 1
-    max_horiz_scroll : int = self.specific_info_table.horizontalScrollBar().maximum() or 1
-    
-    # Define as posições dos scroll bars da última atualização na tela atual
-    self.specific_info_table.verticalScrollBar().setValue(self.table_vert_scroll_pos * max_vert_scroll)
-    self.specific_info_table.horizontalScrollBar().setValue(self.table_horiz_scroll_pos * max_horiz_scroll)
+    self.specific_info_table.setVisible(not show_tree)
+    self.process_tree_view.setVisible(show_tree)
+    self.btn_details.setVisible(True)
   
   def insertUnitsInfoOnTable(self, info_obj: InfoManager, units_iterable_attr: str, attrs_to_show: Dict[str, str]) -> None:
 
@@ -250,99 +341,123 @@ class MainWindow(QWidget):
       Nomes dos atributos dos dados que serão exibidos de cada unidade. As chaves correspondem aos nomes dos rótulos da tabela.
     """
 
-    # Adicionando os dados exibidos em uma lista contendo listas (estrutura bidimensional) para passá-los ao DataFrame
-    data = list()
+    # As colunas de outro módulo começam sem ordenação
+    if list(attrs_to_show.keys()) != self.units_table_model.labels:
 
-    units = getattr(info_obj, units_iterable_attr)
+      self.specific_info_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+
+    # O modelo guarda apenas a referência às unidades; as células são formatadas quando ficam visíveis.
+    # Com as mesmas colunas, o modelo não é reiniciado, então a seleção, os scrolls e a ordenação são mantidos
+    self.units_table_model.setUnits(getattr(info_obj, units_iterable_attr), attrs_to_show)
 
-    for unit in units:
-       
-      row_data = list()
-
-      for attribute in attrs_to_show.values():
-          
-          match attribute:
-             
-             case "created_time":
-                
-                row_data.append(convertToDatetimeFormat(getattr(unit, attribute)))
-
-             case _:
-                
-                row_data.append(getattr(unit, attribute))
-        
-      data.append(row_data)
-    
-    df = pd.DataFrame(data, columns=list(attrs_to_show.keys()))
-
-    self.specific_info_table.setRowCount(df.shape[0])
-    self.specific_info_table.setColumnCount(df.shape[1])
-    self.specific_info_table.setHorizontalHeaderLabels(df.columns)
-
-    self.specific_info_table.setSelectionBehavior(QTableWidget.SelectRows) # Deixa as linhas inteiras selecionáveis
-    self.specific_info_table.setSelectionMode(QTableWidget.SingleSelection) # Seleciona uma linha de cada vez
-
-    for i in range(0, df.shape[0]):
-       for j in range(0, df.shape[1]):
-          
-          table_item = QTableWidgetItem(str(df.iloc[i, j]).replace('.', ',') if isinstance(df.iloc[i, j], float) else str(df.iloc[i, j]))
-          table_item.setFlags(table_item.flags() & ~Qt.ItemIsEditable)
-          
-          self.specific_info_table.setItem(i, j, table_item)
-    
-    for j in range(0, df.shape[1]):
-       
-       self.specific_info_table.setColumnWidth(j, 175)
-  
   def styleSpecificInfoTable(self) -> None:
 
     """Estiliza a tabela de informações especificas sobre as unidades de cada módulo (CPUs, Processos e Partições)
     """
 
-    table_style_content: str = ""
+    self.specific_info_table.setStyleSheet(readStyleSheet("table.txt"))
 
-    TABLE_STYLE_PATH: str = os.path.join(
-       os.path.dirname(os.path.dirname(__file__)), 
-       "styles", 
-       "table.txt"
-       )
+  def setFilterLayout(self) -> None:
 
-    # Estilização da tabela
-    with open(TABLE_STYLE_PATH, "r") as table_style_stream:
-       
-      table_style_content = table_style_stream.read()
-  
-    self.specific_info_table.setStyleSheet(table_style_content)
-  
-  def setFilterLayout(self, proc_info_manager: ProcessesInfoManager) -> None:
-     
-     """Adiciona os widgets de filtro de unidades (Processos apenas)
+     """Cria os widgets de filtro de unidades (Processos apenas), exibidos apenas no módulo de processos
+     """
+
+     filters = ["Nome", "PID", "Estado"]
+
+     self.filter_by_combobox = QComboBox()
+     self.filter_by_combobox.addItems(filters)
+
+     self.filter_value_input = QLineEdit()
+
+     # Usa sempre o gerenciador da última coleta exibida
+     self.filter_value_input.textEdited.connect(lambda: self.filterProcessesTable(
+         self.specific_info_obj,
+         filters[self.filter_by_combobox.currentIndex()],
+         self.filter_value_input.text()
+     ))
+
+     self.top_mode_combobox = QComboBox()
+     self.top_mode_combobox.addItems(list(PROCESSES_TOP_MODES.keys()))
+     self.top_mode_combobox.setCurrentText(self.processes_top_mode)
+     self.top_mode_combobox.currentTextChanged.connect(self.setProcessesTopMode)
+
+     self.tree_mode_checkbox = QCheckBox("Exibir em Árvore")
+     self.tree_mode_checkbox.setChecked(self.process_tree_mode)
+     self.tree_mode_checkbox.toggled.connect(self.setProcessTreeMode)
+
+     self.filter_layout.addWidget(self.filter_by_combobox)
+     self.filter_layout.addWidget(self.filter_value_input)
+     self.filter_layout.addWidget(self.top_mode_combobox)
+     self.filter_layout.addWidget(self.tree_mode_checkbox)
+
+     # A árvore sempre exibe todos os processos
+     self.filter_by_combobox.setEnabled(not self.process_tree_mode)
+     self.filter_value_input.setEnabled(not self.process_tree_mode)
+
+  def setProcessesTopMode(self, mode: str) -> None:
+
+     """Altera o modo de coleta dos processos e pede uma nova coleta
 
      Parameters
      ----------
-     proc_info_manager : ProcessesInfoManager
-      Gerenciador de informações dos processos
+     mode : str
+      Rótulo do modo (chave de PROCESSES_TOP_MODES)
+     """
+
+     self.processes_top_mode = mode
+
+     self.sampler.setProcessesTop(*PROCESSES_TOP_MODES[mode])
+     self.sampler.request(PROCESSES_MODULE)
+
+  def processAttributes(self) -> List[str]:
+
+    """Atributos lidos de cada processo na coleta: todos com a árvore de processos visível; senão, os da tabela e os de detalhe usados pelas regras de alerta
+    """
+
+    if self.process_tree_mode:
+
+      return PROCESS_ATTRIBUTES
+
+    # Sem os atributos das regras na coleta, as regras sobre memória, threads e E/S nunca seriam satisfeitas
+    rule_attributes = self.alert_engine.process_detail_attributes if self.alert_engine is not None else list()
+
+    return [attribute for attribute in PROCESS_ATTRIBUTES
+            if attribute in SUMMARY_PROCESS_ATTRIBUTES or attribute in rule_attributes]
 
+  def setProcessTreeMode(self, enabled: bool) -> None:
+
+     """Alterna a exibição dos processos entre a tabela e a árvore de processos
+
+     Parameters
+     ----------
+     enabled : bool
+      Se verdadeiro, exibe a árvore (sem filtro)
      """
 
-     # Verifica se o layout de filtro está vazio
-     if self.filter_layout.isEmpty():
+     self.process_tree_mode = enabled
 
-      filters = ["Nome", "PID", "Estado"]
+     # A árvore soma CPU, memória, threads e E/S de todos os processos, então os detalhes passam a vir na coleta
+     self.sampler.setProcessAttributes(self.processAttributes())
 
-      self.filter_by_combobox = QComboBox()
-      self.filter_by_combobox.addItems(filters)
+     if enabled:
 
-      self.filter_value_input = QLineEdit()
-     
-      self.filter_value_input.textEdited.connect(lambda: self.filterProcessesTable(
-          proc_info_manager,
-          filters[self.filter_by_combobox.currentIndex()],
-          self.filter_value_input.text()
-      ))
-
-      self.filter_layout.addWidget(self.filter_by_combobox)
-      self.filter_layout.addWidget(self.filter_value_input)
+        self.sampler.request(PROCESSES_MODULE)
+
+     self.filter_by_combobox.setEnabled(not enabled)
+     self.filter_value_input.setEnabled(not enabled)
+
+     if enabled:
+
+        self.current_filter_text = ""
+        self.filter_value_input.setText("")
+
+        if isinstance(self.specific_info_obj, ProcessesInfoManager):
+
+          self.specific_info_obj.filterBy(self.filter_by_combobox.currentText(), "")
+
+     if isinstance(self.specific_info_obj, ProcessesInfoManager):
+
+        self.setSpecificInfoLayout(self.specific_info_obj)
   
   def filterProcessesTable(self, proc_info_manager: ProcessesInfoManager, 
                            by: str, 
@@ -365,8 +480,6 @@ class MainWindow(QWidget):
 
      proc_info_manager.filterBy(by, value)
 
-     self.clearLayout(self.specific_info_layout)
-
      self.setSpecificInfoLayout(proc_info_manager)
   
   def openDetailsWindow(self, selected_row: int, info_obj: InfoManager) -> None:
@@ -390,6 +503,25 @@ class MainWindow(QWidget):
 
     self.details_window.show()
 
+  def openSelectedDetailsWindow(self) -> None:
+
+    """Abre a janela de detalhes da unidade selecionada na tabela (ou na árvore de processos) do módulo atual
+    """
+
+    if self.process_tree_view.isVisible():
+
+      # Sem filtro, a posição do processo na coleta é a mesma linha da tabela
+      pid = self.process_tree_model.pidOf(self.process_tree_view.currentIndex())
+      position = self.specific_info_obj.index.positionOf(pid) if pid is not None else None
+
+      self.openDetailsWindow(position if position is not None else -1, self.specific_info_obj)
+      return
+
+    row = self.specific_info_table.currentIndex().row()
+
+    # A tabela pode estar ordenada, então a linha é convertida na posição da unidade
+    self.openDetailsWindow(self.units_table_model.positionOf(row) if row != -1 else -1, self.specific_info_obj)
+
   def setInfoLayout(self) -> None:
 
     """Define o layout do container de informações. 
@@ -401,44 +533,125 @@ class MainWindow(QWidget):
 
     self.info_layout = QVBoxLayout()
 
+    # Os widgets de todos os layouts são criados uma única vez; as atualizações apenas trocam os textos e os dados
     self.general_info_layout = QVBoxLayout()
 
-    self.filter_layout = QHBoxLayout()
+    # Rótulos das informações gerais de cada módulo (ver setGeneralInfoLayout)
+    self.general_info_pages: Dict[type, QWidget] = dict()
+    self.general_info_labels: Dict[type, Dict[str, QLabel]] = dict()
+    self.shown_general_info_page: QWidget | None = None
+
+    self.filter_widget = QWidget()
+    self.filter_widget.setVisible(False)
+
+    self.filter_layout = QHBoxLayout(self.filter_widget)
+    self.filter_layout.setContentsMargins(0, 0, 0, 0)
+
+    self.setFilterLayout()
 
     self.specific_info_layout = QVBoxLayout()
 
-    self.specific_info_table = QTableWidget()
+    # A tabela e o botão de detalhes são criados uma única vez; cada atualização apenas troca os dados do modelo
+    self.units_table_model = UnitsTableModel(self)
+    self.specific_info_obj = None
+
+    self.specific_info_table = QTableView()
+    self.specific_info_table.setModel(self.units_table_model)
+    self.specific_info_table.setSelectionBehavior(QAbstractItemView.SelectRows) # Deixa as linhas inteiras selecionáveis
+    self.specific_info_table.setSelectionMode(QAbstractItemView.SingleSelection) # Seleciona uma linha de cada vez
+    self.specific_info_table.horizontalHeader().setDefaultSectionSize(175)
+
+    # Um clique no cabeçalho ordena a tabela pela coluna (ex.: os processos pela taxa de escrita). Sem indicador, a tabela
+    # começa na ordem da coleta
+    self.specific_info_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+    self.specific_info_table.setSortingEnabled(True)
+
+    self.styleSpecificInfoTable()
+
+    # Árvore de processos, exibida no lugar da tabela no módulo de processos. Os filhos são carregados ao expandir cada item
+    self.process_tree_model = ProcessTreeModel(self)
+
+    self.process_tree_view = QTreeView()
+    self.process_tree_view.setModel(self.process_tree_model)
+    self.process_tree_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    self.process_tree_view.setSelectionMode(QAbstractItemView.SingleSelection)
+    self.process_tree_view.header().setDefaultSectionSize(175)
+    self.process_tree_view.setVisible(False)
+
+    self.btn_details = QPushButton("Detalhes")
+    self.btn_details.clicked.connect(self.openSelectedDetailsWindow)
+    self.btn_details.setVisible(False)
+
+    # Falha da última coleta do módulo exibido (ver showCollectionError)
+    self.collection_error_label = QLabel()
+    self.collection_error_label.setWordWrap(True)
+    self.collection_error_label.setVisible(False)
 
     self.specific_info_layout.addWidget(self.specific_info_table)
+    self.specific_info_layout.addWidget(self.process_tree_view)
+    self.specific_info_layout.addWidget(self.btn_details)
+    self.specific_info_layout.addWidget(self.collection_error_label)
+
+    self.setChartsLayout()
 
     self.info_layout.addLayout(self.general_info_layout)
-    self.info_layout.addLayout(self.filter_layout)
+    self.info_layout.addWidget(self.filter_widget)
+    self.info_layout.addWidget(self.charts_widget)
     self.info_layout.addLayout(self.specific_info_layout)
 
     self.main_layout.addLayout(self.info_layout)
 
-  def clearLayout(self, layout: QLayout) -> None:
+  def setChartsLayout(self) -> None:
 
+    """Cria os gráficos do histórico (mapa de calor das CPUs e taxas das partições) e a escolha da janela de tempo, exibidos apenas nos módulos de CPU e de Partições
     """
-    Remove os widgets de um determinado layout
+
+    self.charts_widget = QWidget()
+    self.charts_widget.setVisible(False)
+
+    charts_layout = QVBoxLayout(self.charts_widget)
+    charts_layout.setContentsMargins(0, 0, 0, 0)
+
+    self.chart_span_combobox = QComboBox()
+    self.chart_span_combobox.addItems(list(HISTORY_SPANS.keys()))
+    self.chart_span_combobox.setCurrentText("Últimos 5 Minutos")
+    self.chart_span_combobox.currentTextChanged.connect(self.setChartsSpan)
+
+    # Os gráficos leem direto do histórico alimentado pela thread de coleta
+    self.cpu_heatmap_chart = CPUHeatmapChart(self.metrics_history, HISTORY_SPANS["Últimos 5 Minutos"])
+    self.disk_throughput_chart = DiskThroughputChart(self.metrics_history, HISTORY_SPANS["Últimos 5 Minutos"])
+
+    charts_layout.addWidget(self.chart_span_combobox)
+    charts_layout.addWidget(self.cpu_heatmap_chart)
+    charts_layout.addWidget(self.disk_throughput_chart)
+
+  def setChartsSpan(self, span: str) -> None:
+
+    """Altera a janela de tempo dos gráficos
 
     Parameters
     ----------
-    layout : QLayout
-      Layout cujo widgets serão removidos
+    span : str
+      Rótulo da janela (chave de HISTORY_SPANS)
     """
 
-    while layout.count():
-        
-        child = layout.takeAt(0)
+    self.cpu_heatmap_chart.setSpan(HISTORY_SPANS[span])
+    self.disk_throughput_chart.setSpan(HISTORY_SPANS[span])
 
-        if child.widget():
-            
-            child.widget().deleteLater()
+  def showHistoryChart(self, chart: HistoryChart | None) -> None:
 
-        elif child.layout():
-            
-            self.clearLayout(child.layout())
+    """Exibe apenas o gráfico do módulo atual (ou nenhum), redesenhando-o se o histórico tiver amostras novas
+    """
+
+    self.charts_widget.setVisible(chart is not None)
+
+    for module_chart in [self.cpu_heatmap_chart, self.disk_throughput_chart]:
+
+      module_chart.setVisible(module_chart is chart)
+
+    if chart is not None:
+
+      chart.refresh()
 
   def loadCPUInfo(self) -> None:
 
@@ -446,141 +659,230 @@ class MainWindow(QWidget):
     Carrega as informações da CPU
     """
 
-    if not self.specific_info_layout.isEmpty():
-
-      self.current_row_index = self.specific_info_table.currentRow()
+    self.loadModule(CPU_MODULE)
+  
+  def loadProcessInfo(self) -> None:
 
-      # Pega as posições atuais de cada scroll da tabela
-      self.table_vert_scroll_pos : int = self.specific_info_table.verticalScrollBar().value()
-      self.table_horiz_scroll_pos : int = self.specific_info_table.horizontalScrollBar().value()
+    """
+    Carrega as informações dos Processos
+    """
 
-    # Remove as conexões do timer para atualizar apenas a janela atual
-    for timer_connection in self.timer_connections:
-       
-       self.timer.timeout.disconnect(timer_connection)
-    
-    # Limpa todas as conexões na lista de conexões
-    self.timer_connections.clear()
-    
-    # Insere uma conexão correspondente ao módulo atual
-    conn_cpu = self.timer.timeout.connect(self.loadCPUInfo)
-    self.timer_connections.append(conn_cpu)
-       
-    cim = CPUsInfoManager()
+    self.loadModule(PROCESSES_MODULE)
 
-    self.clearLayout(self.general_info_layout)
-    self.clearLayout(self.filter_layout)
-    self.clearLayout(self.specific_info_layout)
+  def loadDiskInfo(self) -> None:
 
-    self.setGeneralInfoLayout(cim)
-    self.setSpecificInfoLayout(cim)
+    """
+    Carrega as informações das Partições de Disco
+    """
 
-    # Seleciona a linha selecionada da última atualização
-    self.specific_info_table.selectRow(self.current_row_index)
+    self.loadModule(DISKS_MODULE)
   
-  def loadProcessInfo(self) -> None:
+  def loadBatteryInfo(self) -> None:
 
     """
-    Carrega as informações dos Processos
+    Carrega as informações da bateria
     """
 
-    if not self.specific_info_layout.isEmpty():
+    self.loadModule(BATTERY_MODULE)
 
-      self.current_row_index = self.specific_info_table.currentRow()
+  def loadModule(self, module: str) -> None:
 
-      # Pega as posições atuais de cada scroll da tabela
-      self.table_vert_scroll_pos : int = self.specific_info_table.verticalScrollBar().value()
-      self.table_horiz_scroll_pos : int = self.specific_info_table.horizontalScrollBar().value()
+    """
+    Define o módulo exibido na janela e pede uma coleta das suas informações à thread de coleta
 
-    # Remove as conexões do timer anteriores do timer
-    for timer_connection in self.timer_connections:
-       
-       self.timer.timeout.disconnect(timer_connection)
-    
-    # Limpa a lista de conexões
-    self.timer_connections.clear()
-    
-    # Cria uma nova conexão e a adiciona à lista
-    conn_proc = self.timer.timeout.connect(self.loadProcessInfo)
-    self.timer_connections.append(conn_proc)
+    Parameters
+    ----------
+    module : str
+      Identificador do módulo (ver src.sampling.snapshot_collector)
+    """
+
+    self.current_module = module
+
+    self.showCollectionErrorLabel()
+
+    # Apenas o módulo exibido é atualizado; a troca de módulo encerra o modo rápido e pede uma coleta imediata
+    self.scheduler.setActiveModules([module])
+
+  def setBurstMode(self, enabled: bool) -> None:
+
+    """
+    Liga ou desliga a atualização rápida do módulo exibido
+    """
+
+    if not enabled:
+
+      self.scheduler.stopBurst()
+
+    elif self.current_module:
+
+      self.scheduler.startBurst(self.current_module)
+
+    else:
+
+      self.uncheckBurstMode()
+
+  @Slot()
+  def uncheckBurstMode(self) -> None:
+
+    """
+    Desmarca a atualização rápida quando ela termina sozinha (tempo esgotado, troca de módulo ou janela oculta)
+    """
+
+    self.burst_mode_checkbox.blockSignals(True)
+    self.burst_mode_checkbox.setChecked(False)
+    self.burst_mode_checkbox.blockSignals(False)
+
+  def showSnapshot(self, snapshot: ModuleSnapshot) -> None:
+
+    """
+    Exibe o resultado de uma coleta, se ele ainda corresponder ao módulo exibido na janela
+
+    Parameters
+    ----------
+    snapshot : ModuleSnapshot
+      Resultado de uma coleta feita pela thread de coleta
+    """
+
+    self.scheduler.collectionFinished(snapshot.module, snapshot.duration)
+
+    if self.failed_modules.pop(snapshot.module, None) is not None:
+
+      self.showCollectionErrorLabel()
+
+    # Os alertas valem para todas as coletas, mesmo as de um módulo que deixou de ser exibido
+    if self.alert_engine is not None:
+
+      self.alert_engine.evaluate(snapshot)
+
+    if snapshot.module != self.current_module:
+
+      return
+
+    match snapshot.module:
+
+      case "cpu":
+
+        self.showCPUInfo(snapshot.info_manager)
+
+      case "processes":
+
+        self.showProcessInfo(snapshot.info_manager)
+
+      case "disks":
+
+        self.showDiskInfo(snapshot.info_manager)
+
+      case "battery":
+
+        self.showBatteryInfo(snapshot.info_manager)
+
+  def showCollectionError(self, module: str, message: str) -> None:
+
+    """
+    Informa a falha de uma coleta, sem interromper as próximas atualizações. As falhas seguidas de um mesmo módulo são informadas uma única vez
+    """
+
+    self.scheduler.collectionFinished(module, None)
+
+    if module not in self.failed_modules:
+
+      print(f"Não foi possível coletar as informações do módulo '{module}': {message}", file=sys.stderr)
+
+    self.failed_modules[module] = message
+
+    self.showCollectionErrorLabel()
+
+  def showCollectionErrorLabel(self) -> None:
+
+    """
+    Exibe a falha da última coleta do módulo exibido, ou esconde o aviso se ela não falhou
+    """
+
+    message = self.failed_modules.get(self.current_module)
+
+    if message is not None:
 
-    pim = ProcessesInfoManager()
+      self.collection_error_label.setText(f"Não foi possível coletar as informações deste módulo: {message}")
+
+    self.collection_error_label.setVisible(message is not None)
+
+  def showCPUInfo(self, cim: CPUsInfoManager) -> None:
+
+    """
+    Exibe as informações da CPU
+    """
+
+    self.filter_widget.setVisible(False)
+    self.showHistoryChart(self.cpu_heatmap_chart)
+
+    self.setGeneralInfoLayout(cim)
+    self.setSpecificInfoLayout(cim)
+
+  def showProcessInfo(self, pim: ProcessesInfoManager) -> None:
+
+    """
+    Exibe as informações dos Processos
+    """
 
     if self.current_filter_text:
 
       pim.filterBy(self.selected_filter, self.current_filter_text)
 
-    # Limpa os layouts
-    self.clearLayout(self.general_info_layout)
-    self.clearLayout(self.specific_info_layout)
+    # A árvore só é atualizada quando visível
+    if self.process_tree_mode:
+
+      self.process_tree_model.updateProcesses(pim.snapshot)
+
+    self.showHistoryChart(None)
 
-    # Carrega os layouts
     self.setGeneralInfoLayout(pim)
-    self.setFilterLayout(pim)
     self.setSpecificInfoLayout(pim)
 
-    self.filter_value_input.setFocus()
+    # O foco vai para o filtro apenas ao entrar no módulo, e não a cada atualização
+    if self.filter_widget.isHidden():
 
-    # Define os resultados anteriores aos widgets de filtro
-    self.filter_by_combobox.setCurrentText(self.selected_filter) # Opção do combobox
-    self.filter_value_input.setText(self.current_filter_text) # Texto no lineedit
-    self.specific_info_table.selectRow(self.current_row_index) # linha selecionada
+      self.filter_widget.setVisible(True)
+      self.filter_value_input.setFocus()
 
-  def loadDiskInfo(self) -> None:
+  def showDiskInfo(self, dpim: DiskPartitionsInfoManager) -> None:
 
     """
-    Carrega as informações das Partições de Disco
+    Exibe as informações das Partições de Disco
     """
 
-    if not self.specific_info_layout.isEmpty():
+    self.filter_widget.setVisible(False)
+    self.showHistoryChart(self.disk_throughput_chart)
 
-      self.current_row_index = self.specific_info_table.currentRow()
+    self.setGeneralInfoLayout(dpim)
+    self.setSpecificInfoLayout(dpim)
 
-      # Pega as posições atuais de cada scroll da tabela
-      self.table_vert_scroll_pos : int = self.specific_info_table.verticalScrollBar().value()
-      self.table_horiz_scroll_pos : int = self.specific_info_table.horizontalScrollBar().value()
+  def showBatteryInfo(self, bim: BatteryInfoManager) -> None:
 
-    # Remove as conexões do timer para atualizar apenas a janela atual
-    for timer_connection in self.timer_connections:
-       
-       self.timer.timeout.disconnect(timer_connection)
-    
-    self.timer_connections.clear()
-    
-    conn_disk = self.timer.timeout.connect(self.loadDiskInfo)
-    self.timer_connections.append(conn_disk)
+    """
+    Exibe as informações da bateria
+    """
 
-    dpim = DiskPartitionsInfoManager()
+    self.filter_widget.setVisible(False)
+    self.showHistoryChart(None)
 
-    self.clearLayout(self.general_info_layout)
-    self.clearLayout(self.filter_layout)
-    self.clearLayout(self.specific_info_layout)
+    # A bateria não possui unidades para exibir na tabela
+    self.specific_info_table.setVisible(False)
+    self.process_tree_view.setVisible(False)
+    self.btn_details.setVisible(False)
 
-    self.setGeneralInfoLayout(dpim)
-    self.setSpecificInfoLayout(dpim)
+    self.setGeneralInfoLayout(bim)
 
-    self.specific_info_table.selectRow(self.current_row_index)
-  
-  def loadBatteryInfo(self) -> None:
+  def closeEvent(self, event: QCloseEvent) -> None:
 
     """
-    Carrega as informações da bateria
+    Encerra a thread de coleta junto com a janela
     """
 
-    # Remove as conexões do timer para atualizar apenas a janela atual
-    for timer_connection in self.timer_connections:
-       
-       self.timer.timeout.disconnect(timer_connection)
-    
-    self.timer_connections.clear()
-    
-    conn_battery = self.timer.timeout.connect(self.loadBatteryInfo)
-    self.timer_connections.append(conn_battery)
+    self.scheduler.stop()
+    self.sampler.stop()
 
-    bim = BatteryInfoManager()
+    if self.alert_engine is not None:
 
-    self.clearLayout(self.general_info_layout)
-    self.clearLayout(self.filter_layout)
-    self.clearLayout(self.specific_info_layout)
+      self.alert_engine.close()
 
-    self.setGeneralInfoLayout(bim)
\ No newline at end of file
+    super().closeEvent(event)
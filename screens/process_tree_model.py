@@ -0,0 +1,147 @@
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex, QPersistentModelIndex
+
+
+from typing import Any, Callable, Dict, List
+
+
+from src.processes.process_info import ProcessInfo
+from src.processes.process_tree import ProcessTree, SubtreeTotals
+from src.processes.processes_snapshot import ProcessesSnapshot
+
+from screens.units_table_model import formatValue
+
+
+def formatTotal(value: Any) -> str:
+
+  """Formata um total de subárvore, limitando as somas de números reais a duas casas decimais
+  """
+
+  return f"{value:.2f}".replace(".", ",") if isinstance(value, float) else str(value)
+
+
+# Colunas da árvore: rótulo -> função que lê o valor de um processo e dos totais da sua subárvore
+TREE_COLUMNS: Dict[str, Callable[[ProcessInfo, SubtreeTotals], str]] = {
+  "Nome": lambda process_info, totals: formatValue(process_info.name),
+  "PID": lambda process_info, totals: formatValue(process_info.pid),
+  "Porcentagem de CPU": lambda process_info, totals: formatTotal(process_info.cpu_used_percentage),
+  "Porcentagem de CPU (Árvore)": lambda process_info, totals: formatTotal(totals.cpu_used_percentage),
+  "Porcentagem de Memória (Árvore)": lambda process_info, totals: formatTotal(totals.memory_used_percent),
+  "Threads (Árvore)": lambda process_info, totals: formatTotal(totals.threads_used_count),
+  "Bytes Lidos (Árvore)": lambda process_info, totals: formatTotal(totals.read_bytes_number),
+  "Bytes Escritos (Árvore)": lambda process_info, totals: formatTotal(totals.write_bytes_number)
+}
+
+
+class ProcessTreeModel(QAbstractItemModel):
+
+  """Modelo da árvore de processos, com os totais de cada subárvore.
+
+  Cada índice guarda o pid do seu processo, e os filhos de um processo só são consultados quando a view expande o seu item. A cada coleta a árvore é atualizada no lugar, mantendo os itens expandidos e a seleção.
+  """
+
+  def __init__(self, parent=None) -> None:
+
+    super().__init__(parent)
+
+    self.__tree = ProcessTree()
+    self.__labels: List[str] = list(TREE_COLUMNS.keys())
+    self.__columns: List[Callable[[ProcessInfo, SubtreeTotals], str]] = list(TREE_COLUMNS.values())
+
+  @property
+  def tree(self) -> ProcessTree:
+
+    return self.__tree
+
+  def updateProcesses(self, processes_info: ProcessesSnapshot) -> None:
+
+    """Atualiza a árvore com os processos de uma nova coleta
+
+    Parameters
+    ----------
+    processes_info : ProcessesSnapshot
+      Todos os processos da coleta (sem filtro)
+    """
+
+    self.layoutAboutToBeChanged.emit()
+
+    # Os índices guardados pela view (itens expandidos, seleção) são remapeados pelo pid
+    previous_indexes = self.persistentIndexList()
+    previous_pids = [(index.internalId(), index.column()) for index in previous_indexes]
+
+    self.__tree.update(processes_info)
+
+    self.changePersistentIndexList(previous_indexes, [self.indexOfPid(pid, column) for pid, column in previous_pids])
+
+    self.layoutChanged.emit()
+
+  def indexOfPid(self, pid: int, column: int = 0) -> QModelIndex:
+
+    """Índice do processo de um pid, ou um índice inválido se ele não estiver na árvore
+    """
+
+    if not self.__tree.hasProcess(pid):
+
+      return QModelIndex()
+
+    return self.createIndex(self.__tree.rowOf(pid), column, pid)
+
+  def pidOf(self, index: QModelIndex | QPersistentModelIndex) -> int | None:
+
+    return index.internalId() if index.isValid() else None
+
+  def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+
+    if not self.hasIndex(row, column, parent):
+
+      return QModelIndex()
+
+    return self.createIndex(row, column, self.__childrenOf(parent)[row])
+
+  def parent(self, index: QModelIndex | QPersistentModelIndex) -> QModelIndex:
+
+    if not index.isValid():
+
+      return QModelIndex()
+
+    parent_pid = self.__tree.parentOf(index.internalId())
+
+    if parent_pid is None:
+
+      return QModelIndex()
+
+    return self.createIndex(self.__tree.rowOf(parent_pid), 0, parent_pid)
+
+  def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+
+    # Apenas a primeira coluna possui filhos
+    if parent.column() > 0:
+
+      return 0
+
+    return len(self.__childrenOf(parent))
+
+  def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+
+    return len(self.__columns)
+
+  def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole) -> Any:
+
+    if role != Qt.DisplayRole or not index.isValid():
+
+      return None
+
+    pid = index.internalId()
+
+    return self.__columns[index.column()](self.__tree.processOf(pid), self.__tree.totalsOf(pid))
+
+  def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+
+    if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+
+      return None
+
+    return self.__labels[section]
+
+  def __childrenOf(self, parent: QModelIndex | QPersistentModelIndex) -> List[int]:
+
+    return self.__tree.childrenOf(parent.internalId()) if parent.isValid() else self.__tree.roots
@@ -0,0 +1,266 @@
+from PySide6.QtCore import QObject, QTimer, QEvent, Signal, Slot
+from PySide6.QtWidgets import QWidget
+
+
+import time
+from typing import Dict, List
+
+
+from src.sampling.snapshot_collector import CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE, BATTERY_MODULE
+
+
+# Intervalo de atualização de cada módulo, em milissegundos, com a janela visível e em foco
+MODULE_INTERVALS: Dict[str, int] = {
+  CPU_MODULE: 1000,
+  PROCESSES_MODULE: 3000,
+  DISKS_MODULE: 10000,
+  BATTERY_MODULE: 30000
+}
+
+# Multiplicadores do intervalo quando a janela está sem foco e quando está oculta (minimizada ou fechada)
+UNFOCUSED_BACKOFF: int = 3
+HIDDEN_BACKOFF: int = 10
+
+# Fração do intervalo que uma coleta pode levar. Acima disso, o intervalo dobra (até MAX_OVERRUN_BACKOFF vezes),
+# e volta a cair pela metade a cada coleta dentro do orçamento
+COLLECTION_BUDGET: float = 0.25
+MAX_OVERRUN_BACKOFF: int = 8
+
+# Modo rápido: intervalo e duração padrão, em milissegundos
+BURST_INTERVAL: int = 250
+BURST_DURATION: int = 60000
+
+
+class RefreshScheduler(QObject):
+
+  """Agenda as atualizações de cada módulo, com um intervalo independente por módulo
+
+  Os intervalos aumentam quando a janela fica sem foco ou oculta, e quando as coletas de um módulo passam do orçamento (uma fração do intervalo). O modo rápido atualiza um módulo várias vezes por segundo por um tempo limitado, enquanto o usuário acompanha a tela; ele é interrompido quando a janela fica oculta.
+
+  Cada módulo é pedido de novo um intervalo depois do pedido anterior, ou assim que a coleta anterior termina se ela atrasou, então as coletas de um mesmo módulo nunca se acumulam.
+  """
+
+  refreshRequested = Signal(str)
+  burstFinished = Signal()
+
+  def __init__(self, window: QWidget, intervals: Dict[str, int] | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    window : QWidget
+      Janela cuja visibilidade e foco controlam os intervalos (também é o objeto pai do Qt)
+    intervals : Dict[str, int] | None
+      Intervalo de cada módulo, em milissegundos. Sem ele, usa MODULE_INTERVALS
+    """
+
+    super().__init__(window)
+
+    self.__window = window
+    self.__intervals = dict(intervals if intervals is not None else MODULE_INTERVALS)
+
+    self.__timers: Dict[str, QTimer] = dict()
+    self.__requested_at: Dict[str, float] = dict()
+    self.__overrun_backoff: Dict[str, int] = {module: 1 for module in self.__intervals}
+
+    # Módulo e intervalo do modo rápido, e o fim do modo rápido
+    self.__burst_module: str | None = None
+    self.__burst_interval = BURST_INTERVAL
+    self.__burst_timer = QTimer(self)
+    self.__burst_timer.setSingleShot(True)
+    self.__burst_timer.timeout.connect(self.stopBurst)
+
+    window.installEventFilter(self)
+
+  @property
+  def active_modules(self) -> List[str]:
+
+    return list(self.__timers.keys())
+
+  @property
+  def burst_module(self) -> str | None:
+
+    """
+    Módulo no modo rápido, ou None fora dele
+    """
+
+    return self.__burst_module
+
+  def setActiveModules(self, modules: List[str]) -> None:
+
+    """Define os módulos atualizados. Os módulos novos são pedidos imediatamente, e o modo rápido de um módulo removido é interrompido
+    """
+
+    for module in [module for module in self.__timers if module not in modules]:
+
+      self.__timers.pop(module).stop()
+
+      if module == self.__burst_module:
+
+        self.stopBurst()
+
+    for module in modules:
+
+      if module not in self.__timers:
+
+        if module not in self.__intervals:
+
+          raise ValueError(f"O módulo '{module}' não existe!")
+
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda module=module: self.__request(module))
+
+        self.__timers[module] = timer
+        self.__request(module)
+
+  def setInterval(self, module: str, interval_ms: int) -> None:
+
+    if module not in self.__intervals:
+
+      raise ValueError(f"O módulo '{module}' não existe!")
+
+    self.__intervals[module] = interval_ms
+    self.__reschedule(module)
+
+  def startBurst(self, module: str, interval_ms: int = BURST_INTERVAL, duration_ms: int = BURST_DURATION) -> None:
+
+    """Atualiza um módulo ativo a cada 'interval_ms' durante 'duration_ms'
+    """
+
+    if module not in self.__timers:
+
+      raise ValueError(f"O módulo '{module}' não está sendo atualizado!")
+
+    self.__burst_module = module
+    self.__burst_interval = interval_ms
+    self.__burst_timer.start(duration_ms)
+
+    self.__reschedule(module)
+
+  @Slot()
+  def stopBurst(self) -> None:
+
+    module = self.__burst_module
+
+    if module is None:
+
+      return
+
+    self.__burst_module = None
+    self.__burst_timer.stop()
+
+    if module in self.__timers:
+
+      self.__reschedule(module)
+
+    self.burstFinished.emit()
+
+  def effectiveInterval(self, module: str) -> int:
+
+    """Intervalo atual de um módulo, em milissegundos, considerando o modo rápido, a janela e os atrasos das coletas
+    """
+
+    if module == self.__burst_module:
+
+      interval = self.__burst_interval
+
+    else:
+
+      interval = self.__intervals[module]
+
+      if self.__isHidden():
+
+        interval *= HIDDEN_BACKOFF
+
+      elif not self.__window.isActiveWindow():
+
+        interval *= UNFOCUSED_BACKOFF
+
+    return interval * self.__overrun_backoff[module]
+
+  def collectionFinished(self, module: str, duration: float | None) -> None:
+
+    """Informa o fim de uma coleta, ajustando o atraso do módulo e agendando o próximo pedido
+
+    Parameters
+    ----------
+    module : str
+      Módulo coletado
+    duration : float | None
+      Duração da coleta, em segundos, ou None se ela falhou
+    """
+
+    if module not in self.__timers:
+
+      return
+
+    if duration is not None:
+
+      # O orçamento é calculado sobre o intervalo sem o atraso, para que o atraso volte a cair quando as coletas melhorarem
+      budget = self.effectiveInterval(module) / self.__overrun_backoff[module] * COLLECTION_BUDGET / 1000
+
+      if duration > budget:
+
+        self.__overrun_backoff[module] = min(self.__overrun_backoff[module] * 2, MAX_OVERRUN_BACKOFF)
+
+      else:
+
+        self.__overrun_backoff[module] = max(self.__overrun_backoff[module] // 2, 1)
+
+    self.__reschedule(module)
+
+  def stop(self) -> None:
+
+    for timer in self.__timers.values():
+
+      timer.stop()
+
+    self.__timers.clear()
+    self.__burst_timer.stop()
+    self.__burst_module = None
+
+  def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+
+    if watched is self.__window and event.type() in (QEvent.Type.Show, QEvent.Type.Hide,
+                                                     QEvent.Type.WindowStateChange,
+                                                     QEvent.Type.WindowActivate, QEvent.Type.WindowDeactivate):
+
+      # Ninguém acompanha o modo rápido com a janela oculta
+      if self.__burst_module is not None and self.__isHidden():
+
+        self.stopBurst()
+
+      for module in self.__timers:
+
+        self.__reschedule(module)
+
+    return super().eventFilter(watched, event)
+
+  def __isHidden(self) -> bool:
+
+    return not self.__window.isVisible() or self.__window.isMinimized()
+
+  def __request(self, module: str) -> None:
+
+    self.__requested_at[module] = time.monotonic()
+
+    # Se a coleta não terminar (ex.: o pedido foi substituído por outro módulo), o módulo é pedido de novo após o intervalo
+    self.__timers[module].start(self.effectiveInterval(module))
+
+    self.refreshRequested.emit(module)
+
+  def __reschedule(self, module: str) -> None:
+
+    """Agenda o próximo pedido de um módulo um intervalo depois do pedido anterior (imediatamente, se já passou)
+    """
+
+    timer = self.__timers.get(module)
+
+    if timer is None:
+
+      return
+
+    elapsed_ms = (time.monotonic() - self.__requested_at.get(module, 0.0)) * 1000
+
+    timer.start(max(0, round(self.effectiveInterval(module) - elapsed_ms)))
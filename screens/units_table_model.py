@@ -0,0 +1,194 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex
+
+
+from typing import Any, Callable, Dict, List, Sequence
+
+
+from src.abstracts.unit_info import UnitInfo
+
+from utils.format_datetime import convertToDatetimeFormat
+
+
+def formatValue(value: Any) -> str:
+
+  """Formata um valor para exibição, usando vírgula como separador decimal dos números reais
+  """
+
+  return str(value).replace(".", ",") if isinstance(value, float) else str(value)
+
+
+def formatOptionalValue(value: Any) -> str:
+
+  """Formata um valor que pode não existir (ex.: a taxa de um processo que apareceu nesta coleta), deixando a célula vazia
+  """
+
+  return formatValue(value) if value is not None else ""
+
+
+# Formatadores específicos de alguns atributos. Os demais usam formatValue
+ATTRIBUTE_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+  "created_time": convertToDatetimeFormat,
+  "cpu_time_percentage": formatOptionalValue,
+  "read_bytes_per_second": formatOptionalValue,
+  "write_bytes_per_second": formatOptionalValue,
+  "io_operations_per_second": formatOptionalValue,
+  "memory_growth_per_second": formatOptionalValue
+}
+
+
+class UnitsTableModel(QAbstractTableModel):
+
+  """Modelo da tabela de informações específicas das unidades de um módulo (CPUs, Processos ou Partições).
+
+  Guarda apenas a referência às unidades coletadas. As células são formatadas sob demanda em data(), que a view só chama para as linhas visíveis.
+
+  As linhas podem ser ordenadas por uma coluna (sort); a ordenação é refeita a cada troca das unidades, e as unidades sem o valor da coluna ficam sempre no fim.
+  """
+
+  def __init__(self, parent=None) -> None:
+
+    super().__init__(parent)
+
+    self.__units: Sequence[UnitInfo] = list()
+    self.__labels: List[str] = list()
+    self.__attributes: List[str] = list()
+    self.__formatters: List[Callable[[Any], str]] = list()
+
+    # Coluna e sentido da ordenação (-1 mantém a ordem das unidades), e posição nas unidades de cada linha ordenada
+    self.__sort_column = -1
+    self.__sort_order = Qt.AscendingOrder
+    self.__rows: List[int] | None = None
+
+  @property
+  def labels(self) -> List[str]:
+
+    return self.__labels
+
+  def positionOf(self, row: int) -> int:
+
+    """Posição nas unidades (ex.: em processes_info) da unidade exibida em uma linha da tabela, que pode estar ordenada
+    """
+
+    return self.__rows[row] if self.__rows is not None else row
+
+  def setUnits(self, units: Sequence[UnitInfo], attrs_to_show: Dict[str, str]) -> None:
+
+    """Substitui as unidades exibidas pelo modelo
+
+    Com as mesmas colunas, o modelo não é reiniciado: apenas as linhas a mais ou a menos são inseridas ou removidas, e as demais são marcadas como alteradas. Assim a view mantém a seleção e os scrolls.
+
+    Parameters
+    ----------
+    units : Sequence[UnitInfo]
+      Unidades de um módulo (Exceto BatteryInfo)
+    attrs_to_show : Dict[str, str]
+      Nomes dos atributos dos dados que serão exibidos de cada unidade. As chaves correspondem aos nomes dos rótulos da tabela.
+    """
+
+    labels = list(attrs_to_show.keys())
+    attributes = list(attrs_to_show.values())
+
+    if labels != self.__labels or attributes != self.__attributes:
+
+      self.beginResetModel()
+
+      self.__units = units
+      self.__labels = labels
+      self.__attributes = attributes
+      self.__formatters = [ATTRIBUTE_FORMATTERS.get(attribute, formatValue) for attribute in attributes]
+
+      # As colunas de outro módulo não têm a ordenação anterior
+      self.__sort_column = -1
+      self.__rows = None
+
+      self.endResetModel()
+      return
+
+    previous_count = len(self.__units)
+    count = len(units)
+
+    if count < previous_count:
+
+      self.beginRemoveRows(QModelIndex(), count, previous_count - 1)
+      self.__setUnits(units)
+      self.endRemoveRows()
+
+    elif count > previous_count:
+
+      self.beginInsertRows(QModelIndex(), previous_count, count - 1)
+      self.__setUnits(units)
+      self.endInsertRows()
+
+    else:
+
+      self.__setUnits(units)
+
+    if min(count, previous_count) and attributes:
+
+      self.dataChanged.emit(self.index(0, 0), self.index(min(count, previous_count) - 1, len(attributes) - 1),
+                            [Qt.DisplayRole])
+
+  def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+
+    """Ordena as linhas pelos valores (não formatados) de uma coluna. A coluna -1 volta à ordem das unidades
+    """
+
+    self.layoutAboutToBeChanged.emit()
+
+    self.__sort_column = column
+    self.__sort_order = order
+    self.__rows = self.__sortedRows()
+
+    self.layoutChanged.emit()
+
+  def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+
+    return 0 if parent.isValid() else len(self.__units)
+
+  def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+
+    return 0 if parent.isValid() else len(self.__attributes)
+
+  def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole) -> Any:
+
+    if role != Qt.DisplayRole or not index.isValid():
+
+      return None
+
+    column = index.column()
+
+    return self.__formatters[column](getattr(self.__units[self.positionOf(index.row())], self.__attributes[column]))
+
+  def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+
+    if role != Qt.DisplayRole:
+
+      return None
+
+    if orientation == Qt.Horizontal:
+
+      return self.__labels[section]
+
+    return str(section + 1)
+
+  def __setUnits(self, units: Sequence[UnitInfo]) -> None:
+
+    self.__units = units
+    self.__rows = self.__sortedRows()
+
+  def __sortedRows(self) -> List[int] | None:
+
+    """Posições das unidades na ordem da coluna ordenada, ou None se as linhas não estão ordenadas
+    """
+
+    if not 0 <= self.__sort_column < len(self.__attributes):
+
+      return None
+
+    attribute = self.__attributes[self.__sort_column]
+    values = [getattr(unit, attribute) for unit in self.__units]
+
+    rows = sorted((position for position, value in enumerate(values) if value is not None), key=values.__getitem__,
+                  reverse=self.__sort_order == Qt.DescendingOrder)
+
+    return rows + [position for position, value in enumerate(values) if value is None]
@@ -1,7 +1,26 @@
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
 class InfoManager:
 
   """
   Classe Abstrata que representa um gerenciador de informações
+
+  Os gerenciadores leem as métricas de uma MetricsSource (o sistema ao vivo, uma gravação ou um sistema sintético), e nunca diretamente do psutil
   """
 
-  pass
\ No newline at end of file
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+  @property
+  def source(self) -> MetricsSource:
+
+    return self.__source
@@ -0,0 +1,103 @@
+import psutil
+import psutil._common
+
+
+from typing import Dict, List
+
+
+class MetricsSource:
+
+  """
+  Classe Abstrata que representa uma fonte das métricas do sistema, lida pelos gerenciadores e amostradores a cada coleta
+
+  Os retornos seguem o formato das funções correspondentes do psutil (namedtuples com os mesmos campos), e os processos têm a interface de psutil.Process usada pelo registro de processos. As exceções também são as do psutil (NoSuchProcess, AccessDenied, ZombieProcess).
+  """
+
+  def time(self) -> float:
+
+    """
+    Momento atual no relógio da fonte, em segundos desde a época. As taxas são calculadas por esse relógio, e não pelo do computador
+    """
+
+    raise NotImplementedError
+
+  def advance(self) -> None:
+
+    """Avança a fonte antes de um ciclo de coletas (ex.: próxima leitura de uma gravação). As fontes ao vivo não fazem nada
+    """
+
+    raise NotImplementedError
+
+  def bootTime(self) -> float:
+
+    raise NotImplementedError
+
+  def pids(self) -> List[int]:
+
+    raise NotImplementedError
+
+  def process(self, pid: int) -> psutil.Process:
+
+    """Objeto com a interface de psutil.Process de um pid. Levanta psutil.NoSuchProcess se o processo não existir
+    """
+
+    raise NotImplementedError
+
+  def cpuTimes(self) -> List[tuple]:
+
+    """Tempos de cada CPU, no formato de psutil.cpu_times(percpu=True)
+    """
+
+    raise NotImplementedError
+
+  def cpuStats(self) -> psutil._common.scpustats:
+
+    raise NotImplementedError
+
+  def cpuFrequencies(self) -> List[psutil._common.scpufreq]:
+
+    """Frequências no formato de psutil.cpu_freq(percpu=True). Pode ter uma única frequência para todas as CPUs, ou nenhuma
+    """
+
+    raise NotImplementedError
+
+  def cpuCount(self, logical: bool = True) -> int | None:
+
+    raise NotImplementedError
+
+  def diskPartitions(self) -> List[psutil._common.sdiskpart]:
+
+    """Partições físicas, no formato de psutil.disk_partitions(all=False)
+    """
+
+    raise NotImplementedError
+
+  def diskIOCounters(self) -> Dict[str, tuple]:
+
+    """Contadores de E/S de cada dispositivo, no formato de psutil.disk_io_counters(perdisk=True)
+    """
+
+    raise NotImplementedError
+
+  def diskDevices(self) -> Dict[str, List[str]] | None:
+
+    """Chaves de diskIOCounters do dispositivo de cada partição de diskPartitions (ex.: /dev/mapper/vg-root -> ["dm-0"]), resolvidas no computador que gerou as métricas
+
+    None quando a fonte lê o próprio computador, cujos dispositivos o DiskDeviceIndex resolve pelos arquivos locais (/dev, /sys)
+    """
+
+    raise NotImplementedError
+
+  def diskUsage(self, mountpoint: str) -> psutil._common.sdiskusage:
+
+    """Uso de um ponto de montagem. Pode travar em sistemas de arquivos de rede, por isso é consultado pelo MountUsageProber
+    """
+
+    raise NotImplementedError
+
+  def battery(self) -> psutil._common.sbattery | None:
+
+    """Estado da bateria, ou None em computadores sem bateria
+    """
+
+    raise NotImplementedError
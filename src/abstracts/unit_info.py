@@ -2,6 +2,8 @@ class UnitInfo:
 
   """
   Representa a informação de uma unidade (Processo, CPU ou Partição de Disco)
+
+  As subclasses declaram __slots__, para que cada unidade não carregue um __dict__ próprio
   """
-  
-  pass
\ No newline at end of file
+
+  __slots__ = ()
\ No newline at end of file
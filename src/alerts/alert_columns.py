@@ -0,0 +1,243 @@
+import numpy as np
+
+
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+from src.abstracts.info_manager import InfoManager
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.processes.processes_snapshot import StringColumn, DETAIL_BITS
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.battery.battery_info_manager import BatteryInfoManager
+from src.sampling.snapshot_collector import CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE, BATTERY_MODULE
+
+
+# Atributos dos processos usados nas regras -> (coluna da coleta, atributo de detalhe que a preenche, ou None)
+PROCESS_RULE_ATTRIBUTES: Dict[str, Tuple[str, str | None]] = {
+  "pid": ("pid", None),
+  "ppid": ("ppid", None),
+  "name": ("name", None),
+  "status": ("status", None),
+  "owner_username": ("username", None),
+  "executable_path": ("exe", None),
+  "created_time": ("create_time", None),
+  "cpu_used_percentage": ("cpu_percent", None),
+  "memory_used_percent": ("memory_percent", "memory_percent"),
+  "threads_used_count": ("num_threads", "num_threads"),
+  "priority_number": ("nice", "nice"),
+  "read_bytes_number": ("read_bytes", "io_counters"),
+  "write_bytes_number": ("write_bytes", "io_counters"),
+  "read_operations_count": ("read_count", "io_counters"),
+  "write_operations_count": ("write_count", "io_counters")
+}
+
+# Atributos usados nas regras de cada módulo (os dos processos estão em PROCESS_RULE_ATTRIBUTES)
+RULE_ATTRIBUTES: Dict[str, List[str]] = {
+  CPU_MODULE: ["cpu_id", "used_percentage", "user_percentage", "system_percentage", "iowait_percentage",
+               "current_frequency"],
+  PROCESSES_MODULE: list(PROCESS_RULE_ATTRIBUTES.keys()),
+  DISKS_MODULE: ["mountpoint_path", "device_path", "file_system", "total_bytes", "used_bytes", "free_bytes",
+                 "used_percentage", "is_stale", "read_bytes_per_second", "write_bytes_per_second",
+                 "read_operations_per_second", "write_operations_per_second", "iops", "busy_percentage"],
+  BATTERY_MODULE: ["percentage_remaining", "time_left", "is_charging"]
+}
+
+
+class SnapshotColumns:
+
+  """
+  Colunas de uma coleta usadas na avaliação das regras, uma linha por unidade (CPU, processo, partição ou a bateria)
+
+  Os processos usam direto as colunas do ProcessesSnapshot, sem cópia nem laço por processo. Os demais módulos têm poucas unidades, então cada coluna é montada em uma passada pelas unidades. As colunas são montadas apenas quando uma regra as usa, e uma única vez por coleta.
+
+  As colunas de texto são representadas por códigos e pelos valores distintos (como a StringColumn), para que as regras comparem cada valor distinto uma única vez.
+  """
+
+  def __init__(self, module: str, info_obj: InfoManager) -> None:
+
+    self.__module = module
+    self.__cache: Dict[str, Any] = dict()
+
+    if isinstance(info_obj, ProcessesInfoManager):
+
+      self.__snapshot = info_obj.snapshot
+      self.__rows_count = len(self.__snapshot)
+
+    elif isinstance(info_obj, CPUsInfoManager):
+
+      self.__units = info_obj.cpus_info
+      self.__rows_count = len(self.__units)
+
+    elif isinstance(info_obj, DiskPartitionsInfoManager):
+
+      self.__units = info_obj.disk_partitions_info
+      self.__rows_count = len(self.__units)
+
+    elif isinstance(info_obj, BatteryInfoManager):
+
+      # A bateria é uma única linha, com os atributos do próprio gerenciador
+      self.__units = [info_obj]
+      self.__rows_count = 1
+
+    else:
+
+      raise ValueError(f"O módulo '{module}' não existe!")
+
+  @property
+  def module(self) -> str:
+
+    return self.__module
+
+  @property
+  def rows_count(self) -> int:
+
+    return self.__rows_count
+
+  def numeric(self, attribute: str) -> np.ndarray:
+
+    """Coluna numérica de um atributo, em float64 (valores ausentes viram NaN)
+    """
+
+    return self.__cached(("numeric", attribute), lambda: self.__numeric(attribute))
+
+  def strings(self, attribute: str) -> Tuple[np.ndarray, List[str]]:
+
+    """Coluna de texto de um atributo: os códigos de cada linha e os valores distintos, na posição do seu código
+    """
+
+    return self.__cached(("strings", attribute), lambda: self.__strings(attribute))
+
+  def valid(self, attribute: str) -> np.ndarray | None:
+
+    """Linhas em que o atributo foi lido, ou None se todas foram
+
+    Nos processos, os atributos de detalhe que não vieram na coleta (ou não puderam ser lidos) não são lidos aqui, para não ler o sistema processo a processo; essas linhas nunca satisfazem uma condição.
+    """
+
+    if self.__module != PROCESSES_MODULE or PROCESS_RULE_ATTRIBUTES[attribute][1] is None:
+
+      return None
+
+    return self.__cached(("valid", attribute), lambda: self.__validDetails(PROCESS_RULE_ATTRIBUTES[attribute][1]))
+
+  def key(self, row: int) -> Hashable:
+
+    """Identidade de uma unidade entre coletas: (pid, instante de criação) nos processos, o id da CPU, o ponto de montagem ou a bateria
+    """
+
+    match self.__module:
+
+      case "processes":
+
+        return (self.__snapshot.column("pid")[row], self.__snapshot.column("create_time")[row])
+
+      case "cpu":
+
+        return self.__units[row].cpu_id
+
+      case "disks":
+
+        return self.__units[row].mountpoint_path
+
+      case _:
+
+        return BATTERY_MODULE
+
+  def rowOf(self, key: Hashable) -> int | None:
+
+    """Linha de uma unidade (ver key), ou None se ela não está na coleta
+    """
+
+    if self.__module == PROCESSES_MODULE:
+
+      # Nos processos, a busca pelo pid é feita sobre a coluna inteira
+      pid, create_time = key
+      rows = np.flatnonzero(np.frombuffer(self.__snapshot.column("pid"), dtype=np.int64) == pid)
+
+      return next((int(row) for row in rows if self.__snapshot.column("create_time")[row] == create_time), None)
+
+    return next((row for row in range(0, self.__rows_count) if self.key(row) == key), None)
+
+  def label(self, row: int) -> str:
+
+    """Nome de uma unidade nas notificações
+    """
+
+    match self.__module:
+
+      case "processes":
+
+        return f"{self.__snapshot.column('name')[row]} (PID {self.__snapshot.column('pid')[row]})"
+
+      case "cpu":
+
+        return f"CPU {self.__units[row].cpu_id}"
+
+      case "disks":
+
+        return self.__units[row].mountpoint_path
+
+      case _:
+
+        return "Bateria"
+
+  def value(self, attribute: str, row: int) -> Any:
+
+    """Valor de um atributo em uma linha, para as notificações
+    """
+
+    if self.__module == PROCESSES_MODULE:
+
+      return self.__snapshot.column(PROCESS_RULE_ATTRIBUTES[attribute][0])[row]
+
+    return getattr(self.__units[row], attribute)
+
+  def __cached(self, cache_key: Any, build: Callable[[], Any]) -> Any:
+
+    if cache_key not in self.__cache:
+
+      self.__cache[cache_key] = build()
+
+    return self.__cache[cache_key]
+
+  def __numeric(self, attribute: str) -> np.ndarray:
+
+    if self.__module == PROCESSES_MODULE:
+
+      column = self.__snapshot.column(PROCESS_RULE_ATTRIBUTES[attribute][0])
+
+      if isinstance(column, StringColumn):
+
+        raise ValueError(f"O atributo '{attribute}' não é numérico!")
+
+      # Os arrays da coleta implementam o protocolo de buffer, então o NumPy os lê sem cópia
+      return np.frombuffer(column, dtype=np.int64 if column.typecode == "q" else np.float64).astype(np.float64)
+
+    return np.array([np.nan if (value := getattr(unit, attribute)) is None else float(value) for unit in self.__units],
+                    dtype=np.float64)
+
+  def __strings(self, attribute: str) -> Tuple[np.ndarray, List[str]]:
+
+    if self.__module == PROCESSES_MODULE:
+
+      column = self.__snapshot.column(PROCESS_RULE_ATTRIBUTES[attribute][0])
+
+      if not isinstance(column, StringColumn):
+
+        raise ValueError(f"O atributo '{attribute}' não é um texto!")
+
+      return np.frombuffer(column.codes, dtype=np.uint32), column.values
+
+    column = StringColumn([str(getattr(unit, attribute)) for unit in self.__units])
+
+    return np.frombuffer(column.codes, dtype=np.uint32), column.values
+
+  def __validDetails(self, detail_attribute: str) -> np.ndarray:
+
+    bit = DETAIL_BITS[detail_attribute]
+
+    loaded = np.frombuffer(self.__snapshot.loaded_details, dtype=np.uint8)
+    missing = np.frombuffer(self.__snapshot.missing_details, dtype=np.uint8)
+
+    return ((loaded & bit) != 0) & ((missing & bit) == 0)
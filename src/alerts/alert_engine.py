@@ -0,0 +1,245 @@
+import numpy as np
+
+
+import json
+from typing import Any, Dict, Hashable, List
+
+
+from src.alerts.alert_columns import SnapshotColumns, PROCESS_RULE_ATTRIBUTES
+from src.alerts.alert_rules import AlertRule, parseRule
+from src.alerts.alert_sinks import Alert, AlertSink, createSink, ALERT_FIRING, ALERT_RESOLVED
+from src.sampling.snapshot_collector import ModuleSnapshot, PROCESSES_MODULE
+
+
+class RuleState:
+
+  """
+  Unidades pendentes (condições verdadeiras há menos de 'for_seconds') e em alerta de uma regra
+  """
+
+  def __init__(self) -> None:
+
+    # Unidade -> instante em que as condições ficaram verdadeiras
+    self.pending: Dict[Hashable, float] = dict()
+
+    # Unidade -> (nome da unidade, instante da última notificação)
+    self.active: Dict[Hashable, List[Any]] = dict()
+
+
+class AlertEngine:
+
+  """
+  Avalia as regras de alerta a cada coleta e envia as notificações aos destinos
+
+  Cada regra é avaliada sobre as colunas da coleta inteira (ver AlertRule.evaluate); apenas as linhas que satisfazem as condições passam pelo acompanhamento das unidades, feito em Python. As notificações são deduplicadas: cada unidade notifica uma vez quando o alerta dispara e uma vez quando ele é resolvido (e, com 'repeat_seconds', a cada intervalo enquanto continua ativo).
+  """
+
+  def __init__(self, rules: List[AlertRule], sinks: List[AlertSink]) -> None:
+
+    self.__rules = rules
+    self.__sinks = sinks
+    self.__states: List[RuleState] = [RuleState() for _ in rules]
+
+    # Instante da última avaliação de cada módulo, e o menor intervalo visto entre duas avaliações dele
+    self.__last_evaluated: Dict[str, float] = dict()
+    self.__intervals: Dict[str, float] = dict()
+
+  @property
+  def rules(self) -> List[AlertRule]:
+
+    return self.__rules
+
+  @property
+  def modules(self) -> List[str]:
+
+    """
+    Módulos com alguma regra, na ordem da primeira regra de cada um
+    """
+
+    return list(dict.fromkeys(rule.module for rule in self.__rules))
+
+  @property
+  def process_detail_attributes(self) -> List[str]:
+
+    """
+    Atributos de detalhe dos processos (ver DETAIL_PROCESS_ATTRIBUTES) usados pelas regras. Eles precisam ser lidos na coleta: nos processos em que não foram, as condições sobre eles nunca são satisfeitas (ver SnapshotColumns.valid)
+    """
+
+    return list(dict.fromkeys(PROCESS_RULE_ATTRIBUTES[condition.attribute][1]
+                              for rule in self.__rules if rule.module == PROCESSES_MODULE
+                              for condition in rule.conditions
+                              if PROCESS_RULE_ATTRIBUTES[condition.attribute][1] is not None))
+
+  @property
+  def active_alerts(self) -> Dict[str, List[str]]:
+
+    """
+    Nome das unidades em alerta de cada regra
+    """
+
+    return {rule.name: [label for label, _ in state.active.values()]
+            for rule, state in zip(self.__rules, self.__states) if state.active}
+
+  def evaluate(self, snapshot: ModuleSnapshot) -> List[Alert]:
+
+    """Avalia as regras do módulo de uma coleta, notificando os destinos
+
+    Returns
+    -------
+    List[Alert]
+      Notificações geradas pela coleta
+    """
+
+    rules = [(rule, state) for rule, state in zip(self.__rules, self.__states) if rule.module == snapshot.module]
+
+    if not rules:
+
+      return list()
+
+    # As colunas são montadas uma única vez por coleta, e compartilhadas por todas as regras do módulo
+    columns = SnapshotColumns(snapshot.module, snapshot.info_manager)
+    now = snapshot.collected_at
+
+    # Um intervalo bem maior que o normal entre as avaliações (ex.: o módulo deixou de ser exibido na janela) interrompe
+    # o acompanhamento: as unidades pendentes não foram observadas nele, então recomeçam a contar 'for_seconds'
+    previous = self.__last_evaluated.get(snapshot.module)
+    interval = self.__intervals.get(snapshot.module)
+    gap = now - previous if previous is not None else 0.0
+
+    alerts: List[Alert] = list()
+
+    for rule, state in rules:
+
+      if gap > rule.for_seconds and (interval is None or gap > 2 * interval):
+
+        state.pending.clear()
+
+      alerts += self.__evaluateRule(rule, state, columns, now)
+
+    if previous is not None:
+
+      self.__intervals[snapshot.module] = min(interval, gap) if interval is not None else gap
+
+    self.__last_evaluated[snapshot.module] = now
+
+    for alert in alerts:
+
+      for sink in self.__sinks:
+
+        sink.notify(alert)
+
+    return alerts
+
+  def close(self) -> None:
+
+    for sink in self.__sinks:
+
+      sink.close()
+
+  def __evaluateRule(self, rule: AlertRule, state: RuleState, columns: SnapshotColumns, now: float) -> List[Alert]:
+
+    entering, staying = rule.evaluate(columns)
+
+    alerts: List[Alert] = list()
+    pending: Dict[Hashable, float] = dict()
+    still_active = set()
+
+    # Uma unidade pendente ou em alerta continua enquanto satisfaz os limites afastados pela histerese;
+    # as demais precisam satisfazer os limites da regra
+    for row in np.flatnonzero(entering | staying).tolist():
+
+      key = columns.key(row)
+
+      if key in state.active:
+
+        if not staying[row]:
+
+          continue
+
+        still_active.add(key)
+        _, notified_at = state.active[key]
+
+        if rule.repeat_seconds and now - notified_at >= rule.repeat_seconds:
+
+          state.active[key][1] = now
+          alerts.append(self.__alert(rule, columns, row, key, ALERT_FIRING, now))
+
+        continue
+
+      if key in state.pending:
+
+        if not staying[row]:
+
+          continue
+
+        since = state.pending[key]
+
+      elif entering[row]:
+
+        since = now
+
+      else:
+
+        continue
+
+      if now - since >= rule.for_seconds:
+
+        still_active.add(key)
+        state.active[key] = [columns.label(row), now]
+        alerts.append(self.__alert(rule, columns, row, key, ALERT_FIRING, now))
+
+      else:
+
+        pending[key] = since
+
+    # As unidades que deixaram de satisfazer as condições (ou deixaram de existir) resolvem o alerta
+    for key in [key for key in state.active if key not in still_active]:
+
+      label, _ = state.active.pop(key)
+
+      alerts.append(Alert(rule.name, rule.severity, rule.module, key, label, ALERT_RESOLVED, now,
+                          self.__resolvedValues(rule, columns, key)))
+
+    state.pending = pending
+
+    return alerts
+
+  def __alert(self, rule: AlertRule, columns: SnapshotColumns, row: int, key: Hashable, alert_state: str,
+              now: float) -> Alert:
+
+    values = {condition.attribute: columns.value(condition.attribute, row) for condition in rule.conditions}
+
+    return Alert(rule.name, rule.severity, rule.module, key, columns.label(row), alert_state, now, values)
+
+  def __resolvedValues(self, rule: AlertRule, columns: SnapshotColumns, key: Hashable) -> Dict[str, Any]:
+
+    row = columns.rowOf(key)
+
+    if row is None:
+
+      return dict()
+
+    return {condition.attribute: columns.value(condition.attribute, row) for condition in rule.conditions}
+
+
+def createAlertEngine(config_path: str) -> AlertEngine:
+
+  """Cria o avaliador de alertas a partir de um arquivo de configuração JSON
+
+  O arquivo tem as regras (ver parseRule) e os destinos das notificações (ver createSink). Exemplo:
+  {"sinks": {"log": {"path": "alertas.log"}, "desktop": {}},
+   "rules": [{"name": "Bateria fraca", "module": "battery", "for_seconds": 30,
+              "when": [{"attribute": "percentage_remaining", "operator": "<", "value": 10},
+                       {"attribute": "is_charging", "operator": "==", "value": false}]}]}
+
+  Sem "sinks", as notificações são escritas na saída de erros.
+  """
+
+  with open(config_path, "r", encoding="utf-8") as config_stream:
+
+    config: Dict[str, Any] = json.load(config_stream)
+
+  rules = [parseRule(rule_description) for rule_description in config.get("rules", [])]
+  sinks = [createSink(name, options) for name, options in config.get("sinks", {"log": {}}).items()]
+
+  return AlertEngine(rules, sinks)
@@ -0,0 +1,277 @@
+import numpy as np
+
+
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+
+from src.alerts.alert_columns import SnapshotColumns, RULE_ATTRIBUTES
+
+
+# Operadores numéricos das condições -> função vetorizada do NumPy
+NUMERIC_OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+  ">": np.greater,
+  ">=": np.greater_equal,
+  "<": np.less,
+  "<=": np.less_equal,
+  "==": np.equal,
+  "!=": np.not_equal,
+  "in": lambda column, values: np.isin(column, values),
+  "not in": lambda column, values: ~np.isin(column, values)
+}
+
+# Operadores de texto das condições -> comparação de um único valor (aplicada a cada valor distinto da coluna)
+STRING_OPERATORS: Dict[str, Callable[[str, Any], bool]] = {
+  "==": lambda value, operand: value == operand,
+  "!=": lambda value, operand: value != operand,
+  "in": lambda value, operand: value in operand,
+  "not in": lambda value, operand: value not in operand,
+  "matches": lambda value, operand: operand.search(value) is not None
+}
+
+# Sentido em que a histerese afasta o limite de cada operador de ordem, enquanto o alerta está ativo
+HYSTERESIS_DIRECTIONS: Dict[str, int] = {
+  ">": -1,
+  ">=": -1,
+  "<": 1,
+  "<=": 1
+}
+
+# Gravidades dos alertas -> rótulo nas notificações
+SEVERITIES: Dict[str, str] = {
+  "info": "INFORMAÇÃO",
+  "warning": "AVISO",
+  "critical": "CRÍTICO"
+}
+
+
+class AlertCondition:
+
+  """
+  Condição sobre um atributo das unidades de um módulo (ex.: used_percentage > 90), compilada em uma operação sobre a coluna inteira
+
+  As condições numéricas são uma única operação do NumPy sobre a coluna. As de texto comparam cada valor distinto uma única vez e espalham o resultado pelos códigos da coluna.
+  """
+
+  def __init__(self, module: str, attribute: str, operator: str, value: Any) -> None:
+
+    if module not in RULE_ATTRIBUTES:
+
+      raise ValueError(f"O módulo '{module}' não existe!")
+
+    if attribute not in RULE_ATTRIBUTES[module]:
+
+      raise ValueError(f"O atributo '{attribute}' não existe no módulo '{module}'!")
+
+    operands = value if isinstance(value, list) else [value]
+    is_string = all(isinstance(operand, str) for operand in operands)
+
+    if not is_string and not all(isinstance(operand, (int, float)) for operand in operands):
+
+      raise ValueError(f"O valor da condição sobre '{attribute}' deve ser um número, um texto ou uma lista deles!")
+
+    if operator in ("in", "not in") and not isinstance(value, list):
+
+      raise ValueError(f"O operador '{operator}' espera uma lista de valores!")
+
+    operators = STRING_OPERATORS if is_string else NUMERIC_OPERATORS
+
+    if operator not in operators:
+
+      raise ValueError(f"O operador '{operator}' não existe para {'textos' if is_string else 'números'}!")
+
+    self.__attribute = attribute
+    self.__operator = operator
+    self.__is_string = is_string
+    self.__compare = operators[operator]
+
+    # O valor é convertido uma única vez, na compilação da regra
+    if operator == "matches":
+
+      self.__value = re.compile(value)
+
+    elif is_string:
+
+      self.__value = set(value) if isinstance(value, list) else value
+
+    else:
+
+      self.__value = np.array(value, dtype=np.float64) if isinstance(value, list) else float(value)
+
+  @property
+  def attribute(self) -> str:
+
+    return self.__attribute
+
+  @property
+  def operator(self) -> str:
+
+    return self.__operator
+
+  def evaluate(self, columns: SnapshotColumns, hysteresis: float = 0.0) -> np.ndarray:
+
+    """Linhas que satisfazem a condição
+
+    Parameters
+    ----------
+    columns : SnapshotColumns
+      Colunas da coleta avaliada
+    hysteresis : float
+      Quanto o limite dos operadores de ordem é afastado a favor da condição (ex.: "> 90" com 5 vira "> 85")
+
+    Returns
+    -------
+    np.ndarray
+      Máscara booleana com uma posição por linha
+    """
+
+    if self.__is_string:
+
+      codes, values = columns.strings(self.__attribute)
+      matches = np.fromiter((self.__compare(value, self.__value) for value in values), dtype=bool, count=len(values))
+
+      mask = matches[codes] if len(values) else np.zeros(len(codes), dtype=bool)
+
+    else:
+
+      threshold = self.__value + HYSTERESIS_DIRECTIONS.get(self.__operator, 0) * hysteresis
+      mask = self.__compare(columns.numeric(self.__attribute), threshold)
+
+    valid = columns.valid(self.__attribute)
+
+    return mask if valid is None else mask & valid
+
+
+class AlertRule:
+
+  """
+  Regra de alerta: um conjunto de condições sobre as unidades de um módulo, todas verdadeiras ao mesmo tempo
+
+  Uma unidade entra no alerta quando as condições ficam verdadeiras por 'for_seconds' seguidos. Enquanto o alerta está ativo, os limites das condições são afastados por 'hysteresis', para que um valor oscilando perto do limite não dispare e resolva o alerta a cada coleta.
+  """
+
+  def __init__(self, name: str, module: str, conditions: List[AlertCondition], for_seconds: float = 0.0,
+               hysteresis: float = 0.0, severity: str = "warning", repeat_seconds: float = 0.0) -> None:
+
+    """
+    Parameters
+    ----------
+    name : str
+      Nome da regra, usado nas notificações
+    module : str
+      Módulo avaliado (ver RULE_ATTRIBUTES)
+    conditions : List[AlertCondition]
+      Condições que precisam ser verdadeiras ao mesmo tempo
+    for_seconds : float
+      Tempo que as condições precisam continuar verdadeiras antes do alerta disparar
+    hysteresis : float
+      Afastamento dos limites numéricos enquanto o alerta está pendente ou ativo
+    severity : str
+      Gravidade do alerta (ver SEVERITIES)
+    repeat_seconds : float
+      Intervalo para notificar de novo um alerta que continua ativo; 0 notifica apenas quando ele dispara e quando é resolvido
+    """
+
+    if module not in RULE_ATTRIBUTES:
+
+      raise ValueError(f"O módulo '{module}' não existe!")
+
+    if not conditions:
+
+      raise ValueError(f"A regra '{name}' não tem condições!")
+
+    if severity not in SEVERITIES:
+
+      raise ValueError(f"A gravidade '{severity}' não existe!")
+
+    self.__name = name
+    self.__module = module
+    self.__conditions = conditions
+    self.__for_seconds = for_seconds
+    self.__hysteresis = hysteresis
+    self.__severity = severity
+    self.__repeat_seconds = repeat_seconds
+
+  @property
+  def name(self) -> str:
+
+    return self.__name
+
+  @property
+  def module(self) -> str:
+
+    return self.__module
+
+  @property
+  def conditions(self) -> List[AlertCondition]:
+
+    return self.__conditions
+
+  @property
+  def for_seconds(self) -> float:
+
+    return self.__for_seconds
+
+  @property
+  def severity(self) -> str:
+
+    return self.__severity
+
+  @property
+  def repeat_seconds(self) -> float:
+
+    return self.__repeat_seconds
+
+  def evaluate(self, columns: SnapshotColumns) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Avalia a regra em todas as linhas de uma coleta
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+      Linhas que satisfazem as condições, e as que as satisfazem com os limites afastados pela histerese (para as unidades já pendentes ou em alerta)
+    """
+
+    entering = np.ones(columns.rows_count, dtype=bool)
+
+    for condition in self.__conditions:
+
+      entering &= condition.evaluate(columns)
+
+    if not self.__hysteresis:
+
+      return entering, entering
+
+    staying = np.ones(columns.rows_count, dtype=bool)
+
+    for condition in self.__conditions:
+
+      staying &= condition.evaluate(columns, self.__hysteresis)
+
+    return entering, staying
+
+
+def parseRule(rule_description: Dict[str, Any]) -> AlertRule:
+
+  """Cria uma regra a partir da sua descrição no arquivo de configuração
+
+  Exemplo: {"name": "Partição quase cheia", "module": "disks", "when": [{"attribute": "used_percentage", "operator": ">", "value": 90}], "hysteresis": 2}
+  """
+
+  try:
+
+    name = rule_description["name"]
+    module = rule_description["module"]
+
+    conditions = [AlertCondition(module, condition["attribute"], condition["operator"], condition["value"])
+                  for condition in rule_description["when"]]
+
+  except KeyError as error:
+
+    raise ValueError(f"Falta o campo {error} em uma regra de alerta!") from None
+
+  return AlertRule(name, module, conditions,
+                   float(rule_description.get("for_seconds", 0.0)),
+                   float(rule_description.get("hysteresis", 0.0)),
+                   rule_description.get("severity", "warning"),
+                   float(rule_description.get("repeat_seconds", 0.0)))
@@ -0,0 +1,219 @@
+import shutil
+import subprocess
+import sys
+import time
+from typing import Any, Dict, Hashable, TextIO
+
+
+from src.alerts.alert_rules import SEVERITIES
+
+
+# Estados de um alerta nas notificações
+ALERT_FIRING = "firing"
+ALERT_RESOLVED = "resolved"
+
+ALERT_STATES: Dict[str, str] = {
+  ALERT_FIRING: "disparado",
+  ALERT_RESOLVED: "resolvido"
+}
+
+
+class Alert:
+
+  """
+  Notificação de uma regra para uma unidade: o disparo, a repetição enquanto continua ativo, ou a resolução
+  """
+
+  def __init__(self, rule_name: str, severity: str, module: str, unit_key: Hashable, unit_label: str, state: str,
+               timestamp: float, values: Dict[str, Any]) -> None:
+
+    """
+    Parameters
+    ----------
+    rule_name : str
+      Nome da regra
+    severity : str
+      Gravidade da regra (ver SEVERITIES)
+    module : str
+      Módulo da regra
+    unit_key : Hashable
+      Identidade da unidade (ver SnapshotColumns.key)
+    unit_label : str
+      Nome da unidade nas notificações
+    state : str
+      ALERT_FIRING ou ALERT_RESOLVED
+    timestamp : float
+      Instante da coleta que gerou a notificação, em segundos desde a época
+    values : Dict[str, Any]
+      Valores dos atributos das condições na coleta (vazio na resolução de uma unidade que deixou de existir)
+    """
+
+    self.__rule_name = rule_name
+    self.__severity = severity
+    self.__module = module
+    self.__unit_key = unit_key
+    self.__unit_label = unit_label
+    self.__state = state
+    self.__timestamp = timestamp
+    self.__values = values
+
+  @property
+  def rule_name(self) -> str:
+
+    return self.__rule_name
+
+  @property
+  def severity(self) -> str:
+
+    return self.__severity
+
+  @property
+  def module(self) -> str:
+
+    return self.__module
+
+  @property
+  def unit_key(self) -> Hashable:
+
+    return self.__unit_key
+
+  @property
+  def unit_label(self) -> str:
+
+    return self.__unit_label
+
+  @property
+  def state(self) -> str:
+
+    return self.__state
+
+  @property
+  def timestamp(self) -> float:
+
+    return self.__timestamp
+
+  @property
+  def values(self) -> Dict[str, Any]:
+
+    return self.__values
+
+  @property
+  def title(self) -> str:
+
+    return f"[{SEVERITIES[self.__severity]}] {self.__rule_name}"
+
+  @property
+  def message(self) -> str:
+
+    values = ", ".join(f"{attribute} = {value:.2f}".replace(".", ",") if isinstance(value, float)
+                       else f"{attribute} = {value}" for attribute, value in self.__values.items())
+
+    return f"{self.__unit_label}: {ALERT_STATES[self.__state]}" + (f" ({values})" if values else "")
+
+
+class AlertSink:
+
+  """
+  Classe Abstrata que representa um destino das notificações de alerta
+  """
+
+  def notify(self, alert: Alert) -> None:
+
+    raise NotImplementedError
+
+  def close(self) -> None:
+
+    pass
+
+
+class LogSink(AlertSink):
+
+  """
+  Escreve cada notificação como uma linha de texto, com o instante da coleta, em um arquivo ou na saída de erros
+  """
+
+  def __init__(self, path: str = "-") -> None:
+
+    """
+    Parameters
+    ----------
+    path : str
+      Arquivo onde as linhas são acrescentadas; '-' escreve na saída de erros
+    """
+
+    self.__stream: TextIO = sys.stderr if path == "-" else open(path, "a", encoding="utf-8")
+
+  def notify(self, alert: Alert) -> None:
+
+    timestamp = time.strftime("%d/%m/%Y %H:%M:%S", time.localtime(alert.timestamp))
+
+    self.__stream.write(f"{timestamp} {alert.title} {alert.message}\n")
+    self.__stream.flush()
+
+  def close(self) -> None:
+
+    if self.__stream is not sys.stderr:
+
+      self.__stream.close()
+
+
+class DesktopSink(AlertSink):
+
+  """
+  Exibe cada notificação na área de notificações da área de trabalho, pelo notify-send (Linux)
+
+  O notify-send é executado sem esperar o seu fim, para que uma área de trabalho lenta não atrase as coletas. Sem ele, as notificações são descartadas com um aviso.
+  """
+
+  def __init__(self) -> None:
+
+    self.__command = shutil.which("notify-send")
+
+    if self.__command is None:
+
+      print("O notify-send não foi encontrado: os alertas não serão exibidos na área de trabalho", file=sys.stderr)
+
+  def notify(self, alert: Alert) -> None:
+
+    if self.__command is None:
+
+      return
+
+    urgency = "critical" if alert.severity == "critical" and alert.state == ALERT_FIRING else "normal"
+
+    try:
+
+      subprocess.Popen([self.__command, "--app-name=Monitoramento do Sistema", f"--urgency={urgency}",
+                        alert.title, alert.message],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    except OSError as error:
+
+      print(f"Não foi possível exibir o alerta na área de trabalho: {error}", file=sys.stderr)
+
+
+def createSink(name: str, options: Dict[str, Any]) -> AlertSink:
+
+  """Cria um destino das notificações a partir da sua descrição no arquivo de configuração
+
+  Parameters
+  ----------
+  name : str
+    "log" ou "desktop"
+  options : Dict[str, Any]
+    Opções do destino (ex.: {"path": "alertas.log"} no "log")
+  """
+
+  match name:
+
+    case "log":
+
+      return LogSink(options.get("path", "-"))
+
+    case "desktop":
+
+      return DesktopSink()
+
+    case _:
+
+      raise ValueError(f"O destino de alertas '{name}' não existe!")
@@ -0,0 +1,97 @@
+import argparse
+import sys
+import time
+from typing import List
+
+
+from src.alerts.alert_engine import AlertEngine, createAlertEngine
+from src.sampling.snapshot_collector import SnapshotCollector
+from src.processes.procfs_registry import PROCESS_BACKENDS
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py alerts",
+                                   description="Avalia as regras de alerta de um arquivo de configuração a cada "
+                                               "intervalo, notificando quando algo está errado")
+
+  parser.add_argument("--config", required=True,
+                      help="Arquivo JSON com as regras e os destinos das notificações")
+  parser.add_argument("--interval", type=float, default=5.0,
+                      help="Intervalo entre as coletas, em segundos (padrão: 5)")
+  parser.add_argument("--count", type=int, default=0,
+                      help="Quantidade de coletas; 0 coleta até ser interrompido (padrão: 0)")
+  parser.add_argument("--process-backend", choices=PROCESS_BACKENDS, default="psutil",
+                      help="Leitura dos processos: psutil ou procfs (leitura direta do /proc, apenas no Linux) (padrão: psutil)")
+
+  addSourceArguments(parser)
+
+  return parser.parse_args(argv)
+
+
+def alertLoop(collector: SnapshotCollector, engine: AlertEngine, interval: float, count: int) -> None:
+
+  """Coleta os módulos com regras em intervalos fixos, avaliando as regras a cada coleta
+  """
+
+  start = time.monotonic()
+  iteration = 0
+
+  while count <= 0 or iteration < count:
+
+    # Todos os módulos do ciclo leem a mesma leitura da fonte
+    collector.advance()
+
+    for module in engine.modules:
+
+      try:
+
+        engine.evaluate(collector.collect(module))
+
+      except Exception as error:
+
+        # Uma falha em um módulo (ex.: computador sem bateria) não interrompe a avaliação dos demais
+        print(f"Não foi possível coletar as informações do módulo '{module}': {error}", file=sys.stderr)
+
+    iteration += 1
+
+    if count > 0 and iteration >= count:
+
+      break
+
+    time.sleep(max(0.0, start + iteration * interval - time.monotonic()))
+
+
+def runAlerts(argv: List[str]) -> int:
+
+  """Ponto de entrada da avaliação de alertas sem interface gráfica (python main.py alerts)
+  """
+
+  args = parseArguments(argv)
+
+  try:
+
+    engine = createAlertEngine(args.config)
+
+  except (OSError, ValueError) as error:
+
+    print(f"Não foi possível ler as regras de alerta: {error}", file=sys.stderr)
+    return 1
+
+  # Os processos são lidos com todos os atributos, para que as regras sobre memória, threads e E/S valham para todos
+  collector = SnapshotCollector(source=sourceFromArguments(args), process_backend=args.process_backend)
+
+  try:
+
+    alertLoop(collector, engine, args.interval, args.count)
+
+  except KeyboardInterrupt:
+
+    pass
+
+  finally:
+
+    engine.close()
+
+  return 0
@@ -0,0 +1,161 @@
+import argparse
+import json
+import sys
+import time
+from typing import List
+
+
+from src.archive.archive_format import STREAMS, STREAM_COLUMNS
+from src.archive.archive_writer import ArchiveWriter
+from src.sampling.snapshot_collector import SnapshotCollector, CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE
+from src.sampling.collector_cli import MODULES
+from src.processes.procfs_registry import PROCESS_BACKENDS
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py archive",
+                                   description="Grava continuamente as métricas do sistema em disco, em blocos "
+                                               "comprimidos, e consulta os intervalos gravados")
+  subparsers = parser.add_subparsers(dest="action", required=True)
+
+  write_parser = subparsers.add_parser("write", help="Grava as coletas até ser interrompido")
+  write_parser.add_argument("--directory", required=True,
+                            help="Diretório do arquivo (criado se não existir)")
+  write_parser.add_argument("--interval", type=float, default=1.0,
+                            help="Intervalo entre as coletas, em segundos (padrão: 1)")
+  write_parser.add_argument("--count", type=int, default=0,
+                            help="Quantidade de coletas; 0 grava até ser interrompido (padrão: 0)")
+  write_parser.add_argument("--modules", nargs="+", choices=MODULES,
+                            default=[CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE],
+                            help="Módulos gravados (padrão: cpu processes disks)")
+  write_parser.add_argument("--top", type=int, default=10,
+                            help="Quantidade de processos gravados a cada coleta, os de maior uso de CPU (padrão: 10)")
+  write_parser.add_argument("--chunk-seconds", type=float, default=60.0,
+                            help="Intervalo coberto por cada bloco; em uma queda, perde-se no máximo esse intervalo "
+                                 "(padrão: 60)")
+  write_parser.add_argument("--max-segment-mb", type=float, default=16.0,
+                            help="Tamanho de cada segmento, em MiB (padrão: 16)")
+  write_parser.add_argument("--max-total-mb", type=float, default=256.0,
+                            help="Tamanho máximo do arquivo, em MiB; os segmentos mais antigos são apagados "
+                                 "(padrão: 256)")
+  write_parser.add_argument("--process-backend", choices=PROCESS_BACKENDS, default="psutil",
+                            help="Leitura dos processos: psutil ou procfs (leitura direta do /proc, apenas no Linux) "
+                                 "(padrão: psutil)")
+
+  addSourceArguments(write_parser)
+
+  read_parser = subparsers.add_parser("read", help="Escreve as linhas de um fluxo gravado, uma linha JSON por linha")
+  read_parser.add_argument("--directory", required=True,
+                           help="Diretório do arquivo")
+  read_parser.add_argument("--stream", choices=list(STREAMS.keys()), required=True,
+                           help="Fluxo lido")
+  read_parser.add_argument("--start", type=float, default=None,
+                           help="Início do intervalo, em segundos desde a época")
+  read_parser.add_argument("--end", type=float, default=None,
+                           help="Fim do intervalo, em segundos desde a época")
+  read_parser.add_argument("--last", type=float, default=None,
+                           help="Lê apenas os últimos N segundos gravados, sem o instante inicial da janela (ignora --start e --end)")
+
+  return parser.parse_args(argv)
+
+
+def writeArchive(args: argparse.Namespace) -> int:
+
+  collector = SnapshotCollector(processes_top_count=args.top, processes_top_by="cpu",
+                                source=sourceFromArguments(args), process_backend=args.process_backend)
+
+  writer = ArchiveWriter(args.directory, args.chunk_seconds, int(args.max_segment_mb * 1024 ** 2),
+                         int(args.max_total_mb * 1024 ** 2), args.top)
+
+  start = time.monotonic()
+  iteration = 0
+
+  try:
+
+    while args.count <= 0 or iteration < args.count:
+
+      # Todos os módulos do ciclo leem a mesma leitura da fonte
+      collector.advance()
+
+      for module in args.modules:
+
+        try:
+
+          writer.record(collector.collect(module))
+
+        except Exception as error:
+
+          # Uma falha em um módulo (ex.: computador sem bateria) não interrompe a gravação dos demais
+          print(f"Não foi possível coletar as informações do módulo '{module}': {error}", file=sys.stderr)
+
+      iteration += 1
+
+      if args.count > 0 and iteration >= args.count:
+
+        break
+
+      # Os instantes das coletas são calculados a partir do início, para que os atrasos não se acumulem
+      time.sleep(max(0.0, start + iteration * args.interval - time.monotonic()))
+
+  except KeyboardInterrupt:
+
+    pass
+
+  finally:
+
+    # As linhas que ainda não formaram um bloco são gravadas antes de sair
+    writer.close()
+
+  return 0
+
+
+def readArchive(args: argparse.Namespace) -> int:
+
+  # O leitor depende do NumPy, então só é importado na consulta
+  from src.archive.archive_reader import ArchiveReader
+
+  reader = ArchiveReader(args.directory)
+  start, end = args.start, args.end
+  exclusive_start = False
+
+  if args.last is not None:
+
+    time_range = reader.timeRange()
+
+    if time_range is None:
+
+      return 0
+
+    # A janela é (última - N, última]: com uma coleta por segundo, --last 10 lê 10 coletas, e não 11
+    start, end, exclusive_start = time_range[1] - args.last, None, True
+
+  columns = reader.query(args.stream, start, end, exclusive_start)
+  names = [name for name, _ in STREAM_COLUMNS[args.stream] if name in columns]
+
+  # Os valores em float32 são arredondados, para não escrever os dígitos espúrios da conversão para float64
+  values = [columns[name].astype("f8").round(4).tolist() if columns[name].dtype.kind == "f" else columns[name].tolist()
+            for name in names]
+
+  for row in zip(*values):
+
+    sys.stdout.write(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n")
+
+  return 0
+
+
+def runArchive(argv: List[str]) -> int:
+
+  """Ponto de entrada do arquivo de métricas (python main.py archive write|read)
+
+  A gravação, assim como o modo "collect", não importa PySide6, pandas nem NumPy.
+  """
+
+  args = parseArguments(argv)
+
+  if args.action == "write":
+
+    return writeArchive(args)
+
+  return readArchive(args)
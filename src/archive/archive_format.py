@@ -0,0 +1,88 @@
+import struct
+from typing import Dict, List, Tuple
+
+
+# Cabeçalho de cada segmento: identificação e versão do formato
+SEGMENT_MAGIC: bytes = b"SMAR"
+SEGMENT_VERSION: int = 1
+SEGMENT_HEADER = struct.Struct("<4sHxx")
+
+# Extensões dos arquivos de um segmento: os blocos comprimidos e o índice dos blocos
+SEGMENT_EXTENSION: str = ".seg"
+INDEX_EXTENSION: str = ".idx"
+
+# Registro do índice de cada bloco: primeiro e último instante, posição e tamanho no segmento, e o fluxo
+INDEX_RECORD = struct.Struct("<ddQIHxx")
+
+# Tamanho do cabeçalho de um bloco, que guarda o tamanho da descrição (JSON) das colunas
+CHUNK_HEADER = struct.Struct("<I")
+
+# Nível de compressão do zlib: os blocos são pequenos, então níveis maiores quase não reduzem o tamanho
+COMPRESSION_LEVEL: int = 6
+
+# Tipos das colunas:
+#   "time": instante em segundos, guardado em milissegundos com codificação delta
+#   "int": inteiro com codificação delta
+#   "float": float32
+#   "label": texto, guardado como o código em um dicionário de textos do bloco (com codificação delta)
+TIME_COLUMN = "time"
+INT_COLUMN = "int"
+FLOAT_COLUMN = "float"
+LABEL_COLUMN = "label"
+
+# Fluxos gravados -> identificador no índice
+STREAMS: Dict[str, int] = {
+  "cpu": 0,
+  "disks": 1,
+  "battery": 2,
+  "processes": 3
+}
+
+# Colunas de cada fluxo (nome, tipo), uma linha por unidade (CPU, partição ou processo) em cada coleta
+STREAM_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+  "cpu": [
+    ("time", TIME_COLUMN),
+    ("cpu_id", INT_COLUMN),
+    ("used_percentage", FLOAT_COLUMN)
+  ],
+  "disks": [
+    ("time", TIME_COLUMN),
+    ("mountpoint_path", LABEL_COLUMN),
+    ("used_percentage", FLOAT_COLUMN),
+    ("read_bytes_per_second", FLOAT_COLUMN),
+    ("write_bytes_per_second", FLOAT_COLUMN),
+    ("iops", FLOAT_COLUMN),
+    ("busy_percentage", FLOAT_COLUMN)
+  ],
+  "battery": [
+    ("time", TIME_COLUMN),
+    ("percentage_remaining", FLOAT_COLUMN),
+    ("time_left", INT_COLUMN),
+    ("is_charging", INT_COLUMN)
+  ],
+  "processes": [
+    ("time", TIME_COLUMN),
+    ("pid", INT_COLUMN),
+    ("name", LABEL_COLUMN),
+    ("cpu_used_percentage", FLOAT_COLUMN),
+    ("memory_used_percent", FLOAT_COLUMN)
+  ]
+}
+
+# Tamanho em bytes do valor guardado de cada tipo, usado no embaralhamento dos bytes
+COLUMN_ITEM_SIZES: Dict[str, int] = {
+  TIME_COLUMN: 8,
+  INT_COLUMN: 8,
+  FLOAT_COLUMN: 4,
+  LABEL_COLUMN: 8
+}
+
+
+def shuffleBytes(data: bytes, item_size: int) -> bytes:
+
+  """Agrupa os bytes de mesma posição de todos os valores (todos os primeiros bytes, depois todos os segundos...)
+
+  Valores próximos (como os deltas e as porcentagens) têm os bytes mais significativos iguais, o que deixa sequências longas de bytes repetidos para o zlib.
+  """
+
+  return b"".join(data[position::item_size] for position in range(0, item_size))
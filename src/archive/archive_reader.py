@@ -0,0 +1,187 @@
+import numpy as np
+
+
+import json
+import mmap
+import os
+import zlib
+from typing import Dict, List, Tuple
+
+
+from src.archive.archive_format import (
+  SEGMENT_MAGIC, SEGMENT_VERSION, SEGMENT_HEADER, SEGMENT_EXTENSION, INDEX_EXTENSION, INDEX_RECORD, CHUNK_HEADER,
+  TIME_COLUMN, FLOAT_COLUMN, LABEL_COLUMN, STREAMS, COLUMN_ITEM_SIZES
+)
+
+
+# Registro do índice (INDEX_RECORD) como tipo do NumPy, para ler o índice inteiro de uma vez
+INDEX_DTYPE = np.dtype([("first_time", "<f8"), ("last_time", "<f8"), ("offset", "<u8"), ("length", "<u4"),
+                        ("stream", "<u2"), ("padding", "<u2")])
+
+
+class ArchiveReader:
+
+  """
+  Leitura de um arquivo gravado pelo ArchiveWriter
+
+  As consultas por intervalo de tempo leem os índices dos segmentos e descomprimem apenas os blocos que se sobrepõem ao intervalo. Os segmentos e os índices são mapeados na memória, então os demais blocos nunca são lidos do disco.
+  """
+
+  def __init__(self, directory: str) -> None:
+
+    if not os.path.isdir(directory):
+
+      raise ValueError(f"O diretório '{directory}' não existe!")
+
+    self.__directory = directory
+
+  def segments(self) -> List[str]:
+
+    """Caminhos dos segmentos (sem extensão), do mais antigo para o mais recente
+    """
+
+    return [os.path.join(self.__directory, entry[:-len(SEGMENT_EXTENSION)])
+            for entry in sorted(os.listdir(self.__directory)) if entry.endswith(SEGMENT_EXTENSION)]
+
+  def timeRange(self) -> Tuple[float, float] | None:
+
+    """Primeiro e último instante gravados, ou None se o arquivo estiver vazio
+    """
+
+    first_times: List[float] = list()
+    last_times: List[float] = list()
+
+    for path in self.segments():
+
+      index = self.__readIndex(path)
+
+      if len(index):
+
+        first_times.append(float(index["first_time"].min()))
+        last_times.append(float(index["last_time"].max()))
+
+    return (min(first_times), max(last_times)) if first_times else None
+
+  def query(self, stream: str, start: float | None = None, end: float | None = None,
+            exclusive_start: bool = False) -> Dict[str, np.ndarray]:
+
+    """Lê as linhas de um fluxo em um intervalo de tempo
+
+    Parameters
+    ----------
+    stream : str
+      Fluxo lido (ver STREAMS)
+    start : float | None
+      Início do intervalo, em segundos desde a época (inclusivo, a não ser com exclusive_start). Sem ele, desde o início do arquivo
+    end : float | None
+      Fim do intervalo (inclusivo). Sem ele, até o fim do arquivo
+    exclusive_start : bool
+      Exclui as linhas do próprio instante de início, para que o intervalo tenha exatamente a duração pedida (ex.: os últimos N segundos)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+      Colunas do fluxo (ver STREAM_COLUMNS), com a coluna "time" em segundos desde a época e as colunas de texto como arrays de objetos
+    """
+
+    if stream not in STREAMS:
+
+      raise ValueError(f"O fluxo '{stream}' não existe!")
+
+    start = -np.inf if start is None else start
+    end = np.inf if end is None else end
+
+    after_start = np.greater if exclusive_start else np.greater_equal
+
+    chunks: List[Dict[str, np.ndarray]] = list()
+
+    for path in self.segments():
+
+      index = self.__readIndex(path)
+      selected = index[(index["stream"] == STREAMS[stream])
+                       & after_start(index["last_time"], start) & (index["first_time"] <= end)]
+
+      if not len(selected):
+
+        continue
+
+      with open(path + SEGMENT_EXTENSION, "rb") as segment_stream, \
+           mmap.mmap(segment_stream.fileno(), 0, access=mmap.ACCESS_READ) as segment:
+
+        header = SEGMENT_HEADER.unpack_from(segment)
+
+        if header != (SEGMENT_MAGIC, SEGMENT_VERSION):
+
+          raise ValueError(f"O arquivo '{path + SEGMENT_EXTENSION}' não é um segmento de métricas suportado!")
+
+        for record in selected:
+
+          # A visão do bloco é liberada logo após a decodificação, para que o mapeamento possa ser fechado
+          with memoryview(segment)[record["offset"]:record["offset"] + record["length"]] as chunk_view:
+
+            chunk = decodeChunk(chunk_view)
+
+          # Os blocos nas bordas do intervalo têm linhas de fora dele
+          rows = after_start(chunk[TIME_COLUMN], start) & (chunk[TIME_COLUMN] <= end)
+          chunks.append({name: column[rows] for name, column in chunk.items()})
+
+    if not chunks:
+
+      return dict()
+
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+  def __readIndex(self, path: str) -> np.ndarray:
+
+    size = os.path.getsize(path + INDEX_EXTENSION) if os.path.exists(path + INDEX_EXTENSION) else 0
+
+    # Um registro incompleto no fim (gravação interrompida) é ignorado
+    count = size // INDEX_RECORD.size
+
+    if not count:
+
+      return np.empty(0, dtype=INDEX_DTYPE)
+
+    return np.memmap(path + INDEX_EXTENSION, dtype=INDEX_DTYPE, mode="r", shape=(count,))
+
+
+def decodeChunk(chunk: memoryview) -> Dict[str, np.ndarray]:
+
+  """Decodifica um bloco gravado por StreamBuffer.encode
+  """
+
+  description_length, = CHUNK_HEADER.unpack_from(chunk)
+  position = CHUNK_HEADER.size + description_length
+  description = json.loads(bytes(chunk[CHUNK_HEADER.size:position]))
+
+  columns: Dict[str, np.ndarray] = dict()
+
+  for column_description in description["columns"]:
+
+    column_type = column_description["type"]
+    item_size = COLUMN_ITEM_SIZES[column_type]
+
+    data = zlib.decompress(chunk[position:position + column_description["length"]])
+    position += column_description["length"]
+
+    # Desfaz o embaralhamento dos bytes: cada linha da matriz é uma posição de byte de todos os valores
+    values = np.frombuffer(data, dtype=np.uint8).reshape(item_size, -1).T.copy()
+
+    if column_type == FLOAT_COLUMN:
+
+      columns[column_description["name"]] = values.view("<f4").ravel()
+      continue
+
+    column = np.cumsum(values.view("<i8").ravel())
+
+    if column_type == TIME_COLUMN:
+
+      column = column / 1000.0
+
+    elif column_type == LABEL_COLUMN:
+
+      column = np.array(column_description["labels"], dtype=object)[column]
+
+    columns[column_description["name"]] = column
+
+  return columns
@@ -0,0 +1,312 @@
+import heapq
+import json
+import os
+import zlib
+from array import array
+from typing import Any, BinaryIO, Dict, List
+
+
+from src.archive.archive_format import (
+  SEGMENT_MAGIC, SEGMENT_VERSION, SEGMENT_HEADER, SEGMENT_EXTENSION, INDEX_EXTENSION, INDEX_RECORD, CHUNK_HEADER,
+  COMPRESSION_LEVEL, FLOAT_COLUMN, LABEL_COLUMN, STREAMS, STREAM_COLUMNS,
+  COLUMN_ITEM_SIZES, shuffleBytes
+)
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.battery.battery_info_manager import BatteryInfoManager
+from src.sampling.snapshot_collector import ModuleSnapshot
+
+
+class StreamBuffer:
+
+  """
+  Linhas de um fluxo ainda não gravadas, guardadas por coluna até formarem um bloco
+  """
+
+  def __init__(self, stream: str) -> None:
+
+    self.__stream = stream
+    self.__columns_types = STREAM_COLUMNS[stream]
+    self.__columns: List[array] = list()
+    self.__labels: List[Dict[str, int]] = list()
+    self.__first_time = 0.0
+    self.__last_time = 0.0
+
+    self.clear()
+
+  @property
+  def stream(self) -> str:
+
+    return self.__stream
+
+  @property
+  def rows_count(self) -> int:
+
+    return len(self.__columns[0])
+
+  @property
+  def first_time(self) -> float:
+
+    return self.__first_time
+
+  @property
+  def last_time(self) -> float:
+
+    return self.__last_time
+
+  def clear(self) -> None:
+
+    self.__columns = [array("f" if column_type == FLOAT_COLUMN else "q") for _, column_type in self.__columns_types]
+    self.__labels = [dict() for _ in self.__columns_types]
+
+  def append(self, timestamp: float, values: List[Any]) -> None:
+
+    """Acrescenta uma linha. Os valores seguem as colunas do fluxo (STREAM_COLUMNS), sem a coluna do instante
+    """
+
+    if not self.rows_count:
+
+      self.__first_time = timestamp
+
+    self.__last_time = timestamp
+
+    columns = self.__columns
+    columns[0].append(round(timestamp * 1000))
+
+    for position, value in enumerate(values, start=1):
+
+      column_type = self.__columns_types[position][1]
+
+      if column_type == LABEL_COLUMN:
+
+        labels = self.__labels[position]
+        columns[position].append(labels.setdefault(value, len(labels)))
+
+      elif column_type == FLOAT_COLUMN:
+
+        columns[position].append(value if value is not None else float("nan"))
+
+      else:
+
+        columns[position].append(int(value) if value is not None else 0)
+
+  def encode(self) -> bytes:
+
+    """Codifica as linhas em um bloco: a descrição das colunas (JSON) seguida de cada coluna comprimida
+    """
+
+    columns_description: List[Dict[str, Any]] = list()
+    blobs: List[bytes] = list()
+
+    for (name, column_type), column, labels in zip(self.__columns_types, self.__columns, self.__labels):
+
+      if column_type != FLOAT_COLUMN:
+
+        # Codificação delta: o primeiro valor seguido das diferenças entre valores consecutivos
+        column = array("q", [column[0]] + [current - previous for previous, current in zip(column, column[1:])])
+
+      blob = zlib.compress(shuffleBytes(column.tobytes(), COLUMN_ITEM_SIZES[column_type]), COMPRESSION_LEVEL)
+      blobs.append(blob)
+
+      description: Dict[str, Any] = {"name": name, "type": column_type, "length": len(blob)}
+
+      if column_type == LABEL_COLUMN:
+
+        description["labels"] = list(labels.keys())
+
+      columns_description.append(description)
+
+    description_bytes = json.dumps({"stream": self.__stream, "rows": self.rows_count,
+                                    "columns": columns_description}).encode("utf-8")
+
+    return CHUNK_HEADER.pack(len(description_bytes)) + description_bytes + b"".join(blobs)
+
+
+class ArchiveWriter:
+
+  """
+  Gravação contínua das coletas em disco, para análise depois de uma falha do sistema
+
+  As linhas de cada fluxo (CPU, partições, bateria e processos) ficam em memória e são gravadas em blocos colunares comprimidos, um a cada 'chunk_seconds'. Cada bloco é acrescentado ao segmento atual e depois registrado no índice do segmento, então um bloco interrompido no meio nunca é lido. Os segmentos são trocados ao atingir 'max_segment_bytes', e os mais antigos são apagados quando o arquivo inteiro passa de 'max_total_bytes'.
+
+  Não depende do NumPy, para que possa ser usado no modo sem interface gráfica.
+  """
+
+  def __init__(self, directory: str, chunk_seconds: float = 60.0, max_segment_bytes: int = 16 * 1024 ** 2,
+               max_total_bytes: int = 256 * 1024 ** 2, top_processes_count: int = 10) -> None:
+
+    """
+    Parameters
+    ----------
+    directory : str
+      Diretório do arquivo (criado se não existir)
+    chunk_seconds : float
+      Intervalo coberto por cada bloco. Em uma queda do sistema, perde-se no máximo esse intervalo
+    max_segment_bytes : int
+      Tamanho a partir do qual o segmento é trocado por um novo
+    max_total_bytes : int
+      Tamanho máximo de todos os segmentos; os mais antigos são apagados para respeitá-lo
+    top_processes_count : int
+      Quantidade de processos (os de maior uso de CPU) gravados a cada coleta de processos
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    self.__directory = directory
+    self.__chunk_seconds = chunk_seconds
+    self.__max_segment_bytes = max_segment_bytes
+    self.__max_total_bytes = max_total_bytes
+    self.__top_processes_count = top_processes_count
+
+    self.__buffers: Dict[str, StreamBuffer] = {stream: StreamBuffer(stream) for stream in STREAMS}
+
+    # Segmento atual, aberto na gravação do primeiro bloco. Cada execução começa um segmento novo
+    self.__segment: BinaryIO | None = None
+    self.__index: BinaryIO | None = None
+
+  def record(self, snapshot: ModuleSnapshot) -> None:
+
+    """Acrescenta o resultado de uma coleta, gravando o bloco do fluxo se ele já cobrir 'chunk_seconds'
+    """
+
+    info_obj = snapshot.info_manager
+    timestamp = snapshot.collected_at
+
+    if isinstance(info_obj, CPUsInfoManager):
+
+      buffer = self.__buffers["cpu"]
+
+      for cpu_info in info_obj.cpus_info:
+
+        buffer.append(timestamp, [cpu_info.cpu_id, cpu_info.used_percentage])
+
+    elif isinstance(info_obj, DiskPartitionsInfoManager):
+
+      buffer = self.__buffers["disks"]
+
+      for partition_info in info_obj.disk_partitions_info:
+
+        buffer.append(timestamp, [partition_info.mountpoint_path, partition_info.used_percentage,
+                                  partition_info.read_bytes_per_second, partition_info.write_bytes_per_second,
+                                  partition_info.iops, partition_info.busy_percentage])
+
+    elif isinstance(info_obj, BatteryInfoManager):
+
+      buffer = self.__buffers["battery"]
+      buffer.append(timestamp, [info_obj.percentage_remaining, info_obj.time_left, info_obj.is_charging])
+
+    elif isinstance(info_obj, ProcessesInfoManager):
+
+      buffer = self.__buffers["processes"]
+      snapshot_columns = info_obj.snapshot
+      cpu_percentages = snapshot_columns.column("cpu_percent")
+
+      # Apenas os processos de maior uso de CPU são gravados
+      for row in heapq.nlargest(self.__top_processes_count, range(0, len(cpu_percentages)),
+                                key=cpu_percentages.__getitem__):
+
+        process_info = snapshot_columns[row]
+        buffer.append(timestamp, [process_info.pid, process_info.name, process_info.cpu_used_percentage,
+                                  process_info.memory_used_percent])
+
+    else:
+
+      return
+
+    if buffer.last_time - buffer.first_time >= self.__chunk_seconds:
+
+      self.__writeChunk(buffer)
+
+  def flush(self) -> None:
+
+    """Grava os blocos de todas as linhas pendentes, mesmo os que ainda não cobrem 'chunk_seconds'
+    """
+
+    for buffer in self.__buffers.values():
+
+      if buffer.rows_count:
+
+        self.__writeChunk(buffer)
+
+  def close(self) -> None:
+
+    self.flush()
+    self.__closeSegment()
+
+  def __writeChunk(self, buffer: StreamBuffer) -> None:
+
+    chunk = buffer.encode()
+
+    if self.__segment is None:
+
+      self.__openSegment(buffer.first_time)
+
+    offset = self.__segment.tell()
+
+    # O bloco vai para o disco antes do registro no índice: na leitura, só os blocos indexados existem
+    self.__segment.write(chunk)
+    self.__segment.flush()
+    os.fsync(self.__segment.fileno())
+
+    self.__index.write(INDEX_RECORD.pack(buffer.first_time, buffer.last_time, offset, len(chunk),
+                                         STREAMS[buffer.stream]))
+    self.__index.flush()
+    os.fsync(self.__index.fileno())
+
+    buffer.clear()
+
+    if self.__segment.tell() >= self.__max_segment_bytes:
+
+      self.__closeSegment()
+      self.__removeOldSegments()
+
+  def __openSegment(self, timestamp: float) -> None:
+
+    # Os nomes dos segmentos começam pelo instante do primeiro bloco, então a ordem alfabética é a cronológica
+    name = f"segment-{round(timestamp * 1000):015d}"
+    suffix = 0
+
+    while os.path.exists(os.path.join(self.__directory, name + SEGMENT_EXTENSION)):
+
+      suffix += 1
+      name = f"segment-{round(timestamp * 1000):015d}-{suffix}"
+
+    path = os.path.join(self.__directory, name)
+
+    self.__segment = open(path + SEGMENT_EXTENSION, "wb")
+    self.__segment.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION))
+    self.__index = open(path + INDEX_EXTENSION, "wb")
+
+  def __closeSegment(self) -> None:
+
+    if self.__segment is not None:
+
+      self.__segment.close()
+      self.__index.close()
+
+      self.__segment = None
+      self.__index = None
+
+  def __removeOldSegments(self) -> None:
+
+    segments = sorted(entry for entry in os.listdir(self.__directory) if entry.endswith(SEGMENT_EXTENSION))
+    paths = [os.path.join(self.__directory, segment[:-len(SEGMENT_EXTENSION)]) for segment in segments]
+
+    sizes = [os.path.getsize(path + SEGMENT_EXTENSION) for path in paths]
+    total_bytes = sum(sizes)
+
+    # O segmento mais recente nunca é apagado
+    for path, size in zip(paths[:-1], sizes[:-1]):
+
+      if total_bytes <= self.__max_total_bytes:
+
+        break
+
+      os.remove(path + SEGMENT_EXTENSION)
+
+      if os.path.exists(path + INDEX_EXTENSION):
+
+        os.remove(path + INDEX_EXTENSION)
+
+      total_bytes -= size
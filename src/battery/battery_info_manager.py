@@ -1,6 +1,7 @@
 import psutil
 
 from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
 
 class BatteryInfoManager(InfoManager):
 
@@ -8,9 +9,23 @@ class BatteryInfoManager(InfoManager):
   Classe que representa um gerenciador de informações sobre a bateria
   """
 
-  def __init__(self) -> None:
+  def __init__(self, source: MetricsSource | None = None) -> None:
 
-    sbattery: psutil._common.sbattery = psutil.sensors_battery()
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, lê o sistema ao vivo
+    """
+
+    super().__init__(source)
+
+    sbattery: psutil._common.sbattery | None = self.source.battery()
+
+    # Computadores sem bateria (ex.: servidores e desktops)
+    if sbattery is None:
+
+      raise RuntimeError("Nenhuma bateria foi encontrada no sistema!")
 
     self.__percentage_remaining = sbattery.percent
     self.__time_left = sbattery.secsleft
@@ -12,12 +12,21 @@ class CPUInfo(UnitInfo):
   
   """
 
+  __slots__ = ("__cpu_id", "__used_percentage", "__user_percentage", "__system_percentage", "__iowait_percentage",
+               "__current_frequency", "__minimum_frequency", "__maximum_frequency")
+
   def __init__(self, cpu_id: int, 
                used_percentage: float, 
-               frequencies: psutil._common.scpufreq) -> None:
+               frequencies: psutil._common.scpufreq,
+               user_percentage: float = 0.0,
+               system_percentage: float = 0.0,
+               iowait_percentage: float = 0.0) -> None:
 
     self.__cpu_id = cpu_id
     self.__used_percentage = used_percentage
+    self.__user_percentage = user_percentage
+    self.__system_percentage = system_percentage
+    self.__iowait_percentage = iowait_percentage
     self.__current_frequency = frequencies.current
     self.__minimum_frequency = frequencies.min
     self.__maximum_frequency = frequencies.max
@@ -32,6 +41,25 @@ class CPUInfo(UnitInfo):
 
     return self.__used_percentage
   
+  @property
+  def user_percentage(self) -> float:
+
+    return self.__user_percentage
+  
+  @property
+  def system_percentage(self) -> float:
+
+    return self.__system_percentage
+  
+  @property
+  def iowait_percentage(self) -> float:
+
+    """
+    Porcentagem do tempo ociosa esperando operações de E/S (apenas Linux)
+    """
+
+    return self.__iowait_percentage
+  
   @property
   def current_frequency(self) -> float:
 
@@ -0,0 +1,215 @@
+import psutil
+import psutil._common
+
+
+from typing import List, NamedTuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
+
+# Campos de cpu_times que já estão contabilizados em user e nice (Linux), e por isso ficam fora do tempo total
+GUEST_FIELDS = ("guest", "guest_nice")
+
+
+class CPUSample:
+
+  """
+
+  Representa as métricas da CPU calculadas entre duas leituras consecutivas do CPUSampler
+
+  """
+
+  def __init__(self, used_percentages: List[float],
+               user_percentages: List[float],
+               system_percentages: List[float],
+               iowait_percentages: List[float],
+               frequencies: List[psutil._common.scpufreq],
+               cpu_stats: psutil._common.scpustats,
+               context_switches_per_second: float,
+               hardware_interrupts_per_second: float,
+               interval: float) -> None:
+
+    self.__used_percentages = used_percentages
+    self.__user_percentages = user_percentages
+    self.__system_percentages = system_percentages
+    self.__iowait_percentages = iowait_percentages
+    self.__frequencies = frequencies
+    self.__cpu_stats = cpu_stats
+    self.__context_switches_per_second = context_switches_per_second
+    self.__hardware_interrupts_per_second = hardware_interrupts_per_second
+    self.__interval = interval
+
+  @property
+  def used_percentages(self) -> List[float]:
+
+    return self.__used_percentages
+
+  @property
+  def user_percentages(self) -> List[float]:
+
+    return self.__user_percentages
+
+  @property
+  def system_percentages(self) -> List[float]:
+
+    return self.__system_percentages
+
+  @property
+  def iowait_percentages(self) -> List[float]:
+
+    return self.__iowait_percentages
+
+  @property
+  def frequencies(self) -> List[psutil._common.scpufreq]:
+
+    """
+    Frequências de cada CPU lógica (repetidas quando o sistema informa uma única frequência para todas)
+    """
+
+    return self.__frequencies
+
+  @property
+  def cpu_stats(self) -> psutil._common.scpustats:
+
+    return self.__cpu_stats
+
+  @property
+  def context_switches_per_second(self) -> float:
+
+    return self.__context_switches_per_second
+
+  @property
+  def hardware_interrupts_per_second(self) -> float:
+
+    return self.__hardware_interrupts_per_second
+
+  @property
+  def interval(self) -> float:
+
+    """
+    Intervalo, em segundos, entre esta leitura e a anterior
+    """
+
+    return self.__interval
+
+
+class CPUReading(NamedTuple):
+
+  """
+  Leitura bruta dos contadores da CPU guardada entre as amostras
+  """
+
+  timestamp: float
+  cpu_times: List[tuple] # scputimes de cada CPU (os campos variam conforme a plataforma)
+  cpu_stats: psutil._common.scpustats
+
+
+class CPUSampler:
+
+  """
+
+  Amostrador da CPU. Lê cpu_times, cpu_stats e cpu_freq uma única vez por amostra e calcula as métricas pela diferença em relação à amostra anterior.
+
+  Na primeira amostra a diferença é feita em relação à inicialização do sistema (médias desde o boot).
+
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+    self.__previous_reading: CPUReading | None = None
+
+  def sample(self) -> CPUSample:
+
+    """Lê os contadores da CPU e calcula as métricas desde a amostra anterior
+
+    Returns
+    -------
+    CPUSample
+      Métricas de uso de cada CPU e taxas por segundo
+    """
+
+    reading = CPUReading(self.__source.time(), self.__source.cpuTimes(), self.__source.cpuStats())
+
+    previous_reading = self.__previous_reading
+
+    if previous_reading is None:
+
+      # Sem leitura anterior, os contadores são comparados com os valores do boot (todos zerados)
+      zeroed_times = type(reading.cpu_times[0])(*([0.0] * len(reading.cpu_times[0])))
+      zeroed_stats = type(reading.cpu_stats)(*([0] * len(reading.cpu_stats)))
+
+      previous_reading = CPUReading(self.__source.bootTime(),
+                                    [zeroed_times] * len(reading.cpu_times),
+                                    zeroed_stats)
+
+    self.__previous_reading = reading
+
+    used_percentages: List[float] = list()
+    user_percentages: List[float] = list()
+    system_percentages: List[float] = list()
+    iowait_percentages: List[float] = list()
+
+    for current_times, previous_times in zip(reading.cpu_times, previous_reading.cpu_times):
+
+      deltas = {field: max(0.0, getattr(current_times, field) - getattr(previous_times, field))
+                for field in current_times._fields}
+
+      total = sum(delta for field, delta in deltas.items() if field not in GUEST_FIELDS)
+
+      # Sem tempo decorrido desde a última leitura, não há o que medir
+      if total <= 0:
+
+        used_percentages.append(0.0)
+        user_percentages.append(0.0)
+        system_percentages.append(0.0)
+        iowait_percentages.append(0.0)
+        continue
+
+      iowait = deltas.get("iowait", 0.0)
+
+      # Mesma definição de ocupação usada pelo psutil.cpu_percent: tudo que não é ocioso nem espera de E/S
+      used_percentages.append(round((total - deltas["idle"] - iowait) / total * 100, 2))
+      user_percentages.append(round((deltas["user"] + deltas.get("nice", 0.0)) / total * 100, 2))
+      system_percentages.append(round(deltas["system"] / total * 100, 2))
+      iowait_percentages.append(round(iowait / total * 100, 2))
+
+    interval = max(reading.timestamp - previous_reading.timestamp, 1e-6)
+
+    context_switches_per_second = (reading.cpu_stats.ctx_switches - previous_reading.cpu_stats.ctx_switches) / interval
+    hardware_interrupts_per_second = (reading.cpu_stats.interrupts - previous_reading.cpu_stats.interrupts) / interval
+
+    return CPUSample(used_percentages,
+                     user_percentages,
+                     system_percentages,
+                     iowait_percentages,
+                     self.__readFrequencies(len(reading.cpu_times)),
+                     reading.cpu_stats,
+                     round(context_switches_per_second, 2),
+                     round(hardware_interrupts_per_second, 2),
+                     interval)
+
+  def __readFrequencies(self, cpu_count: int) -> List[psutil._common.scpufreq]:
+
+    """Lê as frequências de todas as CPUs em uma única chamada
+    """
+
+    frequencies: List[psutil._common.scpufreq] = self.__source.cpuFrequencies()
+
+    # Alguns sistemas informam uma única frequência para todas as CPUs (ou nenhuma)
+    if len(frequencies) != cpu_count:
+
+      shared_frequency = frequencies[0] if frequencies else psutil._common.scpufreq(0.0, 0.0, 0.0)
+
+      frequencies = [shared_frequency] * cpu_count
+
+    return frequencies
@@ -1,8 +1,9 @@
-import psutil
 from typing import List
 
 from src.cpus.cpu_info import CPUInfo
+from src.cpus.cpu_sampler import CPUSampler
 from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
 
 class CPUsInfoManager(InfoManager):
 
@@ -12,34 +13,45 @@ class CPUsInfoManager(InfoManager):
 
   """
 
-  def __init__(self) -> None:
+  def __init__(self, sampler: CPUSampler | None = None, source: MetricsSource | None = None) -> None:
 
-    self.__cpus_info: List[CPUInfo] = list()
+    """
+    Parameters
+    ----------
+    sampler : CPUSampler | None
+      Amostrador reaproveitado entre as atualizações, para que o uso seja medido desde a atualização anterior. Sem ele, o uso é a média desde a inicialização do sistema
+    source : MetricsSource | None
+      Fonte das métricas (a mesma lida pelo amostrador). Sem ela, lê o sistema ao vivo
+    """
 
-    self.__cpu_count = psutil.cpu_count(logical=True)
-    self.__physical_cores_count = psutil.cpu_count(logical=False)
+    super().__init__(source)
 
-    self.__context_switches_count = psutil.cpu_stats().ctx_switches
-    self.__hardware_interrupts_count = psutil.cpu_stats().interrupts
+    self.__cpus_info: List[CPUInfo] = list()
 
-    for i in range(0, self.__cpu_count):
+    if sampler is None:
 
-      used_percentage = psutil.cpu_percent(percpu=True)[i]
+      sampler = CPUSampler(self.source)
 
-      """
+    # Todos os contadores são lidos uma única vez por atualização
+    sample = sampler.sample()
 
-      Verifica se cada CPU possui informações distintas, ou todos eles possuem a mesma informação (Um único elemento scpufreq com a informação de todos).
+    self.__cpu_count = len(sample.used_percentages)
+    self.__physical_cores_count = self.source.cpuCount(logical=False)
 
-      """
-      if len(psutil.cpu_freq(percpu=True)) == 1:
+    self.__context_switches_count = sample.cpu_stats.ctx_switches
+    self.__hardware_interrupts_count = sample.cpu_stats.interrupts
 
-        frequencies = psutil.cpu_freq(percpu=True)[0]
-      
-      else:
+    self.__context_switches_per_second = sample.context_switches_per_second
+    self.__hardware_interrupts_per_second = sample.hardware_interrupts_per_second
 
-        frequencies = psutil.cpu_freq(percpu=True)[i]
+    for i in range(0, self.__cpu_count):
 
-      self.__cpus_info.append(CPUInfo(i, used_percentage, frequencies))
+      self.__cpus_info.append(CPUInfo(i, 
+                                      sample.used_percentages[i], 
+                                      sample.frequencies[i],
+                                      user_percentage=sample.user_percentages[i],
+                                      system_percentage=sample.system_percentages[i],
+                                      iowait_percentage=sample.iowait_percentages[i]))
   
   @property
   def cpus_info(self) -> List[CPUInfo]:
@@ -66,3 +78,13 @@ class CPUsInfoManager(InfoManager):
 
     return self.__hardware_interrupts_count
 
+  @property
+  def context_switches_per_second(self) -> float:
+
+    return self.__context_switches_per_second
+  
+  @property
+  def hardware_interrupts_per_second(self) -> float:
+
+    return self.__hardware_interrupts_per_second
+
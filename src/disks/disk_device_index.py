@@ -0,0 +1,122 @@
+import os
+import re
+from typing import Dict, List
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
+
+# Diretório do sysfs com um link para cada dispositivo de bloco (Linux)
+SYS_BLOCK_DIR: str = "/sys/class/block"
+
+# Partições do macOS (ex.: disk1s2) pertencem ao disco disk1
+MACOS_PARTITION_PATTERN = re.compile(r"^(disk\d+)s\d+")
+
+
+class DiskDeviceIndex:
+
+  """
+
+  Índice que associa o dispositivo de cada partição (ex.: /dev/sda1, /dev/mapper/vg-root) às chaves de psutil.disk_io_counters(perdisk=True).
+
+  A resolução segue links simbólicos (/dev/mapper/* -> dm-N), sobe da partição para o disco pai quando a partição não tem contadores próprios, e, para volumes lógicos sem contadores, usa os dispositivos que os compõem. O resultado de cada dispositivo fica em cache.
+
+  Os arquivos locais só descrevem os dispositivos deste computador. Com uma fonte que reproduz outro computador (gravação, agente remoto), os dispositivos são os resolvidos no computador de origem e informados pela fonte (ver MetricsSource.diskDevices).
+
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das partições e dos contadores. Sem ela, resolve os dispositivos do sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    self.__cache: Dict[str, List[str]] = dict()
+
+  def resolve(self, device_path: str, counter_keys) -> List[str]:
+
+    """Retorna as chaves dos contadores de E/S de um dispositivo
+
+    Parameters
+    ----------
+    device_path : str
+      Caminho do dispositivo da partição (sdiskpart.device)
+    counter_keys : Collection[str]
+      Chaves retornadas por psutil.disk_io_counters(perdisk=True)
+
+    Returns
+    -------
+    List[str]
+      Chaves cujos contadores correspondem ao dispositivo (mais de uma quando o volume é composto por vários dispositivos), ou lista vazia se nenhuma corresponder
+    """
+
+    devices = self.__source.diskDevices()
+
+    if devices is not None:
+
+      return [key for key in devices.get(device_path, list()) if key in counter_keys]
+
+    keys = self.__cache.get(device_path)
+
+    # O cache só vale enquanto as chaves resolvidas continuarem existindo (ex.: disco removido)
+    if keys is None or any(key not in counter_keys for key in keys):
+
+      keys = self.__resolve(device_path, counter_keys)
+      self.__cache[device_path] = keys
+
+    return keys
+
+  def __resolve(self, device_path: str, counter_keys) -> List[str]:
+
+    if not device_path:
+
+      return list()
+
+    # Segue os links simbólicos (ex.: /dev/mapper/vg-root -> /dev/dm-0, /dev/disk/by-uuid/... -> /dev/sda1)
+    name = os.path.basename(os.path.realpath(device_path)) if os.path.isabs(device_path) else device_path
+
+    if name in counter_keys:
+
+      return [name]
+
+    # Também tenta o nome sem resolver os links (alguns sistemas usam o próprio nome do mapper)
+    if os.path.basename(device_path) in counter_keys:
+
+      return [os.path.basename(device_path)]
+
+    sys_path = os.path.join(SYS_BLOCK_DIR, name)
+
+    if os.path.exists(sys_path):
+
+      # Partição sem contadores próprios: usa os do disco pai (/sys/class/block/sda1 -> .../block/sda/sda1)
+      parent = os.path.basename(os.path.dirname(os.path.realpath(sys_path)))
+
+      if parent != name and parent in counter_keys:
+
+        return [parent]
+
+      # Volume lógico (LVM, RAID) sem contadores próprios: usa os dispositivos que o compõem
+      slaves_dir = os.path.join(sys_path, "slaves")
+
+      if os.path.isdir(slaves_dir):
+
+        slaves = [key for slave in sorted(os.listdir(slaves_dir))
+                  for key in self.__resolve(slave, counter_keys)]
+
+        if slaves:
+
+          return slaves
+
+    match = MACOS_PARTITION_PATTERN.match(name)
+
+    if match and match.group(1) in counter_keys:
+
+      return [match.group(1)]
+
+    return list()
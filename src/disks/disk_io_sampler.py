@@ -0,0 +1,188 @@
+import psutil
+import psutil._common
+
+
+from typing import Dict, List, Tuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.disks.disk_device_index import DiskDeviceIndex
+from src.sources.live_source import LIVE_SOURCE
+
+
+class DeviceIORates:
+
+  """
+
+  Representa as taxas de E/S de um dispositivo entre duas leituras consecutivas do DiskIOSampler
+
+  """
+
+  def __init__(self, read_bytes_per_second: float,
+               write_bytes_per_second: float,
+               read_operations_per_second: float,
+               write_operations_per_second: float,
+               busy_percentage: float) -> None:
+
+    self.__read_bytes_per_second = read_bytes_per_second
+    self.__write_bytes_per_second = write_bytes_per_second
+    self.__read_operations_per_second = read_operations_per_second
+    self.__write_operations_per_second = write_operations_per_second
+    self.__busy_percentage = busy_percentage
+
+  @property
+  def read_bytes_per_second(self) -> float:
+
+    return self.__read_bytes_per_second
+
+  @property
+  def write_bytes_per_second(self) -> float:
+
+    return self.__write_bytes_per_second
+
+  @property
+  def read_operations_per_second(self) -> float:
+
+    return self.__read_operations_per_second
+
+  @property
+  def write_operations_per_second(self) -> float:
+
+    return self.__write_operations_per_second
+
+  @property
+  def busy_percentage(self) -> float:
+
+    """
+    Porcentagem do intervalo em que o dispositivo esteve ocupado com E/S (busy_time; apenas Linux e FreeBSD)
+    """
+
+    return self.__busy_percentage
+
+  @classmethod
+  def combine(cls, rates: List["DeviceIORates"]) -> "DeviceIORates":
+
+    """Soma as taxas de vários dispositivos (ex.: volume lógico composto por vários discos). A ocupação é a do dispositivo mais ocupado
+    """
+
+    return cls(sum(rate.read_bytes_per_second for rate in rates),
+               sum(rate.write_bytes_per_second for rate in rates),
+               sum(rate.read_operations_per_second for rate in rates),
+               sum(rate.write_operations_per_second for rate in rates),
+               max((rate.busy_percentage for rate in rates), default=0.0))
+
+
+class DiskIOSampler:
+
+  """
+
+  Amostrador dos contadores de E/S dos dispositivos. Lê disk_io_counters(perdisk=True) uma única vez por amostra e calcula as taxas pela diferença em relação à amostra anterior.
+
+  Na primeira amostra (e para dispositivos novos) a diferença é feita em relação à inicialização do sistema.
+
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    self.__previous_timestamp: float = self.__source.bootTime()
+    self.__previous_counters: Dict[str, psutil._common.sdiskio] = dict()
+    self.__rates: Dict[str, DeviceIORates] = dict()
+
+    self.__device_index = DiskDeviceIndex(self.__source)
+
+  @property
+  def counters(self) -> Dict[str, psutil._common.sdiskio]:
+
+    """
+    Contadores acumulados de cada dispositivo lidos na última amostra
+    """
+
+    return self.__previous_counters
+
+  def sample(self) -> Dict[str, DeviceIORates]:
+
+    """Lê os contadores de E/S de todos os dispositivos e calcula as taxas desde a amostra anterior
+
+    Returns
+    -------
+    Dict[str, DeviceIORates]
+      Taxas de E/S de cada dispositivo, indexadas pelas chaves de disk_io_counters(perdisk=True)
+    """
+
+    timestamp = self.__source.time()
+    counters: Dict[str, psutil._common.sdiskio] = self.__source.diskIOCounters()
+
+    interval = max(timestamp - self.__previous_timestamp, 1e-6)
+
+    rates: Dict[str, DeviceIORates] = dict()
+
+    for device, current in counters.items():
+
+      previous = self.__previous_counters.get(device)
+
+      # Contadores que diminuíram (dispositivo recriado ou contador reiniciado) são tratados como novos
+      if previous is None or current.read_bytes < previous.read_bytes or current.write_bytes < previous.write_bytes:
+
+        previous = type(current)(*([0] * len(current)))
+        device_interval = max(timestamp - self.__source.bootTime(), 1e-6)
+
+      else:
+
+        device_interval = interval
+
+      busy_time = getattr(current, "busy_time", 0) - getattr(previous, "busy_time", 0)
+
+      rates[device] = DeviceIORates(
+        round((current.read_bytes - previous.read_bytes) / device_interval, 2),
+        round((current.write_bytes - previous.write_bytes) / device_interval, 2),
+        round((current.read_count - previous.read_count) / device_interval, 2),
+        round((current.write_count - previous.write_count) / device_interval, 2),
+        # busy_time é dado em milissegundos
+        round(min(100.0, max(0.0, busy_time / (device_interval * 1000) * 100)), 2)
+      )
+
+    self.__previous_timestamp = timestamp
+    self.__previous_counters = counters
+    self.__rates = rates
+
+    return rates
+
+  def deviceMetrics(self, device_path: str) -> Tuple[psutil._common.sdiskio | None, DeviceIORates | None]:
+
+    """Retorna os contadores e as taxas da última amostra para o dispositivo de uma partição
+
+    Parameters
+    ----------
+    device_path : str
+      Caminho do dispositivo da partição (sdiskpart.device)
+
+    Returns
+    -------
+    Tuple[psutil._common.sdiskio | None, DeviceIORates | None]
+      Contadores acumulados e taxas do dispositivo, ou (None, None) se não houver contadores para ele
+    """
+
+    keys = self.__device_index.resolve(device_path, self.__previous_counters.keys())
+
+    if not keys:
+
+      return None, None
+
+    if len(keys) == 1:
+
+      return self.__previous_counters[keys[0]], self.__rates[keys[0]]
+
+    # Volume composto por vários dispositivos: soma os contadores e as taxas de todos eles
+    counters = [self.__previous_counters[key] for key in keys]
+    summed_counters = type(counters[0])(*(sum(values) for values in zip(*counters)))
+
+    return summed_counters, DeviceIORates.combine([self.__rates[key] for key in keys])
@@ -3,23 +3,41 @@ import psutil._common
 
 
 from src.abstracts.unit_info import UnitInfo
+from src.disks.disk_io_sampler import DeviceIORates
+from src.disks.mount_usage_prober import MountUsage
 
 
 class DiskPartitionInfo(UnitInfo):
 
+  __slots__ = ("__device_path", "__mountpoint_path", "__file_system", "__is_stale", "__total_bytes", "__used_bytes",
+               "__write_operations_count", "__read_operations_count", "__write_bytes", "__read_bytes", "__io_rates")
+
   def __init__(self, device_path: str,
                mountpoint_path: str,
                file_system: str,
-               io_counters: psutil._common.sdiskio | None) -> None:
+               io_counters: psutil._common.sdiskio | None,
+               io_rates: DeviceIORates | None = None,
+               usage: MountUsage | None = None) -> None:
     
     self.__device_path = device_path
     self.__mountpoint_path = mountpoint_path
     self.__file_system = file_system
 
-    usage_stats: psutil._common.sdiskusage = psutil.disk_usage(self.__mountpoint_path)
+    # Sem o resultado do MountUsageProber, consulta o uso diretamente
+    if usage is None:
+
+      usage = MountUsage(psutil.disk_usage(self.__mountpoint_path))
+
+    self.__is_stale = usage.is_stale
+
+    self.__total_bytes = 0
+    self.__used_bytes = 0
 
-    self.__total_bytes = usage_stats.total
-    self.__used_bytes = usage_stats.used
+    # Se foi possível consultar o uso da partição
+    if usage.usage_stats:
+
+      self.__total_bytes = usage.usage_stats.total
+      self.__used_bytes = usage.usage_stats.used
 
     self.__write_operations_count = 0
     self.__read_operations_count = 0
@@ -33,6 +51,9 @@ class DiskPartitionInfo(UnitInfo):
       self.__read_operations_count = io_counters.read_count
       self.__write_bytes = io_counters.write_bytes
       self.__read_bytes = io_counters.read_bytes
+
+    # Taxas do dispositivo desde a atualização anterior
+    self.__io_rates = io_rates if io_rates else DeviceIORates(0.0, 0.0, 0.0, 0.0, 0.0)
   
   @property
   def device_path(self) -> str:
@@ -67,8 +88,21 @@ class DiskPartitionInfo(UnitInfo):
   @property
   def used_percentage(self) -> float:
 
+    if not self.__total_bytes:
+
+      return 0.0
+
     return round((self.__used_bytes / self.__total_bytes) * 100, 2)
   
+  @property
+  def is_stale(self) -> bool:
+
+    """
+    Retorna verdadeiro se o ponto de montagem não respondeu a tempo (o uso fica zerado)
+    """
+
+    return self.__is_stale
+  
   @property
   def write_operations_count(self) -> int:
 
@@ -87,4 +121,38 @@ class DiskPartitionInfo(UnitInfo):
   @property
   def read_bytes(self) -> int:
 
-    return self.__read_bytes
\ No newline at end of file
+    return self.__read_bytes
+  
+  @property
+  def read_bytes_per_second(self) -> float:
+
+    return self.__io_rates.read_bytes_per_second
+  
+  @property
+  def write_bytes_per_second(self) -> float:
+
+    return self.__io_rates.write_bytes_per_second
+  
+  @property
+  def read_operations_per_second(self) -> float:
+
+    return self.__io_rates.read_operations_per_second
+  
+  @property
+  def write_operations_per_second(self) -> float:
+
+    return self.__io_rates.write_operations_per_second
+  
+  @property
+  def iops(self) -> float:
+
+    """
+    Operações de E/S (leitura e escrita) por segundo
+    """
+
+    return round(self.__io_rates.read_operations_per_second + self.__io_rates.write_operations_per_second, 2)
+  
+  @property
+  def busy_percentage(self) -> float:
+
+    return self.__io_rates.busy_percentage
\ No newline at end of file
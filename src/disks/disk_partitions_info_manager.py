@@ -1,35 +1,63 @@
 import psutil
-from typing import List, Dict
-
-import psutil
+from typing import List
 
 from src.disks.disk_partition_info import DiskPartitionInfo
+from src.disks.disk_io_sampler import DiskIOSampler
+from src.disks.mount_usage_prober import MountUsageProber
 from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
 
 class DiskPartitionsInfoManager(InfoManager):
 
-  def __init__(self) -> None:
+  def __init__(self, io_sampler: DiskIOSampler | None = None, usage_prober: MountUsageProber | None = None,
+               source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    io_sampler : DiskIOSampler | None
+      Amostrador de E/S reaproveitado entre as atualizações, para que as taxas sejam medidas desde a atualização anterior. Sem ele, as taxas são médias desde a inicialização do sistema
+    usage_prober : MountUsageProber | None
+      Consultor do uso das partições reaproveitado entre as atualizações (mantém o cache e a espera dos pontos de montagem sem resposta)
+    source : MetricsSource | None
+      Fonte das métricas (a mesma lida pelo amostrador e pelo consultor). Sem ela, lê o sistema ao vivo
+    """
+
+    super().__init__(source)
 
     self.__disk_partitions_info: List[DiskPartitionInfo] = list()
 
-    disk_partitions: List[psutil._common.sdiskpart] = psutil.disk_partitions(all=False)
+    if io_sampler is None:
+
+      io_sampler = DiskIOSampler(self.source)
+
+    disk_partitions: List[psutil._common.sdiskpart] = self.source.diskPartitions()
 
-    io_metrics_per_disk: Dict[str, psutil._common.sdiskio] = psutil.disk_io_counters(perdisk=True)
+    # Os contadores de todos os dispositivos são lidos uma única vez por atualização
+    io_sampler.sample()
 
-    for i in range(0, len(disk_partitions)):
+    # O uso de todas as partições é consultado em paralelo, com prazo, para que um ponto de montagem travado não bloqueie a atualização
+    if usage_prober is None:
 
-      if i < len(list(io_metrics_per_disk.keys())):
+      temporary_prober = MountUsageProber(source=self.source)
+      usages = temporary_prober.probe([disk_partition.mountpoint for disk_partition in disk_partitions])
+      temporary_prober.close()
 
-        disk: str = list(io_metrics_per_disk.keys())[i]
-      
-      else:
+    else:
 
-        disk: str = ""
+      usages = usage_prober.probe([disk_partition.mountpoint for disk_partition in disk_partitions])
 
-      disk_partition_info = DiskPartitionInfo(device_path=disk_partitions[i].device,
-                                              mountpoint_path=disk_partitions[i].mountpoint,
-                                              file_system=disk_partitions[i].fstype,
-                                              io_counters=io_metrics_per_disk[disk] if disk else None)
+    for disk_partition in disk_partitions:
+
+      # Associa a partição aos contadores do seu próprio dispositivo (ou do disco pai / volumes que o compõem)
+      io_counters, io_rates = io_sampler.deviceMetrics(disk_partition.device)
+
+      disk_partition_info = DiskPartitionInfo(device_path=disk_partition.device,
+                                              mountpoint_path=disk_partition.mountpoint,
+                                              file_system=disk_partition.fstype,
+                                              io_counters=io_counters,
+                                              io_rates=io_rates,
+                                              usage=usages[disk_partition.mountpoint])
 
       self.__disk_partitions_info.append(disk_partition_info)
   
@@ -38,6 +66,15 @@ class DiskPartitionsInfoManager(InfoManager):
 
     return len(self.__disk_partitions_info)
   
+  @property
+  def stale_partitions_count(self) -> int:
+
+    """
+    Quantidade de partições cujo ponto de montagem não respondeu a tempo
+    """
+
+    return len([partition_info for partition_info in self.__disk_partitions_info if partition_info.is_stale])
+  
   @property
   def disk_partitions_info(self) -> List[DiskPartitionInfo]:
 
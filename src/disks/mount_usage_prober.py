@@ -0,0 +1,330 @@
+import psutil
+import psutil._common
+
+
+import concurrent.futures
+import math
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
+
+class MountUsage:
+
+  """
+
+  Representa o resultado da consulta de uso (statvfs) de um ponto de montagem
+
+  """
+
+  def __init__(self, usage_stats: psutil._common.sdiskusage | None, is_stale: bool = False) -> None:
+
+    self.__usage_stats = usage_stats
+    self.__is_stale = is_stale
+
+  @property
+  def usage_stats(self) -> psutil._common.sdiskusage | None:
+
+    """
+    Uso do ponto de montagem, ou None se não foi possível consultá-lo
+    """
+
+    return self.__usage_stats
+
+  @property
+  def is_stale(self) -> bool:
+
+    """
+    Retorna verdadeiro se o ponto de montagem não respondeu dentro do prazo (ex.: sistema de arquivos de rede inacessível)
+    """
+
+    return self.__is_stale
+
+
+class MountUsageProber:
+
+  """
+
+  Consulta o uso (MetricsSource.diskUsage) de vários pontos de montagem em paralelo, em um pequeno grupo de threads, com prazo por consulta.
+
+  O prazo de cada consulta é contado a partir do momento em que uma thread começa a executá-la, e não de quando ela foi pedida. Pontos de montagem que não respondem no prazo são marcados como sem resposta e só são consultados novamente após um intervalo de espera, que dobra a cada nova falha. Uma consulta travada nunca é repetida enquanto não terminar, e novas threads são criadas para substituí-la, então um ponto de montagem travado não bloqueia os demais. Consultas que nem começaram dentro do prazo (todas as threads ocupadas) são descartadas sem penalizar o ponto de montagem.
+
+  O resultado de pontos de montagem cujo uso não mudou fica em cache por um tempo que também dobra a cada consulta sem mudança (até max_cache_ttl).
+
+  """
+
+  def __init__(self, max_workers: int = 4,
+               timeout: float = 0.5,
+               max_cache_ttl: float = 10.0,
+               initial_backoff: float = 5.0,
+               max_backoff: float = 300.0,
+               source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    max_workers : int
+      Threads disponíveis para consultas que não estão travadas
+    timeout : float
+      Prazo de cada consulta, em segundos
+    max_cache_ttl : float
+      Tempo máximo, em segundos, que o uso de um ponto de montagem sem mudanças fica em cache
+    initial_backoff : float
+      Espera, em segundos, antes de consultar novamente um ponto de montagem sem resposta
+    max_backoff : float
+      Espera máxima, em segundos, entre consultas a um ponto de montagem sem resposta
+    source : MetricsSource | None
+      Fonte das métricas. Sem ela, consulta o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    self.__max_workers = max_workers
+    self.__timeout = timeout
+    self.__max_cache_ttl = max_cache_ttl
+    self.__initial_backoff = initial_backoff
+    self.__max_backoff = max_backoff
+
+    self.__tasks: queue.SimpleQueue = queue.SimpleQueue()
+    self.__workers_count = 0
+
+    # Consultas que ainda não terminaram, por ponto de montagem, e o instante em que cada consulta começou a ser executada
+    self.__in_flight: Dict[str, Future] = dict()
+    self.__started: Dict[Future, float] = dict()
+
+    # (instante da consulta, validade, uso) de cada ponto de montagem
+    self.__cache: Dict[str, Tuple[float, float, psutil._common.sdiskusage]] = dict()
+
+    # (instante da próxima consulta, espera atual) de cada ponto de montagem sem resposta
+    self.__backoff: Dict[str, Tuple[float, float]] = dict()
+
+  @property
+  def stale_mountpoints(self) -> List[str]:
+
+    return list(self.__backoff.keys())
+
+  def probe(self, mountpoints: List[str]) -> Dict[str, MountUsage]:
+
+    """Consulta o uso de vários pontos de montagem, esperando no máximo 'timeout' segundos por consulta (contados do início de cada uma; as que não começam em até duas vezes 'timeout' são descartadas, então a chamada dura no máximo cerca de três vezes 'timeout')
+
+    Parameters
+    ----------
+    mountpoints : List[str]
+      Pontos de montagem consultados
+
+    Returns
+    -------
+    Dict[str, MountUsage]
+      Resultado de cada ponto de montagem
+    """
+
+    now = time.monotonic()
+
+    # Consultas travadas que terminaram desde a última chamada liberam o ponto de montagem
+    for mountpoint in [mountpoint for mountpoint, future in self.__in_flight.items() if future.done()]:
+
+      self.__release(mountpoint)
+
+    results: Dict[str, MountUsage] = dict()
+    submitted: Dict[str, Future] = dict()
+
+    for mountpoint in mountpoints:
+
+      if mountpoint in self.__in_flight:
+
+        # A consulta anterior ainda não terminou: o ponto de montagem continua sem resposta
+        results[mountpoint] = MountUsage(None, is_stale=True)
+        continue
+
+      next_attempt, _ = self.__backoff.get(mountpoint, (0.0, 0.0))
+
+      if now < next_attempt:
+
+        results[mountpoint] = MountUsage(None, is_stale=True)
+        continue
+
+      cached = self.__cache.get(mountpoint)
+
+      if cached is not None and now - cached[0] < cached[1]:
+
+        results[mountpoint] = MountUsage(cached[2])
+        continue
+
+      submitted[mountpoint] = self.__submit(mountpoint)
+
+    # As consultas que nenhuma thread começou até este instante são descartadas. Uma consulta na fila atrás de consultas
+    # travadas começa, no máximo, quando elas passam do prazo e são substituídas por novas threads
+    queue_deadline = now + 2 * self.__timeout
+
+    while submitted:
+
+      current = time.monotonic()
+      wake_at = math.inf
+      hung = False
+
+      for mountpoint, future in list(submitted.items()):
+
+        started = self.__started.get(future)
+
+        if future.done():
+
+          del submitted[mountpoint]
+          results[mountpoint] = self.__finish(mountpoint, future, now)
+
+        elif started is not None and current - started >= self.__timeout:
+
+          # Consulta travada: o ponto de montagem fica em espera, e a thread presa nela deixa de contar como disponível
+          del submitted[mountpoint]
+          results[mountpoint] = MountUsage(None, is_stale=True)
+          self.__markStale(mountpoint)
+          hung = True
+
+        elif started is None and current >= queue_deadline and future.cancel():
+
+          # Todas as threads estavam ocupadas: o ponto de montagem não é penalizado, e será consultado na próxima chamada
+          del submitted[mountpoint]
+          results[mountpoint] = MountUsage(None, is_stale=True)
+          self.__release(mountpoint)
+
+        elif started is not None:
+
+          wake_at = min(wake_at, started + self.__timeout)
+
+        else:
+
+          # O início de uma consulta na fila não é avisado, então a fila é verificada em intervalos curtos
+          wake_at = min(wake_at, queue_deadline, current + self.__timeout / 10)
+
+      if hung:
+
+        self.__startWorkers()
+
+      if submitted:
+
+        concurrent.futures.wait(list(submitted.values()), timeout=max(0.0, wake_at - time.monotonic()),
+                                return_when=concurrent.futures.FIRST_COMPLETED)
+
+    # Mantém a ordem recebida
+    return {mountpoint: results[mountpoint] for mountpoint in mountpoints}
+
+  def close(self) -> None:
+
+    """Encerra as threads ociosas (as que estiverem travadas terminam assim que a consulta retornar)
+    """
+
+    for _ in range(0, self.__workers_count):
+
+      self.__tasks.put(None)
+
+    self.__workers_count = 0
+
+  def __submit(self, mountpoint: str) -> Future:
+
+    future: Future = Future()
+
+    self.__in_flight[mountpoint] = future
+    self.__startWorkers()
+
+    self.__tasks.put((mountpoint, future))
+
+    return future
+
+  def __startWorkers(self) -> None:
+
+    """Cria threads até que max_workers delas estejam livres de consultas travadas
+    """
+
+    now = time.monotonic()
+
+    # Threads presas em consultas que passaram do prazo (desta chamada ou de chamadas anteriores) não contam para o limite
+    # de threads disponíveis
+    stuck_count = sum(1 for future in self.__in_flight.values()
+                      if not future.done() and now - self.__started.get(future, now) >= self.__timeout)
+
+    while self.__workers_count < self.__max_workers + stuck_count:
+
+      threading.Thread(target=self.__work, name="mount-usage-prober", daemon=True).start()
+      self.__workers_count += 1
+
+  def __finish(self, mountpoint: str, future: Future, now: float) -> MountUsage:
+
+    """Resultado de uma consulta que terminou
+    """
+
+    self.__release(mountpoint)
+
+    try:
+
+      usage_stats = future.result()
+
+    except OSError:
+
+      # Ponto de montagem removido ou sem permissão de acesso
+      return MountUsage(None)
+
+    self.__backoff.pop(mountpoint, None)
+    self.__updateCache(mountpoint, usage_stats, now)
+
+    return MountUsage(usage_stats)
+
+  def __release(self, mountpoint: str) -> None:
+
+    future = self.__in_flight.pop(mountpoint, None)
+    self.__started.pop(future, None)
+
+  def __work(self) -> None:
+
+    while True:
+
+      task = self.__tasks.get()
+
+      if task is None:
+
+        return
+
+      mountpoint, future = task
+
+      # O prazo da consulta começa agora. Uma consulta descartada antes de começar é ignorada
+      self.__started[future] = time.monotonic()
+
+      if not future.set_running_or_notify_cancel():
+
+        self.__started.pop(future, None)
+        continue
+
+      try:
+
+        future.set_result(self.__source.diskUsage(mountpoint))
+
+      except Exception as error:
+
+        future.set_exception(error)
+
+  def __markStale(self, mountpoint: str) -> None:
+
+    _, backoff = self.__backoff.get(mountpoint, (0.0, 0.0))
+    backoff = min(self.__max_backoff, backoff * 2 if backoff else self.__initial_backoff)
+
+    self.__backoff[mountpoint] = (time.monotonic() + backoff, backoff)
+    self.__cache.pop(mountpoint, None)
+
+  def __updateCache(self, mountpoint: str, usage_stats: psutil._common.sdiskusage, now: float) -> None:
+
+    cached = self.__cache.get(mountpoint)
+
+    # Uso inalterado desde a última consulta: dobra a validade do cache (começando em 1s)
+    if cached is not None and cached[2] == usage_stats:
+
+      ttl = min(self.__max_cache_ttl, cached[1] * 2 if cached[1] else 1.0)
+
+    else:
+
+      ttl = 0.0
+
+    self.__cache[mountpoint] = (now, ttl, usage_stats)
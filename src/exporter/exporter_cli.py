@@ -0,0 +1,67 @@
+import argparse
+import sys
+from typing import List
+
+
+from src.exporter.metrics_exporter import MetricsExporter
+from src.sampling.snapshot_collector import SnapshotCollector, CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE
+from src.sampling.collector_cli import MODULES
+from src.processes.process_registry import RANKING_ATTRIBUTES
+from src.processes.procfs_registry import PROCESS_BACKENDS
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py export",
+                                   description="Exporta as métricas do sistema por HTTP, no formato OpenMetrics "
+                                               "(ex.: para o Prometheus), em /metrics")
+
+  parser.add_argument("--host", default="127.0.0.1",
+                      help="Endereço do servidor; use 0.0.0.0 para aceitar conexões de outras máquinas "
+                           "(padrão: 127.0.0.1)")
+  parser.add_argument("--port", type=int, default=9464,
+                      help="Porta do servidor (padrão: 9464)")
+  parser.add_argument("--interval", type=float, default=5.0,
+                      help="Intervalo entre as coletas, em segundos; as requisições recebem sempre a última coleta "
+                           "(padrão: 5)")
+  parser.add_argument("--modules", nargs="+", choices=MODULES, default=[CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE],
+                      help="Módulos exportados (padrão: cpu processes disks)")
+  parser.add_argument("--top-k", type=int, default=20,
+                      help="Quantidade de processos exportados, o que limita as séries por processo (padrão: 20)")
+  parser.add_argument("--top-by", choices=list(RANKING_ATTRIBUTES.keys()), default="cpu",
+                      help="Ordenação dos processos exportados (padrão: cpu)")
+  parser.add_argument("--process-backend", choices=PROCESS_BACKENDS, default="psutil",
+                      help="Leitura dos processos: psutil ou procfs (leitura direta do /proc, apenas no Linux) (padrão: psutil)")
+
+  addSourceArguments(parser)
+
+  return parser.parse_args(argv)
+
+
+def runExporter(argv: List[str]) -> int:
+
+  """Ponto de entrada do exportador de métricas (python main.py export)
+
+  Assim como o modo "collect", não importa PySide6, pandas nem NumPy.
+  """
+
+  args = parseArguments(argv)
+
+  collector = SnapshotCollector(processes_top_count=args.top_k, processes_top_by=args.top_by,
+                                source=sourceFromArguments(args), process_backend=args.process_backend)
+
+  exporter = MetricsExporter(collector, args.modules, args.interval, args.host, args.port)
+
+  host, port = exporter.address
+  print(f"Exportando as métricas em http://{host}:{port}/metrics", file=sys.stderr)
+
+  try:
+
+    exporter.serveForever()
+
+  except KeyboardInterrupt:
+
+    pass
+
+  return 0
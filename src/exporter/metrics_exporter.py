@@ -0,0 +1,204 @@
+import gzip
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+
+from src.exporter.openmetrics_serializer import OPENMETRICS_CONTENT_TYPE, snapshotsToOpenMetrics
+from src.sampling.snapshot_collector import SnapshotCollector, ModuleSnapshot
+
+
+class Exposition:
+
+  """
+  Exposição pronta para ser servida: o texto OpenMetrics, em bytes, e a mesma exposição comprimida com gzip
+  """
+
+  __slots__ = ("__payload", "__compressed_payload", "__created_at")
+
+  def __init__(self, payload: bytes) -> None:
+
+    self.__payload = payload
+    self.__compressed_payload = gzip.compress(payload, compresslevel=6)
+    self.__created_at = time.time()
+
+  @property
+  def payload(self) -> bytes:
+
+    return self.__payload
+
+  @property
+  def compressed_payload(self) -> bytes:
+
+    return self.__compressed_payload
+
+  @property
+  def created_at(self) -> float:
+
+    return self.__created_at
+
+
+class MetricsExporter:
+
+  """
+  Exporta as métricas dos módulos por HTTP, no formato OpenMetrics (ex.: para o Prometheus)
+
+  Uma única thread de coleta lê os módulos a cada intervalo e serializa a exposição uma vez por ciclo. As requisições apenas entregam os bytes do último ciclo, então vários scrapers simultâneos não provocam nenhuma leitura extra do sistema.
+  """
+
+  def __init__(self, collector: SnapshotCollector, modules: List[str], interval: float = 1.0,
+               host: str = "127.0.0.1", port: int = 9464) -> None:
+
+    """
+    Parameters
+    ----------
+    collector : SnapshotCollector
+      Coletor dos módulos, usado apenas pela thread de coleta. Para limitar as séries por processo, deve usar o modo Top-N
+    modules : List[str]
+      Módulos exportados
+    interval : float
+      Intervalo entre as coletas, em segundos
+    host : str
+      Endereço do servidor HTTP. O padrão aceita apenas conexões da própria máquina
+    port : int
+      Porta do servidor HTTP (0 escolhe uma porta livre)
+    """
+
+    self.__collector = collector
+    self.__modules = modules
+    self.__interval = interval
+
+    # Último resultado de cada módulo. Um módulo que falhar continua exportando o último resultado bem-sucedido
+    self.__snapshots: Dict[str, ModuleSnapshot] = dict()
+    self.__exposition: Exposition | None = None
+
+    self.__stop_event = threading.Event()
+    self.__collection_thread = threading.Thread(target=self.__collectLoop, name="metrics-exporter-collector",
+                                                daemon=True)
+
+    self.__server = ThreadingHTTPServer((host, port), self.__handlerClass())
+    self.__server.daemon_threads = True
+
+  @property
+  def address(self) -> Tuple[str, int]:
+
+    """
+    Endereço e porta em que o servidor HTTP está escutando
+    """
+
+    return self.__server.server_address[:2]
+
+  @property
+  def exposition(self) -> Exposition | None:
+
+    """
+    Exposição do último ciclo de coleta, ou None antes do primeiro ciclo
+    """
+
+    return self.__exposition
+
+  def collectOnce(self) -> Exposition:
+
+    """Coleta todos os módulos e troca a exposição servida. Usado apenas pela thread de coleta (e antes dela iniciar)
+    """
+
+    # Todos os módulos do ciclo leem a mesma leitura da fonte
+    self.__collector.advance()
+
+    for module in self.__modules:
+
+      try:
+
+        self.__snapshots[module] = self.__collector.collect(module)
+
+      except Exception as error:
+
+        # Uma falha em um módulo (ex.: computador sem bateria) não interrompe a exportação dos demais
+        print(f"Não foi possível coletar as informações do módulo '{module}': {error}", file=sys.stderr)
+
+    exposition = Exposition(snapshotsToOpenMetrics([self.__snapshots[module] for module in self.__modules
+                                                    if module in self.__snapshots]))
+
+    # A troca da referência é atômica, então as requisições em andamento continuam com a exposição anterior
+    self.__exposition = exposition
+
+    return exposition
+
+  def serveForever(self) -> None:
+
+    """Inicia a thread de coleta e atende as requisições até shutdown (chamado de outra thread) ou uma interrupção
+    """
+
+    if self.__exposition is None:
+
+      self.collectOnce()
+
+    self.__collection_thread.start()
+
+    try:
+
+      self.__server.serve_forever()
+
+    finally:
+
+      self.__stop_event.set()
+      self.__server.server_close()
+
+  def shutdown(self) -> None:
+
+    self.__stop_event.set()
+    self.__server.shutdown()
+
+  def __collectLoop(self) -> None:
+
+    start = time.monotonic()
+    iteration = 1
+
+    # Os instantes das coletas são calculados a partir do início, para que os atrasos não se acumulem
+    while not self.__stop_event.wait(max(0.0, start + iteration * self.__interval - time.monotonic())):
+
+      self.collectOnce()
+      iteration += 1
+
+  def __handlerClass(self) -> type:
+
+    exporter = self
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+
+      def do_GET(self) -> None:
+
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+
+          self.send_error(404)
+          return
+
+        exposition = exporter.exposition
+
+        if exposition is None:
+
+          self.send_error(503, "Nenhuma coleta foi concluída ainda")
+          return
+
+        compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+        payload = exposition.compressed_payload if compressed else exposition.payload
+
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(payload)))
+
+        if compressed:
+
+          self.send_header("Content-Encoding", "gzip")
+
+        self.end_headers()
+        self.wfile.write(payload)
+
+      def log_message(self, format: str, *args) -> None:
+
+        # As requisições dos scrapers não são registradas
+        pass
+
+    return MetricsRequestHandler
@@ -0,0 +1,243 @@
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.battery.battery_info_manager import BatteryInfoManager
+from src.sampling.snapshot_collector import ModuleSnapshot
+
+
+# Tipo de conteúdo da exposição (https://openmetrics.io)
+OPENMETRICS_CONTENT_TYPE: str = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Prefixo do nome de todas as métricas exportadas
+METRICS_PREFIX: str = "system_monitoring"
+
+# Uma amostra: rótulos (nome -> valor) e o valor
+Sample = Tuple[Dict[str, str], Any]
+
+
+class OpenMetricsWriter:
+
+  """
+  Monta o texto de uma exposição no formato OpenMetrics, uma família de métricas por vez
+  """
+
+  def __init__(self) -> None:
+
+    self.__lines: List[str] = list()
+
+  def family(self, name: str, metric_type: str, help_text: str, samples: Sequence[Sample], unit: str = "") -> None:
+
+    """Acrescenta uma família de métricas. Amostras sem valor (None) são omitidas
+
+    Parameters
+    ----------
+    name : str
+      Nome da família, sem o prefixo METRICS_PREFIX (e sem o sufixo _total, nos contadores)
+    metric_type : str
+      "gauge" ou "counter"
+    help_text : str
+      Descrição da métrica
+    samples : Sequence[Sample]
+      Amostras da família
+    unit : str
+      Unidade da métrica (ex.: "bytes"), que também deve terminar o nome
+    """
+
+    name = f"{METRICS_PREFIX}_{name}"
+    sample_name = f"{name}_total" if metric_type == "counter" else name
+
+    lines = self.__lines
+
+    lines.append(f"# TYPE {name} {metric_type}")
+
+    if unit:
+
+      lines.append(f"# UNIT {name} {unit}")
+
+    lines.append(f"# HELP {name} {help_text}")
+
+    for labels, value in samples:
+
+      if value is None:
+
+        continue
+
+      if labels:
+
+        label_text = ",".join(f'{label}="{escapeLabelValue(label_value)}"' for label, label_value in labels.items())
+        lines.append(f"{sample_name}{{{label_text}}} {formatValue(value)}")
+
+      else:
+
+        lines.append(f"{sample_name} {formatValue(value)}")
+
+  def toBytes(self) -> bytes:
+
+    return ("\n".join(self.__lines) + "\n# EOF\n").encode("utf-8")
+
+
+def escapeLabelValue(value: Any) -> str:
+
+  return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def formatValue(value: Any) -> str:
+
+  if isinstance(value, bool):
+
+    return "1" if value else "0"
+
+  if isinstance(value, float):
+
+    if math.isnan(value):
+
+      return "NaN"
+
+    if math.isinf(value):
+
+      return "+Inf" if value > 0 else "-Inf"
+
+  return repr(value)
+
+
+def snapshotsToOpenMetrics(snapshots: Sequence[ModuleSnapshot]) -> bytes:
+
+  """Converte os resultados das coletas de um ciclo na exposição OpenMetrics
+
+  Parameters
+  ----------
+  snapshots : Sequence[ModuleSnapshot]
+    Resultado mais recente de cada módulo coletado
+
+  Returns
+  -------
+  bytes
+    Texto da exposição, codificado em UTF-8
+  """
+
+  writer = OpenMetricsWriter()
+
+  for snapshot in snapshots:
+
+    info_obj = snapshot.info_manager
+
+    if isinstance(info_obj, CPUsInfoManager):
+
+      writeCPUs(writer, info_obj)
+
+    elif isinstance(info_obj, ProcessesInfoManager):
+
+      writeProcesses(writer, info_obj)
+
+    elif isinstance(info_obj, DiskPartitionsInfoManager):
+
+      writeDiskPartitions(writer, info_obj)
+
+    elif isinstance(info_obj, BatteryInfoManager):
+
+      writeBattery(writer, info_obj)
+
+    else:
+
+      raise TypeError(f"O gerenciador '{type(info_obj).__name__}' não pode ser exportado!")
+
+  writer.family("collection_duration_seconds", "gauge", "Tempo gasto na última coleta de cada módulo",
+                [({"module": snapshot.module}, snapshot.duration) for snapshot in snapshots], "seconds")
+  writer.family("collection_timestamp_seconds", "gauge", "Momento da última coleta de cada módulo",
+                [({"module": snapshot.module}, snapshot.collected_at) for snapshot in snapshots], "seconds")
+
+  return writer.toBytes()
+
+
+def writeCPUs(writer: OpenMetricsWriter, cpus_info_manager: CPUsInfoManager) -> None:
+
+  cpus_info = cpus_info_manager.cpus_info
+
+  writer.family("cpu_count", "gauge", "Quantidade de CPUs lógicas", [({}, cpus_info_manager.cpu_count)])
+  writer.family("cpu_physical_cores", "gauge", "Quantidade de núcleos físicos",
+                [({}, cpus_info_manager.physical_cores_count)])
+  writer.family("cpu_context_switches", "counter", "Trocas de contexto desde o boot",
+                [({}, cpus_info_manager.context_switches_count)])
+  writer.family("cpu_interrupts", "counter", "Interrupções de hardware desde o boot",
+                [({}, cpus_info_manager.hardware_interrupts_count)])
+
+  writer.family("cpu_usage_percent", "gauge", "Porcentagem de uso de cada CPU, por modo",
+                [({"cpu": str(cpu_info.cpu_id), "mode": mode}, value)
+                 for cpu_info in cpus_info
+                 for mode, value in [("total", cpu_info.used_percentage), ("user", cpu_info.user_percentage),
+                                     ("system", cpu_info.system_percentage), ("iowait", cpu_info.iowait_percentage)]])
+  writer.family("cpu_frequency_megahertz", "gauge", "Frequência atual de cada CPU",
+                [({"cpu": str(cpu_info.cpu_id)}, cpu_info.current_frequency) for cpu_info in cpus_info], "megahertz")
+
+
+def writeProcesses(writer: OpenMetricsWriter, processes_info_manager: ProcessesInfoManager) -> None:
+
+  # Os processos exportados são apenas os do Top-N da coleta, o que limita a quantidade de séries
+  processes_info = processes_info_manager.all_processes_info
+  labels = [{"pid": str(process_info.pid), "name": process_info.name, "user": process_info.owner_username}
+            for process_info in processes_info]
+
+  writer.family("processes", "gauge", "Quantidade de processos do sistema",
+                [({}, processes_info_manager.system_processes_count)])
+
+  writer.family("process_cpu_percent", "gauge", "Porcentagem de CPU dos maiores processos",
+                [(process_labels, process_info.cpu_used_percentage)
+                 for process_labels, process_info in zip(labels, processes_info)])
+  writer.family("process_memory_percent", "gauge", "Porcentagem da memória física usada pelos maiores processos",
+                [(process_labels, process_info.memory_used_percent)
+                 for process_labels, process_info in zip(labels, processes_info)])
+  writer.family("process_threads", "gauge", "Quantidade de threads dos maiores processos",
+                [(process_labels, process_info.threads_used_count)
+                 for process_labels, process_info in zip(labels, processes_info)])
+  writer.family("process_read_bytes", "counter", "Bytes lidos do disco pelos maiores processos",
+                [(process_labels, process_info.read_bytes_number)
+                 for process_labels, process_info in zip(labels, processes_info)], "bytes")
+  writer.family("process_written_bytes", "counter", "Bytes escritos no disco pelos maiores processos",
+                [(process_labels, process_info.write_bytes_number)
+                 for process_labels, process_info in zip(labels, processes_info)], "bytes")
+
+
+def writeDiskPartitions(writer: OpenMetricsWriter, disk_partitions_info_manager: DiskPartitionsInfoManager) -> None:
+
+  disk_partitions_info = disk_partitions_info_manager.disk_partitions_info
+  labels = [{"mountpoint": partition.mountpoint_path, "device": partition.device_path, "fstype": partition.file_system}
+            for partition in disk_partitions_info]
+
+  def samples(attribute: str) -> List[Sample]:
+
+    return [(partition_labels, getattr(partition, attribute))
+            for partition_labels, partition in zip(labels, disk_partitions_info)]
+
+  writer.family("disk_total_bytes", "gauge", "Tamanho de cada partição", samples("total_bytes"), "bytes")
+  writer.family("disk_used_bytes", "gauge", "Espaço usado de cada partição", samples("used_bytes"), "bytes")
+  writer.family("disk_free_bytes", "gauge", "Espaço livre de cada partição", samples("free_bytes"), "bytes")
+  writer.family("disk_stale", "gauge", "1 se o ponto de montagem não respondeu a tempo (o uso fica zerado)",
+                samples("is_stale"))
+  writer.family("disk_read_bytes", "counter", "Bytes lidos do dispositivo de cada partição", samples("read_bytes"),
+                "bytes")
+  writer.family("disk_written_bytes", "counter", "Bytes escritos no dispositivo de cada partição",
+                samples("write_bytes"), "bytes")
+  writer.family("disk_reads", "counter", "Operações de leitura do dispositivo de cada partição",
+                samples("read_operations_count"))
+  writer.family("disk_writes", "counter", "Operações de escrita do dispositivo de cada partição",
+                samples("write_operations_count"))
+  writer.family("disk_busy_percent", "gauge", "Porcentagem do tempo em que o dispositivo esteve ocupado",
+                samples("busy_percentage"))
+
+
+def writeBattery(writer: OpenMetricsWriter, battery_info_manager: BatteryInfoManager) -> None:
+
+  time_left = battery_info_manager.time_left
+
+  writer.family("battery_percent", "gauge", "Carga restante da bateria",
+                [({}, battery_info_manager.percentage_remaining)])
+  writer.family("battery_charging", "gauge", "1 se a bateria estiver carregando",
+                [({}, battery_info_manager.is_charging)])
+
+  # O psutil usa valores negativos quando o tempo é ilimitado ou desconhecido
+  writer.family("battery_time_left_seconds", "gauge", "Tempo estimado até a bateria acabar",
+                [({}, time_left if time_left is not None and time_left >= 0 else None)], "seconds")
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+from typing import Tuple
+
+
+def minMaxDownsample(timestamps: np.ndarray, values: np.ndarray, start: float, end: float,
+                     buckets: int, with_minimums: bool = True) -> Tuple[np.ndarray | None, np.ndarray, np.ndarray]:
+
+  """Reduz as amostras de um intervalo de tempo a 'buckets' faixas de mesma duração, com o mínimo e o máximo de cada faixa
+
+  Diferente de uma média, o mínimo e o máximo preservam os picos de qualquer amostra da faixa. Todas as colunas são reduzidas de uma vez, então o custo é o de uma passada sobre os valores, sem laço em Python.
+
+  Parameters
+  ----------
+  timestamps : np.ndarray
+    Instantes das amostras (n,), em ordem crescente
+  values : np.ndarray
+    Valores das amostras, (n,) ou (n, width). Valores NaN são ignorados
+  start : float
+    Início do intervalo (instante da borda esquerda da primeira faixa)
+  end : float
+    Fim do intervalo (inclusivo)
+  buckets : int
+    Quantidade de faixas (ex.: a largura do gráfico em pixels)
+  with_minimums : bool
+    Se falso, apenas os máximos são calculados (os mínimos ficam None), o que corta o custo pela metade
+
+  Returns
+  -------
+  Tuple[np.ndarray | None, np.ndarray, np.ndarray]
+    Mínimos e máximos de cada faixa, (buckets,) ou (buckets, width) em float32, e a máscara das faixas com amostras. As faixas vazias ficam com NaN
+  """
+
+  first = int(np.searchsorted(timestamps, start, side="left"))
+  last = int(np.searchsorted(timestamps, end, side="right"))
+
+  timestamps = timestamps[first:last]
+  values = values[first:last]
+
+  maximums = np.full((buckets,) + values.shape[1:], np.nan, dtype=np.float32)
+  minimums = maximums.copy() if with_minimums else None
+
+  # Limites de cada faixa nas amostras: as amostras da faixa i vão de edges[i] até edges[i + 1]
+  inner_edges = np.searchsorted(timestamps, start + (end - start) * np.arange(1, buckets) / buckets, side="left")
+  edges = np.concatenate(([0], inner_edges, [len(timestamps)]))
+
+  filled = np.diff(edges) > 0
+
+  if filled.any():
+
+    # Sem as faixas vazias, o início de cada faixa é o fim da anterior, como o reduceat espera
+    starts = edges[:-1][filled]
+
+    if with_minimums:
+
+      minimums[filled] = np.fmin.reduceat(values, starts, axis=0)
+
+    maximums[filled] = np.fmax.reduceat(values, starts, axis=0)
+
+  return minimums, maximums, filled
+
+
+def holdLastBucket(filled: np.ndarray, bucket_seconds: float, max_gap_seconds: float) -> Tuple[np.ndarray, np.ndarray]:
+
+  """Repete cada faixa com amostras nas faixas vazias seguintes, até 'max_gap_seconds'
+
+  Com menos amostras do que faixas (ex.: uma amostra por segundo em um gráfico de 600 pixels para um minuto), cada amostra passa a ocupar as faixas até a próxima amostra, em vez de uma única coluna.
+
+  Returns
+  -------
+  Tuple[np.ndarray, np.ndarray]
+    Índice da faixa com amostras exibida em cada faixa, e a máscara das faixas cobertas por alguma amostra
+  """
+
+  positions = np.arange(0, len(filled))
+  last_filled = np.maximum.accumulate(np.where(filled, positions, -1))
+
+  covered = (last_filled >= 0) & ((positions - last_filled) * bucket_seconds <= max(max_gap_seconds, bucket_seconds))
+
+  return np.maximum(last_filled, 0), covered
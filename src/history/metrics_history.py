@@ -0,0 +1,231 @@
+import numpy as np
+
+
+import threading
+import time
+from collections import OrderedDict
+from typing import List
+
+
+from src.history.ring_buffer import RingBuffer
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.processes.processes_snapshot import DETAIL_BITS
+from src.abstracts.info_manager import InfoManager
+
+
+# Colunas de cada série de partição e de processo, na ordem em que são gravadas. A memória dos processos é um atributo de
+# detalhe, gravada apenas quando já foi lida (NaN nas demais amostras)
+PARTITION_FIELDS: List[str] = ["used_percentage", "read_bytes_per_second", "write_bytes_per_second",
+                               "iops", "busy_percentage"]
+PROCESS_FIELDS: List[str] = ["cpu_used_percentage", "memory_used_percent"]
+
+
+class MetricsHistory:
+
+  """
+  Histórico em memória das métricas coletadas, com orçamento de memória fixo.
+
+  Cada métrica é um RingBuffer pré-alocado: o uso de cada CPU, o uso e as taxas de E/S de cada partição, e o uso de CPU e memória dos processos mais pesados (por pid). Quando há mais partições ou processos do que o limite de séries, a série atualizada há mais tempo é descartada.
+
+  Pode ser alimentado pela thread de coleta e lido pela interface ao mesmo tempo.
+  """
+
+  def __init__(self, capacity: int = 86400,
+               process_capacity: int = 3600,
+               max_partition_series: int = 32,
+               max_process_series: int = 64,
+               top_processes_count: int = 10) -> None:
+
+    """
+    Parameters
+    ----------
+    capacity : int
+      Amostras mantidas por CPU e por partição (86400 = 24h a uma amostra por segundo)
+    process_capacity : int
+      Amostras mantidas por processo
+    max_partition_series : int
+      Quantidade máxima de partições com histórico
+    max_process_series : int
+      Quantidade máxima de processos com histórico
+    top_processes_count : int
+      Quantidade de processos (os de maior uso de CPU) gravados a cada coleta de processos
+    """
+
+    self.__capacity = capacity
+    self.__process_capacity = process_capacity
+    self.__max_partition_series = max_partition_series
+    self.__max_process_series = max_process_series
+    self.__top_processes_count = top_processes_count
+
+    self.__lock = threading.Lock()
+
+    # Criado na primeira coleta da CPU, quando a quantidade de CPUs é conhecida
+    self.__cpu_usage: RingBuffer | None = None
+
+    self.__partitions: OrderedDict[str, RingBuffer] = OrderedDict()
+    self.__processes: OrderedDict[int, RingBuffer] = OrderedDict()
+
+  @property
+  def cpu_usage(self) -> RingBuffer | None:
+
+    """
+    Porcentagem de uso de cada CPU (uma coluna por CPU)
+    """
+
+    return self.__cpu_usage
+
+  @property
+  def partition_mountpoints(self) -> List[str]:
+
+    with self.__lock:
+
+      return list(self.__partitions.keys())
+
+  @property
+  def process_pids(self) -> List[int]:
+
+    with self.__lock:
+
+      return list(self.__processes.keys())
+
+  @property
+  def nbytes(self) -> int:
+
+    """
+    Memória ocupada por todos os buffers, em bytes
+    """
+
+    with self.__lock:
+
+      buffers = list(self.__partitions.values()) + list(self.__processes.values())
+
+      if self.__cpu_usage is not None:
+
+        buffers.append(self.__cpu_usage)
+
+      return sum(buffer.nbytes for buffer in buffers)
+
+  def partitionSeries(self, mountpoint: str) -> RingBuffer | None:
+
+    """
+    Série de uma partição, com as colunas de PARTITION_FIELDS
+    """
+
+    with self.__lock:
+
+      return self.__partitions.get(mountpoint)
+
+  def processSeries(self, pid: int) -> RingBuffer | None:
+
+    """
+    Série de um processo, com as colunas de PROCESS_FIELDS
+    """
+
+    with self.__lock:
+
+      return self.__processes.get(pid)
+
+  def record(self, info_obj: InfoManager, timestamp: float | None = None) -> None:
+
+    """Grava as métricas de uma coleta no histórico
+
+    Parameters
+    ----------
+    info_obj : InfoManager
+      Gerenciador de CPUs, Processos ou Partições (os demais são ignorados)
+    timestamp : float | None
+      Instante da coleta, em segundos desde a época. Sem ele, usa o instante atual
+    """
+
+    timestamp = time.time() if timestamp is None else timestamp
+
+    if isinstance(info_obj, CPUsInfoManager):
+
+      self.__recordCPUs(info_obj, timestamp)
+
+    elif isinstance(info_obj, DiskPartitionsInfoManager):
+
+      self.__recordDiskPartitions(info_obj, timestamp)
+
+    elif isinstance(info_obj, ProcessesInfoManager):
+
+      self.__recordProcesses(info_obj, timestamp)
+
+  def __recordCPUs(self, cim: CPUsInfoManager, timestamp: float) -> None:
+
+    values = np.fromiter((cpu_info.used_percentage for cpu_info in cim.cpus_info),
+                         dtype=np.float16, count=cim.cpu_count)
+
+    with self.__lock:
+
+      # Porcentagens de 0 a 100 cabem em float16, o que reduz pela metade a memória das CPUs
+      if self.__cpu_usage is None or self.__cpu_usage.width != cim.cpu_count:
+
+        self.__cpu_usage = RingBuffer(self.__capacity, cim.cpu_count, np.float16)
+
+      self.__cpu_usage.append(timestamp, values)
+
+  def __recordDiskPartitions(self, dpim: DiskPartitionsInfoManager, timestamp: float) -> None:
+
+    with self.__lock:
+
+      for partition_info in dpim.disk_partitions_info:
+
+        series = self.__series(self.__partitions, partition_info.mountpoint_path,
+                               self.__capacity, len(PARTITION_FIELDS), np.float32,
+                               self.__max_partition_series)
+
+        series.append(timestamp, [getattr(partition_info, field) for field in PARTITION_FIELDS])
+
+  def __recordProcesses(self, pim: ProcessesInfoManager, timestamp: float) -> None:
+
+    snapshot = pim.snapshot
+
+    # Apenas os processos de maior uso de CPU são gravados, selecionados direto da coluna (sem cópia)
+    cpu_percentages = np.frombuffer(snapshot.column("cpu_percent"), dtype=np.float64)
+    top_count = min(self.__top_processes_count, len(cpu_percentages))
+
+    top_rows = np.argpartition(-cpu_percentages, top_count - 1)[:top_count].tolist() if top_count > 0 else []
+
+    # Os valores vêm das colunas: um atributo de detalhe lido pelo ProcessInfo seria lido do sistema nos processos em que
+    # ainda não foi (ver ProcessesSnapshot.detail)
+    pids = snapshot.column("pid")
+    memory_percentages = snapshot.column("memory_percent")
+    loaded, missing = snapshot.loaded_details, snapshot.missing_details
+    bit = DETAIL_BITS["memory_percent"]
+
+    with self.__lock:
+
+      for row in top_rows:
+
+        series = self.__series(self.__processes, pids[row],
+                               self.__process_capacity, len(PROCESS_FIELDS), np.float32,
+                               self.__max_process_series)
+
+        memory_percentage = memory_percentages[row] if loaded[row] & bit and not missing[row] & bit else np.nan
+
+        series.append(timestamp, [cpu_percentages[row], memory_percentage])
+
+  def __series(self, series_by_key: OrderedDict, key, capacity: int, width: int, dtype: np.dtype,
+               max_series: int) -> RingBuffer:
+
+    """Retorna a série de uma chave, criando-a (e descartando a atualizada há mais tempo, se necessário)
+    """
+
+    series = series_by_key.get(key)
+
+    if series is None:
+
+      if len(series_by_key) >= max_series:
+
+        series_by_key.popitem(last=False)
+
+      series = RingBuffer(capacity, width, dtype)
+      series_by_key[key] = series
+
+    # Mantém a ordem do dicionário da série atualizada há mais tempo para a mais recente
+    series_by_key.move_to_end(key)
+
+    return series
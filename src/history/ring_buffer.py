@@ -0,0 +1,134 @@
+import numpy as np
+
+
+from typing import Tuple
+
+
+class RingBuffer:
+
+  """
+  Buffer circular pré-alocado de amostras de uma métrica, com um instante (time.time) por amostra.
+
+  Cada amostra é gravada duas vezes (na posição i e na posição i + capacity), de forma que qualquer janela com até 'capacity' amostras seja um trecho contíguo do array. Assim, append é O(1) e window devolve views do NumPy, sem cópia.
+  """
+
+  def __init__(self, capacity: int, width: int, dtype: np.dtype = np.float32) -> None:
+
+    """
+    Parameters
+    ----------
+    capacity : int
+      Quantidade máxima de amostras mantidas
+    width : int
+      Quantidade de valores por amostra (ex.: uma coluna por CPU)
+    dtype : np.dtype
+      Tipo dos valores armazenados
+    """
+
+    if capacity <= 0 or width <= 0:
+
+      raise ValueError("A capacidade e a largura do buffer devem ser positivas!")
+
+    self.__capacity = capacity
+    self.__width = width
+
+    self.__timestamps = np.zeros(2 * capacity, dtype=np.float64)
+    self.__values = np.zeros((2 * capacity, width), dtype=dtype)
+
+    self.__position = 0 # Posição da próxima gravação
+    self.__count = 0
+
+  @property
+  def capacity(self) -> int:
+
+    return self.__capacity
+
+  @property
+  def width(self) -> int:
+
+    return self.__width
+
+  @property
+  def count(self) -> int:
+
+    """
+    Quantidade de amostras armazenadas
+    """
+
+    return self.__count
+
+  @property
+  def nbytes(self) -> int:
+
+    """
+    Memória ocupada pelos arrays do buffer, em bytes
+    """
+
+    return self.__timestamps.nbytes + self.__values.nbytes
+
+  @property
+  def last_timestamp(self) -> float | None:
+
+    if self.__count == 0:
+
+      return None
+
+    return float(self.__timestamps[self.__position + self.__capacity - 1])
+
+  def append(self, timestamp: float, values) -> None:
+
+    """Grava uma amostra, substituindo a mais antiga quando o buffer está cheio
+
+    Parameters
+    ----------
+    timestamp : float
+      Instante da amostra, em segundos desde a época
+    values : array-like
+      Valores da amostra, com 'width' elementos
+    """
+
+    mirror = self.__position + self.__capacity
+
+    self.__timestamps[self.__position] = timestamp
+    self.__timestamps[mirror] = timestamp
+    self.__values[self.__position] = values
+    self.__values[mirror] = values
+
+    self.__position = (self.__position + 1) % self.__capacity
+    self.__count = min(self.__count + 1, self.__capacity)
+
+  def window(self, count: int | None = None) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Retorna as últimas amostras, da mais antiga para a mais recente
+
+    As views continuam válidas até que o buffer dê uma volta completa sobre elas; para guardá-las por mais tempo, copie-as.
+
+    Parameters
+    ----------
+    count : int | None
+      Quantidade de amostras. Sem ele, retorna todas as amostras armazenadas
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+      Views com os instantes (count,) e os valores (count, width) das amostras
+    """
+
+    count = self.__count if count is None else max(0, min(count, self.__count))
+
+    end = self.__position + self.__capacity
+    start = end - count
+
+    return self.__timestamps[start:end], self.__values[start:end]
+
+  def since(self, timestamp: float) -> Tuple[np.ndarray, np.ndarray]:
+
+    """Retorna as amostras a partir de um instante (inclusive), da mais antiga para a mais recente
+    """
+
+    timestamps, _ = self.window()
+
+    # Os instantes são crescentes, então a busca binária encontra o início da janela
+    first = int(np.searchsorted(timestamps, timestamp, side="left"))
+
+    return self.window(self.__count - first)
@@ -1,126 +1,213 @@
-import psutil
-import psutil._common
+from typing import TYPE_CHECKING, Dict, List
 
 
 from src.abstracts.unit_info import UnitInfo
 
+# A coleta importa este módulo, então a referência a ela é usada apenas nas anotações de tipo
+if TYPE_CHECKING:
+
+  from src.processes.processes_snapshot import ProcessesSnapshot
+
+
+# Atributos lidos de cada processo, no formato aceito por psutil.process_iter(attrs=...)
+PROCESS_ATTRIBUTES: List[str] = [
+  "name",
+  "pid",
+  "ppid",
+  "nice",
+  "username",
+  "status",
+  "exe",
+  "create_time",
+  "num_threads",
+  "cpu_percent",
+  "cpu_times",
+  "io_counters",
+  "memory_percent",
+  "memory_info"
+]
+
+# Mapeamento de traduções dos estados para pt-br
+STATUS_TRANSLATION: Dict[str, str] = {
+  "sleeping": "esperando",
+  "running": "executando",
+  "zombie": "zumbi"
+}
+
+# Atributos de detalhe, usados apenas pela janela de detalhes (e pela árvore de processos). Quando não vêm na coleta,
+# são lidos sob demanda, todos juntos, na primeira vez que algum deles é acessado
+DETAIL_PROCESS_ATTRIBUTES: List[str] = ["nice", "num_threads", "io_counters", "memory_percent"]
+
+# Contadores acumulados usados no cálculo das taxas de cada processo (ver ProcessRatesSampler). Como a leitura deles
+# costuma ser negada nos processos de outros usuários, um contador inacessível fica ausente (None) em vez de ocultar o processo
+RATE_PROCESS_ATTRIBUTES: List[str] = ["cpu_times", "io_counters", "memory_info"]
+
+# Atributos lidos na coleta para a tabela de processos (os contadores das taxas são lidos a cada coleta)
+SUMMARY_PROCESS_ATTRIBUTES: List[str] = [attribute for attribute in PROCESS_ATTRIBUTES
+                                         if attribute not in DETAIL_PROCESS_ATTRIBUTES
+                                         or attribute in RATE_PROCESS_ATTRIBUTES]
+
+# Leituras do sistema (arquivos do /proc ou chamadas de sistema, medidas no Linux) feitas por cada atributo de detalhe
+# quando lido junto com os demais: nice -> getpriority, num_threads -> /proc/<pid>/status,
+# io_counters -> /proc/<pid>/io, memory_percent -> /proc/<pid>/statm e /proc/meminfo
+DETAIL_ATTRIBUTE_READS: Dict[str, int] = {
+  "nice": 1,
+  "num_threads": 1,
+  "io_counters": 1,
+  "memory_percent": 2
+}
+
 
 class ProcessInfo(UnitInfo):
 
   """
 
   Representa a informação de um único processo
-  
+
+  É uma visão leve de uma linha de um ProcessesSnapshot: os valores ficam nas colunas da coleta, e os atributos de detalhe são lidos sob demanda por ela.
+
   """
 
-  def __init__(self, pid: int) -> None:
+  __slots__ = ("__snapshot", "__row")
 
-    process = psutil.Process(pid)
+  def __init__(self, snapshot: "ProcessesSnapshot", row: int) -> None:
 
-    self.__name = process.name()
-    self.__pid = process.pid
-    self.__ppid = process.ppid()
-    self.__priority_number = process.nice()
-    self.__owner_username = process.username()
+    """
+    Parameters
+    ----------
+    snapshot : ProcessesSnapshot
+      Coleta que guarda os valores do processo
+    row : int
+      Linha do processo na coleta
+    """
 
-    # Mapeamento de traduções dos estados para pt-br
-    status_translation = {
-      "sleeping": "esperando",
-      "running": "executando",
-      "zombie": "zumbi"
-    }
+    self.__snapshot = snapshot
+    self.__row = row
 
-    self.__status = status_translation[process.status()]
-    self.__executable_path = process.exe()
-    self.__created_time = process.create_time()
-    self.__threads_used_count = process.num_threads()
+  @property
+  def details_loaded(self) -> bool:
 
-    # Informações da relação CPU e o processo do contexto
-    self.__cpu_used_percentage = process.cpu_percent()
+    """
+    Retorna verdadeiro se todos os atributos de detalhe já foram lidos
+    """
 
-    # Informações da relação I/O e o processo do contexto
-    io_metrics: psutil._common.pio = process.io_counters()
+    return self.__snapshot.isDetailLoaded(self.__row)
 
-    self.__write_operations_count = io_metrics.write_count
-    self.__read_operations_count = io_metrics.read_count
-    self.__write_bytes_number = io_metrics.write_bytes
-    self.__read_bytes_number = io_metrics.read_bytes
+  def loadDetails(self) -> None:
 
-    # Informações da relação Memória principal e o processo do contexto
-    self.__memory_used_percent = process.memory_percent()
+    """Lê, em uma única passada, os atributos de detalhe que ainda não foram lidos
+    """
 
+    self.__snapshot.loadDetails(self.__row)
 
   @property
   def name(self) -> str:
 
-    return self.__name
+    return self.__snapshot.column("name")[self.__row]
 
   @property
   def pid(self) -> int:
 
-    return self.__pid
+    return self.__snapshot.column("pid")[self.__row]
 
   @property
   def ppid(self) -> int:
 
-    return self.__ppid
+    return self.__snapshot.column("ppid")[self.__row]
 
   @property
   def priority_number(self) -> int:
 
-    return self.__priority_number
+    return self.__snapshot.detail(self.__row, "nice")
 
   @property
   def owner_username(self) -> str:
 
-    return self.__owner_username
+    return self.__snapshot.column("username")[self.__row]
 
   @property
   def status(self) -> str:
 
-    return self.__status
+    return self.__snapshot.column("status")[self.__row]
 
   @property
   def executable_path(self) -> str:
 
-    return self.__executable_path
+    return self.__snapshot.column("exe")[self.__row]
 
   @property
   def created_time(self) -> float:
 
-    return self.__created_time
+    return self.__snapshot.column("create_time")[self.__row]
 
   @property
   def cpu_used_percentage(self) -> float:
 
-    return self.__cpu_used_percentage
+    return self.__snapshot.column("cpu_percent")[self.__row]
+
+  @property
+  def cpu_time_percentage(self) -> float | None:
+
+    """
+    Porcentagem de CPU calculada pela diferença dos tempos de CPU (cpu_times) desde a coleta anterior, ou None se não houver coleta anterior do processo
+    """
+
+    return self.__snapshot.rate(self.__row, "cpu_time_percent")
+
+  @property
+  def read_bytes_per_second(self) -> float | None:
+
+    return self.__snapshot.rate(self.__row, "read_bytes_per_second")
+
+  @property
+  def write_bytes_per_second(self) -> float | None:
+
+    return self.__snapshot.rate(self.__row, "write_bytes_per_second")
+
+  @property
+  def io_operations_per_second(self) -> float | None:
+
+    """
+    Operações de leitura e de escrita por segundo (IOPS) desde a coleta anterior
+    """
+
+    return self.__snapshot.rate(self.__row, "io_operations_per_second")
+
+  @property
+  def memory_growth_per_second(self) -> float | None:
+
+    """
+    Variação da memória residente (RSS) por segundo desde a coleta anterior, em bytes (negativa quando a memória diminui)
+    """
+
+    return self.__snapshot.rate(self.__row, "rss_bytes_per_second")
 
   @property
   def write_operations_count(self) -> int:
 
-    return self.__write_operations_count
+    return self.__snapshot.detail(self.__row, "io_counters", "write_count")
 
   @property
   def read_operations_count(self) -> int:
 
-    return self.__read_operations_count
+    return self.__snapshot.detail(self.__row, "io_counters", "read_count")
 
   @property
   def write_bytes_number(self) -> int:
 
-    return self.__write_bytes_number
+    return self.__snapshot.detail(self.__row, "io_counters", "write_bytes")
 
   @property
   def read_bytes_number(self) -> int:
 
-    return self.__read_bytes_number
+    return self.__snapshot.detail(self.__row, "io_counters", "read_bytes")
 
   @property
   def memory_used_percent(self) -> float:
 
-    return self.__memory_used_percent
-  
+    return self.__snapshot.detail(self.__row, "memory_percent")
+
   @property
   def threads_used_count(self) -> int:
 
-    return self.__threads_used_count
\ No newline at end of file
+    return self.__snapshot.detail(self.__row, "num_threads")
@@ -0,0 +1,110 @@
+import numpy as np
+
+
+from array import array
+from typing import List
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.processes.processes_snapshot import ProcessesSnapshot, DETAIL_BITS, RATE_COLUMNS
+from src.sources.live_source import LIVE_SOURCE
+
+
+# Contadores acumulados de cada processo, na ordem das linhas da matriz de contadores. A memória residente (a última)
+# não é acumulada, então pode diminuir entre as coletas
+COUNTERS: List[str] = ["cpu_time", "read_bytes", "write_bytes", "read_count", "write_count", "rss"]
+
+
+class ProcessRatesSampler:
+
+  """
+  Amostrador das taxas de cada processo (CPU pelos tempos de CPU, bytes lidos e escritos por segundo, operações de E/S por segundo e crescimento da memória residente) entre duas coletas consecutivas.
+
+  As coletas são alinhadas pela chave (pid, create_time), com uma busca binária de todos os pids da coleta atual nos pids ordenados da anterior, e as taxas são calculadas subtraindo as colunas inteiras dos contadores, sem percorrer os processos um a um. Processos novos, com o pid reutilizado ou com algum contador ausente ficam com a taxa NaN.
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte do relógio das coletas (a mesma dos processos). Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    # Coleta anterior, ordenada por pid
+    self.__previous_timestamp: float | None = None
+    self.__previous_pids = np.empty(0, dtype=np.int64)
+    self.__previous_create_times = np.empty(0, dtype=np.float64)
+    self.__previous_counters = np.empty((len(COUNTERS), 0), dtype=np.float64)
+
+  def sample(self, snapshot: ProcessesSnapshot) -> None:
+
+    """Calcula as taxas dos processos de uma coleta em relação à coleta anterior e as guarda nela (ver ProcessesSnapshot.setRates)
+
+    Deve ser chamado logo após a coleta, antes que os atributos de detalhe sejam lidos sob demanda: apenas os contadores de E/S lidos na própria coleta entram no cálculo.
+    """
+
+    timestamp = self.__source.time()
+
+    pids = np.frombuffer(snapshot.column("pid"), dtype=np.int64)
+    create_times = np.frombuffer(snapshot.column("create_time"), dtype=np.float64)
+    counters = self.__countersOf(snapshot)
+
+    rates = np.full((len(RATE_COLUMNS), len(pids)), np.nan)
+
+    if self.__previous_timestamp is not None and timestamp > self.__previous_timestamp and len(self.__previous_pids):
+
+      positions = np.minimum(np.searchsorted(self.__previous_pids, pids), len(self.__previous_pids) - 1)
+
+      # O create_time diferencia um pid reutilizado por outro processo
+      rows = np.flatnonzero((self.__previous_pids[positions] == pids)
+                            & (self.__previous_create_times[positions] == create_times))
+
+      deltas = counters[:, rows] - self.__previous_counters[:, positions[rows]]
+
+      # Contadores acumulados que diminuíram foram reiniciados, e não têm taxa
+      cumulative = deltas[:-1]
+      cumulative[cumulative < 0] = np.nan
+
+      deltas /= timestamp - self.__previous_timestamp
+
+      rates[0, rows] = deltas[0] * 100
+      rates[1, rows] = deltas[1]
+      rates[2, rows] = deltas[2]
+      rates[3, rows] = deltas[3] + deltas[4]
+      rates[4, rows] = deltas[5]
+
+      np.round(rates, 2, out=rates)
+
+    order = np.argsort(pids, kind="stable")
+
+    self.__previous_timestamp = timestamp
+    self.__previous_pids = pids[order]
+    self.__previous_create_times = create_times[order]
+    self.__previous_counters = counters[:, order]
+
+    snapshot.setRates({column: array("d", rates[position].tobytes()) for position, column in enumerate(RATE_COLUMNS)})
+
+  def __countersOf(self, snapshot: ProcessesSnapshot) -> np.ndarray:
+
+    """Matriz dos contadores da coleta (uma linha por contador de COUNTERS, uma coluna por processo), com NaN nos ausentes
+    """
+
+    counters = np.empty((len(COUNTERS), len(snapshot)), dtype=np.float64)
+
+    for position, counter in enumerate(COUNTERS):
+
+      column = snapshot.column(counter)
+      counters[position] = np.frombuffer(column, dtype=np.float64 if column.typecode == "d" else np.int64)
+
+    # Os contadores de E/S só valem nos processos em que io_counters foi lido na coleta e não foi negado
+    bit = DETAIL_BITS["io_counters"]
+    loaded = np.frombuffer(snapshot.loaded_details, dtype=np.uint8) & bit
+    missing = np.frombuffer(snapshot.missing_details, dtype=np.uint8) & bit
+
+    counters[1:5, (loaded == 0) | (missing != 0)] = np.nan
+
+    return counters
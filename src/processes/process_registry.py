@@ -0,0 +1,415 @@
+import psutil
+
+
+import heapq
+from typing import Any, Dict, List, Set, Tuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.processes.process_info import PROCESS_ATTRIBUTES, RATE_PROCESS_ATTRIBUTES
+from src.sources.live_source import LIVE_SOURCE
+
+
+# Atributos que não mudam durante a vida do processo, lidos apenas quando ele aparece pela primeira vez
+STATIC_PROCESS_ATTRIBUTES: List[str] = ["name", "pid", "username", "exe", "create_time"]
+
+# Atributos relidos a cada atualização. O ppid fica aqui porque muda quando o processo pai termina,
+# e é nessa leitura que o psutil verifica se o pid foi reutilizado por outro processo
+DYNAMIC_PROCESS_ATTRIBUTES: List[str] = [attribute for attribute in PROCESS_ATTRIBUTES
+                                         if attribute not in STATIC_PROCESS_ATTRIBUTES]
+
+# Valor usado pelo psutil no lugar de atributos cuja leitura foi negada (AccessDenied ou ZombieProcess)
+DENIED = object()
+
+# Ordenações do modo Top-N -> atributo lido de todos os processos na passada de ordenação
+RANKING_ATTRIBUTES: Dict[str, str] = {
+  "cpu": "cpu_percent",
+  "memory": "memory_percent",
+  "io": "io_counters"
+}
+
+
+def acceptedAttributes(process_attributes: Dict[str, Any] | None) -> Dict[str, Any] | None:
+
+  """Trata as leituras negadas dos atributos de um processo: os contadores das taxas (RATE_PROCESS_ATTRIBUTES) ficam None, e os demais tornam o processo inacessível
+
+  Returns
+  -------
+  Dict[str, Any] | None
+    Atributos do processo, ou None se ele deve ser ignorado
+  """
+
+  if process_attributes is None:
+
+    return None
+
+  for attribute in RATE_PROCESS_ATTRIBUTES:
+
+    if process_attributes.get(attribute) is DENIED:
+
+      process_attributes[attribute] = None
+
+  # Assim como antes, processos com algum outro atributo inacessível são ignorados
+  if any(value is DENIED for value in process_attributes.values()):
+
+    return None
+
+  return process_attributes
+
+
+class RegisteredProcess:
+
+  """
+  Representa um processo mantido pelo registro entre as atualizações
+  """
+
+  def __init__(self, handle: psutil.Process, static_attributes: Dict[str, Any] | None = None) -> None:
+
+    self.__handle = handle
+    self.__static_attributes = static_attributes
+    self.__previous_io_bytes: int | None = None
+
+  @property
+  def handle(self) -> psutil.Process:
+
+    """
+    Objeto do psutil reaproveitado entre as atualizações (guarda o estado usado por cpu_percent)
+    """
+
+    return self.__handle
+
+  @property
+  def static_attributes(self) -> Dict[str, Any] | None:
+
+    """
+    Atributos estáticos, ou None se o processo ainda não foi lido por completo (ex.: ficou fora do Top-N)
+    """
+
+    return self.__static_attributes
+
+  @property
+  def is_accessible(self) -> bool:
+
+    """
+    Retorna falso se algum atributo estático do processo teve a leitura negada
+    """
+
+    if self.__static_attributes is None:
+
+      return True
+
+    return not any(value is DENIED for value in self.__static_attributes.values())
+
+  @property
+  def previous_io_bytes(self) -> int | None:
+
+    """
+    Total de bytes lidos e escritos na última passada de ordenação por E/S
+    """
+
+    return self.__previous_io_bytes
+
+  def setStaticAttributes(self, static_attributes: Dict[str, Any]) -> None:
+
+    self.__static_attributes = static_attributes
+
+  def setPreviousIOBytes(self, io_bytes: int) -> None:
+
+    self.__previous_io_bytes = io_bytes
+
+
+class ProcessRegistry:
+
+  """
+  Registro de longa duração dos processos do sistema, indexado por (pid, create_time).
+
+  A cada atualização apenas os processos novos têm os atributos estáticos lidos e os encerrados são descartados. Os demais relêem somente os atributos dinâmicos.
+
+  No modo Top-N (refreshTop), todos os processos passam apenas pela leitura barata da chave de ordenação, e somente os N maiores são lidos por completo.
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte dos processos. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+    self.__processes: Dict[Tuple[int, float], RegisteredProcess] = dict()
+    self.__keys_by_pid: Dict[int, Tuple[int, float]] = dict()
+    self.__scanned_count = 0
+
+  @property
+  def registered_count(self) -> int:
+
+    return len(self.__processes)
+
+  @property
+  def scanned_count(self) -> int:
+
+    """
+    Quantidade de pids do sistema na última atualização, inclusive os inacessíveis e os que ficaram fora do Top-N
+    """
+
+    return self.__scanned_count
+
+  def refresh(self, attributes: List[str] = PROCESS_ATTRIBUTES) -> List[Dict[str, Any]]:
+
+    """Atualiza o registro e lê os atributos dinâmicos dos processos acessíveis
+
+    Parameters
+    ----------
+    attributes : List[str]
+      Atributos lidos (um subconjunto de PROCESS_ATTRIBUTES que contém STATIC_PROCESS_ATTRIBUTES). Os demais podem ser lidos depois pelo objeto de handleOf
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+      Atributos de cada processo acessível, no formato de PROCESS_ATTRIBUTES
+    """
+
+    current_pids = self.__scanPids()
+
+    processes_attributes: List[Dict[str, Any]] = list()
+
+    for pid in sorted(current_pids):
+
+      try:
+
+        process_attributes = self.__read(pid, attributes)
+
+      except psutil.NoSuchProcess:
+
+        # Encerrado durante a leitura, ou pid reutilizado (o novo processo entra na próxima atualização)
+        self.__unregister(pid)
+        continue
+
+      process_attributes = acceptedAttributes(process_attributes)
+
+      if process_attributes is None:
+
+        continue
+
+      processes_attributes.append(process_attributes)
+
+    return processes_attributes
+
+  def refreshTop(self, count: int, by: str, attributes: List[str] = PROCESS_ATTRIBUTES) -> List[Dict[str, Any]]:
+
+    """Atualiza o registro lendo de todos os processos apenas a chave de ordenação, e lê por completo somente os 'count' maiores
+
+    Parameters
+    ----------
+    count : int
+      Quantidade de processos lidos por completo
+    by : str
+      Ordenação: "cpu" (porcentagem de CPU), "memory" (porcentagem de memória) ou "io" (bytes lidos e escritos desde a última atualização)
+    attributes : List[str]
+      Atributos lidos dos maiores processos (ver refresh)
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+      Atributos dos maiores processos acessíveis, do maior para o menor, no formato de PROCESS_ATTRIBUTES
+    """
+
+    if by not in RANKING_ATTRIBUTES:
+
+      raise ValueError(f"A ordenação '{by}' não existe!")
+
+    ranking_attribute = RANKING_ATTRIBUTES[by]
+
+    ranked: List[Tuple[float, int, Any]] = list()
+
+    for pid in self.__scanPids():
+
+      try:
+
+        registered_process = self.__registeredOf(pid)
+
+        if registered_process is None:
+
+          continue
+
+        # Uma única leitura do /proc por processo (ex.: /proc/<pid>/stat para a CPU)
+        value = getattr(registered_process.handle, ranking_attribute)()
+
+      except (psutil.AccessDenied, psutil.ZombieProcess):
+
+        continue
+
+      except psutil.NoSuchProcess:
+
+        self.__unregister(pid)
+        continue
+
+      ranked.append((self.__rankingKey(registered_process, by, value), pid, value))
+
+    processes_attributes: List[Dict[str, Any]] = list()
+
+    for _, pid, ranking_value in heapq.nlargest(count, ranked):
+
+      try:
+
+        # O valor já lido é reaproveitado: uma segunda chamada a cpu_percent mediria um intervalo quase nulo
+        process_attributes = self.__read(pid, attributes, {ranking_attribute: ranking_value})
+
+      except psutil.NoSuchProcess:
+
+        self.__unregister(pid)
+        continue
+
+      process_attributes = acceptedAttributes(process_attributes)
+
+      if process_attributes is None:
+
+        continue
+
+      processes_attributes.append(process_attributes)
+
+    return processes_attributes
+
+  def handleOf(self, pid: int) -> psutil.Process | None:
+
+    """Objeto do psutil de um processo registrado, usado para ler os atributos que não vieram na atualização
+    """
+
+    key = self.__keys_by_pid.get(pid)
+
+    return self.__processes[key].handle if key is not None else None
+
+  def __scanPids(self) -> Set[int]:
+
+    """Lista os pids do sistema e descarta do registro os processos encerrados
+    """
+
+    current_pids: Set[int] = set(self.__source.pids())
+
+    for pid in self.__keys_by_pid.keys() - current_pids:
+
+      self.__unregister(pid)
+
+    self.__scanned_count = len(current_pids)
+
+    return current_pids
+
+  def __rankingKey(self, registered_process: RegisteredProcess, by: str, value: Any) -> float:
+
+    if by != "io":
+
+      return value
+
+    # Por E/S a ordenação usa os bytes desde a última passada (na primeira vez de cada processo, o total desde o início)
+    io_bytes = value.read_bytes + value.write_bytes
+    previous_io_bytes = registered_process.previous_io_bytes
+
+    registered_process.setPreviousIOBytes(io_bytes)
+
+    return io_bytes - previous_io_bytes if previous_io_bytes is not None else io_bytes
+
+  def __registeredOf(self, pid: int) -> RegisteredProcess | None:
+
+    """Retorna o processo registrado de um pid, registrando-o (sem ler os atributos) se ele for novo
+
+    Returns
+    -------
+    RegisteredProcess | None
+      Processo registrado, ou None se ele for inacessível
+    """
+
+    key = self.__keys_by_pid.get(pid)
+
+    if key is not None:
+
+      registered_process = self.__processes[key]
+
+      if registered_process.is_accessible:
+
+        return registered_process
+
+      # Processos inacessíveis não passam pela leitura dinâmica, então o reuso do pid é verificado aqui
+      if registered_process.handle.is_running():
+
+        return None
+
+      self.__unregister(pid)
+
+    handle = self.__source.process(pid)
+
+    try:
+
+      create_time = handle.create_time()
+
+    except (psutil.AccessDenied, psutil.ZombieProcess):
+
+      create_time = 0.0
+
+    key = (pid, create_time)
+
+    registered_process = RegisteredProcess(handle)
+
+    self.__processes[key] = registered_process
+    self.__keys_by_pid[pid] = key
+
+    return registered_process
+
+  def __read(self, pid: int, attributes: List[str],
+             known_attributes: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
+
+    """Lê os atributos de um pid. Processos já registrados relêem apenas os atributos dinâmicos, e os novos são registrados
+
+    Parameters
+    ----------
+    pid : int
+      Pid do processo
+    attributes : List[str]
+      Atributos lidos
+    known_attributes : Dict[str, Any] | None
+      Atributos já lidos nesta atualização, que não são lidos de novo
+
+    Returns
+    -------
+    Dict[str, Any] | None
+      Atributos no formato de PROCESS_ATTRIBUTES, ou None se o processo for inacessível
+    """
+
+    registered_process = self.__registeredOf(pid)
+
+    if registered_process is None:
+
+      return None
+
+    known_attributes = known_attributes or dict()
+
+    if registered_process.static_attributes is not None:
+
+      dynamic_attributes = registered_process.handle.as_dict(
+        attrs=[attribute for attribute in DYNAMIC_PROCESS_ATTRIBUTES
+               if attribute in attributes and attribute not in known_attributes],
+        ad_value=DENIED
+      )
+
+      return {**registered_process.static_attributes, **dynamic_attributes, **known_attributes}
+
+    # Primeira leitura completa: todos os atributos são lidos em uma única passada (oneshot)
+    process_attributes = registered_process.handle.as_dict(
+      attrs=[attribute for attribute in attributes if attribute not in known_attributes],
+      ad_value=DENIED
+    )
+    process_attributes.update(known_attributes)
+
+    registered_process.setStaticAttributes({attribute: process_attributes[attribute]
+                                            for attribute in STATIC_PROCESS_ATTRIBUTES})
+
+    return process_attributes if registered_process.is_accessible else None
+
+  def __unregister(self, pid: int) -> None:
+
+    key = self.__keys_by_pid.pop(pid, None)
+
+    if key is not None:
+
+      self.__processes.pop(key, None)
@@ -0,0 +1,367 @@
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+
+from src.processes.process_info import ProcessInfo
+from src.processes.processes_snapshot import ProcessesSnapshot, DETAIL_BITS
+
+
+# Colunas da coleta somadas em cada subárvore (na ordem de SubtreeTotals) -> atributo de detalhe da coluna, ou None
+# para as colunas lidas sempre na coleta
+TREE_COLUMNS: List[Tuple[str, str | None]] = [
+  ("cpu_percent", None),
+  ("memory_percent", "memory_percent"),
+  ("num_threads", "num_threads"),
+  ("read_bytes", "io_counters"),
+  ("write_bytes", "io_counters")
+]
+
+
+class SubtreeTotals(NamedTuple):
+
+  """
+  Totais de um processo somados aos de todos os seus descendentes
+  """
+
+  cpu_used_percentage: float
+  memory_used_percent: float
+  threads_used_count: int
+  read_bytes_number: int
+  write_bytes_number: int
+
+
+class ProcessTree:
+
+  """
+  Árvore dos processos de uma coleta (pai -> filhos, a partir do ppid), com os totais de cada subárvore.
+
+  A árvore é montada em uma única passada, e os totais somados dos filhos para os pais. Nas atualizações seguintes, apenas os processos que mudaram propagam a diferença até a raiz, sem recalcular a árvore inteira. Processos cujo pai não está na coleta (ex.: pai inacessível ou já encerrado) ficam na raiz.
+
+  Os valores somados são lidos das colunas da coleta, sem ler os atributos de detalhe que não vieram nela: os que não foram lidos, ou não puderam ser lidos, contam como 0.
+  """
+
+  def __init__(self, processes_info: ProcessesSnapshot | None = None, rebuild_ratio: float = 0.25) -> None:
+
+    """
+    Parameters
+    ----------
+    processes_info : ProcessesSnapshot | None
+      Processos da coleta inicial. Sem ela, a árvore começa vazia
+    rebuild_ratio : float
+      Fração dos processos que, ao entrar, sair ou trocar de pai em uma atualização, faz a árvore ser montada do zero
+    """
+
+    self.__rebuild_ratio = rebuild_ratio
+
+    self.__build(processes_info if processes_info is not None else ProcessesSnapshot())
+
+  @property
+  def processes_count(self) -> int:
+
+    return len(self.__processes)
+
+  @property
+  def roots(self) -> List[int]:
+
+    """
+    Pids dos processos na raiz da árvore
+    """
+
+    return self.__children[None]
+
+  def hasProcess(self, pid: int) -> bool:
+
+    return pid in self.__processes
+
+  def processOf(self, pid: int) -> ProcessInfo:
+
+    return self.__processes[pid]
+
+  def parentOf(self, pid: int) -> int | None:
+
+    """Pid do pai de um processo na árvore, ou None se ele estiver na raiz
+    """
+
+    return self.__parents[pid]
+
+  def childrenOf(self, pid: int) -> List[int]:
+
+    return self.__children[pid]
+
+  def rowOf(self, pid: int) -> int:
+
+    """Posição de um processo entre os seus irmãos
+    """
+
+    return self.__children[self.__parents[pid]].index(pid)
+
+  def totalsOf(self, pid: int) -> SubtreeTotals:
+
+    return SubtreeTotals(*self.__totals[pid])
+
+  def update(self, processes_info: ProcessesSnapshot) -> None:
+
+    """Atualiza a árvore com uma nova coleta.
+
+    Processos novos, encerrados ou que trocaram de pai são religados à árvore, e a diferença dos valores de cada processo alterado é propagada apenas pelos seus ancestrais.
+
+    Parameters
+    ----------
+    processes_info : ProcessesSnapshot
+      Processos da nova coleta
+    """
+
+    current_processes = dict(zip(processes_info.column("pid"), processes_info))
+    current_values = self.__readValues(processes_info)
+
+    removed_pids = [pid for pid in self.__processes if pid not in current_processes]
+    added_pids = [pid for pid in current_processes if pid not in self.__processes]
+    moved_pids = [pid for pid, process_info in current_processes.items()
+                  if pid in self.__processes and process_info.ppid != self.__declared_ppids[pid]]
+
+    # Com muitas mudanças de estrutura, montar do zero é mais barato que religar cada processo
+    if len(removed_pids) + len(added_pids) + len(moved_pids) > self.__rebuild_ratio * max(len(current_processes), 1):
+
+      self.__build(processes_info)
+      return
+
+    for pid in removed_pids:
+
+      self.__remove(pid)
+
+    for pid in moved_pids:
+
+      self.__detach(pid)
+      self.__declared_ppids[pid] = current_processes[pid].ppid
+
+    for pid in added_pids:
+
+      process_info = current_processes[pid]
+      own_values = current_values[pid]
+
+      self.__processes[pid] = process_info
+      self.__declared_ppids[pid] = process_info.ppid
+      self.__own_values[pid] = own_values
+      self.__totals[pid] = own_values.copy()
+      self.__parents[pid] = None
+      self.__children[pid] = list()
+
+    # Os processos novos adotam os que estavam na raiz esperando por eles (ex.: pai lido depois do filho)
+    for pid in added_pids:
+
+      for orphan_pid in self.__orphans.pop(pid, set()):
+
+        self.__children[None].remove(orphan_pid)
+        self.__children[pid].append(orphan_pid)
+        self.__parents[orphan_pid] = pid
+
+        self.__addUpwards(pid, self.__totals[orphan_pid])
+
+    for pid in moved_pids + added_pids:
+
+      self.__attach(pid)
+
+    added = set(added_pids)
+
+    for pid, process_info in current_processes.items():
+
+      self.__processes[pid] = process_info
+
+      if pid in added:
+
+        continue
+
+      own_values = current_values[pid]
+      previous_values = self.__own_values[pid]
+
+      if own_values != previous_values:
+
+        self.__own_values[pid] = own_values
+        self.__addUpwards(pid, [value - previous for value, previous in zip(own_values, previous_values)])
+
+  def __build(self, processes_info: ProcessesSnapshot) -> None:
+
+    """Monta a árvore do zero, em tempo linear no número de processos
+    """
+
+    self.__processes: Dict[int, ProcessInfo] = dict(zip(processes_info.column("pid"), processes_info))
+    self.__declared_ppids: Dict[int, int] = dict(zip(processes_info.column("pid"), processes_info.column("ppid")))
+    self.__own_values: Dict[int, List[float]] = self.__readValues(processes_info)
+    self.__totals: Dict[int, List[float]] = {pid: values.copy() for pid, values in self.__own_values.items()}
+
+    self.__parents: Dict[int, int | None] = dict()
+
+    # A chave None guarda os processos na raiz
+    self.__children: Dict[int | None, List[int]] = {pid: list() for pid in self.__processes}
+    self.__children[None] = list()
+
+    # Processos na raiz, indexados pelo ppid que eles informam mas que não está na árvore
+    self.__orphans: Dict[int, Set[int]] = dict()
+
+    for pid, ppid in self.__declared_ppids.items():
+
+      parent = ppid if ppid in self.__processes and ppid != pid else None
+
+      self.__parents[pid] = parent
+      self.__children[parent].append(pid)
+
+      if parent is None:
+
+        self.__orphans.setdefault(ppid, set()).add(pid)
+
+    order = self.__walk(self.__children[None])
+
+    # Processos não alcançados a partir da raiz formam um ciclo (leituras de ppid feitas em momentos diferentes),
+    # que é desfeito levando um deles para a raiz
+    if len(order) < len(self.__processes):
+
+      visited = set(order)
+
+      for pid in self.__processes:
+
+        if pid not in visited:
+
+          self.__children[self.__parents[pid]].remove(pid)
+          self.__parents[pid] = None
+          self.__children[None].append(pid)
+          self.__orphans.setdefault(self.__declared_ppids[pid], set()).add(pid)
+
+          subtree_order = self.__walk([pid])
+
+          visited.update(subtree_order)
+          order += subtree_order
+
+    # Em ordem inversa, os filhos sempre são somados antes dos pais
+    for pid in reversed(order):
+
+      parent = self.__parents[pid]
+
+      if parent is not None:
+
+        parent_totals = self.__totals[parent]
+
+        for position, value in enumerate(self.__totals[pid]):
+
+          parent_totals[position] += value
+
+  def __walk(self, start_pids: List[int]) -> List[int]:
+
+    """Pids das subárvores a partir de 'start_pids', em largura (pais antes dos filhos)
+    """
+
+    order = list(start_pids)
+
+    for pid in order:
+
+      order.extend(self.__children[pid])
+
+    return order
+
+  def __readValues(self, processes_info: ProcessesSnapshot) -> Dict[int, List[float]]:
+
+    """Valores de cada processo somados nos totais (ver TREE_COLUMNS), indexados pelo pid
+
+    Os atributos de detalhe que não foram lidos na coleta, ou cuja leitura foi negada (ex.: io_counters de processos de outros usuários), contam como 0
+    """
+
+    loaded_details = processes_info.loaded_details
+    missing_details = processes_info.missing_details
+
+    columns = list()
+
+    for column, detail_attribute in TREE_COLUMNS:
+
+      values = processes_info.column(column)
+
+      if detail_attribute is not None:
+
+        bit = DETAIL_BITS[detail_attribute]
+        values = [value if loaded & bit and not missing & bit else 0
+                  for value, loaded, missing in zip(values, loaded_details, missing_details)]
+
+      columns.append(values)
+
+    return {pid: values for pid, *values in zip(processes_info.column("pid"), *columns)}
+
+  def __addUpwards(self, pid: int | None, delta: List[float]) -> None:
+
+    """Soma 'delta' aos totais de um processo e de todos os seus ancestrais
+    """
+
+    while pid is not None:
+
+      totals = self.__totals[pid]
+
+      for position, value in enumerate(delta):
+
+        totals[position] += value
+
+      pid = self.__parents[pid]
+
+  def __detach(self, pid: int) -> None:
+
+    """Tira um processo (com a sua subárvore) da árvore, descontando os seus totais dos ancestrais
+    """
+
+    parent = self.__parents[pid]
+
+    self.__children[parent].remove(pid)
+
+    if parent is None:
+
+      self.__orphans.get(self.__declared_ppids[pid], set()).discard(pid)
+
+    else:
+
+      self.__addUpwards(parent, [-value for value in self.__totals[pid]])
+
+    self.__parents[pid] = None
+
+  def __attach(self, pid: int) -> None:
+
+    """Liga um processo fora da árvore ao seu pai, ou à raiz se o pai não estiver na árvore
+    """
+
+    ppid = self.__declared_ppids[pid]
+    parent = ppid if ppid in self.__processes and ppid != pid else None
+
+    # Um pai que descende do próprio processo formaria um ciclo
+    ancestor = parent
+
+    while ancestor is not None:
+
+      if ancestor == pid:
+
+        parent = None
+        break
+
+      ancestor = self.__parents[ancestor]
+
+    self.__parents[pid] = parent
+    self.__children[parent].append(pid)
+
+    if parent is None:
+
+      self.__orphans.setdefault(ppid, set()).add(pid)
+
+    else:
+
+      self.__addUpwards(parent, self.__totals[pid])
+
+  def __remove(self, pid: int) -> None:
+
+    """Remove um processo encerrado. Os seus filhos vão para a raiz até que uma coleta informe o novo pai
+    """
+
+    self.__detach(pid)
+
+    for child_pid in self.__children.pop(pid):
+
+      self.__parents[child_pid] = None
+      self.__children[None].append(child_pid)
+      self.__orphans.setdefault(pid, set()).add(child_pid)
+
+    del self.__processes[pid]
+    del self.__declared_ppids[pid]
+    del self.__own_values[pid]
+    del self.__totals[pid]
+    del self.__parents[pid]
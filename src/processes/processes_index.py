@@ -0,0 +1,125 @@
+import bisect
+
+
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+
+# A coleta é usada apenas nas anotações de tipo
+if TYPE_CHECKING:
+
+  from src.processes.processes_snapshot import ProcessesSnapshot
+
+
+class TextIndex:
+
+  """
+  Índice invertido de um atributo textual (ex.: nome, estado): cada valor distinto, em minúsculas, aponta para as posições dos processos que o possuem.
+
+  As buscas percorrem apenas os valores distintos, que são muito menos numerosos que os processos. A última busca fica guardada, de forma que uma busca mais restrita (o usuário digitando mais um caractere) refine o resultado anterior em vez de percorrer todos os valores de novo.
+  """
+
+  def __init__(self, values: Sequence[str]) -> None:
+
+    self.__positions_by_key: Dict[str, List[int]] = dict()
+
+    for position, value in enumerate(values):
+
+      self.__positions_by_key.setdefault(str(value).lower(), list()).append(position)
+
+    # Valores distintos ordenados, usados pela busca por prefixo
+    self.__sorted_keys: List[str] = sorted(self.__positions_by_key.keys())
+
+    self.__last_query: str | None = None
+    self.__last_is_prefix = False
+    self.__last_keys: List[str] = list()
+
+  def count(self, key: str) -> int:
+
+    """Quantidade de processos com um valor exato (em minúsculas)
+    """
+
+    return len(self.__positions_by_key.get(key.lower(), list()))
+
+  def searchPrefix(self, query: str) -> List[int]:
+
+    """Posições dos processos cujo valor começa com 'query' (sem diferenciar maiúsculas), em ordem crescente
+    """
+
+    query = query.lower()
+
+    if self.__last_is_prefix and self.__last_query is not None and query.startswith(self.__last_query):
+
+      keys = [key for key in self.__last_keys if key.startswith(query)]
+
+    else:
+
+      # Os valores que começam com o prefixo formam um trecho contíguo da lista ordenada
+      start = bisect.bisect_left(self.__sorted_keys, query)
+      end = bisect.bisect_left(self.__sorted_keys, query + "\U0010ffff")
+
+      keys = self.__sorted_keys[start:end]
+
+    return self.__remember(query, True, keys)
+
+  def searchSubstring(self, query: str) -> List[int]:
+
+    """Posições dos processos cujo valor contém 'query' (sem diferenciar maiúsculas), em ordem crescente
+    """
+
+    query = query.lower()
+
+    # Se a busca anterior está contida na atual, o resultado atual é um subconjunto do anterior
+    if not self.__last_is_prefix and self.__last_query is not None and self.__last_query in query:
+
+      candidates = self.__last_keys
+
+    else:
+
+      candidates = self.__sorted_keys
+
+    return self.__remember(query, False, [key for key in candidates if query in key])
+
+  def __remember(self, query: str, is_prefix: bool, keys: List[str]) -> List[int]:
+
+    self.__last_query = query
+    self.__last_is_prefix = is_prefix
+    self.__last_keys = keys
+
+    if len(keys) == 1:
+
+      return self.__positions_by_key[keys[0]]
+
+    return sorted(position for key in keys for position in self.__positions_by_key[key])
+
+
+class ProcessesIndex:
+
+  """
+  Índices de um conjunto de processos coletados: mapa de pid para posição, e índices invertidos de nome e estado.
+
+  É construído em uma única passada pelas colunas da coleta, uma vez por coleta.
+  """
+
+  def __init__(self, snapshot: "ProcessesSnapshot") -> None:
+
+    self.__positions_by_pid: Dict[int, int] = {pid: position for position, pid in enumerate(snapshot.column("pid"))}
+
+    self.__names = TextIndex(list(snapshot.column("name")))
+    self.__statuses = TextIndex(list(snapshot.column("status")))
+
+  @property
+  def names(self) -> TextIndex:
+
+    return self.__names
+
+  @property
+  def statuses(self) -> TextIndex:
+
+    return self.__statuses
+
+  def positionOf(self, pid: int) -> int | None:
+
+    """Posição do processo de um pid, ou None se ele não foi coletado
+    """
+
+    return self.__positions_by_pid.get(pid)
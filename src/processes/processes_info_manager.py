@@ -1,11 +1,21 @@
 import psutil
 
 
-from typing import List, Any
+from typing import TYPE_CHECKING, List, Any, Sequence
 
 
-from src.processes.process_info import ProcessInfo
+from src.processes.process_info import ProcessInfo, PROCESS_ATTRIBUTES, STATUS_TRANSLATION
+from src.processes.process_registry import ProcessRegistry
+from src.processes.procfs_registry import ProcfsRegistry
+from src.processes.processes_index import ProcessesIndex
+from src.processes.processes_snapshot import ProcessesSnapshot
 from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
+
+# O amostrador das taxas usa o NumPy, que a coleta sem interface não importa
+if TYPE_CHECKING:
+
+  from src.processes.process_rates_sampler import ProcessRatesSampler
 
 
 class ProcessesInfoManager(InfoManager):
@@ -14,90 +24,167 @@ class ProcessesInfoManager(InfoManager):
   Representa um gerenciador das informações dos processos do sistema
   """
 
-  def __init__(self) -> None:
+  def __init__(self, registry: ProcessRegistry | ProcfsRegistry | None = None, top_count: int | None = None,
+               top_by: str = "cpu", attributes: List[str] = PROCESS_ATTRIBUTES, source: MetricsSource | None = None,
+               rates_sampler: "ProcessRatesSampler | None" = None) -> None:
+
+    """
+    Parameters
+    ----------
+    registry : ProcessRegistry | ProcfsRegistry | None
+      Registro de processos reaproveitado entre as atualizações. Sem ele, todos os processos são lidos do zero
+    top_count : int | None
+      Se informado, lê por completo apenas os 'top_count' maiores processos segundo 'top_by' (ver ProcessRegistry.refreshTop). A porcentagem de CPU só é significativa a partir da segunda coleta com o mesmo registro
+    top_by : str
+      Ordenação do modo Top-N: "cpu", "memory" ou "io"
+    attributes : List[str]
+      Atributos lidos na coleta (ex.: SUMMARY_PROCESS_ATTRIBUTES). Os atributos de detalhe que ficarem de fora são lidos sob demanda por cada ProcessInfo
+    source : MetricsSource | None
+      Fonte dos processos (a mesma lida pelo registro). Sem ela, lê o sistema ao vivo
+    rates_sampler : ProcessRatesSampler | None
+      Amostrador reaproveitado entre as atualizações que calcula as taxas de cada processo. Sem ele, as taxas não são calculadas
+    """
+
+    super().__init__(source)
+
+    if registry is None:
+
+      registry = ProcessRegistry(self.source)
 
-    self.__processes_info: List[ProcessInfo] = list()
+    if top_count is None:
 
-    for pid in psutil.pids():
+      processes_attributes = registry.refresh(attributes)
 
-      try:
+    else:
 
-        self.__processes_info.append(ProcessInfo(pid))
+      processes_attributes = registry.refreshTop(top_count, top_by, attributes)
 
-      except psutil.AccessDenied:
+    # Os processos ficam em colunas; cada ProcessInfo é uma visão de uma linha
+    self.__snapshot = ProcessesSnapshot(processes_attributes,
+                                        [registry.handleOf(attributes["pid"]) for attributes in processes_attributes],
+                                        self.source)
 
-        pass
+    if rates_sampler is not None:
 
-      except psutil.ZombieProcess:
+      rates_sampler.sample(self.__snapshot)
 
-        pass
+    self.__system_processes_count = registry.scanned_count
     
-    # Cópia de todos os processos
-    self.__all_processes_info = self.__processes_info.copy()
+    # Todos os processos, e os processos após o filtro
+    self.__all_processes_info: Sequence[ProcessInfo] = self.__snapshot
+    self.__processes_info: Sequence[ProcessInfo] = self.__snapshot
+
+    # Índices de busca, construídos na primeira vez que são usados
+    self.__index: ProcessesIndex | None = None
+
+  @property
+  def snapshot(self) -> ProcessesSnapshot:
+
+    """
+    Colunas com todos os processos coletados
+    """
+
+    return self.__snapshot
+
+  @property
+  def index(self) -> ProcessesIndex:
+
+    """
+    Índices de pid, nome e estado dos processos coletados
+    """
+
+    if self.__index is None:
+
+      self.__index = ProcessesIndex(self.__snapshot)
+
+    return self.__index
   
   @property
   def processes_count(self) -> int:
 
     return len(self.__all_processes_info)
+
+  @property
+  def system_processes_count(self) -> int:
+
+    """
+    Quantidade de processos do sistema, inclusive os inacessíveis e os que ficaram fora do Top-N
+    """
+
+    return self.__system_processes_count
+
+  @property
+  def saved_system_reads_count(self) -> int:
+
+    """
+    Leituras do sistema (arquivos do /proc ou chamadas de sistema) que a coleta deixou de fazer por não ler os atributos de detalhe, descontados os detalhes já lidos sob demanda
+    """
+
+    return self.__snapshot.pending_detail_reads
   
   @property
   def running_processes_count(self) -> int:
 
-    return len(list(filter(lambda x: x.status == "running", self.__all_processes_info)))
+    # Os estados ficam traduzidos nos processos, então a comparação também usa a tradução
+    return self.index.statuses.count(STATUS_TRANSLATION.get(psutil.STATUS_RUNNING, psutil.STATUS_RUNNING))
   
   @property
   def waiting_processes_count(self) -> int:
 
-    return len(list(filter(lambda x: x.status in ["waiting", "stopped", "disk_sleep", "sleeping"], 
-                           self.__all_processes_info)))
+    waiting_statuses = [psutil.STATUS_WAITING, psutil.STATUS_STOPPED, psutil.STATUS_DISK_SLEEP, psutil.STATUS_SLEEPING]
+
+    return sum(self.index.statuses.count(STATUS_TRANSLATION.get(status, status)) for status in waiting_statuses)
   
   @property
-  def processes_info(self) -> List[ProcessInfo]:
+  def processes_info(self) -> Sequence[ProcessInfo]:
 
     return self.__processes_info
+
+  @property
+  def all_processes_info(self) -> Sequence[ProcessInfo]:
+
+    """
+    Todos os processos coletados, independente do filtro aplicado
+    """
+
+    return self.__all_processes_info
   
   def filterBy(self, by: str, value: Any) -> None:
 
     """
     Filtra o iterável com as unidades de processo por meio de um valor recebido como entrada (value), correspondente a uma característica específica (by).
-    """
 
-    self.__processes_info = self.__all_processes_info.copy()
+    O PID é buscado pelo valor exato, o nome por trecho contido nele e o estado pelo início, sem diferenciar maiúsculas. As buscas usam os índices da coleta, e uma busca mais restrita que a anterior refina o resultado anterior.
+    """
 
-    match by:
+    if by not in ["PID", "Nome", "Estado"]:
 
-      case "PID":
+      print("Esse filtro não existe!")
 
-        attribute = "pid"
-      
-      case "Nome":
+      self.__processes_info = self.__all_processes_info
+      return
 
-        attribute = "name"
-      
-      case "Estado":
+    # Verifica se o campo não está vazio (Caso sim, não realiza filtro nenhum)
+    if not value:
 
-        attribute = "status"
-      
-      case _:
+      self.__processes_info = self.__all_processes_info
+      return
 
-        attribute = None
+    match by:
 
-    if attribute:
+      case "PID":
 
-      # Verifica se o campo não está vazio (Caso sim, não realiza filtro nenhum)
-      if value:
+        position = self.index.positionOf(int(value)) if str(value).isnumeric() else None
 
-        value = int(value) if (attribute == "pid") and (value.isnumeric()) else value
+        positions = [position] if position is not None else list()
+      
+      case "Nome":
 
-        self.__processes_info = list(filter(
-          lambda x: getattr(x, attribute) == value, 
-          self.__processes_info))
+        positions = self.index.names.searchSubstring(str(value))
       
-      else:
+      case "Estado":
 
-        self.__processes_info = self.__all_processes_info.copy()
-    
-    else:
+        positions = self.index.statuses.searchPrefix(str(value))
 
-      print("Esse filtro não existe!")
+    self.__processes_info = [self.__all_processes_info[position] for position in positions]
 
@@ -0,0 +1,396 @@
+import psutil
+
+
+import math
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.processes.process_info import (
+  ProcessInfo, DETAIL_PROCESS_ATTRIBUTES, DETAIL_ATTRIBUTE_READS, STATUS_TRANSLATION
+)
+from src.sources.live_source import LIVE_SOURCE
+
+
+# Colunas numéricas lidas na coleta -> código de tipo do array
+NUMERIC_COLUMNS: Dict[str, str] = {
+  "pid": "q",
+  "ppid": "q",
+  "create_time": "d",
+  "cpu_percent": "d"
+}
+
+# Colunas de texto lidas na coleta
+STRING_COLUMNS: List[str] = ["name", "username", "status", "exe"]
+
+# Colunas de cada atributo de detalhe -> código de tipo do array (io_counters ocupa quatro colunas)
+DETAIL_COLUMNS: Dict[str, Dict[str, str]] = {
+  "nice": {"nice": "q"},
+  "num_threads": {"num_threads": "q"},
+  "io_counters": {"read_count": "q", "write_count": "q", "read_bytes": "q", "write_bytes": "q"},
+  "memory_percent": {"memory_percent": "d"}
+}
+
+# Colunas dos contadores das taxas lidos na coleta, além das de io_counters: o tempo de CPU (usuário e sistema, em
+# segundos) e a memória residente (em bytes). NaN quando o contador não foi lido
+COUNTER_COLUMNS: List[str] = ["cpu_time", "rss"]
+
+# Colunas das taxas calculadas entre duas coletas (ver ProcessRatesSampler). NaN quando não há coleta anterior do processo
+RATE_COLUMNS: List[str] = ["cpu_time_percent", "read_bytes_per_second", "write_bytes_per_second",
+                           "io_operations_per_second", "rss_bytes_per_second"]
+
+# Bit de cada atributo de detalhe nas máscaras de atributos lidos e ausentes
+DETAIL_BITS: Dict[str, int] = {attribute: 1 << position for position, attribute in enumerate(DETAIL_PROCESS_ATTRIBUTES)}
+
+# Marca os atributos de detalhe que não vieram na coleta
+DETAIL_NOT_LOADED = object()
+
+# Leituras pendentes de cada máscara de atributos lidos
+PENDING_READS_BY_MASK: List[int] = [
+  sum(DETAIL_ATTRIBUTE_READS[attribute] for attribute, bit in DETAIL_BITS.items() if not mask & bit)
+  for mask in range(0, 1 << len(DETAIL_PROCESS_ATTRIBUTES))
+]
+
+
+class StringColumn:
+
+  """
+  Coluna de textos codificada por dicionário: cada linha guarda apenas o código (4 bytes) do seu valor, e cada valor distinto é guardado uma única vez (internado)
+  """
+
+  def __init__(self, values: Iterable[str] = ()) -> None:
+
+    codes_by_value: Dict[str, int] = dict()
+
+    # O código de um valor novo é a quantidade de valores distintos vistos até ele
+    self.__codes = array("I", [codes_by_value.setdefault(value, len(codes_by_value)) for value in values])
+    self.__values: List[str] = [sys.intern(value) for value in codes_by_value.keys()]
+
+  @property
+  def codes(self) -> array:
+
+    return self.__codes
+
+  @property
+  def values(self) -> List[str]:
+
+    """
+    Valores distintos, na posição do seu código
+    """
+
+    return self.__values
+
+  @property
+  def nbytes(self) -> int:
+
+    return self.__codes.itemsize * len(self.__codes) + sum(sys.getsizeof(value) for value in self.__values)
+
+  def __getitem__(self, row: int | slice) -> str | List[str]:
+
+    if isinstance(row, slice):
+
+      values = self.__values
+
+      return [values[code] for code in self.__codes[row]]
+
+    return self.__values[self.__codes[row]]
+
+  def __len__(self) -> int:
+
+    return len(self.__codes)
+
+  def __iter__(self) -> Iterator[str]:
+
+    values = self.__values
+
+    return (values[code] for code in self.__codes)
+
+
+class ProcessesSnapshot(Sequence):
+
+  """
+  Processos de uma coleta guardados em colunas (struct-of-arrays): um array tipado por campo numérico e uma StringColumn por campo de texto.
+
+  Os arrays não são objetos rastreados pelo coletor de lixo e usam poucos bytes por processo. Como implementam o protocolo de buffer, podem ser lidos pelo NumPy sem cópia (numpy.frombuffer). Cada linha é acessada por um ProcessInfo, criado sob demanda.
+
+  Os atributos de detalhe (DETAIL_PROCESS_ATTRIBUTES) que não vierem na coleta são lidos por linha na primeira vez que algum deles for acessado.
+  """
+
+  def __init__(self, processes_attributes: Iterable[Dict[str, Any]] = (),
+               handles: Iterable[psutil.Process | None] | None = None, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    processes_attributes : Iterable[Dict[str, Any]]
+      Atributos de cada processo, no formato de PROCESS_ATTRIBUTES (os atributos de detalhe são opcionais)
+    handles : Iterable[psutil.Process | None] | None
+      Objeto do psutil de cada processo, usado para ler os atributos de detalhe que faltarem
+    source : MetricsSource | None
+      Fonte dos processos sem objeto do psutil. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    processes_attributes = list(processes_attributes)
+
+    # As colunas são montadas uma de cada vez, cada uma em uma única passada pelos processos
+    self.__columns: Dict[str, array | StringColumn] = {
+      column: array(typecode, [attributes[column] for attributes in processes_attributes])
+      for column, typecode in NUMERIC_COLUMNS.items()
+    }
+
+    for column in STRING_COLUMNS:
+
+      self.__columns[column] = StringColumn([attributes[column] for attributes in processes_attributes])
+
+    # Estados sem tradução são mantidos como vieram do psutil (ex.: "idle", "disk-sleep")
+    self.__columns["status"] = StringColumn([STATUS_TRANSLATION.get(attributes["status"], attributes["status"])
+                                             for attributes in processes_attributes])
+
+    # Máscaras (um bit por atributo de detalhe) dos atributos já lidos e dos que não puderam ser lidos
+    self.__loaded_details = bytearray(len(processes_attributes))
+    self.__missing_details = bytearray(len(processes_attributes))
+
+    for attribute, detail_columns in DETAIL_COLUMNS.items():
+
+      bit = DETAIL_BITS[attribute]
+      values = [attributes.get(attribute, DETAIL_NOT_LOADED) for attributes in processes_attributes]
+
+      # Na coleta, um atributo de detalhe costuma vir em todos os processos ou em nenhum
+      if DETAIL_NOT_LOADED not in values:
+
+        self.__loaded_details = bytearray(mask | bit for mask in self.__loaded_details)
+
+      else:
+
+        self.__loaded_details = bytearray(mask | bit if value is not DETAIL_NOT_LOADED else mask
+                                          for mask, value in zip(self.__loaded_details, values))
+
+      if None in values:
+
+        self.__missing_details = bytearray(mask | bit if value is None else mask
+                                           for mask, value in zip(self.__missing_details, values))
+
+      values = [value if value is not DETAIL_NOT_LOADED else None for value in values]
+
+      for column, typecode in detail_columns.items():
+
+        if attribute == "io_counters":
+
+          column_values = [getattr(value, column) if value is not None else 0 for value in values]
+
+        else:
+
+          column_values = [value if value is not None else 0 for value in values]
+
+        self.__columns[column] = array(typecode, column_values)
+
+    cpu_times_values = [attributes.get("cpu_times") for attributes in processes_attributes]
+    memory_info_values = [attributes.get("memory_info") for attributes in processes_attributes]
+
+    self.__columns["cpu_time"] = array("d", [cpu_times.user + cpu_times.system if cpu_times is not None else math.nan
+                                             for cpu_times in cpu_times_values])
+    self.__columns["rss"] = array("d", [memory_info.rss if memory_info is not None else math.nan
+                                        for memory_info in memory_info_values])
+
+    self.__rates_loaded = False
+
+    self.__handles: List[psutil.Process | None] = list(handles) if handles is not None else [None] * len(processes_attributes)
+
+  @property
+  def nbytes(self) -> int:
+
+    """
+    Memória ocupada pelas colunas, em bytes (sem contar os objetos do psutil, que pertencem ao registro)
+    """
+
+    total = len(self.__loaded_details) + len(self.__missing_details) + sys.getsizeof(self.__handles)
+
+    for column in self.__columns.values():
+
+      total += column.nbytes if isinstance(column, StringColumn) else column.itemsize * len(column)
+
+    return total
+
+  @property
+  def loaded_details(self) -> bytearray:
+
+    """
+    Máscara dos atributos de detalhe já lidos de cada linha (um bit por atributo, ver DETAIL_BITS)
+    """
+
+    return self.__loaded_details
+
+  @property
+  def missing_details(self) -> bytearray:
+
+    """
+    Máscara dos atributos de detalhe que não puderam ser lidos de cada linha (um bit por atributo, ver DETAIL_BITS)
+    """
+
+    return self.__missing_details
+
+  @property
+  def pending_detail_reads(self) -> int:
+
+    """
+    Leituras do sistema que os atributos de detalhe ainda não lidos custariam (ver DETAIL_ATTRIBUTE_READS)
+    """
+
+    return sum(PENDING_READS_BY_MASK[mask] for mask in self.__loaded_details)
+
+  @property
+  def rates_loaded(self) -> bool:
+
+    """
+    Retorna verdadeiro se as taxas (RATE_COLUMNS) foram calculadas para esta coleta
+    """
+
+    return self.__rates_loaded
+
+  def column(self, name: str) -> array | StringColumn:
+
+    """Coluna de um campo (ex.: "pid", "name", "cpu_percent", "read_bytes"). Os atributos de detalhe podem não ter sido lidos
+    """
+
+    return self.__columns[name]
+
+  def setRates(self, rates: Dict[str, array]) -> None:
+
+    """Guarda as colunas das taxas calculadas para esta coleta (uma por nome de RATE_COLUMNS, com uma linha por processo)
+    """
+
+    for column in RATE_COLUMNS:
+
+      if len(rates[column]) != len(self.__handles):
+
+        raise ValueError(f"A coluna '{column}' não tem uma taxa por processo!")
+
+      self.__columns[column] = rates[column]
+
+    self.__rates_loaded = True
+
+  def rate(self, row: int, column: str) -> float | None:
+
+    """Taxa de uma linha (ver RATE_COLUMNS), ou None se ela não foi calculada ou não há coleta anterior do processo
+    """
+
+    if not self.__rates_loaded:
+
+      return None
+
+    value = self.__columns[column][row]
+
+    return value if not math.isnan(value) else None
+
+  def isDetailLoaded(self, row: int) -> bool:
+
+    return self.__loaded_details[row] == len(PENDING_READS_BY_MASK) - 1
+
+  def detail(self, row: int, attribute: str, column: str | None = None) -> Any:
+
+    """Valor de um atributo de detalhe de uma linha, lendo os detalhes da linha se for preciso
+
+    Parameters
+    ----------
+    row : int
+      Linha do processo
+    attribute : str
+      Atributo de detalhe (ver DETAIL_PROCESS_ATTRIBUTES)
+    column : str | None
+      Coluna lida, para atributos com mais de uma (ex.: "read_bytes" de "io_counters"). Por padrão, a coluna com o nome do atributo
+
+    Returns
+    -------
+    Any
+      Valor da coluna, ou None se o atributo não pôde ser lido
+    """
+
+    bit = DETAIL_BITS[attribute]
+
+    if not self.__loaded_details[row] & bit:
+
+      self.loadDetails(row)
+
+    if self.__missing_details[row] & bit:
+
+      return None
+
+    return self.__columns[column if column is not None else attribute][row]
+
+  def loadDetails(self, row: int) -> None:
+
+    """Lê, em uma única passada (oneshot), os atributos de detalhe de uma linha que ainda não foram lidos
+    """
+
+    missing_attributes = [attribute for attribute, bit in DETAIL_BITS.items() if not self.__loaded_details[row] & bit]
+
+    if not missing_attributes:
+
+      return
+
+    try:
+
+      handle = self.__handles[row]
+
+      if handle is None:
+
+        handle = self.__source.process(self.__columns["pid"][row])
+
+      # as_dict lê todos os atributos dentro de um oneshot
+      details = handle.as_dict(attrs=missing_attributes, ad_value=None)
+
+    except psutil.NoSuchProcess:
+
+      # O processo terminou depois da coleta: os detalhes ficam indisponíveis
+      details = {attribute: None for attribute in missing_attributes}
+
+    for attribute, value in details.items():
+
+      self.__setDetail(row, attribute, value)
+
+  def __setDetail(self, row: int, attribute: str, value: Any) -> None:
+
+    bit = DETAIL_BITS[attribute]
+
+    self.__loaded_details[row] |= bit
+
+    if value is None:
+
+      self.__missing_details[row] |= bit
+      return
+
+    if attribute == "io_counters":
+
+      for column in DETAIL_COLUMNS["io_counters"].keys():
+
+        self.__columns[column][row] = getattr(value, column)
+
+    else:
+
+      self.__columns[attribute][row] = value
+
+  def __len__(self) -> int:
+
+    return len(self.__handles)
+
+  def __getitem__(self, row: int | slice) -> ProcessInfo | List[ProcessInfo]:
+
+    # Uma fatia da coleta é uma lista das visões das suas linhas
+    if isinstance(row, slice):
+
+      return [ProcessInfo(self, position) for position in range(*row.indices(len(self.__handles)))]
+
+    if row < 0:
+
+      row += len(self.__handles)
+
+    if not 0 <= row < len(self.__handles):
+
+      raise IndexError("Linha fora da coleta!")
+
+    return ProcessInfo(self, row)
@@ -0,0 +1,628 @@
+import psutil
+
+
+import heapq
+import os
+import sys
+import time
+from collections import namedtuple
+from typing import Any, Dict, List, Set, Tuple
+
+# Os nomes dos usuários vêm do banco de usuários do sistema, que só existe nos sistemas POSIX
+try:
+
+  import pwd
+
+except ImportError:
+
+  pwd = None
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.processes.process_info import PROCESS_ATTRIBUTES
+from src.processes.process_registry import (
+  DENIED, RANKING_ATTRIBUTES, STATIC_PROCESS_ATTRIBUTES, ProcessRegistry, acceptedAttributes
+)
+from src.sources.live_source import LIVE_SOURCE, LiveSource
+
+
+# Leitura dos processos: "psutil" (um objeto psutil.Process por processo) ou "procfs" (leitura direta do /proc, no Linux)
+PROCESS_BACKENDS: List[str] = ["psutil", "procfs"]
+
+PROCFS_PATH: str = "/proc"
+
+# O leitor do /proc só é usado no Linux; nos demais sistemas a leitura volta para o psutil
+PROCFS_AVAILABLE: bool = sys.platform.startswith("linux") and os.path.exists(os.path.join(PROCFS_PATH, "self", "stat"))
+
+# Estados do campo 3 do /proc/<pid>/stat, nos mesmos nomes usados pelo psutil
+PROC_STATUSES: Dict[str, str] = {
+  "R": psutil.STATUS_RUNNING,
+  "S": psutil.STATUS_SLEEPING,
+  "D": psutil.STATUS_DISK_SLEEP,
+  "T": psutil.STATUS_STOPPED,
+  "t": psutil.STATUS_TRACING_STOP,
+  "Z": psutil.STATUS_ZOMBIE,
+  "X": psutil.STATUS_DEAD,
+  "x": psutil.STATUS_DEAD,
+  "K": "wake-kill",
+  "W": psutil.STATUS_WAKING,
+  "I": psutil.STATUS_IDLE,
+  "P": psutil.STATUS_PARKED
+}
+
+# Posições, na lista de campos do /proc/<pid>/stat que vem depois do nome, dos campos usados (ver proc_pid_stat(5))
+STAT_STATE = 0
+STAT_PPID = 1
+STAT_UTIME = 11
+STAT_STIME = 12
+STAT_CHILDREN_UTIME = 13
+STAT_CHILDREN_STIME = 14
+STAT_NICE = 16
+STAT_NUM_THREADS = 17
+STAT_START_TIME = 19
+STAT_BLKIO_TICKS = 39
+
+# O kernel trunca o nome do /proc/<pid>/stat (comm) em 15 caracteres; nomes desse tamanho são completados pela linha de comando
+COMM_LENGTH: int = 15
+
+# Mesmos campos do psutil.Process.io_counters, cpu_times e memory_info no Linux
+pio = namedtuple("pio", ["read_count", "write_count", "read_bytes", "write_bytes", "read_chars", "write_chars"])
+pcputimes = namedtuple("pcputimes", ["user", "system", "children_user", "children_system", "iowait"])
+pmem = namedtuple("pmem", ["rss", "vms", "shared", "text", "lib", "data", "dirty"])
+
+
+class ProcfsProcess:
+
+  """
+  Representa um processo mantido pelo ProcfsRegistry entre as atualizações
+  """
+
+  __slots__ = ("__start_ticks", "__static_attributes", "__cpu_ticks", "__cpu_timestamp", "__previous_io_bytes")
+
+  def __init__(self, start_ticks: int) -> None:
+
+    self.__start_ticks = start_ticks
+    self.__static_attributes: Dict[str, Any] | None = None
+    self.__cpu_ticks: int | None = None
+    self.__cpu_timestamp = 0.0
+    self.__previous_io_bytes: int | None = None
+
+  @property
+  def start_ticks(self) -> int:
+
+    """
+    Início do processo, em ticks desde o boot. Junto com o pid, identifica o processo (um pid reutilizado tem outro início)
+    """
+
+    return self.__start_ticks
+
+  @property
+  def static_attributes(self) -> Dict[str, Any] | None:
+
+    return self.__static_attributes
+
+  @property
+  def is_accessible(self) -> bool:
+
+    if self.__static_attributes is None:
+
+      return True
+
+    return not any(value is DENIED for value in self.__static_attributes.values())
+
+  @property
+  def previous_io_bytes(self) -> int | None:
+
+    return self.__previous_io_bytes
+
+  def setStaticAttributes(self, static_attributes: Dict[str, Any]) -> None:
+
+    self.__static_attributes = static_attributes
+
+  def setPreviousIOBytes(self, io_bytes: int) -> None:
+
+    self.__previous_io_bytes = io_bytes
+
+  def cpuPercent(self, cpu_ticks: int, clock_ticks: int) -> float:
+
+    """Porcentagem de CPU desde a leitura anterior, calculada como em psutil.Process.cpu_percent (0.0 na primeira leitura)
+    """
+
+    timestamp = time.monotonic()
+
+    previous_ticks = self.__cpu_ticks
+    previous_timestamp = self.__cpu_timestamp
+
+    self.__cpu_ticks = cpu_ticks
+    self.__cpu_timestamp = timestamp
+
+    if previous_ticks is None or timestamp <= previous_timestamp:
+
+      return 0.0
+
+    return round((cpu_ticks - previous_ticks) / clock_ticks / (timestamp - previous_timestamp) * 100, 1)
+
+
+class ProcfsRegistry:
+
+  """
+  Registro dos processos que lê o /proc diretamente, sem criar um psutil.Process por processo. Tem a mesma interface do ProcessRegistry e retorna os atributos no mesmo formato.
+
+  Cada arquivo é lido por inteiro com uma única chamada os.read, e apenas os arquivos dos atributos pedidos são lidos: o stat sempre (pid, ppid, estado, CPU), o statm só para memory_percent e memory_info (uma única vez para os dois) e o io só para io_counters. Os atributos estáticos (nome, usuário, executável) são lidos apenas quando o processo aparece.
+
+  Os atributos de detalhe que ficarem de fora da coleta são lidos depois pelo psutil, já que handleOf não guarda objetos do psutil.
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte do momento do boot, usado no cálculo do create_time. Os processos sempre vêm do /proc do sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+    self.__processes: Dict[int, ProcfsProcess] = dict()
+    self.__scanned_count = 0
+
+    self.__clock_ticks: int = os.sysconf("SC_CLK_TCK")
+    self.__page_size: int = os.sysconf("SC_PAGE_SIZE")
+    self.__total_memory: int = self.__readTotalMemory()
+    self.__boot_time: float = self.__source.bootTime()
+
+    # Nome de cada uid, consultado uma única vez
+    self.__usernames: Dict[int, str] = dict()
+
+  @property
+  def registered_count(self) -> int:
+
+    return len(self.__processes)
+
+  @property
+  def scanned_count(self) -> int:
+
+    """
+    Quantidade de pids do sistema na última atualização, inclusive os inacessíveis e os que ficaram fora do Top-N
+    """
+
+    return self.__scanned_count
+
+  def refresh(self, attributes: List[str] = PROCESS_ATTRIBUTES) -> List[Dict[str, Any]]:
+
+    """Atualiza o registro e lê os atributos pedidos dos processos acessíveis (ver ProcessRegistry.refresh)
+    """
+
+    processes_attributes: List[Dict[str, Any]] = list()
+
+    for pid in sorted(self.__scanPids()):
+
+      try:
+
+        process_attributes = self.__read(pid, attributes)
+
+      except psutil.NoSuchProcess:
+
+        self.__processes.pop(pid, None)
+        continue
+
+      process_attributes = acceptedAttributes(process_attributes)
+
+      if process_attributes is None:
+
+        continue
+
+      processes_attributes.append(process_attributes)
+
+    return processes_attributes
+
+  def refreshTop(self, count: int, by: str, attributes: List[str] = PROCESS_ATTRIBUTES) -> List[Dict[str, Any]]:
+
+    """Atualiza o registro lendo de todos os processos apenas o arquivo da chave de ordenação, e lê por completo somente os 'count' maiores (ver ProcessRegistry.refreshTop)
+    """
+
+    if by not in RANKING_ATTRIBUTES:
+
+      raise ValueError(f"A ordenação '{by}' não existe!")
+
+    ranking_attribute = RANKING_ATTRIBUTES[by]
+
+    ranked: List[Tuple[float, int, Any]] = list()
+    stats: Dict[int, Tuple[str, List[bytes]]] = dict()
+
+    for pid in self.__scanPids():
+
+      try:
+
+        stat = self.__readStat(pid)
+        registered_process = self.__registeredOf(pid, stat)
+
+        # Assim como no ProcessRegistry, os processos inacessíveis ficam fora da ordenação
+        if not registered_process.is_accessible:
+
+          continue
+
+        # O stat já tem a CPU; memória e E/S leem mais um arquivo
+        value = self.__readAttribute(pid, registered_process, stat, ranking_attribute)
+
+      except psutil.NoSuchProcess:
+
+        self.__processes.pop(pid, None)
+        continue
+
+      if value is DENIED:
+
+        continue
+
+      stats[pid] = stat
+      ranked.append((self.__rankingKey(registered_process, by, value), pid, value))
+
+    processes_attributes: List[Dict[str, Any]] = list()
+
+    for _, pid, ranking_value in heapq.nlargest(count, ranked):
+
+      try:
+
+        process_attributes = self.__read(pid, attributes, stats[pid], {ranking_attribute: ranking_value})
+
+      except psutil.NoSuchProcess:
+
+        self.__processes.pop(pid, None)
+        continue
+
+      process_attributes = acceptedAttributes(process_attributes)
+
+      if process_attributes is None:
+
+        continue
+
+      processes_attributes.append(process_attributes)
+
+    return processes_attributes
+
+  def handleOf(self, pid: int) -> None:
+
+    """Sempre None: os atributos de detalhe que não vieram na coleta são lidos pela fonte (psutil) quando pedidos
+    """
+
+    return None
+
+  def __scanPids(self) -> Set[int]:
+
+    current_pids = {int(entry) for entry in os.listdir(PROCFS_PATH) if entry.isdigit()}
+
+    for pid in self.__processes.keys() - current_pids:
+
+      del self.__processes[pid]
+
+    self.__scanned_count = len(current_pids)
+
+    return current_pids
+
+  def __rankingKey(self, registered_process: ProcfsProcess, by: str, value: Any) -> float:
+
+    if by != "io":
+
+      return value
+
+    io_bytes = value.read_bytes + value.write_bytes
+    previous_io_bytes = registered_process.previous_io_bytes
+
+    registered_process.setPreviousIOBytes(io_bytes)
+
+    return io_bytes - previous_io_bytes if previous_io_bytes is not None else io_bytes
+
+  def __registeredOf(self, pid: int, stat: Tuple[str, List[bytes]]) -> ProcfsProcess:
+
+    """Retorna o processo registrado de um pid, registrando-o se ele for novo ou se o pid tiver sido reutilizado
+    """
+
+    start_ticks = int(stat[1][STAT_START_TIME])
+    registered_process = self.__processes.get(pid)
+
+    if registered_process is None or registered_process.start_ticks != start_ticks:
+
+      registered_process = ProcfsProcess(start_ticks)
+      self.__processes[pid] = registered_process
+
+    return registered_process
+
+  def __read(self, pid: int, attributes: List[str], stat: Tuple[str, List[bytes]] | None = None,
+             known_attributes: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
+
+    """Lê os atributos de um pid no formato de PROCESS_ATTRIBUTES, ou retorna None se algum atributo estático for inacessível
+    """
+
+    if stat is None:
+
+      stat = self.__readStat(pid)
+
+    registered_process = self.__registeredOf(pid, stat)
+
+    if registered_process.static_attributes is None:
+
+      registered_process.setStaticAttributes(self.__readStaticAttributes(pid, stat, registered_process.start_ticks))
+
+    if not registered_process.is_accessible:
+
+      return None
+
+    process_attributes = dict(registered_process.static_attributes)
+
+    if known_attributes:
+
+      process_attributes.update(known_attributes)
+
+    # Arquivos já lidos nesta leitura do processo (ex.: o statm, usado por dois atributos)
+    files: Dict[str, Any] = dict()
+
+    for attribute in attributes:
+
+      if attribute not in process_attributes:
+
+        process_attributes[attribute] = self.__readAttribute(pid, registered_process, stat, attribute, files)
+
+    return process_attributes
+
+  def __readAttribute(self, pid: int, registered_process: ProcfsProcess, stat: Tuple[str, List[bytes]],
+                      attribute: str, files: Dict[str, Any] | None = None) -> Any:
+
+    fields = stat[1]
+    files = files if files is not None else dict()
+
+    match attribute:
+
+      case "ppid":
+
+        return int(fields[STAT_PPID])
+
+      case "status":
+
+        state = fields[STAT_STATE].decode()
+
+        return PROC_STATUSES.get(state, "?")
+
+      case "nice":
+
+        return int(fields[STAT_NICE])
+
+      case "num_threads":
+
+        return int(fields[STAT_NUM_THREADS])
+
+      case "cpu_percent":
+
+        return registered_process.cpuPercent(int(fields[STAT_UTIME]) + int(fields[STAT_STIME]), self.__clock_ticks)
+
+      case "cpu_times":
+
+        # Os tempos do stat são dados em ticks do relógio; o de espera de E/S (delayacct_blkio_ticks) também
+        return pcputimes(*(int(fields[position]) / self.__clock_ticks
+                           for position in [STAT_UTIME, STAT_STIME, STAT_CHILDREN_UTIME, STAT_CHILDREN_STIME,
+                                            STAT_BLKIO_TICKS]))
+
+      case "memory_percent":
+
+        data = self.__readFileOnce(pid, "statm", files)
+
+        if data is DENIED:
+
+          return DENIED
+
+        return int(data.split()[1]) * self.__page_size / self.__total_memory * 100
+
+      case "memory_info":
+
+        data = self.__readFileOnce(pid, "statm", files)
+
+        if data is DENIED:
+
+          return DENIED
+
+        # Campos do statm, em páginas: size, resident, shared, text, lib, data e dt (no pmem, o rss vem antes do vms)
+        size, resident, *others = (int(value) * self.__page_size for value in data.split()[:7])
+
+        return pmem(resident, size, *others)
+
+      case "io_counters":
+
+        data = self.__readFile(pid, "io")
+
+        if data is DENIED:
+
+          return DENIED
+
+        # Linhas "rchar: N", na ordem rchar, wchar, syscr, syscw, read_bytes, write_bytes, cancelled_write_bytes
+        values = {name: int(value) for name, value in (line.split(b": ") for line in data.splitlines() if line)}
+
+        return pio(values[b"syscr"], values[b"syscw"], values[b"read_bytes"], values[b"write_bytes"],
+                   values[b"rchar"], values[b"wchar"])
+
+    raise ValueError(f"O atributo '{attribute}' não existe!")
+
+  def __readStaticAttributes(self, pid: int, stat: Tuple[str, List[bytes]], start_ticks: int) -> Dict[str, Any]:
+
+    name = stat[0]
+
+    # Mesma regra do psutil: nomes truncados são completados pelo executável da linha de comando
+    if len(name) >= COMM_LENGTH:
+
+      cmdline = self.__readFile(pid, "cmdline")
+
+      if cmdline is not DENIED and cmdline:
+
+        extended_name = os.path.basename(os.fsdecode(cmdline.split(b"\0", 1)[0]))
+
+        if extended_name.startswith(name):
+
+          name = extended_name
+
+    static_attributes = {
+      "name": name,
+      "pid": pid,
+      "username": self.__readUsername(pid),
+      "exe": self.__readExe(pid, stat),
+      "create_time": start_ticks / self.__clock_ticks + self.__boot_time
+    }
+
+    return {attribute: static_attributes[attribute] for attribute in STATIC_PROCESS_ATTRIBUTES}
+
+  def __readUsername(self, pid: int) -> Any:
+
+    data = self.__readFile(pid, "status")
+
+    if data is DENIED:
+
+      return DENIED
+
+    # Linha "Uid:\t<real>\t<efetivo>\t<salvo>\t<fs>"; o psutil usa o uid real
+    start = data.find(b"\nUid:") + 5
+    uid = int(data[start:data.find(b"\n", start)].split()[0])
+
+    username = self.__usernames.get(uid)
+
+    if username is None:
+
+      try:
+
+        username = pwd.getpwuid(uid).pw_name
+
+      except KeyError:
+
+        username = str(uid)
+
+      self.__usernames[uid] = username
+
+    return username
+
+  def __readExe(self, pid: int, stat: Tuple[str, List[bytes]]) -> Any:
+
+    try:
+
+      exe = os.readlink(os.path.join(PROCFS_PATH, str(pid), "exe")).split("\0")[0]
+
+    except PermissionError:
+
+      return DENIED
+
+    except (FileNotFoundError, ProcessLookupError):
+
+      # Assim como no psutil, zumbis não têm executável acessível, e processos do kernel têm um executável vazio
+      if stat[1][STAT_STATE] == b"Z":
+
+        return DENIED
+
+      if not os.path.lexists(os.path.join(PROCFS_PATH, str(pid))):
+
+        raise psutil.NoSuchProcess(pid)
+
+      return ""
+
+    if exe.endswith(" (deleted)") and not os.path.exists(exe):
+
+      exe = exe[:-len(" (deleted)")]
+
+    return exe
+
+  def __readStat(self, pid: int) -> Tuple[str, List[bytes]]:
+
+    """Lê o /proc/<pid>/stat
+
+    Returns
+    -------
+    Tuple[str, List[bytes]]
+      Nome do processo (que pode conter espaços e parênteses) e os campos seguintes
+    """
+
+    data = self.__readFile(pid, "stat")
+
+    if data is DENIED or not data:
+
+      raise psutil.NoSuchProcess(pid)
+
+    name_end = data.rfind(b")")
+
+    return os.fsdecode(data[data.find(b"(") + 1:name_end]), data[name_end + 2:].split()
+
+  def __readFileOnce(self, pid: int, name: str, files: Dict[str, Any]) -> Any:
+
+    """Lê um arquivo do processo apenas se ele ainda não estiver em files (ver __readFile)
+    """
+
+    if name not in files:
+
+      files[name] = self.__readFile(pid, name)
+
+    return files[name]
+
+  def __readFile(self, pid: int, name: str) -> Any:
+
+    """Lê um arquivo do /proc/<pid> com uma única chamada de sistema, sem criar um objeto de arquivo do Python
+
+    Returns
+    -------
+    bytes | DENIED
+      Conteúdo do arquivo, ou DENIED se a leitura for negada
+    """
+
+    try:
+
+      file_descriptor = os.open(f"{PROCFS_PATH}/{pid}/{name}", os.O_RDONLY)
+
+    except PermissionError:
+
+      return DENIED
+
+    except (FileNotFoundError, ProcessLookupError):
+
+      raise psutil.NoSuchProcess(pid)
+
+    try:
+
+      # Todos os arquivos lidos cabem em uma página, exceto a linha de comando, da qual só o início é usado
+      return os.read(file_descriptor, 4096)
+
+    except PermissionError:
+
+      return DENIED
+
+    except ProcessLookupError:
+
+      raise psutil.NoSuchProcess(pid)
+
+    finally:
+
+      os.close(file_descriptor)
+
+  def __readTotalMemory(self) -> int:
+
+    with open(os.path.join(PROCFS_PATH, "meminfo"), "rb") as meminfo:
+
+      for line in meminfo:
+
+        if line.startswith(b"MemTotal:"):
+
+          # Valor em KiB
+          return int(line.split()[1]) * 1024
+
+    return psutil.virtual_memory().total
+
+
+def createProcessRegistry(backend: str = "psutil", source: MetricsSource | None = None) -> ProcessRegistry | ProcfsRegistry:
+
+  """Cria o registro de processos de uma leitura (ver PROCESS_BACKENDS)
+
+  O leitor do /proc só é usado no Linux e com o sistema ao vivo (uma gravação ou um sistema sintético não têm /proc); nos demais casos, volta para o psutil.
+  """
+
+  if backend not in PROCESS_BACKENDS:
+
+    raise ValueError(f"A leitura de processos '{backend}' não existe!")
+
+  source = source if source is not None else LIVE_SOURCE
+
+  if backend == "procfs" and PROCFS_AVAILABLE and isinstance(source, LiveSource):
+
+    return ProcfsRegistry(source)
+
+  return ProcessRegistry(source)
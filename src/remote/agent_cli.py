@@ -0,0 +1,61 @@
+import argparse
+import sys
+from typing import List
+
+
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+from src.remote.remote_agent import RemoteAgent
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py agent",
+                                   description="Lê o sistema a cada intervalo e transmite as leituras aos visualizadores "
+                                               "conectados (python main.py --connect ENDEREÇO)")
+
+  parser.add_argument("--listen", default="127.0.0.1:9500",
+                      help="Endereço em que o agente escuta: HOST:PORTA (TCP) ou unix:CAMINHO (socket Unix). "
+                           "Use 0.0.0.0:PORTA para aceitar conexões de outros computadores (padrão: 127.0.0.1:9500)")
+  parser.add_argument("--interval", type=float, default=1.0,
+                      help="Intervalo entre as leituras, em segundos (padrão: 1)")
+  parser.add_argument("--count", type=int, default=0,
+                      help="Quantidade de leituras; 0 transmite até ser interrompido (padrão: 0)")
+
+  addSourceArguments(parser)
+
+  return parser.parse_args(argv)
+
+
+def runAgent(argv: List[str]) -> int:
+
+  """Ponto de entrada do agente remoto (python main.py agent)
+
+  Assim como o modo "collect", não importa PySide6 nem pandas.
+  """
+
+  args = parseArguments(argv)
+
+  try:
+
+    agent = RemoteAgent(args.listen, sourceFromArguments(args), args.interval)
+
+  except (OSError, ValueError) as error:
+
+    print(f"Não foi possível escutar em '{args.listen}': {error}", file=sys.stderr)
+    return 1
+
+  print(f"Agente escutando em {agent.address}", file=sys.stderr)
+
+  try:
+
+    agent.serve(args.count)
+
+  except KeyboardInterrupt:
+
+    pass
+
+  finally:
+
+    agent.close()
+
+  return 0
@@ -0,0 +1,410 @@
+import numpy as np
+
+
+import json
+import struct
+import zlib
+from typing import Any, Dict, List, Tuple
+
+
+from src.archive.archive_format import shuffleBytes
+from src.sources.recorded_source import PROCESS_STATIC_FIELDS
+
+
+# Atributos numéricos dos processos transmitidos a cada leitura, seguidos pelos campos de io_counters. O status é
+# transmitido como o código em um dicionário de textos da conexão
+PROCESS_NUMERIC_FIELDS: List[str] = ["ppid", "nice", "status", "num_threads", "cpu_percent", "memory_percent"]
+
+# Atributos inteiros (assim como os campos de io_counters), convertidos de volta a int na leitura
+PROCESS_INTEGER_FIELDS: List[str] = ["ppid", "nice", "num_threads"]
+
+# Valores do sistema transmitidos na descrição (JSON) de cada leitura. Os tempos das CPUs vão em binário
+SYSTEM_FIELDS: List[str] = ["time", "cpu_stats", "cpu_freq", "disk_partitions", "disk_io", "disk_devices", "disk_usage",
+                            "battery"]
+
+# Tamanho de cada bloco de uma leitura (a descrição e os arrays que a seguem)
+BLOCK_HEADER = struct.Struct("<I")
+
+# Nível de compressão do zlib: as leituras parciais são pequenas, então um nível maior quase não custa tempo ao agente
+COMPRESSION_LEVEL: int = 6
+
+
+def encodePids(pids: np.ndarray) -> bytes:
+
+  """Codifica pids em ordem crescente pela diferença para o anterior, em uint32 (diferenças pequenas comprimem bem)
+  """
+
+  return np.diff(pids, prepend=0).astype(np.uint32).tobytes()
+
+
+def decodePids(data: bytes) -> np.ndarray:
+
+  return np.cumsum(np.frombuffer(data, dtype=np.uint32), dtype=np.int64)
+
+
+def encodeFloats(values: np.ndarray) -> bytes:
+
+  return shuffleBytes(np.ascontiguousarray(values, dtype=np.float64).tobytes(), 8)
+
+
+def decodeFloats(data: bytes) -> np.ndarray:
+
+  # Desfaz o embaralhamento dos bytes: cada linha da matriz é uma posição de byte de todos os valores
+  return np.frombuffer(data, dtype=np.uint8).reshape(8, -1).T.copy().view(np.float64).ravel()
+
+
+class RemoteReading:
+
+  """
+  Leitura de um agente remoto, com os processos em colunas: os pids em ordem crescente e uma matriz com os atributos numéricos (uma linha por processo, NaN nos que não puderam ser lidos)
+
+  Uma leitura nunca é alterada depois de criada; a seguinte compartilha com ela o que não mudou.
+  """
+
+  def __init__(self, system: Dict[str, Any], cpu_times: np.ndarray, pids: np.ndarray, values: np.ndarray,
+               static: Dict[int, List[Any]], statuses: List[str]) -> None:
+
+    self.__system = system
+    self.__cpu_times = cpu_times
+    self.__pids = pids
+    self.__values = values
+    self.__static = static
+    self.__statuses = statuses
+
+    # Linha de cada pid, montada apenas quando um processo é consultado
+    self.__rows: Dict[int, int] | None = None
+
+  @property
+  def system(self) -> Dict[str, Any]:
+
+    """
+    Valores do sistema (ver SYSTEM_FIELDS), no formato das leituras do SourceReader
+    """
+
+    return self.__system
+
+  @property
+  def time(self) -> float:
+
+    return self.__system["time"]
+
+  @property
+  def cpu_times(self) -> np.ndarray:
+
+    return self.__cpu_times
+
+  @property
+  def pids(self) -> np.ndarray:
+
+    return self.__pids
+
+  @property
+  def values(self) -> np.ndarray:
+
+    return self.__values
+
+  @property
+  def static(self) -> Dict[int, List[Any]]:
+
+    return self.__static
+
+  @property
+  def statuses(self) -> List[str]:
+
+    return self.__statuses
+
+  def processValues(self, pid: int) -> Dict[str, Any] | None:
+
+    """Atributos de um processo, no formato de PROCESS_ATTRIBUTES (io_counters como lista), ou None se ele não está na leitura
+    """
+
+    if self.__rows is None:
+
+      self.__rows = dict(zip(self.__pids.tolist(), range(0, len(self.__pids))))
+
+    row = self.__rows.get(pid)
+
+    if row is None:
+
+      return None
+
+    numbers = [None if number != number else number for number in self.__values[row].tolist()]
+
+    values = dict(zip(PROCESS_STATIC_FIELDS, self.__static[pid]))
+    values.update(zip(PROCESS_NUMERIC_FIELDS, numbers))
+
+    for field in PROCESS_INTEGER_FIELDS:
+
+      values[field] = int(values[field]) if values[field] is not None else None
+
+    values["status"] = self.__statuses[int(values["status"])] if values["status"] is not None else None
+
+    io_counters = numbers[len(PROCESS_NUMERIC_FIELDS):]
+    values["io_counters"] = [int(counter) for counter in io_counters] if None not in io_counters else None
+
+    return values
+
+
+class FrameEncoder:
+
+  """
+  Codifica as leituras do SourceReader no formato binário transmitido pelo agente remoto
+
+  Uma leitura completa leva todos os processos. As parciais levam apenas as mudanças desde a leitura anterior: os pids dos processos encerrados, os processos novos (com os atributos estáticos) e, para cada atributo numérico, os pids e os valores dos processos em que ele mudou. A comparação com a leitura anterior é feita sobre as colunas inteiras, sem laço por processo.
+
+  Formato (comprimido com zlib): a descrição em JSON (valores do sistema, atributos estáticos dos processos novos e textos novos do dicionário de status), seguida dos arrays, cada um precedido pelo seu tamanho: tempos das CPUs, pids encerrados, pids novos, atributos numéricos dos processos novos, e os pids e os valores alterados de cada atributo. Os pids são codificados pela diferença para o anterior, e os bytes dos valores são embaralhados (ver shuffleBytes).
+  """
+
+  def __init__(self, process_io_fields: List[str]) -> None:
+
+    """
+    Parameters
+    ----------
+    process_io_fields : List[str]
+      Campos de io_counters dos processos na fonte lida (ver SourceReader.fields)
+    """
+
+    self.__io_count = len(process_io_fields)
+    self.__columns_count = len(PROCESS_NUMERIC_FIELDS) + self.__io_count
+
+    self.__system: Dict[str, Any] = dict()
+    self.__cpu_times = np.empty(0, dtype=np.float64)
+
+    # Processos da última leitura codificada
+    self.__pids = np.empty(0, dtype=np.int64)
+    self.__values = np.empty((0, self.__columns_count), dtype=np.float64)
+    self.__static: Dict[int, List[Any]] = dict()
+
+    # Dicionário de status da conexão: os textos só crescem, então os códigos já transmitidos continuam válidos
+    self.__statuses: List[str] = list()
+    self.__status_codes: Dict[str, int] = dict()
+
+  def encode(self, frame: Dict[str, Any]) -> bytes:
+
+    """Codifica as mudanças de uma leitura em relação à anterior (na primeira, todos os processos são novos)
+    """
+
+    statuses_count = len(self.__statuses)
+
+    pids = np.fromiter((row[0] for row in frame["processes"]), dtype=np.int64, count=len(frame["processes"]))
+    values = self.__valuesOf(frame["processes"])
+
+    # Um pid reutilizado por outro processo aparece como encerrado e novo na mesma leitura
+    spawned_pids = np.array(sorted(static[0] for static in frame["new_processes"]), dtype=np.int64)
+    spawned = np.isin(pids, spawned_pids)
+    exited = np.union1d(np.setdiff1d(self.__pids, pids), np.intersect1d(self.__pids, spawned_pids))
+
+    staying_pids = pids[~spawned]
+    current = values[~spawned]
+    previous = self.__values[np.searchsorted(self.__pids, staying_pids)]
+
+    # Os valores que não puderam ser lidos (NaN) nas duas leituras não mudaram
+    changed = (current != previous) & ~(np.isnan(current) & np.isnan(previous))
+    changes = [(staying_pids[changed[:, column]], current[changed[:, column], column])
+               for column in range(0, self.__columns_count)]
+
+    for pid in exited.tolist():
+
+      del self.__static[pid]
+
+    for static in frame["new_processes"]:
+
+      self.__static[static[0]] = static
+
+    self.__system = {field: frame[field] for field in SYSTEM_FIELDS}
+    self.__cpu_times = np.array(frame["cpu_times"], dtype=np.float64)
+    self.__pids = pids
+    self.__values = values
+
+    return self.__pack(exited, pids[spawned], values[spawned], changes, self.__statuses[statuses_count:])
+
+  def encodeFull(self) -> bytes:
+
+    """Codifica a última leitura inteira, enviada a quem acabou de se conectar
+    """
+
+    empty = np.empty(0, dtype=np.int64)
+    changes = [(empty, np.empty(0, dtype=np.float64)) for _ in range(0, self.__columns_count)]
+
+    return self.__pack(empty, self.__pids, self.__values, changes, self.__statuses)
+
+  def __valuesOf(self, processes: List[List[Any]]) -> np.ndarray:
+
+    """Matriz dos atributos numéricos dos processos (linhas no formato de PROCESS_DYNAMIC_FIELDS), com NaN nos ausentes
+    """
+
+    missing_io = [None] * self.__io_count
+    rows: List[List[Any]] = list()
+
+    for _, ppid, nice, status, num_threads, cpu_percent, memory_percent, io_counters in processes:
+
+      row = [ppid, nice, self.__statusCode(status), num_threads, cpu_percent, memory_percent]
+      row += io_counters if io_counters is not None else missing_io
+
+      rows.append(row)
+
+    # O NumPy converte os None em NaN
+    return np.array(rows, dtype=np.float64).reshape(-1, self.__columns_count)
+
+  def __statusCode(self, status: str | None) -> int | None:
+
+    if status is None:
+
+      return None
+
+    code = self.__status_codes.get(status)
+
+    if code is None:
+
+      code = self.__status_codes[status] = len(self.__statuses)
+      self.__statuses.append(status)
+
+    return code
+
+  def __pack(self, exited: np.ndarray, spawned_pids: np.ndarray, spawned_values: np.ndarray,
+             changes: List[Tuple[np.ndarray, np.ndarray]], statuses: List[str]) -> bytes:
+
+    description = dict(self.__system, statuses=statuses,
+                       new_processes=[self.__static[pid] for pid in spawned_pids.tolist()])
+
+    blocks = [json.dumps(description, separators=(",", ":")).encode("utf-8"),
+              encodeFloats(self.__cpu_times), encodePids(exited), encodePids(spawned_pids), encodeFloats(spawned_values)]
+
+    for changed_pids, changed_values in changes:
+
+      blocks += [encodePids(changed_pids), encodeFloats(changed_values)]
+
+    return zlib.compress(b"".join(BLOCK_HEADER.pack(len(block)) + block for block in blocks), COMPRESSION_LEVEL)
+
+
+class FrameDecoder:
+
+  """
+  Aplica as leituras codificadas pelo FrameEncoder, montando a RemoteReading de cada uma
+
+  As mudanças são aplicadas sobre as colunas inteiras: os processos encerrados são retirados por uma máscara, os novos são acrescentados e reordenados pelo pid, e os valores alterados de cada atributo são escritos de uma vez nas linhas encontradas por busca binária.
+  """
+
+  def __init__(self, header: Dict[str, Any]) -> None:
+
+    """
+    Parameters
+    ----------
+    header : Dict[str, Any]
+      Cabeçalho enviado pelo agente, com os campos das namedtuples (ver SourceReader.header)
+    """
+
+    self.__columns_count = len(PROCESS_NUMERIC_FIELDS) + len(header["fields"]["process_io"])
+    self.__cpu_fields_count = len(header["fields"]["cpu_times"])
+
+    self.__reading: RemoteReading | None = None
+
+  @property
+  def reading(self) -> RemoteReading | None:
+
+    return self.__reading
+
+  def apply(self, payload: bytes, full: bool) -> RemoteReading:
+
+    """Aplica uma leitura codificada
+
+    Parameters
+    ----------
+    payload : bytes
+      Leitura codificada por FrameEncoder.encode ou FrameEncoder.encodeFull
+    full : bool
+      Se a leitura é completa (descarta o estado anterior)
+    """
+
+    blocks = self.__unpack(zlib.decompress(payload))
+    description = json.loads(blocks[0])
+
+    if full:
+
+      pids = np.empty(0, dtype=np.int64)
+      values = np.empty((0, self.__columns_count), dtype=np.float64)
+      static: Dict[int, List[Any]] = dict()
+      statuses: List[str] = list()
+
+    elif self.__reading is None:
+
+      raise ValueError("A primeira leitura recebida do agente não é completa!")
+
+    else:
+
+      pids, values = self.__reading.pids, self.__reading.values
+      static, statuses = self.__reading.static, self.__reading.statuses
+
+    exited = decodePids(blocks[2])
+    spawned_pids = decodePids(blocks[3])
+
+    # Os arrays e o dicionário da leitura anterior não são alterados: as mudanças são feitas em cópias
+    copied = False
+
+    if len(exited) or len(spawned_pids):
+
+      static = dict(static)
+
+      for pid in exited.tolist():
+
+        static.pop(pid, None)
+
+      for process_static in description["new_processes"]:
+
+        static[process_static[0]] = process_static
+
+    if len(exited):
+
+      kept = ~np.isin(pids, exited)
+      pids, values = pids[kept], values[kept]
+      copied = True
+
+    if len(spawned_pids):
+
+      pids = np.concatenate([pids, spawned_pids])
+      values = np.concatenate([values, decodeFloats(blocks[4]).reshape(-1, self.__columns_count)])
+
+      order = np.argsort(pids, kind="stable")
+      pids, values = pids[order], values[order]
+      copied = True
+
+    for column in range(0, self.__columns_count):
+
+      changed_pids = decodePids(blocks[5 + column * 2])
+
+      if not len(changed_pids):
+
+        continue
+
+      if not copied:
+
+        values = values.copy()
+        copied = True
+
+      values[np.searchsorted(pids, changed_pids), column] = decodeFloats(blocks[6 + column * 2])
+
+    system = {field: description[field] for field in SYSTEM_FIELDS}
+    cpu_times = decodeFloats(blocks[1]).reshape(-1, self.__cpu_fields_count)
+
+    self.__reading = RemoteReading(system, cpu_times, pids, values, static, statuses + description["statuses"])
+
+    return self.__reading
+
+  def __unpack(self, data: bytes) -> List[bytes]:
+
+    blocks: List[bytes] = list()
+    position = 0
+
+    while position < len(data):
+
+      length, = BLOCK_HEADER.unpack_from(data, position)
+      position += BLOCK_HEADER.size
+
+      blocks.append(data[position:position + length])
+      position += length
+
+    if len(blocks) != 5 + self.__columns_count * 2:
+
+      raise ValueError("A leitura recebida do agente está incompleta!")
+
+    return blocks
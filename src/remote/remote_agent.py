@@ -0,0 +1,246 @@
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from typing import List
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.source_reader import SourceReader
+from src.remote.frame_codec import FrameEncoder
+from src.remote.remote_protocol import (
+  AGENT_FORMAT, AGENT_VERSION, HEADER_MESSAGE, FULL_FRAME_MESSAGE, DELTA_FRAME_MESSAGE, parseAddress, encodeMessage
+)
+
+
+# Tempo máximo para enviar uma mensagem a um visualizador, em segundos. Um visualizador mais lento é desconectado,
+# para não atrasar as leituras dos demais
+SEND_TIMEOUT: float = 5.0
+
+
+class RemoteAgent:
+
+  """
+  Lê uma fonte (normalmente o sistema ao vivo) a cada intervalo e transmite as leituras aos visualizadores conectados, por TCP ou por um socket Unix
+
+  Ao se conectar, cada visualizador recebe o cabeçalho e a última leitura completa; depois, apenas as leituras parciais (ver FrameEncoder). Cada leitura é feita e codificada uma única vez, qualquer que seja a quantidade de visualizadores.
+  """
+
+  def __init__(self, address: str, source: MetricsSource | None = None, interval: float = 1.0) -> None:
+
+    """
+    Parameters
+    ----------
+    address : str
+      Endereço em que o agente escuta (ver parseAddress). A porta 0 escolhe uma porta livre
+    source : MetricsSource | None
+      Fonte lida. Sem ela, lê o sistema ao vivo
+    interval : float
+      Intervalo entre as leituras, em segundos
+    """
+
+    self.__reader = SourceReader(source)
+    self.__interval = interval
+
+    self.__encoder: FrameEncoder | None = None
+    self.__header_message: bytes | None = None
+
+    # Visualizadores conectados. A lista e o codificador são usados sob a trava, para que um visualizador que se conecta
+    # entre a codificação e o envio de uma leitura parcial não a receba depois da leitura completa que já a contém
+    self.__clients: List[socket.socket] = list()
+    self.__lock = threading.Lock()
+    self.__bytes_sent = 0
+
+    family, socket_address = parseAddress(address)
+
+    self.__unix_path: str | None = socket_address if family == getattr(socket, "AF_UNIX", None) else None
+
+    # O socket de uma execução anterior impede a criação de um novo no mesmo caminho
+    if self.__unix_path is not None and os.path.exists(self.__unix_path):
+
+      os.remove(self.__unix_path)
+
+    self.__server = socket.socket(family, socket.SOCK_STREAM)
+
+    if self.__unix_path is None:
+
+      self.__server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    self.__server.bind(socket_address)
+    self.__server.listen()
+
+    self.__accept_thread = threading.Thread(target=self.__acceptLoop, name="remote-agent-accept", daemon=True)
+
+  @property
+  def address(self) -> str:
+
+    """
+    Endereço em que o agente está escutando, no formato de parseAddress (com a porta escolhida, se foi 0)
+    """
+
+    if self.__unix_path is not None:
+
+      return f"unix:{self.__unix_path}"
+
+    host, port = self.__server.getsockname()[:2]
+
+    return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+
+  @property
+  def clients_count(self) -> int:
+
+    return len(self.__clients)
+
+  @property
+  def bytes_sent(self) -> int:
+
+    """
+    Bytes enviados a todos os visualizadores desde o início
+    """
+
+    return self.__bytes_sent
+
+  def step(self) -> int:
+
+    """Faz uma leitura da fonte e a envia aos visualizadores conectados
+
+    Returns
+    -------
+    int
+      Quantidade de processos lidos
+    """
+
+    frame = self.__reader.read()
+
+    with self.__lock:
+
+      if self.__encoder is None:
+
+        self.__encoder = FrameEncoder(self.__reader.fields["process_io"])
+        self.__header_message = self.__headerMessage()
+
+      message = encodeMessage(DELTA_FRAME_MESSAGE, self.__encoder.encode(frame))
+
+      for client in list(self.__clients):
+
+        self.__send(client, message)
+
+    # As conexões são aceitas apenas depois da primeira leitura, que é a primeira leitura completa enviada
+    if not self.__accept_thread.is_alive():
+
+      self.__accept_thread.start()
+
+    return len(frame["processes"])
+
+  def serve(self, count: int = 0) -> None:
+
+    """Faz as leituras a cada intervalo, até count leituras (0 continua até uma interrupção)
+    """
+
+    start = time.monotonic()
+    iteration = 0
+
+    while count <= 0 or iteration < count:
+
+      self.step()
+      iteration += 1
+
+      if count > 0 and iteration >= count:
+
+        break
+
+      # Os instantes das leituras são calculados a partir do início, para que os atrasos não se acumulem
+      time.sleep(max(0.0, start + iteration * self.__interval - time.monotonic()))
+
+  def close(self) -> None:
+
+    with self.__lock:
+
+      for client in self.__clients:
+
+        client.close()
+
+      self.__clients.clear()
+
+    try:
+
+      # Interrompe a espera por conexões na thread do agente (fechar o socket não a interrompe)
+      self.__server.shutdown(socket.SHUT_RDWR)
+
+    except OSError:
+
+      pass
+
+    self.__server.close()
+
+    if self.__unix_path is not None and os.path.exists(self.__unix_path):
+
+      os.remove(self.__unix_path)
+
+  def __headerMessage(self) -> bytes:
+
+    header = {
+      "format": AGENT_FORMAT,
+      "version": AGENT_VERSION,
+      "hostname": socket.gethostname(),
+      **self.__reader.header(),
+      "interval": self.__interval
+    }
+
+    return encodeMessage(HEADER_MESSAGE, json.dumps(header).encode("utf-8"))
+
+  def __acceptLoop(self) -> None:
+
+    while True:
+
+      try:
+
+        client, _ = self.__server.accept()
+
+      except OSError:
+
+        # O socket do agente foi fechado
+        return
+
+      client.settimeout(SEND_TIMEOUT)
+
+      if self.__unix_path is None:
+
+        # As leituras parciais são pequenas, então não devem esperar para serem agrupadas com as próximas
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+      with self.__lock:
+
+        full_message = encodeMessage(FULL_FRAME_MESSAGE, self.__encoder.encodeFull())
+
+        if self.__send(client, self.__header_message) and self.__send(client, full_message):
+
+          self.__clients.append(client)
+          print(f"Visualizador conectado ({len(self.__clients)} conectados)", file=sys.stderr)
+
+  def __send(self, client: socket.socket, message: bytes) -> bool:
+
+    """Envia uma mensagem a um visualizador, desconectando-o se o envio falhar. Usado sob a trava
+    """
+
+    try:
+
+      client.sendall(message)
+
+    except OSError as error:
+
+      print(f"Visualizador desconectado: {error}", file=sys.stderr)
+
+      client.close()
+
+      if client in self.__clients:
+
+        self.__clients.remove(client)
+
+      return False
+
+    self.__bytes_sent += len(message)
+
+    return True
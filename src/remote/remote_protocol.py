@@ -0,0 +1,108 @@
+import socket
+import struct
+from typing import Any, Tuple
+
+
+# Identificação do protocolo (no cabeçalho enviado pelo agente)
+AGENT_FORMAT: str = "system-monitoring-agent"
+AGENT_VERSION: int = 2
+
+# Tipos das mensagens: o cabeçalho (JSON), uma leitura completa e uma leitura parcial (ver FrameEncoder)
+HEADER_MESSAGE: int = 0
+FULL_FRAME_MESSAGE: int = 1
+DELTA_FRAME_MESSAGE: int = 2
+
+# Início de cada mensagem: o tipo e o tamanho do conteúdo
+MESSAGE_HEADER = struct.Struct("<BI")
+
+# Tamanho máximo do conteúdo de uma mensagem, para que uma conexão corrompida não reserve memória sem limite
+MAX_MESSAGE_SIZE: int = 256 * 1024 * 1024
+
+
+def parseAddress(address: str) -> Tuple[int, Any]:
+
+  """Converte um endereço do agente na família e no endereço do socket
+
+  Parameters
+  ----------
+  address : str
+    "HOST:PORTA" (TCP; o IPv6 vai entre colchetes, ex.: "[::1]:9500") ou "unix:CAMINHO" (socket Unix)
+  """
+
+  if address.startswith("unix:"):
+
+    if not hasattr(socket, "AF_UNIX"):
+
+      raise ValueError("Os sockets Unix não existem nesta plataforma!")
+
+    return socket.AF_UNIX, address[len("unix:"):]
+
+  host, separator, port = address.rpartition(":")
+
+  if not separator or not port.isdigit():
+
+    raise ValueError(f"O endereço '{address}' não é válido! Use HOST:PORTA ou unix:CAMINHO")
+
+  if host.startswith("[") and host.endswith("]"):
+
+    return socket.AF_INET6, (host[1:-1], int(port))
+
+  return socket.AF_INET, (host, int(port))
+
+
+def encodeMessage(kind: int, payload: bytes) -> bytes:
+
+  return MESSAGE_HEADER.pack(kind, len(payload)) + payload
+
+
+def receiveExactly(connection: socket.socket, size: int) -> bytes | None:
+
+  """Recebe exatamente size bytes, ou None se a conexão foi encerrada antes
+  """
+
+  buffer = bytearray(size)
+  view = memoryview(buffer)
+  position = 0
+
+  while position < size:
+
+    received = connection.recv_into(view[position:])
+
+    if not received:
+
+      return None
+
+    position += received
+
+  return bytes(buffer)
+
+
+def receiveMessage(connection: socket.socket) -> Tuple[int, bytes] | None:
+
+  """Recebe uma mensagem do agente
+
+  Returns
+  -------
+  Tuple[int, bytes] | None
+    Tipo e conteúdo da mensagem, ou None se a conexão foi encerrada
+  """
+
+  header = receiveExactly(connection, MESSAGE_HEADER.size)
+
+  if header is None:
+
+    return None
+
+  kind, size = MESSAGE_HEADER.unpack(header)
+
+  if size > MAX_MESSAGE_SIZE:
+
+    raise ValueError(f"A mensagem do agente tem {size} bytes, acima do limite!")
+
+  payload = receiveExactly(connection, size)
+
+  if payload is None:
+
+    return None
+
+  return kind, payload
@@ -0,0 +1,306 @@
+import psutil
+import psutil._common
+
+
+import json
+import socket
+import sys
+import threading
+import time
+from collections import namedtuple
+from typing import Any, Dict, List, Tuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.recorded_source import RecordedProcess
+from src.remote.frame_codec import FrameDecoder, RemoteReading
+from src.remote.remote_protocol import (
+  AGENT_FORMAT, AGENT_VERSION, HEADER_MESSAGE, FULL_FRAME_MESSAGE, DELTA_FRAME_MESSAGE, parseAddress, receiveMessage
+)
+
+
+class RemoteSource(MetricsSource):
+
+  """
+  Fonte que lê as leituras transmitidas por um agente remoto (ver src.remote.remote_agent)
+
+  As leituras são recebidas e aplicadas em uma thread própria, assim que chegam, e cada coleta usa a última leitura aplicada (trocada em advance). O relógio da fonte é o do agente, então as taxas são as medidas no sistema remoto. Se a conexão cair, a última leitura é mantida e a fonte tenta se reconectar a cada reconnect_interval segundos.
+  """
+
+  def __init__(self, address: str, timeout: float = 10.0, reconnect_interval: float = 2.0) -> None:
+
+    """
+    Parameters
+    ----------
+    address : str
+      Endereço do agente (ver parseAddress)
+    timeout : float
+      Tempo máximo para conectar e receber a primeira leitura, em segundos
+    reconnect_interval : float
+      Intervalo entre as tentativas de reconexão, em segundos
+    """
+
+    self.__address = address
+    self.__timeout = timeout
+    self.__reconnect_interval = reconnect_interval
+
+    self.__header: Dict[str, Any] = dict()
+    self.__types: Dict[str, type] = dict()
+
+    # Última leitura aplicada pela thread de recepção, e a leitura usada pelas coletas
+    self.__latest: RemoteReading | None = None
+    self.__reading: RemoteReading | None = None
+    self.__lock = threading.Lock()
+
+    self.__bytes_received = 0
+    self.__frames_received = 0
+    self.__closed = False
+
+    # A primeira conexão é feita aqui, para que um endereço errado seja informado na criação da fonte
+    self.__connection, self.__decoder = self.__connect()
+    self.__reading = self.__latest
+
+    self.__thread = threading.Thread(target=self.__receiveLoop, name="remote-source", daemon=True)
+    self.__thread.start()
+
+  @property
+  def address(self) -> str:
+
+    return self.__address
+
+  @property
+  def hostname(self) -> str:
+
+    """
+    Nome do computador do agente
+    """
+
+    return self.__header["hostname"]
+
+  @property
+  def connected(self) -> bool:
+
+    return self.__connection is not None
+
+  @property
+  def bytes_received(self) -> int:
+
+    """
+    Bytes recebidos do agente desde a criação da fonte (contando as reconexões)
+    """
+
+    return self.__bytes_received
+
+  @property
+  def frames_received(self) -> int:
+
+    return self.__frames_received
+
+  def close(self) -> None:
+
+    self.__closed = True
+    connection = self.__connection
+
+    if connection is not None:
+
+      try:
+
+        # Interrompe a recepção em andamento na thread da fonte
+        connection.shutdown(socket.SHUT_RDWR)
+
+      except OSError:
+
+        pass
+
+  def processValues(self, pid: int) -> Dict[str, Any]:
+
+    """Atributos de um processo na leitura atual, no formato de PROCESS_ATTRIBUTES (None nos que não puderam ser lidos)
+    """
+
+    values = self.__reading.processValues(pid)
+
+    if values is None:
+
+      raise psutil.NoSuchProcess(pid)
+
+    if values["io_counters"] is not None:
+
+      values["io_counters"] = self.__types["process_io"](*values["io_counters"])
+
+    return values
+
+  def time(self) -> float:
+
+    return self.__reading.time
+
+  def advance(self) -> None:
+
+    with self.__lock:
+
+      self.__reading = self.__latest
+
+  def bootTime(self) -> float:
+
+    return self.__header["boot_time"]
+
+  def pids(self) -> List[int]:
+
+    return self.__reading.pids.tolist()
+
+  def process(self, pid: int) -> RecordedProcess:
+
+    # O processo remoto tem a mesma interface do gravado: ambos leem os atributos da leitura atual da fonte
+    return RecordedProcess(self, pid)
+
+  def cpuTimes(self) -> List[tuple]:
+
+    return [self.__types["cpu_times"](*cpu_times) for cpu_times in self.__reading.cpu_times.tolist()]
+
+  def cpuStats(self) -> psutil._common.scpustats:
+
+    return self.__types["cpu_stats"](*self.__reading.system["cpu_stats"])
+
+  def cpuFrequencies(self) -> List[psutil._common.scpufreq]:
+
+    return [self.__types["cpu_freq"](*frequency) for frequency in self.__reading.system["cpu_freq"]]
+
+  def cpuCount(self, logical: bool = True) -> int | None:
+
+    return self.__header["cpu_count"] if logical else self.__header["physical_cpu_count"]
+
+  def diskPartitions(self) -> List[psutil._common.sdiskpart]:
+
+    return [self.__types["disk_partition"](*partition) for partition in self.__reading.system["disk_partitions"]]
+
+  def diskIOCounters(self) -> Dict[str, tuple]:
+
+    return {device: self.__types["disk_io"](*counters)
+            for device, counters in self.__reading.system["disk_io"].items()}
+
+  def diskDevices(self) -> Dict[str, List[str]] | None:
+
+    return self.__reading.system["disk_devices"]
+
+  def diskUsage(self, mountpoint: str) -> psutil._common.sdiskusage:
+
+    usage = self.__reading.system["disk_usage"].get(mountpoint)
+
+    # Assim como no psutil, um ponto de montagem inacessível levanta OSError
+    if usage is None:
+
+      raise FileNotFoundError(mountpoint)
+
+    return self.__types["disk_usage"](*usage)
+
+  def battery(self) -> psutil._common.sbattery | None:
+
+    battery = self.__reading.system["battery"]
+
+    return self.__types["battery"](*battery) if battery is not None else None
+
+  def __connect(self) -> Tuple[socket.socket, FrameDecoder]:
+
+    """Conecta ao agente e recebe o cabeçalho e a primeira leitura (completa)
+
+    Returns
+    -------
+    Tuple[socket.socket, FrameDecoder]
+      Conexão e decodificador das leituras
+    """
+
+    family, socket_address = parseAddress(self.__address)
+
+    connection = socket.socket(family, socket.SOCK_STREAM)
+    connection.settimeout(self.__timeout)
+
+    try:
+
+      connection.connect(socket_address)
+
+      header_message = receiveMessage(connection)
+      frame_message = receiveMessage(connection)
+
+    except OSError as error:
+
+      connection.close()
+      raise ConnectionError(f"Não foi possível conectar ao agente '{self.__address}': {error}") from None
+
+    if header_message is None or frame_message is None or header_message[0] != HEADER_MESSAGE \
+       or frame_message[0] != FULL_FRAME_MESSAGE:
+
+      connection.close()
+      raise ConnectionError(f"O agente '{self.__address}' encerrou a conexão antes da primeira leitura!")
+
+    header = json.loads(header_message[1])
+
+    if header.get("format") != AGENT_FORMAT or header.get("version") != AGENT_VERSION:
+
+      connection.close()
+      raise ValueError(f"O endereço '{self.__address}' não é um agente compatível do monitoramento do sistema!")
+
+    # As leituras seguintes podem demorar o intervalo do agente, então a recepção não tem limite de tempo
+    connection.settimeout(None)
+
+    # Os campos das namedtuples variam conforme a plataforma do agente, então os tipos são recriados a partir do cabeçalho
+    self.__types = {kind: namedtuple(kind, fields) for kind, fields in header["fields"].items()}
+    self.__header = header
+
+    decoder = FrameDecoder(header)
+    self.__apply(decoder, frame_message[1], True)
+
+    return connection, decoder
+
+  def __apply(self, decoder: FrameDecoder, payload: bytes, full: bool) -> None:
+
+    reading = decoder.apply(payload, full)
+
+    with self.__lock:
+
+      self.__latest = reading
+
+    self.__bytes_received += len(payload)
+    self.__frames_received += 1
+
+  def __receiveLoop(self) -> None:
+
+    while not self.__closed:
+
+      try:
+
+        message = receiveMessage(self.__connection)
+
+        if message is not None and message[0] in (FULL_FRAME_MESSAGE, DELTA_FRAME_MESSAGE):
+
+          self.__apply(self.__decoder, message[1], message[0] == FULL_FRAME_MESSAGE)
+          continue
+
+      except (OSError, ValueError) as error:
+
+        if not self.__closed:
+
+          print(f"Erro na conexão com o agente '{self.__address}': {error}", file=sys.stderr)
+
+      self.__connection.close()
+      self.__connection = None
+
+      self.__reconnect()
+
+  def __reconnect(self) -> None:
+
+    """Tenta se reconectar ao agente até conseguir (ou até a fonte ser fechada), mantendo a última leitura
+    """
+
+    while not self.__closed:
+
+      time.sleep(self.__reconnect_interval)
+
+      try:
+
+        self.__connection, self.__decoder = self.__connect()
+
+      except (ConnectionError, ValueError):
+
+        continue
+
+      print(f"Reconectado ao agente '{self.__address}'", file=sys.stderr)
+      return
@@ -0,0 +1,115 @@
+import argparse
+import json
+import sys
+import time
+from typing import List, TextIO
+
+
+from src.sampling.snapshot_collector import (
+  SnapshotCollector, CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE, BATTERY_MODULE
+)
+from src.sampling.snapshot_serializer import snapshotToDict
+from src.processes.process_registry import RANKING_ATTRIBUTES
+from src.processes.procfs_registry import PROCESS_BACKENDS
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+
+
+MODULES: List[str] = [CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE, BATTERY_MODULE]
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py collect",
+                                   description="Coleta as informações do sistema sem interface gráfica, "
+                                               "escrevendo uma linha JSON por módulo a cada intervalo")
+
+  parser.add_argument("--interval", type=float, default=1.0,
+                      help="Intervalo entre as coletas, em segundos (padrão: 1)")
+  parser.add_argument("--count", type=int, default=0,
+                      help="Quantidade de coletas; 0 coleta até ser interrompido (padrão: 0)")
+  parser.add_argument("--modules", nargs="+", choices=MODULES, default=[CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE],
+                      help="Módulos coletados (padrão: cpu processes disks)")
+  parser.add_argument("--output", default="-",
+                      help="Arquivo onde as linhas são acrescentadas; '-' escreve na saída padrão (padrão: -)")
+  parser.add_argument("--top", type=int, default=None,
+                      help="Coleta por completo apenas os N maiores processos; os demais passam só pela ordenação")
+  parser.add_argument("--top-by", choices=list(RANKING_ATTRIBUTES.keys()), default="cpu",
+                      help="Ordenação do modo --top (padrão: cpu)")
+  parser.add_argument("--process-backend", choices=PROCESS_BACKENDS, default="psutil",
+                      help="Leitura dos processos: psutil ou procfs (leitura direta do /proc, apenas no Linux) (padrão: psutil)")
+
+  addSourceArguments(parser)
+
+  return parser.parse_args(argv)
+
+
+def collectLoop(collector: SnapshotCollector, modules: List[str], interval: float, count: int, stream: TextIO) -> None:
+
+  """Coleta os módulos em intervalos fixos, escrevendo cada resultado como uma linha JSON
+
+  Os instantes das coletas são calculados a partir do início, para que atrasos de uma coleta não se acumulem nas seguintes.
+  """
+
+  start = time.monotonic()
+  iteration = 0
+
+  while count <= 0 or iteration < count:
+
+    # Todos os módulos do ciclo leem a mesma leitura da fonte
+    collector.advance()
+
+    for module in modules:
+
+      try:
+
+        line = json.dumps(snapshotToDict(collector.collect(module)), ensure_ascii=False)
+
+      except Exception as error:
+
+        # Uma falha em um módulo (ex.: computador sem bateria) não interrompe a coleta dos demais
+        print(f"Não foi possível coletar as informações do módulo '{module}': {error}", file=sys.stderr)
+        continue
+
+      stream.write(line + "\n")
+
+    stream.flush()
+
+    iteration += 1
+
+    if count > 0 and iteration >= count:
+
+      break
+
+    # Se a coleta atrasou mais de um intervalo, segue direto para a próxima
+    time.sleep(max(0.0, start + iteration * interval - time.monotonic()))
+
+
+def runCollector(argv: List[str]) -> int:
+
+  """Ponto de entrada do modo sem interface gráfica (python main.py collect)
+
+  Não importa PySide6, pandas nem NumPy, para que possa rodar em servidores sem tela e iniciar rapidamente.
+  """
+
+  args = parseArguments(argv)
+
+  collector = SnapshotCollector(processes_top_count=args.top, processes_top_by=args.top_by,
+                                source=sourceFromArguments(args), process_backend=args.process_backend)
+
+  stream = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+
+  try:
+
+    collectLoop(collector, args.modules, args.interval, args.count, stream)
+
+  except KeyboardInterrupt:
+
+    pass
+
+  finally:
+
+    if stream is not sys.stdout:
+
+      stream.close()
+
+  return 0
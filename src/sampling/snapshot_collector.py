@@ -0,0 +1,192 @@
+import time
+from typing import TYPE_CHECKING, List
+
+
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.cpus.cpu_sampler import CPUSampler
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.processes.procfs_registry import createProcessRegistry
+from src.processes.process_info import PROCESS_ATTRIBUTES
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.disks.disk_io_sampler import DiskIOSampler
+from src.disks.mount_usage_prober import MountUsageProber
+from src.battery.battery_info_manager import BatteryInfoManager
+from src.abstracts.info_manager import InfoManager
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
+# O histórico depende do NumPy, que não é carregado no modo sem interface gráfica
+if TYPE_CHECKING:
+
+  from src.history.metrics_history import MetricsHistory
+  from src.processes.process_rates_sampler import ProcessRatesSampler
+
+
+# Identificadores dos módulos que podem ser coletados
+CPU_MODULE = "cpu"
+PROCESSES_MODULE = "processes"
+DISKS_MODULE = "disks"
+BATTERY_MODULE = "battery"
+
+
+class ModuleSnapshot:
+
+  """
+  Representa o resultado imutável de uma coleta de um módulo (CPU, Processos, Partições ou Bateria)
+  """
+
+  def __init__(self, module: str, info_manager: InfoManager, collected_at: float, duration: float) -> None:
+
+    self.__module = module
+    self.__info_manager = info_manager
+    self.__collected_at = collected_at
+    self.__duration = duration
+
+  @property
+  def module(self) -> str:
+
+    return self.__module
+
+  @property
+  def info_manager(self) -> InfoManager:
+
+    return self.__info_manager
+
+  @property
+  def collected_at(self) -> float:
+
+    """
+    Momento da coleta no relógio da fonte, em segundos desde a época (time.time, no sistema ao vivo)
+    """
+
+    return self.__collected_at
+
+  @property
+  def duration(self) -> float:
+
+    """
+    Tempo gasto na coleta, em segundos
+    """
+
+    return self.__duration
+
+
+class SnapshotCollector:
+
+  """
+  Coletor das informações de cada módulo. Mantém o estado reaproveitado entre as coletas (ex.: registro de processos, amostras anteriores da CPU e dos discos).
+
+  Não depende de nenhuma interface gráfica e deve ser usado sempre pela mesma thread.
+  """
+
+  def __init__(self, history: "MetricsHistory | None" = None,
+               processes_top_count: int | None = None, processes_top_by: str = "cpu",
+               process_attributes: List[str] = PROCESS_ATTRIBUTES, source: MetricsSource | None = None,
+               process_backend: str = "psutil", process_rates_sampler: "ProcessRatesSampler | None" = None) -> None:
+
+    """
+    Parameters
+    ----------
+    history : MetricsHistory | None
+      Histórico alimentado a cada coleta. Sem ele, nenhum histórico é mantido
+    processes_top_count : int | None
+      Se informado, a coleta de processos lê por completo apenas os maiores processos (ver ProcessesInfoManager)
+    processes_top_by : str
+      Ordenação do modo Top-N: "cpu", "memory" ou "io"
+    process_attributes : List[str]
+      Atributos lidos de cada processo na coleta; os atributos de detalhe que ficarem de fora são lidos sob demanda
+    source : MetricsSource | None
+      Fonte das métricas (o sistema ao vivo, uma gravação ou um sistema sintético). Sem ela, lê o sistema ao vivo
+    process_backend : str
+      Leitura dos processos (ver PROCESS_BACKENDS): "psutil" ou "procfs" (leitura direta do /proc, apenas no Linux e com o sistema ao vivo; nos demais casos volta para o psutil)
+    process_rates_sampler : ProcessRatesSampler | None
+      Amostrador das taxas de cada processo entre as coletas. Sem ele, as taxas não são calculadas
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+    self.__processes_top = (processes_top_count, processes_top_by)
+    self.__process_attributes = process_attributes
+    self.__process_registry = createProcessRegistry(process_backend, self.__source)
+    self.__cpu_sampler = CPUSampler(self.__source)
+    self.__disk_io_sampler = DiskIOSampler(self.__source)
+    self.__mount_usage_prober = MountUsageProber(source=self.__source)
+    self.__history = history
+    self.__process_rates_sampler = process_rates_sampler
+
+  @property
+  def source(self) -> MetricsSource:
+
+    return self.__source
+
+  def setProcessesTop(self, count: int | None, by: str = "cpu") -> None:
+
+    """Altera o modo Top-N da coleta de processos. Pode ser chamado de outra thread: a troca vale a partir da próxima coleta
+    """
+
+    self.__processes_top = (count, by)
+
+  def setProcessAttributes(self, attributes: List[str]) -> None:
+
+    """Altera os atributos lidos de cada processo (ex.: todos quando a árvore de processos está visível). Pode ser chamado de outra thread
+    """
+
+    self.__process_attributes = attributes
+
+  def advance(self) -> None:
+
+    """Avança a fonte para a próxima leitura (ex.: a próxima leitura de uma gravação). Deve ser chamado uma única vez por ciclo de coletas, antes das coletas dos módulos do ciclo, para que todos eles leiam a mesma leitura da fonte
+    """
+
+    self.__source.advance()
+
+  def collect(self, module: str) -> ModuleSnapshot:
+
+    """Coleta as informações de um módulo na leitura atual da fonte (ver advance)
+
+    Parameters
+    ----------
+    module : str
+      Identificador do módulo (CPU_MODULE, PROCESSES_MODULE, DISKS_MODULE ou BATTERY_MODULE)
+
+    Returns
+    -------
+    ModuleSnapshot
+      Resultado da coleta
+    """
+
+    start = time.perf_counter()
+
+    collected_at = self.__source.time()
+
+    match module:
+
+      case "cpu":
+
+        info_manager = CPUsInfoManager(self.__cpu_sampler, self.__source)
+
+      case "processes":
+
+        top_count, top_by = self.__processes_top
+
+        info_manager = ProcessesInfoManager(self.__process_registry, top_count, top_by, self.__process_attributes,
+                                            self.__source, self.__process_rates_sampler)
+
+      case "disks":
+
+        info_manager = DiskPartitionsInfoManager(self.__disk_io_sampler, self.__mount_usage_prober, self.__source)
+
+      case "battery":
+
+        info_manager = BatteryInfoManager(self.__source)
+
+      case _:
+
+        raise ValueError(f"O módulo '{module}' não existe!")
+
+    duration = time.perf_counter() - start
+
+    if self.__history is not None:
+
+      self.__history.record(info_manager, collected_at)
+
+    return ModuleSnapshot(module, info_manager, collected_at, duration)
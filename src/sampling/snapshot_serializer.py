@@ -0,0 +1,86 @@
+from typing import Any, Dict, List
+
+
+from src.cpus.cpus_info_manager import CPUsInfoManager
+from src.processes.processes_info_manager import ProcessesInfoManager
+from src.disks.disk_partitions_info_manager import DiskPartitionsInfoManager
+from src.battery.battery_info_manager import BatteryInfoManager
+from src.sampling.snapshot_collector import ModuleSnapshot
+
+
+# Atributos gerais de cada gerenciador
+CPUS_GENERAL_ATTRIBUTES: List[str] = ["cpu_count", "physical_cores_count",
+                                      "context_switches_count", "hardware_interrupts_count",
+                                      "context_switches_per_second", "hardware_interrupts_per_second"]
+PROCESSES_GENERAL_ATTRIBUTES: List[str] = ["processes_count", "system_processes_count",
+                                            "running_processes_count", "waiting_processes_count"]
+DISK_PARTITIONS_GENERAL_ATTRIBUTES: List[str] = ["disk_partitions_count", "stale_partitions_count"]
+BATTERY_GENERAL_ATTRIBUTES: List[str] = ["percentage_remaining", "time_left", "is_charging"]
+
+# Atributos de cada unidade
+CPU_ATTRIBUTES: List[str] = ["cpu_id", "used_percentage", "user_percentage", "system_percentage",
+                             "iowait_percentage", "current_frequency", "minimum_frequency", "maximum_frequency"]
+PROCESS_ATTRIBUTES: List[str] = ["name", "pid", "ppid", "status", "priority_number", "owner_username",
+                                 "executable_path", "created_time", "cpu_used_percentage", "memory_used_percent",
+                                 "write_operations_count", "read_operations_count", "write_bytes_number",
+                                 "read_bytes_number", "threads_used_count"]
+DISK_PARTITION_ATTRIBUTES: List[str] = ["mountpoint_path", "device_path", "file_system", "total_bytes",
+                                        "used_bytes", "free_bytes", "used_percentage", "write_operations_count",
+                                        "read_operations_count", "write_bytes", "read_bytes",
+                                        "read_bytes_per_second", "write_bytes_per_second",
+                                        "read_operations_per_second", "write_operations_per_second",
+                                        "busy_percentage", "is_stale"]
+
+
+def snapshotToDict(snapshot: ModuleSnapshot) -> Dict[str, Any]:
+
+  """Converte o resultado de uma coleta em um dicionário serializável em JSON
+
+  Parameters
+  ----------
+  snapshot : ModuleSnapshot
+    Resultado de uma coleta
+
+  Returns
+  -------
+  Dict[str, Any]
+    Dicionário com o módulo, o instante da coleta, as informações gerais e as unidades
+  """
+
+  info_obj = snapshot.info_manager
+
+  if isinstance(info_obj, CPUsInfoManager):
+
+    general_attributes = CPUS_GENERAL_ATTRIBUTES
+    units = info_obj.cpus_info
+    unit_attributes = CPU_ATTRIBUTES
+
+  elif isinstance(info_obj, ProcessesInfoManager):
+
+    general_attributes = PROCESSES_GENERAL_ATTRIBUTES
+    units = info_obj.all_processes_info
+    unit_attributes = PROCESS_ATTRIBUTES
+
+  elif isinstance(info_obj, DiskPartitionsInfoManager):
+
+    general_attributes = DISK_PARTITIONS_GENERAL_ATTRIBUTES
+    units = info_obj.disk_partitions_info
+    unit_attributes = DISK_PARTITION_ATTRIBUTES
+
+  elif isinstance(info_obj, BatteryInfoManager):
+
+    general_attributes = BATTERY_GENERAL_ATTRIBUTES
+    units = list()
+    unit_attributes = list()
+
+  else:
+
+    raise TypeError(f"O gerenciador '{type(info_obj).__name__}' não pode ser serializado!")
+
+  return {
+    "module": snapshot.module,
+    "collected_at": snapshot.collected_at,
+    "duration": snapshot.duration,
+    "general": {attribute: getattr(info_obj, attribute) for attribute in general_attributes},
+    "units": [{attribute: getattr(unit, attribute) for attribute in unit_attributes} for unit in units]
+  }
@@ -0,0 +1,76 @@
+import psutil
+import psutil._common
+
+
+import time
+from typing import Dict, List
+
+
+from src.abstracts.metrics_source import MetricsSource
+
+
+class LiveSource(MetricsSource):
+
+  """
+  Fonte que lê o próprio sistema pelo psutil
+  """
+
+  def time(self) -> float:
+
+    return time.time()
+
+  def advance(self) -> None:
+
+    pass
+
+  def bootTime(self) -> float:
+
+    return psutil.boot_time()
+
+  def pids(self) -> List[int]:
+
+    return psutil.pids()
+
+  def process(self, pid: int) -> psutil.Process:
+
+    return psutil.Process(pid)
+
+  def cpuTimes(self) -> List[tuple]:
+
+    return psutil.cpu_times(percpu=True)
+
+  def cpuStats(self) -> psutil._common.scpustats:
+
+    return psutil.cpu_stats()
+
+  def cpuFrequencies(self) -> List[psutil._common.scpufreq]:
+
+    return psutil.cpu_freq(percpu=True) or list()
+
+  def cpuCount(self, logical: bool = True) -> int | None:
+
+    return psutil.cpu_count(logical=logical)
+
+  def diskPartitions(self) -> List[psutil._common.sdiskpart]:
+
+    return psutil.disk_partitions(all=False)
+
+  def diskIOCounters(self) -> Dict[str, tuple]:
+
+    return psutil.disk_io_counters(perdisk=True) or dict()
+
+  def diskDevices(self) -> Dict[str, List[str]] | None:
+
+    return None
+
+  def diskUsage(self, mountpoint: str) -> psutil._common.sdiskusage:
+
+    return psutil.disk_usage(mountpoint)
+
+  def battery(self) -> psutil._common.sbattery | None:
+
+    return psutil.sensors_battery()
+
+
+# Fonte usada quando nenhuma é informada. Não guarda estado, então pode ser compartilhada por todas as coletas
+LIVE_SOURCE = LiveSource()
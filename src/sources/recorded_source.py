@@ -0,0 +1,364 @@
+import psutil
+import psutil._common
+
+
+import gzip
+import json
+import os
+import time
+from collections import namedtuple
+from typing import Any, Dict, List, TextIO
+
+
+from src.abstracts.metrics_source import MetricsSource
+
+
+# Identificação das gravações (primeira linha do arquivo)
+RECORDING_FORMAT: str = "system-monitoring-recording"
+RECORDING_VERSION: int = 1
+
+# Campos de um processo gravados apenas na primeira leitura em que ele aparece, e campos gravados a cada leitura
+PROCESS_STATIC_FIELDS: List[str] = ["pid", "create_time", "name", "username", "exe"]
+PROCESS_DYNAMIC_FIELDS: List[str] = ["pid", "ppid", "nice", "status", "num_threads", "cpu_percent", "memory_percent",
+                                     "io_counters"]
+
+
+class RecordedProcess:
+
+  """
+  Processo de uma gravação, com a interface de psutil.Process usada pelo aplicativo. Os atributos que não puderam ser lidos na gravação levantam psutil.AccessDenied
+  """
+
+  def __init__(self, source: "RecordedSource", pid: int) -> None:
+
+    self.__source = source
+    self.__pid = pid
+    self.__create_time = source.processValues(pid)["create_time"]
+
+  @property
+  def pid(self) -> int:
+
+    return self.__pid
+
+  def as_dict(self, attrs: List[str], ad_value: Any = None) -> Dict[str, Any]:
+
+    values = self.__values()
+
+    # Os atributos que não são gravados (ex.: cpu_times) são tratados como não lidos
+    return {attribute: values[attribute] if values.get(attribute) is not None else ad_value for attribute in attrs}
+
+  def is_running(self) -> bool:
+
+    try:
+
+      self.__values()
+
+    except psutil.NoSuchProcess:
+
+      return False
+
+    return True
+
+  def create_time(self) -> float:
+
+    return self.__create_time
+
+  def cpu_percent(self, interval: float | None = None) -> float:
+
+    return self.__value("cpu_percent")
+
+  def memory_percent(self) -> float:
+
+    return self.__value("memory_percent")
+
+  def io_counters(self) -> tuple:
+
+    return self.__value("io_counters")
+
+  def __value(self, attribute: str) -> Any:
+
+    value = self.__values()[attribute]
+
+    if value is None:
+
+      raise psutil.AccessDenied(self.__pid)
+
+    return value
+
+  def __values(self) -> Dict[str, Any]:
+
+    values = self.__source.processValues(self.__pid)
+
+    # O pid foi reutilizado por outro processo na gravação
+    if values["create_time"] != self.__create_time:
+
+      raise psutil.NoSuchProcess(self.__pid)
+
+    return values
+
+
+class RecordedSource(MetricsSource):
+
+  """
+  Fonte que reproduz uma gravação feita pelo SourceRecorder (ver src.sources.source_recorder)
+
+  O arquivo é lido em sequência, uma leitura por vez, então gravações longas não precisam caber na memória. O relógio da fonte é o da gravação, então as taxas são as que foram medidas no sistema gravado, qualquer que seja a velocidade da reprodução.
+  """
+
+  def __init__(self, path: str, speed: float | None = 1.0, loop: bool = False) -> None:
+
+    """
+    Parameters
+    ----------
+    path : str
+      Caminho da gravação
+    speed : float | None
+      Velocidade da reprodução em relação ao tempo da gravação (ex.: 10 reproduz 10 segundos de gravação por segundo). None avança exatamente uma leitura por ciclo de coleta (ver SnapshotCollector.advance), o que torna a reprodução determinística
+    loop : bool
+      Recomeça a gravação ao chegar ao fim. Sem isso, a última leitura é mantida
+    """
+
+    if speed is not None and speed <= 0:
+
+      raise ValueError("A velocidade da reprodução deve ser maior que zero!")
+
+    self.__path = path
+    self.__speed = speed
+    self.__loop = loop
+
+    self.__stream: TextIO | None = None
+    self.__header: Dict[str, Any] = dict()
+    self.__types: Dict[str, type] = dict()
+
+    # Atributos estáticos dos processos vivos, por pid
+    self.__static: Dict[int, List[Any]] = dict()
+
+    self.__frame: Dict[str, Any] = dict()
+    self.__processes: Dict[int, List[Any]] = dict()
+    self.__next_frame: Dict[str, Any] | None = None
+
+    self.__frames_count = 0
+    self.__first_time = 0.0
+
+    # Deslocamento do relógio da leitura atual e da próxima (cresce a cada volta da reprodução repetida)
+    self.__time_offset = 0.0
+    self.__next_time_offset = 0.0
+    self.__replay_start: float | None = None
+    self.__finished = False
+
+    self.__open()
+
+    if self.__next_frame is None:
+
+      raise ValueError(f"A gravação '{path}' não possui nenhuma leitura!")
+
+    self.__first_time = self.__next_frame["time"]
+
+    self.__load(self.__readFrame())
+
+  @property
+  def finished(self) -> bool:
+
+    """
+    Retorna verdadeiro se a reprodução chegou à última leitura (nunca, quando a gravação se repete)
+    """
+
+    return self.__finished
+
+  @property
+  def frames_count(self) -> int:
+
+    """
+    Quantidade de leituras reproduzidas até agora (contando as puladas pela velocidade)
+    """
+
+    return self.__frames_count
+
+  def close(self) -> None:
+
+    if self.__stream is not None:
+
+      self.__stream.close()
+      self.__stream = None
+
+  def processValues(self, pid: int) -> Dict[str, Any]:
+
+    """Atributos de um processo na leitura atual, no formato de PROCESS_ATTRIBUTES (None nos que não puderam ser lidos)
+    """
+
+    row = self.__processes.get(pid)
+
+    if row is None:
+
+      raise psutil.NoSuchProcess(pid)
+
+    values = dict(zip(PROCESS_STATIC_FIELDS, self.__static[pid]))
+    values.update(zip(PROCESS_DYNAMIC_FIELDS, row))
+
+    if values["io_counters"] is not None:
+
+      values["io_counters"] = self.__types["process_io"](*values["io_counters"])
+
+    return values
+
+  def time(self) -> float:
+
+    return self.__frame["time"] + self.__time_offset
+
+  def advance(self) -> None:
+
+    # A primeira coleta usa a leitura carregada na abertura
+    if self.__replay_start is None:
+
+      self.__replay_start = time.monotonic()
+      return
+
+    if self.__speed is None:
+
+      if self.__hasNextFrame():
+
+        self.__load(self.__readFrame())
+
+      return
+
+    # Avança até a última leitura anterior ao relógio da reprodução, aplicando as leituras puladas
+    replay_time = self.__first_time + (time.monotonic() - self.__replay_start) * self.__speed
+
+    while self.__hasNextFrame() and self.__next_frame["time"] + self.__next_time_offset <= replay_time:
+
+      self.__load(self.__readFrame())
+
+  def bootTime(self) -> float:
+
+    return self.__header["boot_time"]
+
+  def pids(self) -> List[int]:
+
+    return list(self.__processes.keys())
+
+  def process(self, pid: int) -> RecordedProcess:
+
+    return RecordedProcess(self, pid)
+
+  def cpuTimes(self) -> List[tuple]:
+
+    return [self.__types["cpu_times"](*cpu_times) for cpu_times in self.__frame["cpu_times"]]
+
+  def cpuStats(self) -> psutil._common.scpustats:
+
+    return self.__types["cpu_stats"](*self.__frame["cpu_stats"])
+
+  def cpuFrequencies(self) -> List[psutil._common.scpufreq]:
+
+    return [self.__types["cpu_freq"](*frequency) for frequency in self.__frame["cpu_freq"]]
+
+  def cpuCount(self, logical: bool = True) -> int | None:
+
+    return self.__header["cpu_count"] if logical else self.__header["physical_cpu_count"]
+
+  def diskPartitions(self) -> List[psutil._common.sdiskpart]:
+
+    return [self.__types["disk_partition"](*partition) for partition in self.__frame["disk_partitions"]]
+
+  def diskIOCounters(self) -> Dict[str, tuple]:
+
+    return {device: self.__types["disk_io"](*counters) for device, counters in self.__frame["disk_io"].items()}
+
+  def diskDevices(self) -> Dict[str, List[str]] | None:
+
+    devices = self.__frame.get("disk_devices")
+
+    # Gravações anteriores ao mapeamento dos dispositivos: apenas o próprio nome de cada um, já que os arquivos deste
+    # computador não descrevem os dispositivos do computador gravado
+    if devices is None:
+
+      devices = {partition[0]: [os.path.basename(partition[0])] for partition in self.__frame["disk_partitions"]}
+
+    return devices
+
+  def diskUsage(self, mountpoint: str) -> psutil._common.sdiskusage:
+
+    usage = self.__frame["disk_usage"].get(mountpoint)
+
+    # Assim como no psutil, um ponto de montagem inacessível levanta OSError
+    if usage is None:
+
+      raise FileNotFoundError(mountpoint)
+
+    return self.__types["disk_usage"](*usage)
+
+  def battery(self) -> psutil._common.sbattery | None:
+
+    battery = self.__frame["battery"]
+
+    return self.__types["battery"](*battery) if battery is not None else None
+
+  def __open(self) -> None:
+
+    self.__stream = gzip.open(self.__path, "rt", encoding="utf-8")
+
+    header = json.loads(self.__stream.readline() or "{}")
+
+    if header.get("format") != RECORDING_FORMAT:
+
+      raise ValueError(f"O arquivo '{self.__path}' não é uma gravação do monitoramento do sistema!")
+
+    if header.get("version") != RECORDING_VERSION:
+
+      raise ValueError(f"A versão {header.get('version')} da gravação não é suportada!")
+
+    self.__header = header
+
+    # Os campos das namedtuples variam conforme a plataforma gravada, então os tipos são recriados a partir do cabeçalho
+    self.__types = {kind: namedtuple(kind, fields) for kind, fields in header["fields"].items()}
+
+    self.__next_frame = self.__readLine()
+
+  def __readLine(self) -> Dict[str, Any] | None:
+
+    line = self.__stream.readline()
+
+    return json.loads(line) if line else None
+
+  def __hasNextFrame(self) -> bool:
+
+    if self.__next_frame is None and self.__loop:
+
+      # Recomeça a gravação depois da última leitura, mantendo o relógio crescente
+      last_time = self.__frame["time"]
+
+      self.close()
+      self.__open()
+
+      self.__next_time_offset += last_time - self.__next_frame["time"] + self.__header.get("interval", 1.0)
+
+    return self.__next_frame is not None
+
+  def __readFrame(self) -> Dict[str, Any]:
+
+    frame = self.__next_frame
+
+    self.__next_frame = self.__readLine()
+    self.__finished = self.__next_frame is None and not self.__loop
+
+    return frame
+
+  def __load(self, frame: Dict[str, Any]) -> None:
+
+    """Torna uma leitura a atual, atualizando os atributos estáticos dos processos
+    """
+
+    for static in frame["new_processes"]:
+
+      self.__static[static[0]] = static
+
+    self.__processes = {row[0]: row for row in frame["processes"]}
+
+    # Descarta os atributos estáticos dos processos encerrados
+    for pid in [pid for pid in self.__static if pid not in self.__processes]:
+
+      del self.__static[pid]
+
+    self.__frame = frame
+    self.__time_offset = self.__next_time_offset
+    self.__frames_count += 1
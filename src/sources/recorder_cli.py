@@ -0,0 +1,67 @@
+import argparse
+import sys
+import time
+from typing import List
+
+
+from src.sources.source_arguments import addSourceArguments, sourceFromArguments
+from src.sources.source_recorder import SourceRecorder
+
+
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+
+  parser = argparse.ArgumentParser(prog="main.py record",
+                                   description="Grava as leituras do sistema em um arquivo comprimido, que pode ser "
+                                               "reproduzido depois com --replay (na janela ou no modo collect)")
+
+  parser.add_argument("--output", required=True,
+                      help="Arquivo da gravação (sobrescrito se existir). Costuma usar a extensão .jsonl.gz")
+  parser.add_argument("--interval", type=float, default=1.0,
+                      help="Intervalo entre as leituras, em segundos (padrão: 1)")
+  parser.add_argument("--count", type=int, default=0,
+                      help="Quantidade de leituras; 0 grava até ser interrompido (padrão: 0)")
+
+  addSourceArguments(parser)
+
+  return parser.parse_args(argv)
+
+
+def runRecorder(argv: List[str]) -> int:
+
+  """Ponto de entrada do modo de gravação (python main.py record)
+
+  Assim como o modo "collect", não importa PySide6, pandas nem NumPy.
+  """
+
+  args = parseArguments(argv)
+
+  recorder = SourceRecorder(args.output, sourceFromArguments(args), args.interval)
+
+  start = time.monotonic()
+  iteration = 0
+
+  try:
+
+    while args.count <= 0 or iteration < args.count:
+
+      processes_count = recorder.record()
+      iteration += 1
+
+      print(f"Leitura {iteration} gravada ({processes_count} processos)", file=sys.stderr)
+
+      if args.count > 0 and iteration >= args.count:
+
+        break
+
+      # Os instantes das leituras são calculados a partir do início, para que os atrasos não se acumulem
+      time.sleep(max(0.0, start + iteration * args.interval - time.monotonic()))
+
+  except KeyboardInterrupt:
+
+    pass
+
+  finally:
+
+    recorder.close()
+
+  return 0
@@ -0,0 +1,76 @@
+import argparse
+from typing import List
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.live_source import LIVE_SOURCE
+
+
+def addSourceArguments(parser: argparse.ArgumentParser) -> None:
+
+  """Adiciona a um parser as opções de escolha da fonte das métricas (sistema ao vivo, gravação, sistema sintético ou agente remoto)
+  """
+
+  group = parser.add_argument_group("fonte das métricas", "Sem --replay, --synthetic nem --connect, lê o sistema ao vivo")
+  sources = group.add_mutually_exclusive_group()
+
+  sources.add_argument("--replay", metavar="ARQUIVO",
+                       help="Reproduz uma gravação feita com 'python main.py record'")
+  sources.add_argument("--synthetic", type=int, metavar="PROCESSOS",
+                       help="Lê um sistema sintético com a quantidade de processos informada")
+  sources.add_argument("--connect", metavar="ENDEREÇO", action="append",
+                       help="Lê as leituras de um agente remoto ('python main.py agent'): HOST:PORTA ou unix:CAMINHO. "
+                            "A janela aceita a opção várias vezes, com uma janela por agente")
+
+  group.add_argument("--speed", type=float, default=1.0,
+                     help="Velocidade da reprodução em relação ao tempo gravado (padrão: 1)")
+  group.add_argument("--step", action="store_true",
+                     help="Avança exatamente uma leitura da gravação por ciclo de coleta, ignorando --speed (reprodução determinística)")
+  group.add_argument("--loop", action="store_true",
+                     help="Recomeça a gravação ao chegar ao fim")
+  group.add_argument("--synthetic-cpus", type=int, default=8,
+                     help="Quantidade de CPUs do sistema sintético (padrão: 8)")
+  group.add_argument("--synthetic-mountpoints", type=int, default=4,
+                     help="Quantidade de pontos de montagem do sistema sintético (padrão: 4)")
+  group.add_argument("--seed", type=int, default=0,
+                     help="Semente do sistema sintético (padrão: 0)")
+
+
+def sourceFromArguments(args: argparse.Namespace) -> MetricsSource:
+
+  """Cria a fonte das métricas escolhida pelas opções de addSourceArguments
+  """
+
+  if args.connect is not None and len(args.connect) > 1:
+
+    raise ValueError("Apenas a janela aceita mais de um agente em --connect!")
+
+  return sourcesFromArguments(args)[0]
+
+
+def sourcesFromArguments(args: argparse.Namespace) -> List[MetricsSource]:
+
+  """Cria as fontes das métricas escolhidas pelas opções de addSourceArguments: uma por agente de --connect, ou a única fonte das demais opções
+  """
+
+  if args.connect is not None:
+
+    # Importada apenas aqui, pois a fonte remota depende do NumPy
+    from src.remote.remote_source import RemoteSource
+
+    return [RemoteSource(address) for address in args.connect]
+
+  # As fontes são importadas apenas quando escolhidas, para não atrasar o início da coleta do sistema ao vivo
+  if args.replay is not None:
+
+    from src.sources.recorded_source import RecordedSource
+
+    return [RecordedSource(args.replay, None if args.step else args.speed, args.loop)]
+
+  if args.synthetic is not None:
+
+    from src.sources.synthetic_source import SyntheticSource
+
+    return [SyntheticSource(args.synthetic, args.synthetic_cpus, args.synthetic_mountpoints, seed=args.seed)]
+
+  return [LIVE_SOURCE]
@@ -0,0 +1,221 @@
+import psutil
+import psutil._common
+
+
+from typing import Any, Dict, List, Set, Tuple
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.disks.disk_device_index import DiskDeviceIndex
+from src.sources.live_source import LIVE_SOURCE
+from src.sources.recorded_source import PROCESS_STATIC_FIELDS, PROCESS_DYNAMIC_FIELDS
+from src.processes.process_info import PROCESS_ATTRIBUTES
+
+
+# Atributos lidos de cada processo: apenas os gravados (os contadores das taxas, como cpu_times, não são gravados)
+READ_PROCESS_ATTRIBUTES: List[str] = [attribute for attribute in PROCESS_ATTRIBUTES
+                                      if attribute in PROCESS_STATIC_FIELDS or attribute in PROCESS_DYNAMIC_FIELDS]
+
+
+class SourceReader:
+
+  """
+  Faz leituras completas de uma fonte (normalmente o sistema ao vivo), no formato gravado pelo SourceRecorder e transmitido pelo agente remoto
+
+  Cada leitura é um dicionário serializável em JSON. Os processos têm em cada leitura apenas os atributos que mudam (PROCESS_DYNAMIC_FIELDS); os estáticos (PROCESS_STATIC_FIELDS) vêm só na leitura em que o processo aparece.
+  """
+
+  def __init__(self, source: MetricsSource | None = None) -> None:
+
+    """
+    Parameters
+    ----------
+    source : MetricsSource | None
+      Fonte lida. Sem ela, lê o sistema ao vivo
+    """
+
+    self.__source = source if source is not None else LIVE_SOURCE
+
+    # Os dispositivos das partições são resolvidos aqui, no computador lido, porque quem reproduz as leituras não tem
+    # acesso aos seus arquivos de dispositivo
+    self.__device_index = DiskDeviceIndex(self.__source)
+
+    # Objetos dos processos mantidos entre as leituras (guardam o estado usado por cpu_percent), por pid
+    self.__handles: Dict[int, Any] = dict()
+
+    # (pid, create_time) dos processos da leitura anterior
+    self.__known_processes: Set[Tuple[int, float]] = set()
+
+    # Campos de psutil.Process.io_counters nesta plataforma, conhecidos na primeira leitura bem-sucedida
+    self.__process_io_fields: List[str] | None = None
+
+    # Campos de cada namedtuple, conhecidos na primeira leitura (ver fields)
+    self.__fields: Dict[str, List[str]] | None = None
+
+  @property
+  def source(self) -> MetricsSource:
+
+    return self.__source
+
+  @property
+  def fields(self) -> Dict[str, List[str]]:
+
+    """
+    Campos de cada namedtuple das leituras, como lidos na primeira leitura. Tipos sem nenhuma amostra usam os campos do psutil._common
+    """
+
+    if self.__fields is None:
+
+      raise ValueError("A fonte ainda não foi lida!")
+
+    return self.__fields
+
+  def header(self) -> Dict[str, Any]:
+
+    """Dados fixos do sistema lido e os campos das namedtuples (disponíveis depois da primeira leitura)
+    """
+
+    return {
+      "boot_time": self.__source.bootTime(),
+      "cpu_count": self.__source.cpuCount(logical=True),
+      "physical_cpu_count": self.__source.cpuCount(logical=False),
+      "fields": self.fields
+    }
+
+  def read(self) -> Dict[str, Any]:
+
+    """Avança a fonte e faz uma leitura completa
+
+    Returns
+    -------
+    Dict[str, Any]
+      Leitura com os valores do sistema ("cpu_times", "disk_io" etc., como listas, e "disk_devices", as chaves de "disk_io" do dispositivo de cada partição), os atributos estáticos dos processos que não estavam na leitura anterior ("new_processes") e os dinâmicos de todos os processos, em ordem de pid ("processes")
+    """
+
+    source = self.__source
+    source.advance()
+
+    cpu_times = source.cpuTimes()
+    cpu_stats = source.cpuStats()
+    cpu_frequencies = source.cpuFrequencies()
+    disk_partitions = source.diskPartitions()
+    disk_io = source.diskIOCounters()
+    battery = source.battery()
+
+    new_processes, processes = self.__readProcesses()
+
+    if self.__fields is None:
+
+      self.__fields = self.__readFields(cpu_times, cpu_stats, disk_partitions, disk_io, battery)
+
+    disk_usage: Dict[str, List[Any] | None] = dict()
+
+    for partition in disk_partitions:
+
+      try:
+
+        disk_usage[partition.mountpoint] = list(source.diskUsage(partition.mountpoint))
+
+      except OSError:
+
+        disk_usage[partition.mountpoint] = None
+
+    return {
+      "time": source.time(),
+      "cpu_times": [list(times) for times in cpu_times],
+      "cpu_stats": list(cpu_stats),
+      "cpu_freq": [list(frequency) for frequency in cpu_frequencies],
+      "disk_partitions": [list(partition) for partition in disk_partitions],
+      "disk_io": {device: list(counters) for device, counters in disk_io.items()},
+      "disk_devices": {partition.device: self.__device_index.resolve(partition.device, disk_io.keys())
+                       for partition in disk_partitions},
+      "disk_usage": disk_usage,
+      "battery": list(battery) if battery is not None else None,
+      "new_processes": new_processes,
+      "processes": processes
+    }
+
+  def __readProcesses(self) -> Tuple[List[List[Any]], List[List[Any]]]:
+
+    """Lê todos os processos da fonte
+
+    Returns
+    -------
+    Tuple[List[List[Any]], List[List[Any]]]
+      Atributos estáticos dos processos que não estavam na leitura anterior (PROCESS_STATIC_FIELDS), e atributos dinâmicos de todos os processos (PROCESS_DYNAMIC_FIELDS)
+    """
+
+    new_processes: List[List[Any]] = list()
+    processes: List[List[Any]] = list()
+    known_processes: Set[Tuple[int, float]] = set()
+
+    current_pids = set(self.__source.pids())
+
+    for pid in self.__handles.keys() - current_pids:
+
+      del self.__handles[pid]
+
+    for pid in sorted(current_pids):
+
+      try:
+
+        values = self.__readProcess(pid)
+
+      except psutil.NoSuchProcess:
+
+        self.__handles.pop(pid, None)
+        continue
+
+      key = (pid, values["create_time"])
+      known_processes.add(key)
+
+      if key not in self.__known_processes:
+
+        new_processes.append([values[field] for field in PROCESS_STATIC_FIELDS])
+
+      io_counters = values["io_counters"]
+
+      if io_counters is not None:
+
+        self.__process_io_fields = self.__process_io_fields or list(io_counters._fields)
+        values["io_counters"] = list(io_counters)
+
+      processes.append([values[field] for field in PROCESS_DYNAMIC_FIELDS])
+
+    self.__known_processes = known_processes
+
+    return new_processes, processes
+
+  def __readProcess(self, pid: int) -> Dict[str, Any]:
+
+    handle = self.__handles.get(pid)
+
+    if handle is not None:
+
+      try:
+
+        # A leitura do ppid verifica se o pid foi reutilizado por outro processo
+        return handle.as_dict(attrs=READ_PROCESS_ATTRIBUTES, ad_value=None)
+
+      except psutil.NoSuchProcess:
+
+        pass
+
+    handle = self.__source.process(pid)
+    self.__handles[pid] = handle
+
+    return handle.as_dict(attrs=READ_PROCESS_ATTRIBUTES, ad_value=None)
+
+  def __readFields(self, cpu_times: List[tuple], cpu_stats: tuple, disk_partitions: List[tuple],
+                   disk_io: Dict[str, tuple], battery: tuple | None) -> Dict[str, List[str]]:
+
+    return {
+      "cpu_times": list(cpu_times[0]._fields),
+      "cpu_stats": list(cpu_stats._fields),
+      "cpu_freq": list(psutil._common.scpufreq._fields),
+      "disk_partition": list(disk_partitions[0]._fields) if disk_partitions else list(psutil._common.sdiskpart._fields),
+      "disk_io": list(next(iter(disk_io.values()))._fields) if disk_io else list(psutil._common.sdiskio._fields),
+      "disk_usage": list(psutil._common.sdiskusage._fields),
+      "battery": list(battery._fields) if battery is not None else list(psutil._common.sbattery._fields),
+      "process_io": self.__process_io_fields or list(psutil._common.pio._fields)
+    }
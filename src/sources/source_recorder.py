@@ -0,0 +1,76 @@
+import gzip
+import json
+from typing import TextIO
+
+
+from src.abstracts.metrics_source import MetricsSource
+from src.sources.recorded_source import RECORDING_FORMAT, RECORDING_VERSION
+from src.sources.source_reader import SourceReader
+
+
+class SourceRecorder:
+
+  """
+  Grava as leituras de uma fonte (normalmente o sistema ao vivo) em um arquivo, para que sejam reproduzidas depois pela RecordedSource
+
+  O arquivo é um JSON por linha, comprimido com gzip: um cabeçalho com os dados fixos do sistema e os campos de cada namedtuple, seguido de uma linha por leitura (ver SourceReader). Os processos guardam em cada leitura apenas os atributos que mudam; os estáticos (nome, usuário, executável) são gravados só na leitura em que o processo aparece.
+  """
+
+  def __init__(self, path: str, source: MetricsSource | None = None, interval: float = 1.0) -> None:
+
+    """
+    Parameters
+    ----------
+    path : str
+      Caminho do arquivo da gravação (sobrescrito se existir)
+    source : MetricsSource | None
+      Fonte gravada. Sem ela, grava o sistema ao vivo
+    interval : float
+      Intervalo previsto entre as leituras, em segundos, usado pela reprodução repetida para emendar o fim da gravação ao início
+    """
+
+    self.__reader = SourceReader(source)
+    self.__interval = interval
+    self.__stream: TextIO = gzip.open(path, "wt", encoding="utf-8")
+    self.__header_written = False
+
+  def record(self) -> int:
+
+    """Faz uma leitura completa da fonte e a acrescenta à gravação
+
+    Returns
+    -------
+    int
+      Quantidade de processos gravados
+    """
+
+    frame = self.__reader.read()
+
+    if not self.__header_written:
+
+      self.__writeHeader()
+
+    self.__stream.write(json.dumps(frame, separators=(",", ":")) + "\n")
+
+    return len(frame["processes"])
+
+  def close(self) -> None:
+
+    self.__stream.close()
+
+  def __writeHeader(self) -> None:
+
+    system = self.__reader.header()
+
+    header = {
+      "format": RECORDING_FORMAT,
+      "version": RECORDING_VERSION,
+      "boot_time": system["boot_time"],
+      "cpu_count": system["cpu_count"],
+      "physical_cpu_count": system["physical_cpu_count"],
+      "interval": self.__interval,
+      "fields": system["fields"]
+    }
+
+    self.__stream.write(json.dumps(header) + "\n")
+    self.__header_written = True
@@ -0,0 +1,337 @@
+import psutil
+import psutil._common
+
+
+import random
+import zlib
+from collections import namedtuple
+from typing import Any, Dict, List
+
+
+from src.abstracts.metrics_source import MetricsSource
+
+
+# Tipos no formato dos retornados pelo psutil no Linux (os do psutil._common não têm os campos específicos da plataforma)
+scputimes = namedtuple("scputimes", ["user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal",
+                                     "guest", "guest_nice"])
+sdiskio = namedtuple("sdiskio", ["read_count", "write_count", "read_bytes", "write_bytes", "read_time", "write_time",
+                                 "read_merged_count", "write_merged_count", "busy_time"])
+pio = namedtuple("pio", ["read_count", "write_count", "read_bytes", "write_bytes", "read_chars", "write_chars"])
+pcputimes = namedtuple("pcputimes", ["user", "system", "children_user", "children_system", "iowait"])
+pmem = namedtuple("pmem", ["rss", "vms", "shared", "text", "lib", "data", "dirty"])
+
+BOOT_TIME: float = 1_700_000_000.0
+
+# Memória total do sistema sintético, da qual sai a memória residente de cada processo
+TOTAL_MEMORY: int = 16 * 1024 ** 3
+
+PROCESS_NAMES: List[str] = ["bash", "python3", "sleep", "nginx", "postgres", "java", "node", "chrome", "sshd",
+                            "kworker/0:1", "systemd-journald", "containerd-shim", "make", "cc1", "ld"]
+USERNAMES: List[str] = ["root", "www-data", "postgres", "build"]
+
+
+class SyntheticProcess:
+
+  """
+  Processo sintético com a interface de psutil.Process usada pelo aplicativo
+  """
+
+  def __init__(self, source: "SyntheticSource", pid: int) -> None:
+
+    self.__source = source
+    self.__pid = pid
+    self.__create_time = source.processState(pid)["create_time"]
+
+  @property
+  def pid(self) -> int:
+
+    return self.__pid
+
+  def as_dict(self, attrs: List[str], ad_value: Any = None) -> Dict[str, Any]:
+
+    # O estado é consultado uma única vez, como o oneshot faz com os arquivos do /proc
+    state = self.__state()
+
+    return {attribute: self.__valueOf(state, attribute) for attribute in attrs}
+
+  def is_running(self) -> bool:
+
+    return self.__source.isRunning(self.__pid, self.__create_time)
+
+  def create_time(self) -> float:
+
+    return self.__create_time
+
+  def cpu_percent(self, interval: float | None = None) -> float:
+
+    return self.__state()["cpu_percent"]
+
+  def memory_percent(self) -> float:
+
+    return self.__state()["memory_percent"]
+
+  def io_counters(self) -> pio:
+
+    return self.__valueOf(self.__state(), "io_counters")
+
+  def __valueOf(self, state: Dict[str, Any], attribute: str) -> Any:
+
+    match attribute:
+
+      case "pid":
+
+        return self.__pid
+
+      case "io_counters":
+
+        return pio(state["read_count"], state["write_count"], state["read_bytes"], state["write_bytes"],
+                   state["read_bytes"], state["write_bytes"])
+
+      case "cpu_times":
+
+        return pcputimes(state["cpu_time"], 0.0, 0.0, 0.0, 0.0)
+
+      case "memory_info":
+
+        return pmem(state["rss"], state["rss"] * 2, 0, 0, 0, state["rss"], 0)
+
+      case _:
+
+        return state[attribute]
+
+  def __state(self) -> Dict[str, Any]:
+
+    if not self.__source.isRunning(self.__pid, self.__create_time):
+
+      raise psutil.NoSuchProcess(self.__pid)
+
+    return self.__source.processState(self.__pid)
+
+
+class SyntheticSource(MetricsSource):
+
+  """
+  Sistema sintético, reprodutível pela semente, com a quantidade de processos, CPUs e pontos de montagem desejada (ex.: testes de carga e medições de desempenho)
+
+  Cada chamada de advance() avança a simulação em um segundo: uma fração dos processos termina, novos processos são criados e os contadores (CPU, E/S dos processos e dos discos) avançam.
+  """
+
+  def __init__(self, processes_count: int = 1000, cpu_count: int = 8, mountpoints_count: int = 4,
+               churn: float = 0.01, seed: int = 0) -> None:
+
+    """
+    Parameters
+    ----------
+    processes_count : int
+      Quantidade de processos mantida a cada passo
+    cpu_count : int
+      Quantidade de CPUs lógicas
+    mountpoints_count : int
+      Quantidade de pontos de montagem (um dispositivo por ponto)
+    churn : float
+      Fração dos processos substituída a cada passo
+    seed : int
+      Semente dos valores gerados
+    """
+
+    self.__random = random.Random(seed)
+    self.__processes_count = processes_count
+    self.__cpu_count = cpu_count
+    self.__mountpoints_count = mountpoints_count
+    self.__churn = churn
+
+    self.__clock = BOOT_TIME + 3600.0
+    self.__next_pid = 1
+    self.__processes: Dict[int, Dict[str, Any]] = dict()
+
+    for _ in range(0, processes_count):
+
+      self.__spawn()
+
+    self.__cpu_times = [[0.0] * len(scputimes._fields) for _ in range(0, cpu_count)]
+    self.__cpu_stats = [0, 0, 0, 0]
+    self.__disk_counters = [[0] * len(sdiskio._fields) for _ in range(0, mountpoints_count)]
+
+  @property
+  def processes_count(self) -> int:
+
+    return len(self.__processes)
+
+  @property
+  def mountpoints_count(self) -> int:
+
+    return self.__mountpoints_count
+
+  def processState(self, pid: int) -> Dict[str, Any]:
+
+    state = self.__processes.get(pid)
+
+    if state is None:
+
+      raise psutil.NoSuchProcess(pid)
+
+    return state
+
+  def isRunning(self, pid: int, create_time: float) -> bool:
+
+    state = self.__processes.get(pid)
+
+    return state is not None and state["create_time"] == create_time
+
+  def time(self) -> float:
+
+    return self.__clock
+
+  def advance(self) -> None:
+
+    self.__clock += 1.0
+
+    # Processos não são encerrados antes dos seus filhos serem reatribuídos: os órfãos passam para o pid 1
+    exiting_count = int(len(self.__processes) * self.__churn)
+    exiting_pids = self.__random.sample(sorted(pid for pid in self.__processes if pid != 1), exiting_count)
+
+    for pid in exiting_pids:
+
+      del self.__processes[pid]
+
+    exiting = set(exiting_pids)
+
+    for state in self.__processes.values():
+
+      if state["ppid"] in exiting:
+
+        state["ppid"] = 1
+
+      # Apenas uma pequena parte dos processos usa CPU e faz E/S a cada passo
+      if self.__random.random() < 0.05:
+
+        state["cpu_percent"] = round(self.__random.random() * 100, 1)
+        state["cpu_time"] += state["cpu_percent"] / 100
+        state["read_count"] += 10
+        state["write_count"] += 5
+        state["read_bytes"] += 40960
+        state["write_bytes"] += 20480
+        state["rss"] += 4096
+
+      else:
+
+        state["cpu_percent"] = 0.0
+
+    while len(self.__processes) < self.__processes_count:
+
+      self.__spawn()
+
+    fields = scputimes._fields
+
+    for cpu_times in self.__cpu_times:
+
+      # Cada CPU divide o segundo entre usuário, sistema, espera de E/S e ociosidade
+      busy = self.__random.random()
+
+      cpu_times[fields.index("user")] += busy * 0.7
+      cpu_times[fields.index("system")] += busy * 0.3
+      cpu_times[fields.index("iowait")] += (1 - busy) * 0.1
+      cpu_times[fields.index("idle")] += (1 - busy) * 0.9
+
+    self.__cpu_stats = [value + increment for value, increment in zip(self.__cpu_stats, [50000, 20000, 10000, 0])]
+
+    for counters in self.__disk_counters:
+
+      increments = [100, 50, 409600, 204800, 30, 20, 0, 0, self.__random.randint(0, 1000)]
+
+      for position, increment in enumerate(increments):
+
+        counters[position] += increment
+
+  def bootTime(self) -> float:
+
+    return BOOT_TIME
+
+  def pids(self) -> List[int]:
+
+    return list(self.__processes.keys())
+
+  def process(self, pid: int) -> SyntheticProcess:
+
+    return SyntheticProcess(self, pid)
+
+  def cpuTimes(self) -> List[tuple]:
+
+    return [scputimes(*cpu_times) for cpu_times in self.__cpu_times]
+
+  def cpuStats(self) -> psutil._common.scpustats:
+
+    return psutil._common.scpustats(*self.__cpu_stats)
+
+  def cpuFrequencies(self) -> List[psutil._common.scpufreq]:
+
+    return [psutil._common.scpufreq(2400.0 + cpu % 8 * 100, 800.0, 3600.0) for cpu in range(0, self.__cpu_count)]
+
+  def cpuCount(self, logical: bool = True) -> int | None:
+
+    return self.__cpu_count if logical else max(1, self.__cpu_count // 2)
+
+  def diskPartitions(self) -> List[psutil._common.sdiskpart]:
+
+    return [psutil._common.sdiskpart(f"/dev/fake{mountpoint}", f"/mnt/fake{mountpoint}", "ext4", "rw")
+            for mountpoint in range(0, self.__mountpoints_count)]
+
+  def diskIOCounters(self) -> Dict[str, tuple]:
+
+    return {f"fake{mountpoint}": sdiskio(*counters) for mountpoint, counters in enumerate(self.__disk_counters)}
+
+  def diskDevices(self) -> Dict[str, List[str]] | None:
+
+    return {f"/dev/fake{mountpoint}": [f"fake{mountpoint}"] for mountpoint in range(0, self.__mountpoints_count)}
+
+  def diskUsage(self, mountpoint: str) -> psutil._common.sdiskusage:
+
+    total = 500 * 1024 ** 3
+
+    # O crc32 (ao contrário do hash) não muda entre execuções, então o uso de cada ponto de montagem é reprodutível
+    used = (zlib.crc32(mountpoint.encode()) % 90 + 5) * total // 100
+
+    return psutil._common.sdiskusage(total, used, total - used, round(used / total * 100, 1))
+
+  def battery(self) -> psutil._common.sbattery | None:
+
+    return None
+
+  def __spawn(self) -> None:
+
+    pid = self.__next_pid
+    self.__next_pid += 1
+
+    name = self.__random.choice(PROCESS_NAMES)
+
+    # Árvores largas e rasas, como as de um sistema real: a maioria dos processos é filha do pid 1
+    ppid = self.__random.randint(1, pid - 1) if pid > 1 and self.__random.random() < 0.3 else 1
+
+    if pid == 1:
+
+      ppid = 0
+
+    elif ppid not in self.__processes:
+
+      ppid = 1
+
+    self.__processes[pid] = {
+      "name": name,
+      "ppid": ppid,
+      "nice": self.__random.choice([0, 0, 0, 0, 10, -20]),
+      "username": self.__random.choice(USERNAMES),
+      "status": self.__random.choice(["sleeping"] * 8 + ["running", "idle"]),
+      "exe": f"/usr/bin/{name}",
+      "create_time": self.__clock,
+      "num_threads": self.__random.randint(1, 32),
+      "cpu_percent": 0.0,
+      "cpu_time": 0.0,
+      "memory_percent": round(self.__random.random() * 0.5, 3),
+      "read_count": 0,
+      "write_count": 0,
+      "read_bytes": 0,
+      "write_bytes": 0
+    }
+
+    state = self.__processes[pid]
+    state["rss"] = int(state["memory_percent"] * TOTAL_MEMORY / 100)
@@ -0,0 +1,16 @@
+import os
+from functools import lru_cache
+
+
+STYLES_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "styles")
+
+
+@lru_cache(maxsize=None)
+def readStyleSheet(name: str) -> str:
+
+  """Lê uma folha de estilos da pasta styles (ex.: "table.txt"). Cada arquivo é lido do disco uma única vez
+  """
+
+  with open(os.path.join(STYLES_DIR, name), "r") as style_sheet_stream:
+
+    return style_sheet_stream.read()